@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import base64
+import heapq
+import json
+import os
 from pathlib import Path
 from typing import Any, Optional
 
@@ -17,7 +21,54 @@ class FilesystemBrowseError(Exception):
         return {"success": False, "error": {"code": self.code, "message": self.message}}
 
 
-def browse_filesystem(path: str, *, include_hidden: bool = False) -> dict[str, Any]:
+def _sort_key(name: str, is_dir: bool) -> tuple[bool, bool, str, str]:
+    # Same key and cursor format as the server's browse pages, so the UI pages
+    # agent, local and SSH listings the same way.
+    return (True, not is_dir, name.lower(), name)
+
+
+def _encode_cursor(key: tuple[bool, bool, str, str]) -> str:
+    payload = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[bool, bool, str, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise FilesystemBrowseError("invalid_cursor", "Invalid browse cursor") from exc
+    if (
+        not isinstance(value, list)
+        or len(value) != 4
+        or not all(isinstance(part, bool) for part in value[:2])
+        or not all(isinstance(part, str) for part in value[2:])
+    ):
+        raise FilesystemBrowseError("invalid_cursor", "Invalid browse cursor")
+    return tuple(value)
+
+
+def _entry_is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def browse_filesystem(
+    path: str,
+    *,
+    include_hidden: bool = False,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    name_filter: Optional[str] = None,
+) -> dict[str, Any]:
+    """List a directory, optionally one keyset page at a time.
+
+    One ``os.scandir`` pass picks the page with a bounded heap; only the
+    returned entries are stat'ed, so a page costs the same in a directory with
+    500k entries as in a small one.
+    """
     requested = Path(path or "/").expanduser()
     try:
         current = requested.resolve(strict=True)
@@ -33,40 +84,68 @@ def browse_filesystem(path: str, *, include_hidden: bool = False) -> dict[str, A
             "not_directory", f"Path is not a directory: {current}"
         )
 
-    items: list[dict[str, Any]] = []
+    after = _decode_cursor(cursor) if cursor else None
+    needle = (name_filter or "").lower()
+    total = 0
+    candidates: list[tuple[tuple[bool, bool, str, str], os.DirEntry, bool]] = []
     try:
-        for entry in current.iterdir():
-            hidden = entry.name.startswith(".")
-            if hidden and not include_hidden:
-                continue
-            try:
-                stat = entry.stat()
-                is_dir = entry.is_dir()
-            except OSError:
-                continue
-            items.append(
-                {
-                    "name": entry.name,
-                    "path": str(entry),
-                    "type": "directory" if is_dir else "file",
-                    "size": stat.st_size,
-                    "modified_at": stat.st_mtime,
-                    "hidden": hidden,
-                }
-            )
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") and not include_hidden:
+                    continue
+                if needle and needle not in entry.name.lower():
+                    continue
+                total += 1
+                is_dir = _entry_is_dir(entry)
+                key = _sort_key(entry.name, is_dir)
+                if after is not None and key <= after:
+                    continue
+                candidates.append((key, entry, is_dir))
+                if limit and len(candidates) > 4 * (limit + 1):
+                    candidates = heapq.nsmallest(
+                        limit + 1, candidates, key=lambda item: item[0]
+                    )
     except PermissionError as exc:
         raise FilesystemBrowseError(
             "unreadable", f"Path is not readable: {current}"
         ) from exc
 
-    items.sort(key=lambda item: (item["type"] != "directory", item["name"].lower()))
+    if limit:
+        ordered = heapq.nsmallest(limit + 1, candidates, key=lambda item: item[0])
+    else:
+        ordered = sorted(candidates, key=lambda item: item[0])
+    page = ordered[:limit] if limit else ordered
+
+    items: list[dict[str, Any]] = []
+    for _key, entry, is_dir in page:
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        items.append(
+            {
+                "name": entry.name,
+                "path": entry.path,
+                "type": "directory" if is_dir else "file",
+                "size": stat.st_size,
+                "modified_at": stat.st_mtime,
+                "hidden": entry.name.startswith("."),
+            }
+        )
+
     parent = current.parent if current.parent != current else None
-    return {
+    result = {
         "success": True,
         "current_path": str(current),
         "parent_path": str(parent) if parent else None,
         "items": items,
+        "total_items": total,
     }
+    if limit:
+        result["next_cursor"] = (
+            _encode_cursor(page[-1][0]) if len(ordered) > limit else None
+        )
+    return result
 
 
 def execute_filesystem_browse_job(
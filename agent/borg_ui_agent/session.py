@@ -4,9 +4,11 @@ import json
 import logging
 import os
 import queue
+import selectors
 import socket as socket_module
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
 from contextlib import contextmanager
 from typing import Any, Optional
@@ -23,20 +25,44 @@ from agent.borg_ui_agent.scripts import list_allowed_scripts
 logger = logging.getLogger(__name__)
 
 try:
-    from websocket import WebSocketTimeoutException
+    from websocket import ABNF, WebSocketTimeoutException
 except Exception:  # pragma: no cover - only used when optional dep is unavailable.
+    ABNF = None
     WebSocketTimeoutException = TimeoutError
 
 
-# How long the session thread blocks in recv() before it looks at the outbox
-# again; also the worst-case delay before a worker's frame reaches the server.
+# Only for connections without a file descriptor to wait on: the session thread
+# then blocks in recv() this long before it looks at the outbox again. Real
+# sessions wait on the socket and a wakeup pipe, so frames go out immediately.
 OUTBOX_POLL_SECONDS = 1.0
 # How often an idle session emits its application heartbeat + protocol ping.
 KEEPALIVE_INTERVAL_SECONDS = 30.0
-# Outbox capacity. Frames are drained once per poll interval, so this only fills
-# up if the socket has stopped accepting writes; frames are then dropped rather
-# than growing without bound.
+# Frames the outbox holds before a worker queueing another one blocks until the
+# session thread has written some out. Progress frames are coalesced per job
+# and don't count, so a stalled socket slows workers down instead of dropping
+# their logs or state changes.
 OUTBOX_MAX_FRAMES = 1000
+# While an orderly shutdown waits for workers, the session thread writes out
+# what they queued this often, so a worker blocked on a full outbox can finish.
+SHUTDOWN_FLUSH_SECONDS = 0.1
+# Worker threads per kind of command; further commands of a kind wait in FIFO
+# order. Cancels have their own pool so they never queue behind the jobs they
+# are meant to stop.
+COMMAND_POOL_LIMITS = {
+    "control": 2,
+    "interactive": 4,
+    "backup": 2,
+    "repository": 4,
+    "script": 2,
+}
+INTERACTIVE_COMMANDS = frozenset(
+    {
+        "filesystem.browse",
+        "diagnostics.run",
+        "agent.repository_defaults",
+        "agent.list_scripts",
+    }
+)
 
 
 def _default_connect(url: str, *, header: list[str], timeout: int):
@@ -73,6 +99,266 @@ def _open_tcp_connection(host: str, port: int, timeout_seconds: float) -> None:
     connection.close()
 
 
+def _command_kind(command: str) -> str:
+    if command == "cancel":
+        return "control"
+    if command in INTERACTIVE_COMMANDS:
+        return "interactive"
+    prefix = command.split(".", 1)[0]
+    return prefix if prefix in COMMAND_POOL_LIMITS else "repository"
+
+
+class SessionOutbox:
+    """Frames waiting for the session thread to write them to the socket.
+
+    Frames are written in the order they were queued. A progress frame queued
+    with a ``coalesce_key`` replaces the still-unsent progress frame of the
+    same job, so a fast progress stream costs one frame per flush. Every other
+    frame is kept; once ``max_frames`` of them are waiting, ``put`` blocks the
+    calling worker until the session thread drains the outbox or closes it.
+    The session thread itself queues with ``block=False``: it is the only one
+    draining the outbox, so waiting there would never end.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_frames: int = OUTBOX_MAX_FRAMES,
+        wake: Optional[Callable[[], None]] = None,
+    ):
+        self._max_frames = max_frames
+        self._wake = wake
+        self._changed = threading.Condition()
+        # Each entry is [message]; a coalesced progress frame is superseded by
+        # blanking its entry and appending the new one, keeping frame order.
+        self._frames: deque[list[Optional[str]]] = deque()
+        self._coalesced: dict[Any, list[Optional[str]]] = {}
+        self._kept = 0
+        self._signalled = False
+        self._closed = False
+
+    def put(
+        self, message: str, *, coalesce_key: Any = None, block: bool = True
+    ) -> bool:
+        """Queue one frame; False if the outbox was closed first.
+
+        With ``block=False`` the frame is queued even when the outbox is full.
+        """
+        with self._changed:
+            if coalesce_key is not None:
+                if self._closed:
+                    return False
+                superseded = self._coalesced.get(coalesce_key)
+                if superseded is not None:
+                    superseded[0] = None
+                entry = [message]
+                self._coalesced[coalesce_key] = entry
+            else:
+                while block and self._kept >= self._max_frames and not self._closed:
+                    self._changed.wait()
+                if self._closed:
+                    return False
+                entry = [message]
+                self._kept += 1
+            self._frames.append(entry)
+            wake = not self._signalled
+            self._signalled = True
+        if wake and self._wake is not None:
+            self._wake()
+        return True
+
+    def drain(self) -> list[str]:
+        """Take every queued frame, oldest first, and unblock waiting workers."""
+        with self._changed:
+            frames = [entry[0] for entry in self._frames if entry[0] is not None]
+            self._frames.clear()
+            self._coalesced.clear()
+            self._kept = 0
+            self._signalled = False
+            self._changed.notify_all()
+        return frames
+
+    def close(self) -> None:
+        """Refuse further frames and release any worker blocked in ``put``."""
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    def empty(self) -> bool:
+        with self._changed:
+            return not any(entry[0] is not None for entry in self._frames)
+
+    def get_nowait(self) -> str:
+        """Pop the oldest frame (queue.Queue-compatible, for tests and tools)."""
+        with self._changed:
+            while self._frames:
+                entry = self._frames.popleft()
+                if entry[0] is None:
+                    continue
+                for key, pending in list(self._coalesced.items()):
+                    if pending is entry:
+                        del self._coalesced[key]
+                        break
+                else:
+                    self._kept -= 1
+                self._changed.notify_all()
+                return entry[0]
+        raise queue.Empty
+
+
+class _Waker:
+    """Self-pipe that wakes the session thread out of ``select``."""
+
+    def __init__(self):
+        self._reader, self._writer = socket_module.socketpair()
+        self._reader.setblocking(False)
+        self._writer.setblocking(False)
+
+    def fileno(self) -> int:
+        return self._reader.fileno()
+
+    def wake(self) -> None:
+        try:
+            self._writer.send(b"\0")
+        except OSError:
+            pass  # Pipe full: a wakeup is already pending.
+
+    def clear(self) -> None:
+        try:
+            while self._reader.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self._reader.close()
+        self._writer.close()
+
+
+class _CommandPool:
+    """Bounded set of daemon worker threads for one kind of command.
+
+    Commands beyond ``max_workers`` wait in FIFO order for a free worker.
+    Workers are daemons, as the per-command threads were before, so a wedged
+    job never holds up process exit.
+    """
+
+    def __init__(self, kind: str, max_workers: int, run: Callable[[Any], None]):
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self._run = run
+        self._changed = threading.Condition()
+        self._pending: deque[Any] = deque()
+        self._workers = 0
+        self._busy = 0
+        self._closed = False
+
+    def submit(self, item: Any) -> bool:
+        with self._changed:
+            if self._closed:
+                return False
+            self._pending.append(item)
+            idle = self._workers - self._busy
+            if idle < len(self._pending) and self._workers < self.max_workers:
+                self._workers += 1
+                threading.Thread(
+                    target=self._work, name=f"agent-{self.kind}", daemon=True
+                ).start()
+            elif idle < len(self._pending):
+                logger.info(
+                    "All %s %s workers busy; command queued (%s waiting)",
+                    self.max_workers,
+                    self.kind,
+                    len(self._pending),
+                )
+            self._changed.notify_all()
+        return True
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued and running command has finished.
+
+        Returns False if ``timeout`` seconds passed first.
+        """
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def close(self) -> list[Any]:
+        """Stop accepting commands; return the ones that never started."""
+        with self._changed:
+            self._closed = True
+            discarded = list(self._pending)
+            self._pending.clear()
+            self._changed.notify_all()
+        return discarded
+
+    def _work(self) -> None:
+        while True:
+            with self._changed:
+                while not self._pending and not self._closed:
+                    self._changed.wait()
+                if not self._pending:
+                    self._workers -= 1
+                    return
+                item = self._pending.popleft()
+                self._busy += 1
+            try:
+                self._run(item)
+            except Exception:
+                logger.exception("Agent %s worker failed", self.kind)
+            finally:
+                with self._changed:
+                    self._busy -= 1
+                    self._changed.notify_all()
+
+
+def _selectable_socket(socket) -> Any:
+    """The OS-level socket under a websocket-client connection, if any."""
+    raw = getattr(socket, "sock", None)
+    fileno = getattr(raw, "fileno", None)
+    if not callable(fileno):
+        return None
+    try:
+        return raw if fileno() >= 0 else None
+    except OSError:
+        return None
+
+
+def _has_buffered_input(socket) -> bool:
+    """True when bytes are already buffered above the OS socket.
+
+    ``select`` only sees the kernel buffer; decrypted TLS records and the
+    tail of a previous read held by websocket-client would otherwise sit
+    unread until the next packet arrives.
+    """
+    pending = getattr(getattr(socket, "sock", None), "pending", None)
+    if callable(pending) and pending():
+        return True
+    frame_buffer = getattr(socket, "frame_buffer", None)
+    return bool(getattr(frame_buffer, "recv_buffer", None))
+
+
+def _recv_message(socket) -> Optional[str]:
+    """Read one frame; None for control frames (pings are answered inside).
+
+    Plain ``recv()`` keeps reading after a ping until a data frame arrives,
+    which would park the session thread while workers' frames pile up.
+    """
+    recv_data_frame = getattr(socket, "recv_data_frame", None)
+    if ABNF is None or not callable(recv_data_frame):
+        return socket.recv()
+    opcode, frame = recv_data_frame(True)
+    if opcode == ABNF.OPCODE_CLOSE:
+        raise ConnectionError("Agent session closed by server")
+    if opcode == ABNF.OPCODE_TEXT:
+        data = frame.data
+        return data.decode("utf-8") if isinstance(data, bytes) else data
+    if opcode == ABNF.OPCODE_BINARY:
+        return frame.data
+    return None
+
+
 class SessionCommandClient:
     """Command-scoped client handed to a job handler in a worker thread.
 
@@ -86,7 +372,7 @@ class SessionCommandClient:
         *,
         command_id: str,
         job_id: Optional[int],
-        outbox: "queue.Queue[str]",
+        outbox: SessionOutbox,
         closing: Optional[threading.Event] = None,
         artifact_uploader: Optional[Callable[[int, Any], dict[str, Any]]] = None,
         http_client: Optional[AgentClient] = None,
@@ -241,30 +527,28 @@ class SessionCommandClient:
         self.enqueue(ws_payload)
 
     def _send(self, payload: dict[str, Any]) -> None:
-        """Best-effort telemetry send (job_started/progress/log/cancel). Losing
-        one is harmless; terminal results go through _deliver_terminal instead."""
+        """Telemetry send (job_started/progress/log). Progress frames may be
+        coalesced with a newer one; the rest are delivered in order. Terminal
+        results go through _deliver_terminal instead."""
         self.enqueue(payload)
 
-    def enqueue(self, payload: dict[str, Any]) -> bool:
+    def enqueue(self, payload: dict[str, Any], *, block: bool = True) -> bool:
         """Hand one frame to the session thread, which owns the socket.
 
-        Returns False when the frame was not queued: the session is already
-        closing (nothing queued now can still be delivered), or the outbox is
-        full because the socket has stopped draining.
+        Blocks while the outbox is full (the socket is draining slower than
+        workers produce) unless ``block`` is False, which the session thread
+        must pass. Returns False when the frame was not queued because the
+        session is closing: nothing queued now can still be delivered.
         """
         if self._closing is not None and self._closing.is_set():
             return False
         message = json.dumps({"command_id": self.command_id, **payload})
-        try:
-            self._outbox.put_nowait(message)
-        except queue.Full:
-            logger.warning(
-                "Agent session outbox is full; dropping %s frame for command %s",
-                payload.get("type"),
-                self.command_id,
-            )
-            return False
-        return True
+        coalesce_key = (
+            (self.command_id, payload.get("job_id"))
+            if payload.get("type") == "progress"
+            else None
+        )
+        return self._outbox.put(message, coalesce_key=coalesce_key, block=block)
 
     def _ensure_started(self, job_id: int) -> None:
         if not self.started:
@@ -295,6 +579,7 @@ class AgentSessionRuntime:
         # wraps one requests.Session).
         self._http_lock = threading.Lock()
         self._registry_lock = threading.Lock()
+        self._idle_timeout: float = OUTBOX_POLL_SECONDS
         self._cancel_events: dict[int, threading.Event] = {}
         self._pending_cancels: set[int] = set()
 
@@ -324,74 +609,119 @@ class AgentSessionRuntime:
             backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
 
     def run_session(self, *, max_messages: Optional[int] = None) -> None:
-        """Open a session and dispatch each server command to a worker thread.
+        """Open a session and dispatch each server command to a worker pool.
 
         **Single-writer invariant: this thread is the only one that ever touches
-        the socket.** Worker threads hand outgoing frames to ``outbox`` and this
-        loop drains them between ``recv()`` calls. The socket may be a TLS
-        connection (``wss://``), and an ``ssl.SSLSocket`` is not thread-safe:
-        websocket-client guards send and recv with two *different* locks, so a
-        worker sending while this loop reads corrupts the OpenSSL state and the
-        session dies mid-write. A single lock over both is not an option either —
-        the blocking ``recv()`` would lock every sender out.
-
-        The loop also stays in ``recv()`` while a job runs, so websocket-client
-        keeps auto-ponging the server's keepalive pings and the session survives
-        long backups and checks.
+        the socket.** Worker threads hand outgoing frames to the outbox and this
+        loop writes them. The socket may be a TLS connection (``wss://``), and an
+        ``ssl.SSLSocket`` is not thread-safe: websocket-client guards send and
+        recv with two *different* locks, so a worker sending while this loop
+        reads corrupts the OpenSSL state and the session dies mid-write. A
+        single lock over both is not an option either — a blocking ``recv()``
+        would lock every sender out.
+
+        So the loop never blocks in ``recv()``: it waits on the socket and a
+        wakeup pipe together, writes queued frames as soon as a worker queues
+        them, and only reads once a frame is actually arriving. Pings are
+        answered as they are read, so the session survives long backups and
+        checks. Connections without a file descriptor fall back to polling
+        ``recv()`` every ``OUTBOX_POLL_SECONDS``.
+
+        Commands run on bounded per-kind worker pools (``COMMAND_POOL_LIMITS``)
+        and are acknowledged as soon as they arrive, even if they have to
+        queue for a free worker.
         """
         socket = self.connect(
             _session_url(self.config.server_url),
             header=[f"{AGENT_AUTH_HEADER}: Bearer {self.config.agent_token}"],
             timeout=self.timeout_seconds,
         )
-        # The connect timeout covers the TCP/TLS handshake; once established the
-        # loop wants a short recv timeout so queued frames are not held back.
-        self._set_socket_timeout(socket, OUTBOX_POLL_SECONDS)
-        outbox: "queue.Queue[str]" = queue.Queue(maxsize=OUTBOX_MAX_FRAMES)
-        workers: list[threading.Thread] = []
+        raw_socket = _selectable_socket(socket)
+        waker = _Waker() if raw_socket is not None else None
+        # The connect timeout covers the TCP/TLS handshake. An event-driven
+        # session only reads once data is arriving, so reads keep the full
+        # timeout; a polling session needs a short one so queued frames are
+        # not held back.
+        self._idle_timeout = (
+            self.timeout_seconds if waker is not None else OUTBOX_POLL_SECONDS
+        )
+        self._set_socket_timeout(socket, self._idle_timeout)
+        outbox = SessionOutbox(wake=waker.wake if waker is not None else None)
         # Per-session guard: once set, in-flight workers stop queueing frames
         # that this loop will never get to deliver.
         closing = threading.Event()
+        pools = {
+            kind: _CommandPool(kind, limit, self._run_command)
+            for kind, limit in COMMAND_POOL_LIMITS.items()
+        }
+        selector = None
         clean_exit = False
         try:
             self._send_hello(socket)
+            if waker is not None:
+                selector = selectors.DefaultSelector()
+                selector.register(waker, selectors.EVENT_READ, "wake")
+                selector.register(raw_socket, selectors.EVENT_READ, "socket")
             handled = 0
             last_keepalive_at = None
             while max_messages is None or handled < max_messages:
                 self._flush_outbox(socket, outbox)
-                try:
-                    raw_message = socket.recv()
-                except (TimeoutError, WebSocketTimeoutException):
+                if selector is not None:
+                    if last_keepalive_at is None:
+                        last_keepalive_at = time.monotonic()
+                    readable = _has_buffered_input(socket)
+                    if not readable:
+                        wait = last_keepalive_at + KEEPALIVE_INTERVAL_SECONDS
+                        events = selector.select(max(0.0, wait - time.monotonic()))
+                        for key, _mask in events:
+                            if key.data == "wake":
+                                waker.clear()
+                            else:
+                                readable = True
                     now = time.monotonic()
-                    if (
-                        last_keepalive_at is None
-                        or now - last_keepalive_at >= KEEPALIVE_INTERVAL_SECONDS
-                    ):
+                    if now - last_keepalive_at >= KEEPALIVE_INTERVAL_SECONDS:
                         last_keepalive_at = now
                         self._send_keepalive(socket)
-                    continue
+                    if not readable:
+                        continue
+                    raw_message = _recv_message(socket)
+                    if raw_message is None:
+                        continue
+                else:
+                    try:
+                        raw_message = socket.recv()
+                    except (TimeoutError, WebSocketTimeoutException):
+                        now = time.monotonic()
+                        if (
+                            last_keepalive_at is None
+                            or now - last_keepalive_at >= KEEPALIVE_INTERVAL_SECONDS
+                        ):
+                            last_keepalive_at = now
+                            self._send_keepalive(socket)
+                        continue
                 message = json.loads(raw_message)
                 if isinstance(message, dict) and message.get("type") == "command":
-                    worker = threading.Thread(
-                        target=self._handle_command,
-                        args=(outbox, message, closing),
-                        daemon=True,
-                    )
-                    worker.start()
-                    workers.append(worker)
-                    workers = [w for w in workers if w.is_alive()]
+                    self._accept_command(message, outbox, closing, pools)
                 handled += 1
             clean_exit = True
         finally:
             if clean_exit:
-                # Orderly shutdown (e.g. max_messages reached): let in-flight jobs
-                # finish, then flush what they queued before the socket closes.
-                for worker in workers:
-                    worker.join()
+                # Orderly shutdown (e.g. max_messages reached): let queued and
+                # in-flight commands finish, then flush what they queued before
+                # the socket closes. Keep writing while waiting -- a worker
+                # blocked on a full outbox only finishes once it is drained.
                 try:
+                    for pool in pools.values():
+                        while not pool.join(timeout=SHUTDOWN_FLUSH_SECONDS):
+                            self._flush_outbox(socket, outbox)
+                        pool.close()
                     self._flush_outbox(socket, outbox)
                 except Exception:
-                    pass
+                    # The socket failed mid-flush: stop queueing and release
+                    # the workers; outbox.close() below unblocks their puts.
+                    closing.set()
+                    for pool in pools.values():
+                        pool.close()
             else:
                 # The session dropped. Suppress any further frames, signal
                 # cancellation, and return *without* joining -- so run_forever
@@ -401,6 +731,20 @@ class AgentSessionRuntime:
                 with self._registry_lock:
                     for event in self._cancel_events.values():
                         event.set()
+                discarded = [
+                    queued for pool in pools.values() for queued in pool.close()
+                ]
+                if discarded:
+                    threading.Thread(
+                        target=self._fail_unstarted_commands,
+                        args=(discarded,),
+                        daemon=True,
+                    ).start()
+            outbox.close()
+            if selector is not None:
+                selector.close()
+            if waker is not None:
+                waker.close()
             try:
                 socket.close()
             except Exception:
@@ -409,7 +753,7 @@ class AgentSessionRuntime:
     @contextmanager
     def _writing(self, socket):
         """Raise the socket timeout to the full session timeout for the duration
-        of a write, then drop back to the recv poll interval.
+        of a write, then drop back to the idle read timeout.
 
         ``settimeout`` bounds writes as well as reads, so every write has to run
         under it: a frame can be hundreds of KB, and on a slow link the poll
@@ -420,23 +764,18 @@ class AgentSessionRuntime:
         try:
             yield
         finally:
-            self._set_socket_timeout(socket, OUTBOX_POLL_SECONDS)
+            self._set_socket_timeout(socket, self._idle_timeout)
 
-    def _flush_outbox(self, socket, outbox: "queue.Queue[str]") -> None:
+    def _flush_outbox(self, socket, outbox: SessionOutbox) -> None:
         """Write every queued worker frame. Session thread only — see the
         single-writer invariant on run_session. A failing write propagates so
         the loop tears the session down and run_forever reconnects."""
-        try:
-            message = outbox.get_nowait()
-        except queue.Empty:
+        frames = outbox.drain()
+        if not frames:
             return
         with self._writing(socket):
-            while True:
+            for message in frames:
                 socket.send(message)
-                try:
-                    message = outbox.get_nowait()
-                except queue.Empty:
-                    return
 
     @staticmethod
     def _set_socket_timeout(socket, timeout_seconds: float) -> None:
@@ -476,16 +815,17 @@ class AgentSessionRuntime:
         with self._writing(socket):
             socket.send(message)
 
-    def _handle_command(
+    def _accept_command(
         self,
-        outbox: "queue.Queue[str]",
         message: dict[str, Any],
-        closing: Optional[threading.Event] = None,
+        outbox: SessionOutbox,
+        closing: threading.Event,
+        pools: dict[str, "_CommandPool"],
     ) -> None:
-        """Handle one server command (runs in a worker thread): ack it, then run
-        the matching handler with cooperative cancellation wired in. Outgoing
-        frames go to ``outbox`` for the session thread to write; ``closing``
-        suppresses them once the owning session has been torn down."""
+        """Acknowledge one server command and queue it on its worker pool
+        (session thread). Outgoing frames go to ``outbox`` for the session
+        thread to write; ``closing`` suppresses them once the owning session
+        has been torn down."""
         command_id = str(message.get("command_id") or "")
         command = str(message.get("command") or "")
         raw_job_id = message.get("job_id")
@@ -503,7 +843,40 @@ class AgentSessionRuntime:
             http_lock=self._http_lock,
         )
 
-        client.enqueue({"type": "command_ack", "job_id": job_id})
+        # Session thread: never wait on the outbox this thread has to drain.
+        client.enqueue({"type": "command_ack", "job_id": job_id}, block=False)
+
+        if command == "cancel" and job_id is not None:
+            # Signal the target straight away: its worker may be busy, or the
+            # target may still be queued, and either way must not wait for a
+            # free worker to learn about the cancel.
+            self._signal_cancel(job_id)
+
+        pools[_command_kind(command)].submit((client, command, payload))
+
+    def _fail_unstarted_commands(
+        self, queued: list[tuple["SessionCommandClient", str, dict[str, Any]]]
+    ) -> None:
+        """Report persisted jobs that were still queued when the session dropped,
+        so they fail now instead of waiting for the server-side reaper."""
+        for client, command, _payload in queued:
+            if client.job_id is None:
+                continue
+            client.fail_job(
+                client.job_id,
+                error_message=(
+                    f"{command} was not started: agent session closed while it "
+                    "was queued"
+                ),
+            )
+
+    def _run_command(
+        self, queued: tuple["SessionCommandClient", str, dict[str, Any]]
+    ) -> None:
+        """Run one acknowledged command (worker thread): the matching handler
+        with cooperative cancellation wired in."""
+        client, command, payload = queued
+        job_id = client.job_id
 
         if command == "filesystem.browse":
             self._handle_filesystem_browse(client, payload)
@@ -522,15 +895,15 @@ class AgentSessionRuntime:
             return
 
         if command == "cancel":
-            # Signal the worker running this job so it actually stops; it emits
-            # its own job_canceled as it unwinds. Also record the cancel here via
-            # the cancel path (idempotent /cancel) so the outcome is captured even
-            # if no worker is running. NOT send_result — that routes through
-            # complete_job and would wrongly finalize the target job as completed,
-            # racing the worker's cancel. The server dispatches cancel
-            # fire-and-forget (wait_for_result=False), so no response is expected.
+            # The target was already signalled on receipt (see _accept_command);
+            # it emits its own job_canceled as it unwinds. Also record the cancel
+            # here via the cancel path (idempotent /cancel) so the outcome is
+            # captured even if no worker is running. NOT send_result — that
+            # routes through complete_job and would wrongly finalize the target
+            # job as completed, racing the worker's cancel. The server dispatches
+            # cancel fire-and-forget (wait_for_result=False), so no response is
+            # expected.
             if job_id is not None:
-                self._signal_cancel(job_id)
                 client.cancel_job(job_id)
             return
 
@@ -620,8 +993,14 @@ class AgentSessionRuntime:
         path = str(payload.get("path") or "/")
         include_hidden = bool(payload.get("include_hidden", False))
         max_items = int(payload.get("max_items") or 0)
+        # Paging arguments are only sent by servers that page agent listings
+        page = {
+            name: payload[name]
+            for name in ("limit", "cursor", "name_filter")
+            if payload.get(name) is not None
+        }
         try:
-            result = browse_filesystem(path, include_hidden=include_hidden)
+            result = browse_filesystem(path, include_hidden=include_hidden, **page)
         except FilesystemBrowseError as exc:
             client.send_result(exc.to_result())
             return
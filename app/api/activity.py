@@ -4,9 +4,10 @@ Activity feed API endpoints.
 Provides a unified view of all operations (backups, restores, checks, compacts, package installs).
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, joinedload
 from typing import Any, List, Optional
 from datetime import datetime
 from pydantic import BaseModel
@@ -35,15 +36,25 @@ from app.database.models import (
     ScriptExecution,
 )
 from app.api.auth import get_current_user, User
-from app.core.security import get_current_download_user
+from app.core.security import get_current_download_user, get_repository_permissions
 from app.utils.datetime_utils import serialize_datetime
+from app.services.activity_feed import (
+    ACTIVITY_SOURCES_BY_KEY,
+    RCLONE_ACTIVITY_OPERATIONS,
+    ActivityRow,
+    InvalidActivityCursor,
+    select_activity_page,
+)
 from app.services.backup_service import backup_service
+from app.services.change_versions import conditional_etag
 from app.services.log_policy import get_log_save_policy, job_has_logs_by_policy
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/api/activity", tags=["activity"])
 
+MAX_ACTIVITY_PAGE_SIZE = 1000
+
 
 def _get_agent_job_for_backup(db: Session, backup_job_id: int) -> Optional[AgentJob]:
     return (
@@ -184,12 +195,6 @@ def _format_running_agent_script_logs(execution: ScriptExecution, db: Session) -
     return "\n".join(lines)
 
 
-RCLONE_ACTIVITY_OPERATIONS = {
-    "rclone_sync": "sync",
-    "rclone_hydrate": "hydrate",
-}
-
-
 def _no_logs_available_exception() -> HTTPException:
     return HTTPException(
         status_code=404,
@@ -309,560 +314,445 @@ def _text_download_response(log_text: str, *, filename: str) -> FileResponse:
         raise e
 
 
-@router.get("/recent", response_model=List[ActivityItem])
-async def list_recent_activity(
-    limit: int = 200,
-    job_type: Optional[str] = None,  # Filter by type: 'backup', 'restore', etc.
-    status: Optional[str] = None,  # Filter by status: 'running', 'completed', 'failed'
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """
-    Get recent activity across all job types.
+class ActivityFeedPage(BaseModel):
+    items: List[ActivityItem]
+    next_cursor: Optional[str] = None  # Cursor of the next page, if any
 
-    Returns a unified list of all operations sorted by start time (most recent first).
-    Excludes the logs column for performance - use the logs endpoint to fetch logs.
-    """
 
-    activities = []
-    log_save_policy = get_log_save_policy(db)
+def _trigger_from_flag(flag: Optional[bool]) -> str:
+    return "schedule" if flag else "manual"
 
-    # Fetch backup jobs
-    if not job_type or job_type == "backup":
-        backup_jobs = (
-            db.query(BackupJob).order_by(BackupJob.started_at.desc()).limit(limit).all()
-        )
-        for job in backup_jobs:
-            if status and job.status != status:
-                continue
-            # Get repository name from path
-            repo = (
-                db.query(Repository).filter(Repository.path == job.repository).first()
+
+def _repository_labels(repo: Optional[Repository], job) -> tuple[str, Optional[str]]:
+    """Display name and path of an id-linked job's repository."""
+    if repo:
+        return repo.name, repo.path
+    return f"Repository #{job.repository_id}", getattr(job, "repository_path", None)
+
+
+def _load_activity_rows(db: Session, rows: list[ActivityRow]) -> dict[str, dict]:
+    """Jobs of a feed page grouped by source, one query per source."""
+    ids_by_source: dict[str, list[int]] = {}
+    for row in rows:
+        ids_by_source.setdefault(row.source, []).append(row.id)
+    loaded = {}
+    for source_key, ids in ids_by_source.items():
+        model = ACTIVITY_SOURCES_BY_KEY[source_key].model
+        query = db.query(model).filter(model.id.in_(ids))
+        if model is ScriptExecution:
+            query = query.options(
+                joinedload(ScriptExecution.script),
+                joinedload(ScriptExecution.repository),
+                joinedload(ScriptExecution.backup_plan),
+            )
+        loaded[source_key] = {job.id: job for job in query.all()}
+    return loaded
+
+
+def _by_id(db: Session, model, ids: set) -> dict:
+    ids.discard(None)
+    if not ids:
+        return {}
+    return {item.id: item for item in db.query(model).filter(model.id.in_(ids))}
+
+
+def _serialize_activity_page(
+    db: Session, rows: list[ActivityRow], log_save_policy: str
+) -> list[dict]:
+    loaded = _load_activity_rows(db, rows)
+    jobs = [job for by_id in loaded.values() for job in by_id.values()]
+
+    # Resolve the page's repositories, schedules, plans and packages in bulk
+    repository_ids = {getattr(job, "repository_id", None) for job in jobs}
+    repository_paths = {
+        job.repository
+        for key in ("backup", "restore")
+        for job in loaded.get(key, {}).values()
+        if job.repository
+    }
+    repository_ids.discard(None)
+    repositories = (
+        db.query(Repository)
+        .filter(
+            or_(
+                Repository.id.in_(repository_ids),
+                Repository.path.in_(repository_paths),
             )
-            repo_name = repo.name if repo else job.repository
+        )
+        .all()
+        if repository_ids or repository_paths
+        else []
+    )
+    repositories_by_id = {repo.id: repo for repo in repositories}
+    repositories_by_path = {repo.path: repo for repo in repositories}
+    schedules = _by_id(
+        db,
+        ScheduledJob,
+        {job.scheduled_job_id for job in loaded.get("backup", {}).values()}
+        | {skip.scheduled_job_id for skip in loaded.get("schedule_skip", {}).values()},
+    )
+    plans = _by_id(
+        db,
+        BackupPlan,
+        {job.backup_plan_id for job in loaded.get("backup", {}).values()}
+        | {run.backup_plan_id for run in loaded.get("backup_plan_skip", {}).values()},
+    )
+    packages = _by_id(
+        db,
+        InstalledPackage,
+        {job.package_id for job in loaded.get("package", {}).values()},
+    )
 
-            # Determine trigger type
-            triggered_by = (
+    def backup(job: BackupJob) -> dict:
+        repo = repositories_by_path.get(job.repository)
+        schedule = schedules.get(job.scheduled_job_id)
+        plan = plans.get(job.backup_plan_id)
+        return {
+            "id": job.id,
+            "type": "backup",
+            "status": job.status,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "error_message": job.error_message,
+            "repository": repo.name if repo else job.repository,
+            "repository_path": job.repository,  # Always include the path
+            "log_file_path": job.log_file_path,
+            "triggered_by": (
                 "backup_plan"
                 if job.backup_plan_id
                 else "schedule"
                 if job.scheduled_job_id
                 else "manual"
-            )
-
-            # Get schedule name if this is a scheduled backup
-            schedule_name = None
-            if job.scheduled_job_id:
-                scheduled_job = (
-                    db.query(ScheduledJob)
-                    .filter(ScheduledJob.id == job.scheduled_job_id)
-                    .first()
-                )
-                if scheduled_job:
-                    schedule_name = scheduled_job.name
-            backup_plan_name = None
-            if job.backup_plan_id:
-                backup_plan = (
-                    db.query(BackupPlan)
-                    .filter(BackupPlan.id == job.backup_plan_id)
-                    .first()
-                )
-                if backup_plan:
-                    backup_plan_name = backup_plan.name
-
-            activities.append(
-                {
-                    "id": job.id,
-                    "type": "backup",
-                    "status": job.status,
-                    "started_at": job.started_at,
-                    "completed_at": job.completed_at,
-                    "error_message": job.error_message,
-                    "repository": repo_name,
-                    "repository_path": job.repository,  # Always include the path
-                    "log_file_path": job.log_file_path,
-                    "triggered_by": triggered_by,
-                    "schedule_id": job.scheduled_job_id,
-                    "schedule_name": schedule_name,
-                    "backup_plan_id": job.backup_plan_id,
-                    "backup_plan_run_id": job.backup_plan_run_id,
-                    "backup_plan_name": backup_plan_name,
-                    "archive_name": getattr(job, "archive_name", None),
-                    "package_name": None,
-                    "has_logs": job_has_logs_by_policy(
-                        job,
-                        log_save_policy,
-                        output_text=[job.logs, job.error_message],
-                        file_path=job.log_file_path,
-                    ),
-                }
-            )
+            ),
+            "schedule_id": job.scheduled_job_id,
+            "schedule_name": schedule.name if schedule else None,
+            "backup_plan_id": job.backup_plan_id,
+            "backup_plan_run_id": job.backup_plan_run_id,
+            "backup_plan_name": plan.name if plan else None,
+            "archive_name": getattr(job, "archive_name", None),
+            "package_name": None,
+            "has_logs": job_has_logs_by_policy(
+                job,
+                log_save_policy,
+                output_text=[job.logs, job.error_message],
+                file_path=job.log_file_path,
+            ),
+        }
 
-    # Availability Plan skips are plan-run records, not BackupJobs: Borg was never
-    # invoked, so they must be added independently to Activity.
-    if not job_type or job_type == "availability_check":
-        plan_skips = (
-            db.query(BackupPlanRun)
-            .filter(
-                BackupPlanRun.status == "skipped",
-                BackupPlanRun.trigger == "availability",
-            )
-            .order_by(BackupPlanRun.completed_at.desc(), BackupPlanRun.id.desc())
-            .limit(limit)
-            .all()
-        )
-        for run in plan_skips:
-            if status and status != "skipped":
-                continue
-            plan = (
-                db.get(BackupPlan, run.backup_plan_id) if run.backup_plan_id else None
-            )
-            activities.append(
-                {
-                    "activity_key": f"backup-plan-run-{run.id}",
-                    "id": run.id,
-                    "type": "availability_check",
-                    "status": "skipped",
-                    "started_at": run.started_at,
-                    "completed_at": run.completed_at,
-                    "error_message": run.error_message,
-                    "repository": plan.name if plan else "Backup plan",
-                    "repository_path": None,
-                    "log_file_path": None,
-                    "triggered_by": "backup_plan",
-                    "backup_plan_id": run.backup_plan_id,
-                    "backup_plan_run_id": run.id,
-                    "backup_plan_name": plan.name if plan else None,
-                    "skip_reason": run.skip_reason,
-                    "has_logs": False,
-                    "_sort_at": run.completed_at or run.created_at,
-                }
-            )
+    def backup_plan_skip(run: BackupPlanRun) -> dict:
+        plan = plans.get(run.backup_plan_id)
+        return {
+            "activity_key": f"backup-plan-run-{run.id}",
+            "id": run.id,
+            "type": "availability_check",
+            "status": "skipped",
+            "started_at": run.started_at,
+            "completed_at": run.completed_at,
+            "error_message": run.error_message,
+            "repository": plan.name if plan else "Backup plan",
+            "repository_path": None,
+            "log_file_path": None,
+            "triggered_by": "backup_plan",
+            "backup_plan_id": run.backup_plan_id,
+            "backup_plan_run_id": run.id,
+            "backup_plan_name": plan.name if plan else None,
+            "skip_reason": run.skip_reason,
+            "has_logs": False,
+        }
 
-        automation_skips = (
-            db.query(AvailabilityScheduleSkip)
-            .order_by(
-                AvailabilityScheduleSkip.occurred_at.desc(),
-                AvailabilityScheduleSkip.id.desc(),
-            )
-            .limit(limit)
-            .all()
-        )
-        for skip in automation_skips:
-            if status and status != "skipped":
-                continue
-            schedule = db.get(ScheduledJob, skip.scheduled_job_id)
-            activities.append(
-                {
-                    "activity_key": f"availability-schedule-skip-{skip.id}",
-                    "id": skip.id,
-                    "type": "availability_check",
-                    "status": "skipped",
-                    "started_at": skip.occurred_at,
-                    "completed_at": skip.occurred_at,
-                    "error_message": None,
-                    "repository": schedule.name if schedule else "Backup automation",
-                    "repository_path": None,
-                    "log_file_path": None,
-                    "triggered_by": "schedule",
-                    "schedule_id": skip.scheduled_job_id,
-                    "schedule_name": schedule.name if schedule else None,
-                    "skip_reason": skip.reason,
-                    "has_logs": False,
-                    "_sort_at": skip.occurred_at,
-                }
-            )
+    def schedule_skip(skip: AvailabilityScheduleSkip) -> dict:
+        schedule = schedules.get(skip.scheduled_job_id)
+        return {
+            "activity_key": f"availability-schedule-skip-{skip.id}",
+            "id": skip.id,
+            "type": "availability_check",
+            "status": "skipped",
+            "started_at": skip.occurred_at,
+            "completed_at": skip.occurred_at,
+            "error_message": None,
+            "repository": schedule.name if schedule else "Backup automation",
+            "repository_path": None,
+            "log_file_path": None,
+            "triggered_by": "schedule",
+            "schedule_id": skip.scheduled_job_id,
+            "schedule_name": schedule.name if schedule else None,
+            "skip_reason": skip.reason,
+            "has_logs": False,
+        }
 
-    # Fetch restore jobs
-    if not job_type or job_type == "restore":
-        restore_jobs = (
-            db.query(RestoreJob)
-            .order_by(RestoreJob.started_at.desc())
-            .limit(limit)
-            .all()
-        )
-        for job in restore_jobs:
-            if status and job.status != status:
-                continue
-            # Get repository name from path
-            repo = (
-                db.query(Repository).filter(Repository.path == job.repository).first()
-            )
-            repo_name = repo.name if repo else job.repository
-
-            activities.append(
-                {
-                    "id": job.id,
-                    "type": "restore",
-                    "status": job.status,
-                    "started_at": job.started_at,
-                    "completed_at": job.completed_at,
-                    "error_message": job.error_message,
-                    "repository": repo_name,
-                    "repository_path": job.repository,  # Always include the path
-                    "log_file_path": None,  # Restore jobs store logs in DB, not file
-                    "triggered_by": "manual",  # Restore jobs are always manual
-                    "schedule_id": None,
-                    "archive_name": job.archive,
-                    "package_name": None,
-                    "has_logs": job_has_logs_by_policy(
-                        job,
-                        log_save_policy,
-                        output_text=[job.logs, job.error_message],
-                    ),
-                }
-            )
+    def restore(job: RestoreJob) -> dict:
+        repo = repositories_by_path.get(job.repository)
+        return {
+            "id": job.id,
+            "type": "restore",
+            "status": job.status,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "error_message": job.error_message,
+            "repository": repo.name if repo else job.repository,
+            "repository_path": job.repository,  # Always include the path
+            "log_file_path": None,  # Restore jobs store logs in DB, not file
+            "triggered_by": "manual",  # Restore jobs are always manual
+            "schedule_id": None,
+            "archive_name": job.archive,
+            "package_name": None,
+            "has_logs": job_has_logs_by_policy(
+                job,
+                log_save_policy,
+                output_text=[job.logs, job.error_message],
+            ),
+        }
 
-    # Fetch check jobs
-    if not job_type or job_type == "check":
-        check_jobs = db.query(CheckJob).order_by(CheckJob.id.desc()).limit(limit).all()
-        for job in check_jobs:
-            if status and job.status != status:
-                continue
-            # Get repository name from repository_id, with fallback to stored path
-            repo = (
-                db.query(Repository).filter(Repository.id == job.repository_id).first()
-            )
-            repo_name = repo.name if repo else f"Repository #{job.repository_id}"
-            repo_path = repo.path if repo else job.repository_path
-            triggered_by = (
-                "schedule" if getattr(job, "scheduled_check", False) else "manual"
+    def maintenance(activity_type: str, scheduled_flag: str, archive_name=None):
+        def serialize(job) -> dict:
+            repo_name, repo_path = _repository_labels(
+                repositories_by_id.get(job.repository_id), job
             )
+            log_file_path = getattr(job, "log_file_path", None)
+            return {
+                "id": job.id,
+                "type": activity_type,
+                "status": job.status,
+                "started_at": job.started_at,
+                "completed_at": job.completed_at,
+                "error_message": job.error_message,
+                "repository": repo_name,
+                "repository_path": repo_path,
+                "log_file_path": log_file_path,
+                "triggered_by": _trigger_from_flag(getattr(job, scheduled_flag, False)),
+                "schedule_id": None,
+                "archive_name": archive_name(job) if archive_name else None,
+                "package_name": None,
+                "has_logs": job_has_logs_by_policy(
+                    job,
+                    log_save_policy,
+                    output_text=[getattr(job, "logs", None), job.error_message],
+                    file_path=log_file_path,
+                ),
+            }
 
-            activities.append(
-                {
-                    "id": job.id,
-                    "type": "check",
-                    "status": job.status,
-                    "started_at": job.started_at,
-                    "completed_at": job.completed_at,
-                    "error_message": job.error_message,
-                    "repository": repo_name,
-                    "repository_path": repo_path,
-                    "log_file_path": getattr(job, "log_file_path", None),
-                    "triggered_by": triggered_by,
-                    "schedule_id": None,
-                    "archive_name": None,
-                    "package_name": None,
-                    "has_logs": job_has_logs_by_policy(
-                        job,
-                        log_save_policy,
-                        output_text=[
-                            getattr(job, "logs", None),
-                            job.error_message,
-                        ],
-                        file_path=getattr(job, "log_file_path", None),
-                    ),
-                    "_sort_at": job.started_at or job.created_at,
-                }
-            )
+        return serialize
 
-    # Fetch restore check jobs
-    if not job_type or job_type == "restore_check":
-        restore_check_jobs = (
-            db.query(RestoreCheckJob)
-            .order_by(RestoreCheckJob.id.desc())
-            .limit(limit)
-            .all()
-        )
-        for job in restore_check_jobs:
-            if status and job.status != status:
-                continue
-            repo = (
-                db.query(Repository).filter(Repository.id == job.repository_id).first()
-            )
-            repo_name = repo.name if repo else f"Repository #{job.repository_id}"
-            repo_path = repo.path if repo else job.repository_path
-            triggered_by = (
-                "schedule"
-                if getattr(job, "scheduled_restore_check", False)
-                else "manual"
-            )
+    def package(job: PackageInstallJob) -> dict:
+        installed = packages.get(job.package_id)
+        return {
+            "id": job.id,
+            "type": "package",
+            "status": job.status,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "error_message": job.error_message,
+            "repository": None,
+            "log_file_path": getattr(job, "log_file_path", None),
+            "triggered_by": "manual",  # Package jobs are always manual
+            "schedule_id": None,
+            "archive_name": None,
+            "package_name": (
+                installed.name if installed else f"Package #{job.package_id}"
+            ),
+            "has_logs": job_has_logs_by_policy(
+                job,
+                log_save_policy,
+                output_text=[
+                    getattr(job, "stdout", None),
+                    getattr(job, "stderr", None),
+                    job.error_message,
+                ],
+                file_path=getattr(job, "log_file_path", None),
+            ),
+        }
 
-            activities.append(
-                {
-                    "id": job.id,
-                    "type": "restore_check",
-                    "status": job.status,
-                    "started_at": job.started_at,
-                    "completed_at": job.completed_at,
-                    "error_message": job.error_message,
-                    "repository": repo_name,
-                    "repository_path": repo_path,
-                    "log_file_path": getattr(job, "log_file_path", None),
-                    "triggered_by": triggered_by,
-                    "schedule_id": None,
-                    "archive_name": job.archive_name,
-                    "package_name": None,
-                    "has_logs": job_has_logs_by_policy(
-                        job,
-                        log_save_policy,
-                        output_text=[
-                            getattr(job, "logs", None),
-                            job.error_message,
-                        ],
-                        file_path=getattr(job, "log_file_path", None),
-                    ),
-                    "_sort_at": job.started_at or job.created_at,
-                }
-            )
+    def script_execution(execution: ScriptExecution) -> dict:
+        script_name = _script_execution_display_name(execution)
+        return {
+            "id": execution.id,
+            "type": "script_execution",
+            "status": execution.status,
+            "started_at": execution.started_at,
+            "completed_at": execution.completed_at,
+            "error_message": execution.error_message,
+            "repository": (
+                execution.repository.name if execution.repository else script_name
+            ),
+            "repository_path": (
+                execution.repository.path if execution.repository else None
+            ),
+            "log_file_path": None,
+            "triggered_by": execution.triggered_by or "manual",
+            "schedule_id": None,
+            "schedule_name": None,
+            "backup_plan_id": execution.backup_plan_id,
+            "backup_plan_run_id": execution.backup_plan_run_id,
+            "backup_plan_name": (
+                execution.backup_plan.name if execution.backup_plan else None
+            ),
+            "archive_name": execution.hook_type,
+            "package_name": script_name,
+            "has_logs": job_has_logs_by_policy(
+                execution,
+                log_save_policy,
+                output_text=[
+                    execution.stdout,
+                    execution.stderr,
+                    execution.error_message,
+                ],
+                exit_code=execution.exit_code,
+            ),
+        }
 
-    # Fetch compact jobs
-    if not job_type or job_type == "compact":
-        compact_jobs = (
-            db.query(CompactJob)
-            .order_by(CompactJob.started_at.desc())
-            .limit(limit)
-            .all()
-        )
-        for job in compact_jobs:
-            if status and job.status != status:
-                continue
-            # Get repository name from repository_id, with fallback to stored path
-            repo = (
-                db.query(Repository).filter(Repository.id == job.repository_id).first()
-            )
-            repo_name = repo.name if repo else f"Repository #{job.repository_id}"
-            repo_path = repo.path if repo else job.repository_path
+    def rclone(job: RcloneSyncJob) -> dict:
+        repo = repositories_by_id.get(job.repository_id)
+        return {
+            "id": job.id,
+            "type": "rclone_hydrate" if job.operation == "hydrate" else "rclone_sync",
+            "status": job.status,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "error_message": job.error_text,
+            "repository": repo.name if repo else f"Repository #{job.repository_id}",
+            "repository_path": repo.path if repo else None,
+            "log_file_path": job.log_path,
+            "triggered_by": job.triggered_by,
+            "schedule_id": None,
+            "archive_name": None,
+            "package_name": None,
+            "has_logs": job_has_logs_by_policy(
+                job,
+                log_save_policy,
+                output_text=[job.log_text, job.error_text],
+                file_path=job.log_path,
+            ),
+        }
 
-            # Determine trigger type based on scheduled_compact field
-            triggered_by = (
-                "schedule" if getattr(job, "scheduled_compact", False) else "manual"
-            )
+    serializers = {
+        "backup": backup,
+        "backup_plan_skip": backup_plan_skip,
+        "schedule_skip": schedule_skip,
+        "restore": restore,
+        "check": maintenance("check", "scheduled_check"),
+        "restore_check": maintenance(
+            "restore_check",
+            "scheduled_restore_check",
+            archive_name=lambda job: job.archive_name,
+        ),
+        "compact": maintenance("compact", "scheduled_compact"),
+        "prune": maintenance("prune", "scheduled_prune"),
+        "package": package,
+        "script_execution": script_execution,
+        "rclone": rclone,
+    }
+    activities = []
+    for row in rows:
+        job = loaded[row.source].get(row.id)
+        if job is not None:  # Deleted between the page query and the load
+            activities.append(serializers[row.source](job))
+    return activities
 
-            activities.append(
-                {
-                    "id": job.id,
-                    "type": "compact",
-                    "status": job.status,
-                    "started_at": job.started_at,
-                    "completed_at": job.completed_at,
-                    "error_message": job.error_message,
-                    "repository": repo_name,
-                    "repository_path": repo_path,
-                    "log_file_path": getattr(job, "log_file_path", None),
-                    "triggered_by": triggered_by,
-                    "schedule_id": None,
-                    "archive_name": None,
-                    "package_name": None,
-                    "has_logs": job_has_logs_by_policy(
-                        job,
-                        log_save_policy,
-                        output_text=[
-                            getattr(job, "logs", None),
-                            job.error_message,
-                        ],
-                        file_path=getattr(job, "log_file_path", None),
-                    ),
-                }
-            )
 
-    # Fetch prune jobs
-    if not job_type or job_type == "prune":
-        prune_jobs = (
-            db.query(PruneJob).order_by(PruneJob.started_at.desc()).limit(limit).all()
+def _activity_page(
+    db: Session,
+    current_user: User,
+    *,
+    limit: int,
+    cursor: Optional[str],
+    job_type: Optional[str],
+    status: Optional[str],
+    repository_id: Optional[int],
+) -> tuple[list[dict], Optional[str]]:
+    try:
+        rows, next_cursor = select_activity_page(
+            db,
+            limit=limit,
+            cursor=cursor,
+            job_type=job_type,
+            status=status,
+            repository_id=repository_id,
+            visible_repository_ids=get_repository_permissions(
+                db, current_user
+            ).repository_ids("viewer"),
         )
-        for job in prune_jobs:
-            if status and job.status != status:
-                continue
-            # Get repository name from repository_id, with fallback to stored path
-            repo = (
-                db.query(Repository).filter(Repository.id == job.repository_id).first()
-            )
-            repo_name = repo.name if repo else f"Repository #{job.repository_id}"
-            repo_path = repo.path if repo else job.repository_path
-
-            # Determine trigger type based on scheduled_prune field
-            triggered_by = (
-                "schedule" if getattr(job, "scheduled_prune", False) else "manual"
-            )
+    except InvalidActivityCursor:
+        raise HTTPException(
+            status_code=400,
+            detail={"key": "backend.errors.activity.invalidCursor"},
+        )
+    return _serialize_activity_page(db, rows, get_log_save_policy(db)), next_cursor
 
-            activities.append(
-                {
-                    "id": job.id,
-                    "type": "prune",
-                    "status": job.status,
-                    "started_at": job.started_at,
-                    "completed_at": job.completed_at,
-                    "error_message": job.error_message,
-                    "repository": repo_name,
-                    "repository_path": repo_path,
-                    "log_file_path": getattr(job, "log_file_path", None),
-                    "triggered_by": triggered_by,
-                    "schedule_id": None,
-                    "archive_name": None,
-                    "package_name": None,
-                    "has_logs": job_has_logs_by_policy(
-                        job,
-                        log_save_policy,
-                        output_text=[
-                            getattr(job, "logs", None),
-                            job.error_message,
-                        ],
-                        file_path=getattr(job, "log_file_path", None),
-                    ),
-                }
-            )
 
-    # Fetch package install jobs
-    if not job_type or job_type == "package":
-        package_jobs = (
-            db.query(PackageInstallJob)
-            .order_by(PackageInstallJob.started_at.desc())
-            .limit(limit)
-            .all()
-        )
-        for job in package_jobs:
-            if status and job.status != status:
-                continue
-            # Get package name from package_id
-            package = (
-                db.query(InstalledPackage)
-                .filter(InstalledPackage.id == job.package_id)
-                .first()
-            )
-            package_name = package.name if package else f"Package #{job.package_id}"
-
-            activities.append(
-                {
-                    "id": job.id,
-                    "type": "package",
-                    "status": job.status,
-                    "started_at": job.started_at,
-                    "completed_at": job.completed_at,
-                    "error_message": job.error_message,
-                    "repository": None,
-                    "log_file_path": getattr(job, "log_file_path", None),
-                    "triggered_by": "manual",  # Package jobs are always manual
-                    "schedule_id": None,
-                    "archive_name": None,
-                    "package_name": package_name,
-                    "has_logs": job_has_logs_by_policy(
-                        job,
-                        log_save_policy,
-                        output_text=[
-                            getattr(job, "stdout", None),
-                            getattr(job, "stderr", None),
-                            job.error_message,
-                        ],
-                        file_path=getattr(job, "log_file_path", None),
-                    ),
-                }
-            )
+_ACTIVITY_FAMILIES = (
+    "jobs",
+    "repositories",
+    "schedules",
+    "backup_plans",
+    "settings",
+    "permissions",
+)
 
-    # Fetch script executions
-    if not job_type or job_type == "script_execution":
-        script_executions = (
-            db.query(ScriptExecution)
-            .order_by(ScriptExecution.started_at.desc())
-            .limit(limit)
-            .all()
-        )
-        for execution in script_executions:
-            if status and execution.status != status:
-                continue
-            script_name = _script_execution_display_name(execution)
-            backup_plan_name = None
-            if execution.backup_plan:
-                backup_plan_name = execution.backup_plan.name
-            repo_name = (
-                execution.repository.name if execution.repository else script_name
-            )
-            repo_path = execution.repository.path if execution.repository else None
-            activities.append(
-                {
-                    "id": execution.id,
-                    "type": "script_execution",
-                    "status": execution.status,
-                    "started_at": execution.started_at,
-                    "completed_at": execution.completed_at,
-                    "error_message": execution.error_message,
-                    "repository": repo_name,
-                    "repository_path": repo_path,
-                    "log_file_path": None,
-                    "triggered_by": execution.triggered_by or "manual",
-                    "schedule_id": None,
-                    "schedule_name": None,
-                    "backup_plan_id": execution.backup_plan_id,
-                    "backup_plan_run_id": execution.backup_plan_run_id,
-                    "backup_plan_name": backup_plan_name,
-                    "archive_name": execution.hook_type,
-                    "package_name": script_name,
-                    "has_logs": job_has_logs_by_policy(
-                        execution,
-                        log_save_policy,
-                        output_text=[
-                            execution.stdout,
-                            execution.stderr,
-                            execution.error_message,
-                        ],
-                        exit_code=execution.exit_code,
-                    ),
-                    "_sort_at": execution.started_at,
-                }
-            )
 
-    if not job_type or job_type in RCLONE_ACTIVITY_OPERATIONS:
-        operations = (
-            [RCLONE_ACTIVITY_OPERATIONS[job_type]]
-            if job_type in RCLONE_ACTIVITY_OPERATIONS
-            else list(RCLONE_ACTIVITY_OPERATIONS.values())
-        )
-        rclone_jobs = (
-            db.query(RcloneSyncJob)
-            .filter(RcloneSyncJob.operation.in_(operations))
-            .order_by(RcloneSyncJob.id.desc())
-            .limit(limit)
-            .all()
-        )
-        for job in rclone_jobs:
-            if status and job.status != status:
-                continue
-            repo = (
-                db.query(Repository).filter(Repository.id == job.repository_id).first()
-            )
-            repo_name = repo.name if repo else f"Repository #{job.repository_id}"
-            repo_path = repo.path if repo else None
-            activity_type = (
-                "rclone_hydrate" if job.operation == "hydrate" else "rclone_sync"
-            )
-            activities.append(
-                {
-                    "id": job.id,
-                    "type": activity_type,
-                    "status": job.status,
-                    "started_at": job.started_at,
-                    "completed_at": job.completed_at,
-                    "error_message": job.error_text,
-                    "repository": repo_name,
-                    "repository_path": repo_path,
-                    "log_file_path": job.log_path,
-                    "triggered_by": job.triggered_by,
-                    "schedule_id": None,
-                    "archive_name": None,
-                    "package_name": None,
-                    "has_logs": job_has_logs_by_policy(
-                        job,
-                        log_save_policy,
-                        output_text=[job.log_text, job.error_text],
-                        file_path=job.log_path,
-                    ),
-                    "_sort_at": job.started_at or job.created_at,
-                }
-            )
+@router.get("/feed", response_model=ActivityFeedPage)
+async def list_activity_feed(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=MAX_ACTIVITY_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    job_type: Optional[str] = None,
+    status: Optional[str] = None,
+    repository_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Page through activity across all job types, most recent first.
 
-    # Sort by start time, falling back to creation time for pending jobs.
-    activities.sort(
-        key=lambda x: x.get("_sort_at") or x["started_at"] or datetime.min,
-        reverse=True,
+    Type, status and repository filters are applied before paging, and
+    ``next_cursor`` continues after the last item of this page.
+    """
+    not_modified = conditional_etag(request, response, _ACTIVITY_FAMILIES, current_user)
+    if not_modified:
+        return not_modified
+    items, next_cursor = _activity_page(
+        db,
+        current_user,
+        limit=limit,
+        cursor=cursor,
+        job_type=job_type,
+        status=status,
+        repository_id=repository_id,
     )
+    return {"items": items, "next_cursor": next_cursor}
 
-    # Apply limit to combined results
-    activities = activities[:limit]
-    for activity in activities:
-        activity.pop("_sort_at", None)
 
-    return activities
+@router.get("/recent", response_model=List[ActivityItem])
+async def list_recent_activity(
+    request: Request,
+    response: Response,
+    limit: int = Query(200, ge=1, le=MAX_ACTIVITY_PAGE_SIZE),
+    job_type: Optional[str] = None,  # Filter by type: 'backup', 'restore', etc.
+    status: Optional[str] = None,  # Filter by status: 'running', 'completed', 'failed'
+    repository_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Get recent activity across all job types.
+
+    Returns the first page of the activity feed as a plain list, sorted by
+    start time (most recent first). Excludes the logs column for performance -
+    use the logs endpoint to fetch logs.
+    """
+    not_modified = conditional_etag(request, response, _ACTIVITY_FAMILIES, current_user)
+    if not_modified:
+        return not_modified
+    items, _ = _activity_page(
+        db,
+        current_user,
+        limit=limit,
+        cursor=None,
+        job_type=job_type,
+        status=status,
+        repository_id=repository_id,
+    )
+    return items
 
 
 @router.get("/{job_type}/{job_id}/logs")
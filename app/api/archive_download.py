@@ -1,12 +1,52 @@
+import asyncio
 import os
+import re
 import shutil
 import tempfile
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+from urllib.parse import quote
 
+import structlog
 from fastapi import HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from starlette.background import BackgroundTask
 
+from app.services.cache_service import archive_cache
+
+logger = structlog.get_logger()
+
+# Bytes read from `borg extract --stdout` per chunk; also the subprocess pipe
+# buffer limit, so a slow client pauses borg instead of growing memory.
+STREAM_CHUNK_SIZE = 256 * 1024
+_STDERR_TAIL_BYTES = 16 * 1024
+_TERMINATE_GRACE_SECONDS = 5
+_BYTE_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class ArchiveStreamError(RuntimeError):
+    """Borg failed after the response headers were sent; aborts the body."""
+
+
+def _is_borg_error(returncode: Optional[int]) -> bool:
+    # 1 and 100-127 are warnings; negative codes are our own SIGTERM/SIGKILL.
+    return returncode is not None and returncode >= 2 and not 100 <= returncode <= 127
+
+
+def content_disposition_attachment(filename: str) -> str:
+    """Build a safe `Content-Disposition` for a user-controlled filename.
+
+    Escapes an ASCII fallback (dropping quotes/backslashes/control chars so the
+    header can't be broken or injected) and adds an RFC 5987 `filename*` UTF-8
+    variant so non-ASCII names survive.
+    """
+    ascii_name = filename.encode("ascii", "ignore").decode("ascii")
+    ascii_name = "".join(
+        ch for ch in ascii_name if ch.isprintable() and ch not in '"\\'
+    ).strip()
+    ascii_name = ascii_name or "download"
+    utf8_name = quote(filename, safe="")
+    return f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{utf8_name}"
+
 
 def resolve_extracted_file_path(temp_dir: str, file_path: str) -> str:
     temp_dir_realpath = os.path.realpath(temp_dir)
@@ -59,3 +99,261 @@ async def extract_file_download(
     except Exception:
         shutil.rmtree(temp_dir, ignore_errors=True)
         raise
+
+
+def cached_file_size(items: Optional[List[dict]], file_path: str) -> Optional[int]:
+    """Size of ``file_path`` in a cached archive listing, if it is a regular file.
+
+    Accepts both raw `borg list --json-lines` items (type ``-``) and browse
+    items (type ``file``). Returns None for directories, links and misses.
+    """
+    target = file_path.strip("/")
+    for item in items or ():
+        if not isinstance(item, dict) or (item.get("path") or "").strip("/") != target:
+            continue
+        size = item.get("size")
+        if item.get("type") in ("-", "file") and isinstance(size, int) and size >= 0:
+            return size
+        return None
+    return None
+
+
+async def lookup_cached_file_size(
+    repository_id: int, file_path: str, cache_keys: Iterable[str]
+) -> Optional[int]:
+    """Find the file's size in whichever archive listing is already cached."""
+    for cache_key in cache_keys:
+        try:
+            items = await archive_cache.get(repository_id, cache_key)
+        except Exception as exc:
+            logger.debug("Archive cache lookup failed", error=str(exc))
+            continue
+        size = cached_file_size(items, file_path)
+        if size is not None:
+            return size
+    return None
+
+
+def parse_byte_range(
+    range_header: Optional[str], size: int
+) -> Optional[Tuple[int, int]]:
+    """Parse a single-range ``Range: bytes=...`` header into ``(start, end)``.
+
+    ``end`` is inclusive. Returns None when the whole file should be sent:
+    no header, a syntax we don't serve (multiple ranges, other units) or an
+    empty file. Raises 416 for a range that lies outside the file.
+    """
+    if not range_header or size <= 0:
+        return None
+    match = _BYTE_RANGE_RE.match(range_header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        suffix = int(last)
+        if suffix == 0:
+            raise _range_not_satisfiable(size)
+        return max(0, size - suffix), size - 1
+
+    start = int(first)
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    if start >= size:
+        raise _range_not_satisfiable(size)
+    if end < start:
+        return None
+    return start, end
+
+
+def _range_not_satisfiable(size: int) -> HTTPException:
+    return HTTPException(
+        status_code=416,
+        detail={"key": "backend.errors.archives.rangeNotSatisfiable"},
+        headers={"Content-Range": f"bytes */{size}"},
+    )
+
+
+async def _drain_stderr(stream: asyncio.StreamReader, tail: bytearray) -> None:
+    while True:
+        chunk = await stream.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            return
+        tail.extend(chunk)
+        del tail[:-_STDERR_TAIL_BYTES]
+
+
+async def _stop_process(
+    process: asyncio.subprocess.Process, *, grace: float = 0
+) -> None:
+    """Reap borg, letting it exit on its own for ``grace`` seconds first.
+
+    SIGTERM before SIGKILL so borg can release its repository lock.
+    """
+    if process.returncode is None and grace:
+        try:
+            await asyncio.wait_for(process.wait(), grace)
+        except asyncio.TimeoutError:
+            pass
+    if process.returncode is None:
+        try:
+            process.terminate()
+        except ProcessLookupError:
+            pass
+        try:
+            await asyncio.wait_for(process.wait(), _TERMINATE_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+
+async def stream_extracted_file(
+    file_path: str,
+    size: Optional[int],
+    open_process: Callable[[], Awaitable[asyncio.subprocess.Process]],
+    *,
+    range_header: Optional[str] = None,
+    on_close: Optional[Callable[[], None]] = None,
+    on_empty: Optional[Callable[[], Awaitable[Response]]] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Response:
+    """Stream one file from `borg extract --stdout` without touching disk.
+
+    ``size`` comes from the cached archive listing and is sent as
+    Content-Length. Borg can't seek inside a file, so a Range request reads
+    and discards the bytes before ``start`` and kills borg once ``end`` has
+    been sent. ``on_close`` runs once the process is gone (e.g. to remove a
+    temporary SSH key), including when the client disconnects.
+
+    With ``size`` unknown the file is sent chunked and Range is not offered.
+    Borg writes nothing for a directory, so if it then exits cleanly without
+    output the response comes from ``on_empty`` instead.
+    """
+    headers = {
+        "Content-Disposition": content_disposition_attachment(
+            os.path.basename(file_path) or "download"
+        ),
+    }
+    status_code = status.HTTP_200_OK
+    if size is None:
+        start, end, length = 0, None, None
+        headers["Accept-Ranges"] = "none"
+    else:
+        byte_range = parse_byte_range(range_header, size)
+        start, end = byte_range if byte_range else (0, size - 1)
+        length = end - start + 1
+        headers["Accept-Ranges"] = "bytes"
+        headers["Content-Length"] = str(length)
+        if byte_range:
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    if length is not None and length <= 0:
+        if on_close:
+            on_close()
+        return Response(
+            content=b"",
+            status_code=status_code,
+            media_type="application/octet-stream",
+            headers=headers,
+        )
+
+    try:
+        process = await open_process()
+    except Exception:
+        if on_close:
+            on_close()
+        raise
+
+    stderr_tail = bytearray()
+    stderr_task = asyncio.create_task(_drain_stderr(process.stderr, stderr_tail))
+
+    async def read_range():
+        skip = start
+        while skip:
+            chunk = await process.stdout.read(min(chunk_size, skip))
+            if not chunk:
+                return
+            skip -= len(chunk)
+        remaining = length
+        while remaining is None or remaining:
+            chunk = await process.stdout.read(
+                chunk_size if remaining is None else min(chunk_size, remaining)
+            )
+            if not chunk:
+                return
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+    async def cleanup(grace: float = 0):
+        await _stop_process(process, grace=grace)
+        stderr_task.cancel()
+        if on_close:
+            on_close()
+
+    chunks = read_range()
+    # Pull the first chunk here so a borg failure still yields a proper status
+    # code, before StreamingResponse commits the headers to the client.
+    try:
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        first_chunk = None
+    except BaseException:
+        await cleanup()
+        raise
+
+    if first_chunk is None:
+        await cleanup(grace=_TERMINATE_GRACE_SECONDS)
+        if size is None and on_empty is not None and process.returncode == 0:
+            return await on_empty()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "key": "backend.errors.archives.failedExtractFile",
+                "params": {
+                    "error": stderr_tail.decode("utf-8", errors="replace")
+                    or f"borg extract exited with code {process.returncode}"
+                },
+            },
+        )
+
+    async def body():
+        # The last chunk is held back until borg has exited, so a failed
+        # extract ends the transfer short of Content-Length instead of
+        # looking like a complete download.
+        pending = first_chunk
+        sent = 0
+        try:
+            async for chunk in chunks:
+                yield pending
+                sent += len(pending)
+                pending = chunk
+            received = sent + len(pending)
+            short = length is not None and received < length
+            # Only a fully read file lets borg finish; after a partial range
+            # the finally block stops it straight away.
+            if size is None or end == size - 1 or short:
+                await _stop_process(process, grace=_TERMINATE_GRACE_SECONDS)
+            if short or _is_borg_error(process.returncode):
+                await asyncio.wait({stderr_task}, timeout=1)
+                logger.error(
+                    "Archive file stream failed",
+                    file_path=file_path,
+                    expected_bytes=length,
+                    sent_bytes=received,
+                    return_code=process.returncode,
+                    stderr=stderr_tail.decode("utf-8", errors="replace"),
+                )
+                raise ArchiveStreamError(
+                    f"borg extract exited with code {process.returncode}"
+                )
+            yield pending
+        finally:
+            await cleanup()
+
+    return StreamingResponse(
+        body(),
+        status_code=status_code,
+        media_type="application/octet-stream",
+        headers=headers,
+    )
@@ -6,16 +6,28 @@ import os
 import re
 import tempfile  # noqa: F401 - retained as a patch target in download endpoint tests
 from types import SimpleNamespace
-from urllib.parse import quote
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from fastapi.responses import FileResponse  # noqa: F401 - retained as a patch target in download endpoint tests
 from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.api.archive_download import extract_file_download, resolve_extracted_file_path
+from app.api.archive_download import (
+    content_disposition_attachment as _content_disposition_attachment,
+    extract_file_download,
+    STREAM_CHUNK_SIZE,
+    lookup_cached_file_size,
+    resolve_extracted_file_path,
+    stream_extracted_file,
+)
+from app.api.browse import _get_browse_result_cache_key
 from app.core.borg import borg
+from app.core.borg2 import borg2
 from app.core.borg_router import BorgRouter
 from app.core.security import (
     check_repo_access,
@@ -33,7 +45,9 @@ from app.services.repository_executor import (
     queue_agent_repository_operation_job,
     wait_for_agent_repository_operation_job,
 )
+from app.utils.archive_listing import page_archives
 from app.utils.borg_env import (
+    build_repository_borg_env,
     cleanup_temp_key_file,
     get_standard_ssh_opts,
     setup_borg_env,
@@ -101,22 +115,6 @@ AGENT_ARTIFACT_FIRST_BYTE_TIMEOUT = 60.0
 AGENT_ARTIFACT_IDLE_TIMEOUT = 60.0
 
 
-def _content_disposition_attachment(filename: str) -> str:
-    """Build a safe `Content-Disposition` for a user-controlled filename.
-
-    Escapes an ASCII fallback (dropping quotes/backslashes/control chars so the
-    header can't be broken or injected) and adds an RFC 5987 `filename*` UTF-8
-    variant so non-ASCII names survive.
-    """
-    ascii_name = filename.encode("ascii", "ignore").decode("ascii")
-    ascii_name = "".join(
-        ch for ch in ascii_name if ch.isprintable() and ch not in '"\\'
-    ).strip()
-    ascii_name = ascii_name or "download"
-    utf8_name = quote(filename, safe="")
-    return f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{utf8_name}"
-
-
 def _repo_bound_agent(repo: Repository, db: Session) -> AgentMachine | None:
     if not repo.agent_machine_id:
         return None
@@ -208,6 +206,41 @@ async def _stream_agent_archive_file(
     )
 
 
+async def _stream_repository_file(
+    repo: Repository,
+    db: Session,
+    archive: str,
+    file_path: str,
+    size: Optional[int],
+    range_header: Optional[str],
+    on_empty=None,
+):
+    """Serve a server-side repository file from `borg extract --stdout`."""
+    env, temp_key_file = _build_repo_env(repo, db)
+    extractor = borg2 if getattr(repo, "borg_version", 1) == 2 else borg
+
+    async def open_process():
+        return await extractor.open_extract_stdout(
+            repo.path,
+            archive,
+            file_path,
+            remote_path=repo.remote_path,
+            passphrase=repo.passphrase,
+            bypass_lock=repo.bypass_lock,
+            env=env,
+            read_limit=STREAM_CHUNK_SIZE,
+        )
+
+    return await stream_extracted_file(
+        file_path,
+        size,
+        open_process,
+        range_header=range_header,
+        on_close=lambda: cleanup_temp_key_file(temp_key_file),
+        on_empty=on_empty,
+    )
+
+
 @router.get("/list")
 async def list_archives(
     repository: str,
@@ -499,11 +532,153 @@ async def delete_archive(
         )
 
 
+class BulkDeleteArchivesRequest(BaseModel):
+    """Archives to delete: an explicit list, or a name glob and/or time range."""
+
+    repository: str
+    archives: Optional[List[str]] = None
+    name_glob: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+
+
+async def _resolve_bulk_delete_selection(
+    request: BulkDeleteArchivesRequest, repo: Repository, db: Session
+) -> list[str]:
+    """Archive selectors for a bulk delete, in the repository's addressing."""
+    has_filter = bool(request.name_glob) or request.since or request.until
+    if request.archives is not None:
+        if has_filter:
+            raise HTTPException(
+                status_code=400,
+                detail={"key": "backend.errors.archives.invalidArchiveSelection"},
+            )
+        selected = [_archive_extract_selector(name, repo) for name in request.archives]
+        return list(dict.fromkeys(name for name in selected if name))
+    if not has_filter:
+        raise HTTPException(
+            status_code=400,
+            detail={"key": "backend.errors.archives.invalidArchiveSelection"},
+        )
+
+    env, temp_key_file = build_repository_borg_env(repo, db)
+    try:
+        archives = await BorgRouter(repo).list_archives(env=env, db=db)
+    finally:
+        cleanup_temp_key_file(temp_key_file)
+    matching = page_archives(
+        archives,
+        name_glob=request.name_glob,
+        since=request.since,
+        until=request.until,
+    ).archives
+    if getattr(repo, "borg_version", 1) == 2:
+        # Borg 2 names repeat across a series; only the id is unique
+        return [f"aid:{archive['id']}" for archive in matching if archive.get("id")]
+    return [archive["name"] for archive in matching if archive.get("name")]
+
+
+@router.post("/bulk-delete")
+async def bulk_delete_archives(
+    request: BulkDeleteArchivesRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Delete many archives as one background job.
+
+    Borg 1 deletes the whole selection in a single ``borg delete`` so the
+    repository lock, manifest rewrite and commit happen once.
+    """
+    try:
+        repo = require_repository_access_by_path(
+            db, current_user, request.repository, "operator"
+        )
+        if is_agent_executor(repo):
+            raise HTTPException(
+                status_code=400,
+                detail={"key": "backend.errors.archives.bulkDeleteAgentUnsupported"},
+            )
+
+        running_job = (
+            db.query(DeleteArchiveJob)
+            .filter(
+                DeleteArchiveJob.repository_id == repo.id,
+                DeleteArchiveJob.status.in_(["pending", "running"]),
+            )
+            .first()
+        )
+        if running_job:
+            raise HTTPException(
+                status_code=409,
+                detail={
+                    "key": "backend.errors.archives.deleteAlreadyRunning",
+                    "params": {"jobId": running_job.id},
+                },
+            )
+
+        archive_names = await _resolve_bulk_delete_selection(request, repo, db)
+        if not archive_names:
+            raise HTTPException(
+                status_code=400,
+                detail={"key": "backend.errors.archives.noArchivesSelected"},
+            )
+
+        delete_job = DeleteArchiveJob(
+            repository_id=repo.id,
+            repository_path=repo.path,
+            archive_name=(
+                archive_names[0]
+                if len(archive_names) == 1
+                else f"{len(archive_names)} archives"
+            ),
+            archive_names=archive_names,
+            status="pending",
+        )
+        db.add(delete_job)
+        db.commit()
+        db.refresh(delete_job)
+
+        asyncio.create_task(
+            BorgRouter(
+                SimpleNamespace(
+                    id=repo.id,
+                    borg_version=repo.borg_version,
+                    executor_type=repo.executor_type,
+                    execution_target=repo.execution_target,
+                )
+            ).delete_archives(delete_job.id, archive_names)
+        )
+
+        logger.info(
+            "Bulk delete archive job created",
+            job_id=delete_job.id,
+            repository_id=repo.id,
+            archive_count=len(archive_names),
+            user=current_user.username,
+        )
+
+        return {
+            "job_id": delete_job.id,
+            "status": "pending",
+            "archive_count": len(archive_names),
+            "message": "backend.success.archives.deletionStarted",
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to start bulk delete archive job", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to start archive deletion: {str(e)}",
+        )
+
+
 @router.get("/download")
 async def download_file_from_archive(
     repository: str,
     archive: str,
     file_path: str,
+    range_header: Optional[str] = Header(None, alias="Range"),
     current_user: User = Depends(get_current_download_user),
     db: Session = Depends(get_db),
 ):
@@ -517,12 +692,19 @@ async def download_file_from_archive(
             detail_key="backend.errors.archives.repositoryNotFound",
         )
 
+        # Browse caches listings under the archive reference the client used.
+        listing_keys = [
+            archive,
+            _get_browse_result_cache_key(
+                archive, os.path.dirname(file_path.strip("/"))
+            ),
+        ]
         # Borg 2: address the archive by id (aid:) so extract targets exactly one
         # archive in a series; a bare id would be read as a name → 0-byte file.
         archive = _archive_extract_selector(archive, repo)
 
-        # New agents stream the file straight through; older agents (and
-        # server-side repos) fall through to the base64/local path below.
+        # New agents stream the file straight through; older agents fall
+        # through to the base64 path below.
         if is_agent_executor(repo):
             agent = _repo_bound_agent(repo, db)
             if agent and ARTIFACT_UPLOAD_CAPABILITY in (agent.capabilities or []):
@@ -562,16 +744,36 @@ async def download_file_from_archive(
                     passphrase=repo.passphrase,
                     bypass_lock=repo.bypass_lock,
                     env=env,
+                    repository_record=repo,
                 )
             finally:
                 cleanup_temp_key_file(temp_key_file)
 
-        return await extract_file_download(
+        async def temp_dir_download():
+            return await extract_file_download(
+                file_path,
+                extract,
+                temp_dir_factory=tempfile.mkdtemp,
+                path_exists=os.path.exists,
+                file_response_factory=FileResponse,
+            )
+
+        if is_agent_executor(repo):
+            return await temp_dir_download()
+
+        # Server-side repos stream from `borg extract --stdout`. The size from
+        # a cached listing enables Content-Length and Range; without it the
+        # file is sent chunked. Only directories, for which borg writes
+        # nothing, go through a temp dir.
+        size = await lookup_cached_file_size(repo.id, file_path, listing_keys)
+        return await _stream_repository_file(
+            repo,
+            db,
+            archive,
             file_path,
-            extract,
-            temp_dir_factory=tempfile.mkdtemp,
-            path_exists=os.path.exists,
-            file_response_factory=FileResponse,
+            size,
+            range_header,
+            on_empty=temp_dir_download,
         )
 
     except HTTPException:
@@ -629,6 +831,9 @@ async def get_delete_job_status(
             "id": job.id,
             "repository_id": job.repository_id,
             "archive_name": job.archive_name,
+            "archive_names": job.archive_names,
+            "archive_count": len(job.archive_names) if job.archive_names else 1,
+            "archives_deleted": job.archives_deleted,
             "status": job.status,
             "started_at": serialize_datetime(job.started_at),
             "completed_at": serialize_datetime(job.completed_at),
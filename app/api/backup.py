@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 import structlog
@@ -25,8 +26,10 @@ from app.core.security import (
     get_current_user,
     get_current_download_user,
     check_repo_access,
+    get_repository_permissions,
 )
 from app.services.backup_service import backup_service
+from app.services.change_versions import conditional_etag
 from app.services.backup_progress_contract import serialize_backup_progress_details
 from app.services.backup_route_planner import apply_repository_route_to_backup_job
 from app.services.agent_job_dispatcher import dispatch_agent_job_best_effort
@@ -50,6 +53,14 @@ logger = structlog.get_logger()
 router = APIRouter()
 
 RETRYABLE_BACKUP_STATUSES = {"failed", "cancelled"}
+# Tables the polled job list and status responses are built from
+_BACKUP_JOB_FAMILIES = (
+    "jobs",
+    "repositories",
+    "backup_plans",
+    "settings",
+    "permissions",
+)
 
 # asyncio keeps only a weak reference to a bare create_task() result, so a
 # fire-and-forget backup task can be garbage-collected mid-execution — leaving
@@ -612,6 +623,8 @@ async def retry_backup_job(
 
 @router.get("/jobs")
 async def get_all_backup_jobs(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     limit: int = 200,
@@ -625,6 +638,11 @@ async def get_all_backup_jobs(
         scheduled_only: If True, only return jobs triggered by scheduled tasks
         manual_only: If True, only return manual backup jobs (not scheduled)
     """
+    not_modified = conditional_etag(
+        request, response, _BACKUP_JOB_FAMILIES, current_user
+    )
+    if not_modified:
+        return not_modified
     try:
         query = db.query(BackupJob)
 
@@ -642,19 +660,26 @@ async def get_all_backup_jobs(
         if repository:
             query = query.filter(BackupJob.repository == repository)
 
+        if current_user.role != "admin":
+            # Jobs whose repository no longer exists are only shown to admins
+            visible_paths = select(Repository.path)
+            visibility = get_repository_permissions(db, current_user).repository_filter(
+                Repository.id
+            )
+            if visibility is not None:
+                visible_paths = visible_paths.where(visibility)
+            query = query.filter(BackupJob.repository.in_(visible_paths))
+
         jobs = query.order_by(BackupJob.id.desc()).limit(limit).all()
-        visible_jobs = []
-        for job in jobs:
-            repo = _get_job_repository(db, job.repository)
-            if repo is None:
-                if current_user.role == "admin":
-                    visible_jobs.append(job)
-                continue
-            try:
-                check_repo_access(db, current_user, repo, "viewer")
-                visible_jobs.append(job)
-            except HTTPException:
-                continue
+        job_paths = {job.repository for job in jobs if job.repository}
+        repositories_by_path = {
+            repo.path: repo
+            for repo in (
+                db.query(Repository).filter(Repository.path.in_(job_paths)).all()
+                if job_paths
+                else []
+            )
+        }
 
         log_save_policy = get_log_save_policy(db)
         return {
@@ -688,10 +713,10 @@ async def get_all_backup_jobs(
                     **_retry_metadata(job),
                     "progress_details": serialize_backup_progress_details(
                         job,
-                        _get_job_repository(db, job.repository),
+                        repositories_by_path.get(job.repository),
                     ),
                 }
-                for job in visible_jobs
+                for job in jobs
             ]
         }
     except Exception as e:
@@ -705,10 +730,17 @@ async def get_all_backup_jobs(
 @router.get("/status/{job_id}")
 async def get_backup_status(
     job_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get backup job status with detailed progress information"""
+    not_modified = conditional_etag(
+        request, response, _BACKUP_JOB_FAMILIES, current_user
+    )
+    if not_modified:
+        return not_modified
     try:
         job = db.query(BackupJob).filter(BackupJob.id == job_id).first()
         if not job:
@@ -5,14 +5,16 @@ from datetime import datetime
 from typing import Any, Optional
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, Field
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session, joinedload, object_session
 
 from app.core.security import (
     check_repo_access,
     encrypt_secret,
     get_current_user,
+    get_repository_permissions,
     require_any_role,
 )
 from app.database.database import get_db
@@ -43,6 +45,7 @@ from app.services.check_flag_validation import (
     CheckFlagConflictError,
     validate_check_flags_for_max_duration,
 )
+from app.services.change_versions import conditional_etag
 from app.services.backup_progress_contract import serialize_backup_progress_details
 from app.services.log_policy import (
     DEFAULT_LOG_SAVE_POLICY,
@@ -833,14 +836,25 @@ def _can_view_plan(db: Session, user: User, plan: BackupPlan) -> bool:
         return True
     if not plan.repositories:
         return False
-    for link in plan.repositories:
-        if not link.repository:
-            continue
-        try:
-            check_repo_access(db, user, link.repository, "viewer")
-        except HTTPException:
-            return False
-    return True
+    permissions = get_repository_permissions(db, user)
+    return all(
+        permissions.allows(link.repository.id, "viewer")
+        for link in plan.repositories
+        if link.repository
+    )
+
+
+def _visible_plan_filter(db: Session, user: User):
+    """SQL counterpart of ``_can_view_plan``; ``None`` when every plan is visible."""
+    if user.role == "admin":
+        return None
+    has_repositories = BackupPlan.repositories.any()
+    visibility = get_repository_permissions(db, user).repository_filter(
+        BackupPlanRepository.repository_id
+    )
+    if visibility is None:
+        return has_repositories
+    return and_(has_repositories, ~BackupPlan.repositories.any(~visibility))
 
 
 def _require_plan_operator_access(db: Session, user: User, plan: BackupPlan) -> None:
@@ -1408,39 +1422,43 @@ async def list_backup_plans(
             BackupPlanRepository.repository_id == repository_id,
             BackupPlanRepository.enabled.is_(True),
         )
+    visibility = _visible_plan_filter(db, current_user)
+    if visibility is not None:
+        query = query.filter(visibility)
     plans = query.order_by(BackupPlan.name.asc()).all()
-    visible = [plan for plan in plans if _can_view_plan(db, current_user, plan)]
     return {
         "backup_plans": [
-            _serialize_plan(plan, detail=repository_id is not None) for plan in visible
+            _serialize_plan(plan, detail=repository_id is not None) for plan in plans
         ]
     }
 
 
 @router.get("/runs")
 async def list_backup_plan_runs(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     limit: int = 50,
 ):
-    plans = (
-        db.query(BackupPlan)
-        .options(
-            joinedload(BackupPlan.repositories).joinedload(
-                BackupPlanRepository.repository
-            )
-        )
-        .all()
+    not_modified = conditional_etag(
+        request,
+        response,
+        ("backup_plans", "jobs", "repositories", "settings", "permissions"),
+        current_user,
+    )
+    if not_modified:
+        return not_modified
+    visible_plan_ids = select(BackupPlan.id)
+    visibility = _visible_plan_filter(db, current_user)
+    if visibility is not None:
+        visible_plan_ids = visible_plan_ids.where(visibility)
+    query = db.query(BackupPlanRun).filter(
+        BackupPlanRun.backup_plan_id.in_(visible_plan_ids)
     )
-    visible_plan_ids = [
-        plan.id for plan in plans if _can_view_plan(db, current_user, plan)
-    ]
-    if not visible_plan_ids:
-        return {"runs": []}
 
     runs = (
-        db.query(BackupPlanRun)
-        .options(
+        query.options(
             joinedload(BackupPlanRun.repositories).joinedload(
                 BackupPlanRunRepository.repository
             ),
@@ -1451,7 +1469,6 @@ async def list_backup_plan_runs(
                 ScriptExecution.script
             ),
         )
-        .filter(BackupPlanRun.backup_plan_id.in_(visible_plan_ids))
         .order_by(BackupPlanRun.id.desc())
         .limit(limit)
         .all()
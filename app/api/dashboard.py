@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
@@ -23,8 +23,22 @@ from app.database.models import (
     SSHConnection,
     SystemSettings,
 )
-from app.core.security import get_current_user
+from app.core.security import get_current_user, get_repository_permissions
+from app.services.check_verify_rotation import VerifyCoverage, verify_coverage
 from app.services.log_policy import get_log_save_policy, job_has_logs_by_policy
+from app.services.metric_history import (
+    METRIC_REPOSITORY_SIZE,
+    METRICS,
+    RESOLUTION_DAY,
+    RESOLUTIONS,
+    combined_last_series,
+    metric_series,
+)
+from app.services.repository_stats import (
+    dedup_ratio_percent,
+    parse_size_string,
+    repository_size_bytes,
+)
 from app.utils.datetime_utils import serialize_datetime
 from app.utils.schedule_time import (
     DEFAULT_SCHEDULE_TIMEZONE,
@@ -37,6 +51,7 @@ router = APIRouter()
 
 RESTORE_CHECK_WARNING_DAYS = 14
 RESTORE_CHECK_CRITICAL_DAYS = 30
+STORAGE_TREND_DAYS = 30
 
 
 @dataclass(frozen=True)
@@ -461,6 +476,17 @@ def build_observe_repository_health(
     }
 
 
+def _serialize_verify_coverage(
+    coverage: Optional[VerifyCoverage],
+) -> Optional[Dict[str, Any]]:
+    if coverage is None:
+        return None
+    data = coverage.to_dict()
+    data["oldest_verified_at"] = serialize_datetime(coverage.oldest_verified_at)
+    data["last_verified_at"] = serialize_datetime(coverage.last_verified_at)
+    return data
+
+
 def build_backup_plan_summary(plans: list[BackupPlan], now: datetime) -> Dict[str, Any]:
     """Build repository-level backup plan counts and next scheduled run metadata."""
     scheduled_plans = [plan for plan in plans if plan.enabled and plan.schedule_enabled]
@@ -751,19 +777,26 @@ async def get_dashboard_overview(
 
         # Calculate repository health (only for full-mode repos that do backups)
         repo_health = []
-        total_size_bytes = 0
-        total_archives = 0
 
-        # Include all repos for size/archive totals
-        for repo in repositories:
-            size_bytes = parse_size_to_bytes(repo.total_size)
-            total_size_bytes += size_bytes
-            total_archives += repo.archive_count or 0
+        # Include all repos for size/archive totals. The integer columns sum in
+        # SQL; only rows never refreshed since they were added need parsing.
+        size_sum, archive_sum = db.query(
+            func.coalesce(func.sum(Repository.unique_size_bytes), 0),
+            func.coalesce(func.sum(Repository.archive_count), 0),
+        ).one()
+        total_size_bytes = int(size_sum) + sum(
+            parse_size_to_bytes(repo.total_size)
+            for repo in repositories
+            if repo.unique_size_bytes is None
+        )
+        total_archives = int(archive_sum)
+
+        verify_coverage_by_repo = verify_coverage(db, full_mode_repos)
 
         # Show health for both repo modes, but with mode-specific semantics.
         for repo in full_mode_repos:
             # Parse size for this repo
-            size_bytes = parse_size_to_bytes(repo.total_size)
+            size_bytes = repository_size_bytes(repo)
             latest_restore_check = latest_restore_checks.get(repo.id)
             health = build_full_repository_health(
                 repo, now, latest_restore_check, health_thresholds
@@ -797,17 +830,8 @@ async def get_dashboard_overview(
                 repo_schedule = fallback_schedule
             repo_backup_plans = backup_plans_by_repo.get(repo.id, [])
 
-            # Calculate dedup ratio (if we have the data)
-            dedup_ratio = None
-            if (
-                hasattr(repo, "deduplicated_size")
-                and repo.deduplicated_size
-                and size_bytes > 0
-            ):
-                dedup_bytes = parse_size_to_bytes(repo.deduplicated_size)
-                dedup_ratio = (
-                    int((1 - (dedup_bytes / size_bytes)) * 100) if size_bytes > 0 else 0
-                )
+            dedup_ratio = dedup_ratio_percent(repo)
+            coverage = verify_coverage_by_repo.get(repo.id)
 
             repo_health.append(
                 {
@@ -832,6 +856,7 @@ async def get_dashboard_overview(
                     ],
                     "latest_restore_check_error": health["latest_restore_check_error"],
                     "dedup_ratio": dedup_ratio,
+                    "verify_coverage": _serialize_verify_coverage(coverage),
                     "has_schedule": repo_schedule is not None,
                     "schedule_enabled": repo_schedule.enabled
                     if repo_schedule
@@ -850,7 +875,7 @@ async def get_dashboard_overview(
             )
 
         for repo in observe_only_repos:
-            size_bytes = parse_size_to_bytes(repo.total_size)
+            size_bytes = repository_size_bytes(repo)
             latest_restore_check = latest_restore_checks.get(repo.id)
             health = build_observe_repository_health(
                 repo, now, latest_restore_check, health_thresholds
@@ -880,6 +905,7 @@ async def get_dashboard_overview(
                     ],
                     "latest_restore_check_error": health["latest_restore_check_error"],
                     "dedup_ratio": None,
+                    "verify_coverage": None,
                     "has_schedule": False,
                     "schedule_enabled": False,
                     "schedule_name": None,
@@ -924,6 +950,20 @@ async def get_dashboard_overview(
                 }
             )
 
+        # Total deduplicated size per day, from the metric history
+        storage_trend = [
+            {"date": serialize_datetime(day), "size_bytes": int(size)}
+            for day, size in combined_last_series(
+                metric_series(
+                    db,
+                    METRIC_REPOSITORY_SIZE,
+                    RESOLUTION_DAY,
+                    now - timedelta(days=STORAGE_TREND_DAYS),
+                    repository_ids=repository_ids,
+                )
+            )
+        ]
+
         # Get upcoming schedules (next 24 hours)
         end_time = now + timedelta(hours=24)
         upcoming_tasks = []
@@ -1235,13 +1275,9 @@ async def get_dashboard_overview(
                         {
                             "name": repo.name,
                             "size": repo.total_size,
-                            "size_bytes": parse_size_to_bytes(repo.total_size),
+                            "size_bytes": repository_size_bytes(repo),
                             "percentage": round(
-                                (
-                                    parse_size_to_bytes(repo.total_size)
-                                    / total_size_bytes
-                                    * 100
-                                ),
+                                (repository_size_bytes(repo) / total_size_bytes * 100),
                                 1,
                             )
                             if total_size_bytes > 0
@@ -1280,6 +1316,7 @@ async def get_dashboard_overview(
                 ),
             ),
             "backup_trends": backup_trends,
+            "storage_trend": storage_trend,
             "upcoming_tasks": upcoming_tasks,
             "activity_feed": activity_feed,
             "system_metrics": system_metrics.dict(),
@@ -1294,39 +1331,68 @@ async def get_dashboard_overview(
         )
 
 
-def parse_size_to_bytes(size_str: str) -> int:
-    """Parse human-readable size string to bytes"""
-    if not size_str:
-        return 0
-
-    size_str = size_str.strip().upper()
-
-    # Remove spaces
-    size_str = size_str.replace(" ", "")
-
-    # Check units from longest to shortest to avoid matching 'B' in 'GB'
-    multipliers = [
-        ("PB", 1024**5),
-        ("TB", 1024**4),
-        ("GB", 1024**3),
-        ("MB", 1024**2),
-        ("KB", 1024),
-        ("B", 1),
-    ]
+@router.get("/trends")
+async def get_dashboard_trends(
+    metric: str = Query(...),
+    resolution: str = Query(RESOLUTION_DAY),
+    days: int = Query(365, ge=1, le=1825),
+    repository_id: Optional[int] = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Time series of a repository or backup metric from the metric history"""
+    if metric not in METRICS or resolution not in RESOLUTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"key": "backend.errors.dashboard.invalidTrendQuery"},
+        )
 
-    for unit, multiplier in multipliers:
-        if size_str.endswith(unit):
-            try:
-                number = float(size_str[: -len(unit)])
-                return int(number * multiplier)
-            except ValueError:
-                return 0
+    repository_ids = get_repository_permissions(db, current_user).repository_ids()
+    if repository_id is not None:
+        if repository_ids is None or repository_id in repository_ids:
+            repository_ids = {repository_id}
+        else:
+            repository_ids = set()
+
+    series = metric_series(
+        db,
+        metric,
+        resolution,
+        datetime.utcnow() - timedelta(days=days),
+        repository_ids=repository_ids,
+    )
+    names = dict(
+        db.query(Repository.id, Repository.name)
+        .filter(Repository.id.in_(list(series)))
+        .all()
+    )
+    return {
+        "metric": metric,
+        "resolution": resolution,
+        "series": [
+            {
+                "repository_id": series_repository_id,
+                "repository_name": names.get(series_repository_id),
+                "points": [
+                    {
+                        "bucket_start": serialize_datetime(point.bucket_start),
+                        "count": point.count,
+                        "avg": point.average,
+                        "min": point.minimum,
+                        "max": point.maximum,
+                        "last": point.last,
+                    }
+                    for point in points
+                ],
+            }
+            for series_repository_id, points in sorted(series.items())
+        ],
+    }
 
-    # Try parsing as plain number
-    try:
-        return int(float(size_str))
-    except ValueError:
-        return 0
+
+def parse_size_to_bytes(size_str: str) -> int:
+    """Parse human-readable size string to bytes"""
+    return parse_size_string(size_str)
 
 
 def format_bytes(bytes_value: int) -> str:
@@ -1338,8 +1404,14 @@ def format_bytes(bytes_value: int) -> str:
     return f"{bytes_value:.1f} PB"
 
 
-def calculate_average_dedup(repositories: List[Repository]) -> int:
-    """Calculate average deduplication ratio across repositories"""
-    # This is a placeholder - would need actual dedup data from borg info
-    # For now, return None to indicate we don't have this data
-    return None
+def calculate_average_dedup(repositories: List[Repository]) -> Optional[int]:
+    """Space saved by deduplication across repositories with known sizes"""
+    original_total = 0
+    unique_total = 0
+    for repo in repositories:
+        if repo.original_size_bytes and repo.unique_size_bytes is not None:
+            original_total += repo.original_size_bytes
+            unique_total += repo.unique_size_bytes
+    if original_total <= 0:
+        return None
+    return max(0, int((1 - (unique_total / original_total)) * 100))
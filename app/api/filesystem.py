@@ -5,6 +5,7 @@ Filesystem browsing API endpoints
 from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 from typing import List, Optional
+import asyncio
 import os
 import subprocess
 import structlog
@@ -17,6 +18,7 @@ from sqlalchemy.orm import Session
 from app.database.models import SSHConnection, SSHKey
 from app.config import settings
 from app.utils.datetime_utils import serialize_datetime
+from app.utils.directory_paging import browse_sort_key, select_page
 from app.utils.ssh_utils import ssh_key_auth_args
 
 logger = structlog.get_logger()
@@ -55,6 +57,8 @@ class BrowseResponse(BaseModel):
     items: List[FileSystemItem]
     parent_path: Optional[str] = None
     is_inside_local_mount: bool = False  # Whether current path is inside a host mount
+    next_cursor: Optional[str] = None  # Cursor of the next page, when paginated
+    total_items: Optional[int] = None  # Entries matching the filter in the directory
 
 
 def is_borg_repository(path: str) -> bool:
@@ -207,6 +211,13 @@ async def browse_filesystem(
     host: Optional[str] = Query(None, description="SSH host"),
     username: Optional[str] = Query(None, description="SSH username"),
     port: int = Query(22, description="SSH port"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=5000, description="Page size; omit for the whole directory"
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    name_filter: Optional[str] = Query(
+        None, max_length=255, description="Case-insensitive name substring"
+    ),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -215,10 +226,14 @@ async def browse_filesystem(
 
     For local paths: browses the container's filesystem (including /local mount)
     For SSH paths: browses remote filesystem via SSH connection
+
+    With ``limit`` the listing is paginated: only the returned page is stat'ed
+    and probed for Borg repositories, and ``next_cursor`` fetches the next one.
     """
+    page = {"limit": limit, "cursor": cursor, "name_filter": name_filter}
     try:
         if connection_type == "local":
-            return await browse_local_filesystem(path)
+            return await browse_local_filesystem(path, **page)
         elif connection_type == "ssh":
             if not all([ssh_key_id, host, username]):
                 raise HTTPException(
@@ -253,7 +268,7 @@ async def browse_filesystem(
                 path = ssh_connection.default_path
 
             return await browse_ssh_filesystem(
-                path, ssh_key_id, host, username, port, db
+                path, ssh_key_id, host, username, port, db, **page
             )
         else:
             raise HTTPException(
@@ -270,7 +285,75 @@ async def browse_filesystem(
         )
 
 
-async def browse_local_filesystem(path: str) -> BrowseResponse:
+def _invalid_cursor_error() -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail={"key": "backend.errors.filesystem.invalidCursor"},
+    )
+
+
+def _scandir_is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _local_browse_page(
+    path: str,
+    mount_points: set[str],
+    *,
+    limit: Optional[int],
+    cursor: Optional[str],
+    name_filter: Optional[str],
+) -> tuple[List[FileSystemItem], Optional[str], int]:
+    """Pick the requested page from one scandir pass, then stat only that page."""
+    with os.scandir(path) as iterator:
+        entries = ((entry, _scandir_is_dir(entry)) for entry in iterator)
+        page, next_cursor, total = select_page(
+            entries,
+            key=lambda item: browse_sort_key(
+                item[0].name, item[1], item[1] and item[0].path in mount_points
+            ),
+            name=lambda item: item[0].name,
+            limit=limit,
+            cursor=cursor,
+            name_filter=name_filter,
+        )
+
+    items = []
+    for entry, is_dir in page:
+        try:
+            stat_info = os.stat(entry.path)
+        except (PermissionError, OSError) as e:
+            # Skip items we can't access
+            logger.debug("Skipping inaccessible item", item=entry.name, error=str(e))
+            continue
+
+        items.append(
+            FileSystemItem(
+                name=entry.name,
+                path=entry.path,
+                is_directory=is_dir,
+                size=stat_info.st_size if not is_dir else None,
+                modified=serialize_datetime(
+                    datetime.fromtimestamp(stat_info.st_mtime, tz=timezone.utc)
+                ),
+                is_borg_repo=is_dir and is_borg_repository(entry.path),
+                # Only mark the mount point itself, not its children
+                is_local_mount=is_dir and entry.path in mount_points,
+                permissions=oct(stat_info.st_mode)[-3:],
+            )
+        )
+    return items, next_cursor, total
+
+
+async def browse_local_filesystem(
+    path: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    name_filter: Optional[str] = None,
+) -> BrowseResponse:
     """Browse local filesystem"""
     # Security: Prevent directory traversal attacks
     path = os.path.abspath(path)
@@ -295,68 +378,18 @@ async def browse_local_filesystem(path: str) -> BrowseResponse:
             },
         )
 
-    items = []
+    # Get mount points once for reuse
+    mount_points = settings.get_local_mount_points()
 
     try:
-        # List directory contents
-        entries = os.listdir(path)
-
-        # Get mount points once for reuse
-        mount_points = settings.get_local_mount_points()
-
-        for entry in entries:
-            try:
-                full_path = os.path.join(path, entry)
-                stat_info = os.stat(full_path)
-                is_dir = os.path.isdir(full_path)
-
-                # Check if directory is a Borg repository
-                is_borg = False
-                if is_dir:
-                    is_borg = is_borg_repository(full_path)
-
-                # Check if this path is a local mount point (host filesystem)
-                # Only mark the mount point itself, not its children
-                is_local = is_dir and full_path in mount_points
-
-                item = FileSystemItem(
-                    name=entry,
-                    path=full_path,
-                    is_directory=is_dir,
-                    size=stat_info.st_size if not is_dir else None,
-                    modified=serialize_datetime(
-                        datetime.fromtimestamp(stat_info.st_mtime, tz=timezone.utc)
-                    ),
-                    is_borg_repo=is_borg,
-                    is_local_mount=is_local,
-                    permissions=oct(stat_info.st_mode)[-3:],
-                )
-                items.append(item)
-            except (PermissionError, OSError) as e:
-                # Skip items we can't access
-                logger.debug("Skipping inaccessible item", item=entry, error=str(e))
-                continue
-
-        # Sort items: local mounts first, then directories, then alphabetically
-        items.sort(
-            key=lambda x: (not x.is_local_mount, not x.is_directory, x.name.lower())
+        items, next_cursor, total = await asyncio.to_thread(
+            _local_browse_page,
+            path,
+            set(mount_points),
+            limit=limit,
+            cursor=cursor,
+            name_filter=name_filter,
         )
-
-        # Get parent path
-        parent_path = os.path.dirname(path) if path != "/" else None
-
-        # Check if current path is inside a local mount
-        is_inside_mount = any(
-            path == mp or path.startswith(mp + "/") for mp in mount_points
-        )
-
-        return BrowseResponse(
-            current_path=path,
-            items=items,
-            parent_path=parent_path,
-            is_inside_local_mount=is_inside_mount,
-        )
-
     except PermissionError:
         raise HTTPException(
             status_code=403,
@@ -365,12 +398,43 @@ async def browse_local_filesystem(path: str) -> BrowseResponse:
                 "params": {"path": path},
             },
         )
+    except ValueError:
+        raise _invalid_cursor_error()
+
+    # Get parent path
+    parent_path = os.path.dirname(path) if path != "/" else None
+
+    # Check if current path is inside a local mount
+    is_inside_mount = any(
+        path == mp or path.startswith(mp + "/") for mp in mount_points
+    )
+
+    return BrowseResponse(
+        current_path=path,
+        items=items,
+        parent_path=parent_path,
+        is_inside_local_mount=is_inside_mount,
+        next_cursor=next_cursor,
+        total_items=total,
+    )
 
 
 async def browse_ssh_filesystem(
-    path: str, ssh_key_id: int, host: str, username: str, port: int, db: Session
+    path: str,
+    ssh_key_id: int,
+    host: str,
+    username: str,
+    port: int,
+    db: Session,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    name_filter: Optional[str] = None,
 ) -> BrowseResponse:
-    """Browse remote filesystem via SSH"""
+    """Browse remote filesystem via SSH
+
+    SFTP returns the whole listing at once; paging still bounds the per-entry
+    work, since only the returned page is probed for Borg repositories.
+    """
     import tempfile
     from app.config import settings
 
@@ -517,7 +581,7 @@ async def browse_ssh_filesystem(
         )
 
         # Parse SFTP ls output
-        items = []
+        entries = []
         lines = result.stdout.strip().split("\n")
         seen_names = set()  # Track seen names to avoid duplicates
 
@@ -574,19 +638,39 @@ async def browse_ssh_filesystem(
                 seen_names.add(name)
 
                 is_dir = permissions.startswith("d")
-                full_path = os.path.join(path, name)
-                command_path = _join_remote_path(effective_command_path, name)
+                entries.append((name, is_dir, size, permissions, timestamp))
+                logger.debug("Parsed SSH ls entry", name=name, is_dir=is_dir)
+            except (ValueError, IndexError) as e:
+                logger.debug("Failed to parse ls line", line=line, error=str(e))
+                continue
 
-                # Check if directory is a Borg repository
-                is_borg = False
-                if is_dir:
-                    is_borg = is_borg_repository_ssh(
-                        host, username, temp_key_file, command_path, port
-                    )
+        try:
+            page, next_cursor, total = select_page(
+                entries,
+                key=lambda entry: browse_sort_key(entry[0], entry[1]),
+                name=lambda entry: entry[0],
+                limit=limit,
+                cursor=cursor,
+                name_filter=name_filter,
+            )
+        except ValueError:
+            raise _invalid_cursor_error()
+
+        items = []
+        for name, is_dir, size, permissions, timestamp in page:
+            command_path = _join_remote_path(effective_command_path, name)
+
+            # Check if directory is a Borg repository
+            is_borg = False
+            if is_dir:
+                is_borg = is_borg_repository_ssh(
+                    host, username, temp_key_file, command_path, port
+                )
 
-                item = FileSystemItem(
+            items.append(
+                FileSystemItem(
                     name=name,
-                    path=full_path,
+                    path=os.path.join(path, name),
                     is_directory=is_dir,
                     size=size if not is_dir else None,
                     modified=serialize_datetime(
@@ -596,18 +680,7 @@ async def browse_ssh_filesystem(
                     is_local_mount=False,  # SSH paths are not local mounts
                     permissions=permissions[1:] if len(permissions) > 1 else None,
                 )
-                items.append(item)
-                logger.debug(
-                    "Parsed SSH ls entry", name=name, is_dir=is_dir, path=full_path
-                )
-            except (ValueError, IndexError) as e:
-                logger.debug("Failed to parse ls line", line=line, error=str(e))
-                continue
-
-        # Sort items: local mounts first, then directories, then alphabetically
-        items.sort(
-            key=lambda x: (not x.is_local_mount, not x.is_directory, x.name.lower())
-        )
+            )
 
         # Get parent path
         parent_path = os.path.dirname(path) if path != "/" else None
@@ -623,6 +696,8 @@ async def browse_ssh_filesystem(
             items=items,
             parent_path=parent_path,
             is_inside_local_mount=is_inside_mount,
+            next_cursor=next_cursor,
+            total_items=total,
         )
 
     except subprocess.TimeoutExpired:
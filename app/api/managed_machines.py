@@ -10,7 +10,10 @@ from sqlalchemy.orm import Session, defer
 import structlog
 
 from app.core.agent_auth import AGENT_TOKEN_PREFIX_LENGTH
-from app.core.agent_constants import AGENT_FILESYSTEM_BROWSE_TIMEOUT_SECONDS
+from app.core.agent_constants import (
+    AGENT_FILESYSTEM_BROWSE_MAX_ITEMS,
+    AGENT_FILESYSTEM_BROWSE_TIMEOUT_SECONDS,
+)
 from app.core.features import require_feature_access
 from app.core.security import get_current_admin_user, get_password_hash
 from app.database.database import get_db
@@ -544,6 +547,9 @@ async def browse_agent_machine_filesystem(
     agent_machine_id: int,
     path: str = "/",
     include_hidden: bool = False,
+    limit: Optional[int] = Query(None, ge=1, le=AGENT_FILESYSTEM_BROWSE_MAX_ITEMS),
+    cursor: Optional[str] = None,
+    name_filter: Optional[str] = Query(None, max_length=255),
     _: User = Depends(require_managed_agents_admin_user),
     db: Session = Depends(get_db),
 ):
@@ -553,6 +559,9 @@ async def browse_agent_machine_filesystem(
         path=path,
         include_hidden=include_hidden,
         timeout_seconds=AGENT_FILESYSTEM_BROWSE_TIMEOUT_SECONDS,
+        limit=limit,
+        cursor=cursor,
+        name_filter=name_filter,
     )
 
 
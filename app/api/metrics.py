@@ -11,7 +11,7 @@ from fastapi import APIRouter, Depends, Header, HTTPException, status as http_st
 from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import structlog
 
 from app.database.database import get_db
@@ -25,11 +25,31 @@ from app.database.models import (
     SystemSettings,
     ScheduledJob,
 )
+from app.services.check_verify_rotation import verify_coverage
+from app.services.metric_history import (
+    METRIC_BACKUP_SUCCESS,
+    METRIC_BACKUP_THROUGHPUT,
+    METRIC_REPOSITORY_SIZE,
+    RESOLUTION_DAY,
+    metric_series,
+    series_average,
+    series_growth_per_day,
+)
+from app.services.repository_stats import (
+    dedup_ratio_percent,
+    parse_size_string as _parse_size_string,
+    repository_size_bytes,
+)
 from app.utils.datetime_utils import serialize_datetime
 
 logger = structlog.get_logger()
 router = APIRouter(tags=["metrics"])
 
+# Windows of the gauges read from the metric history
+GROWTH_WINDOW_DAYS = 30
+THROUGHPUT_WINDOW_DAYS = 7
+SUCCESS_WINDOW_DAYS = 30
+
 
 def _resolve_metrics_settings(db: Session) -> Tuple[bool, bool, Optional[str]]:
     settings = db.query(SystemSettings).first()
@@ -57,28 +77,7 @@ def _extract_metrics_token(
 
 def parse_size_string(size_str: str) -> int:
     """Convert size string like '1.5 GB' to bytes"""
-    if not size_str:
-        return 0
-
-    size_str = size_str.strip()
-    # Check longer units first to avoid matching 'B' in 'GB'
-    units = [
-        ("PB", 1024**5),
-        ("TB", 1024**4),
-        ("GB", 1024**3),
-        ("MB", 1024**2),
-        ("KB", 1024),
-        ("B", 1),
-    ]
-
-    try:
-        for unit, multiplier in units:
-            if unit in size_str:
-                number = float(size_str.replace(unit, "").strip())
-                return int(number * multiplier)
-        return int(float(size_str))
-    except:
-        return 0
+    return _parse_size_string(size_str)
 
 
 def timestamp_to_unix(dt: datetime) -> int:
@@ -141,12 +140,37 @@ async def get_metrics(
         lines.append("# HELP borg_repository_size_bytes Repository total size in bytes")
         lines.append("# TYPE borg_repository_size_bytes gauge")
         for repo in repositories:
-            size_bytes = parse_size_string(repo.total_size or "0")
+            size_bytes = repository_size_bytes(repo)
             lines.append(
                 f'borg_repository_size_bytes{{repository="{repo.name}"}} {size_bytes}'
             )
         lines.append("")
 
+        lines.append(
+            "# HELP borg_repository_original_size_bytes Sum of original archive sizes in bytes"
+        )
+        lines.append("# TYPE borg_repository_original_size_bytes gauge")
+        for repo in repositories:
+            if repo.original_size_bytes is None:
+                continue
+            lines.append(
+                f'borg_repository_original_size_bytes{{repository="{repo.name}"}} {repo.original_size_bytes}'
+            )
+        lines.append("")
+
+        lines.append(
+            "# HELP borg_repository_dedup_savings_percent Space saved by deduplication and compression"
+        )
+        lines.append("# TYPE borg_repository_dedup_savings_percent gauge")
+        for repo in repositories:
+            savings = dedup_ratio_percent(repo)
+            if savings is None:
+                continue
+            lines.append(
+                f'borg_repository_dedup_savings_percent{{repository="{repo.name}"}} {savings}'
+            )
+        lines.append("")
+
         lines.append(
             "# HELP borg_repository_archive_count Number of archives in repository"
         )
@@ -190,6 +214,93 @@ async def get_metrics(
             )
         lines.append("")
 
+        coverage_by_repo = verify_coverage(db, repositories)
+        lines.append(
+            "# HELP borg_repository_verify_coverage_percent Share of archives whose data a rotating check verified"
+        )
+        lines.append("# TYPE borg_repository_verify_coverage_percent gauge")
+        for repo in repositories:
+            coverage = coverage_by_repo.get(repo.id)
+            if coverage is None:
+                continue
+            lines.append(
+                f'borg_repository_verify_coverage_percent{{repository="{repo.name}"}} {coverage.percent}'
+            )
+        lines.append("")
+
+        lines.append(
+            "# HELP borg_repository_verify_oldest_timestamp Unix timestamp of the least recent archive data verification"
+        )
+        lines.append("# TYPE borg_repository_verify_oldest_timestamp gauge")
+        for repo in repositories:
+            coverage = coverage_by_repo.get(repo.id)
+            if coverage is None:
+                continue
+            timestamp = timestamp_to_unix(coverage.oldest_verified_at)
+            lines.append(
+                f'borg_repository_verify_oldest_timestamp{{repository="{repo.name}"}} {timestamp}'
+            )
+        lines.append("")
+
+        # ===== Trends from the metric history =====
+        history_now = datetime.utcnow()
+        size_series = metric_series(
+            db,
+            METRIC_REPOSITORY_SIZE,
+            RESOLUTION_DAY,
+            history_now - timedelta(days=GROWTH_WINDOW_DAYS),
+        )
+        lines.append(
+            f"# HELP borg_repository_size_growth_bytes_per_day Change of repository size per day over {GROWTH_WINDOW_DAYS} days"
+        )
+        lines.append("# TYPE borg_repository_size_growth_bytes_per_day gauge")
+        for repo in repositories:
+            growth = series_growth_per_day(size_series.get(repo.id, []))
+            if growth is None:
+                continue
+            lines.append(
+                f'borg_repository_size_growth_bytes_per_day{{repository="{repo.name}"}} {growth:.0f}'
+            )
+        lines.append("")
+
+        throughput_series = metric_series(
+            db,
+            METRIC_BACKUP_THROUGHPUT,
+            RESOLUTION_DAY,
+            history_now - timedelta(days=THROUGHPUT_WINDOW_DAYS),
+        )
+        lines.append(
+            f"# HELP borg_backup_throughput_bytes_per_second Average backup throughput over {THROUGHPUT_WINDOW_DAYS} days"
+        )
+        lines.append("# TYPE borg_backup_throughput_bytes_per_second gauge")
+        for repo in repositories:
+            throughput = series_average(throughput_series.get(repo.id, []))
+            if throughput is None:
+                continue
+            lines.append(
+                f'borg_backup_throughput_bytes_per_second{{repository="{repo.name}"}} {throughput:.0f}'
+            )
+        lines.append("")
+
+        success_series = metric_series(
+            db,
+            METRIC_BACKUP_SUCCESS,
+            RESOLUTION_DAY,
+            history_now - timedelta(days=SUCCESS_WINDOW_DAYS),
+        )
+        lines.append(
+            f"# HELP borg_backup_success_ratio Share of successful backups over {SUCCESS_WINDOW_DAYS} days"
+        )
+        lines.append("# TYPE borg_backup_success_ratio gauge")
+        for repo in repositories:
+            ratio = series_average(success_series.get(repo.id, []))
+            if ratio is None:
+                continue
+            lines.append(
+                f'borg_backup_success_ratio{{repository="{repo.name}"}} {ratio:.3f}'
+            )
+        lines.append("")
+
         # ===== Backup Job Metrics =====
         lines.append(
             "# HELP borg_backup_jobs_total Total number of backup jobs by status"
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from fastapi.responses import Response
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from functools import partial
 from pathlib import Path as FilesystemPath
 from types import SimpleNamespace
@@ -23,6 +24,7 @@ from app.database.models import (
     RcloneRemote,
     RcloneSyncJob,
     AgentMachine,
+    BackupJob,
     CheckJob,
     CompactJob,
     PruneJob,
@@ -30,7 +32,6 @@ from app.database.models import (
     ScheduledJob,
     ScheduledJobRepository,
     SystemSettings,
-    UserRepositoryPermission,
     RepositoryWipeJob,
 )
 from app.api.maintenance_jobs import (
@@ -44,7 +45,12 @@ from app.api.maintenance_jobs import (
     serialize_job_summary,
 )
 from app.core.authorization import authorize_request
-from app.core.security import get_current_user, check_repo_access, decrypt_secret
+from app.core.security import (
+    get_current_user,
+    check_repo_access,
+    decrypt_secret,
+    get_repository_permissions,
+)
 from app.core.borg import BorgInterface
 from app.core.borg_router import BorgRouter
 from app.core.borg_errors import is_lock_error
@@ -57,6 +63,10 @@ from app.core.features import (
 from app.config import settings
 from app.services.mqtt_service import mqtt_service
 from app.services.restore_check_service import restore_check_service
+from app.services.compression_tuning import (
+    CompressionTuningError,
+    compression_tuning_service,
+)
 from app.services.repository_wipe_service import (
     WipeArchiveSetChanged,
     WipeValidationError,
@@ -89,7 +99,9 @@ from app.services.job_admission import (
     ensure_repository_admission,
 )
 from app.services.log_policy import get_log_save_policy, job_has_logs_by_policy
+from app.services.archive_list_cache import archive_list_cache
 from app.services.repository_command_lock import run_serialized_repository_command
+from app.services.repository_stats import apply_repository_info
 from app.services.rclone_repository_service import (
     SYNC_DIRECTION_AGENT_TO_REMOTE,
     SYNC_DIRECTION_PRIMARY_TO_REMOTE,
@@ -106,7 +118,14 @@ from app.utils.schedule_time import (
     calculate_next_cron_run,
     normalize_schedule_timezone,
 )
+from app.utils.archive_listing import (
+    DEFAULT_ARCHIVE_SORT,
+    ArchivePage,
+    page_archives,
+)
 from app.utils.archive_job_metadata import enrich_archives_with_backup_metadata
+from app.utils.prune_simulation import format_prune_line, simulate_prune
+from app.utils.process_priority import validate_process_priorities
 from app.utils.ssh_paths import apply_ssh_command_prefix
 from app.utils.repository_paths import build_ssh_repository_path, strip_ssh_url_path
 from app.utils.source_locations import (
@@ -187,6 +206,18 @@ class RepositoryWipePreviewRequest(BaseModel):
     run_compact: bool = True
 
 
+class PrunePreviewRequest(BaseModel):
+    keep_within: Optional[str] = None
+    keep_hourly: int = Field(0, ge=0)
+    keep_daily: int = Field(7, ge=0)
+    keep_weekly: int = Field(4, ge=0)
+    keep_monthly: int = Field(6, ge=0)
+    keep_quarterly: int = Field(0, ge=0)
+    keep_yearly: int = Field(1, ge=0)
+    name_glob: Optional[str] = None
+    timezone: Optional[str] = None
+
+
 class RepositoryWipeExecuteRequest(BaseModel):
     preview_id: int
     preview_fingerprint: str
@@ -200,6 +231,12 @@ class RepositoryPermanentDeleteRequest(BaseModel):
     understood: bool
 
 
+class CompressionTuningRequest(BaseModel):
+    apply: bool = False
+    # Highest acceptable stored/original ratio; None allows 5% over the best
+    target_ratio: Optional[float] = Field(default=None, gt=0)
+
+
 def _normalize_restore_check_paths(paths: Any) -> list[str]:
     if not paths:
         return []
@@ -235,6 +272,16 @@ def _validate_upload_ratelimit_kib(value: Optional[int]) -> None:
         )
 
 
+def _validate_process_priorities(value: Optional[dict]) -> Optional[dict]:
+    try:
+        return validate_process_priorities(value)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={"key": "backend.errors.repo.invalidProcessPriorities"},
+        ) from exc
+
+
 def _raise_check_flag_conflict(exc: CheckFlagConflictError) -> None:
     raise HTTPException(
         status_code=422,
@@ -245,6 +292,18 @@ def _raise_check_flag_conflict(exc: CheckFlagConflictError) -> None:
     ) from exc
 
 
+def _parse_verify_archives_per_run(value) -> Optional[int]:
+    """Rotating verification batch size from a request; 0 or None turns it off."""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise HTTPException(
+            status_code=422,
+            detail={"key": "backend.errors.repo.invalidVerifyArchivesPerRun"},
+        )
+    return value or None
+
+
 def _resolve_restore_check_targets(
     *,
     request: Optional[dict],
@@ -851,7 +910,6 @@ async def _update_agent_repository_stats(repository: Repository, db: Session) ->
         last_backup_time = max(archive_times) if archive_times else None
 
         encryption_mode = None
-        total_size = None
         try:
             rinfo_job = queue_agent_repository_operation_job(
                 db, repository, job_kind="repository.rinfo"
@@ -866,10 +924,7 @@ async def _update_agent_repository_stats(repository: Repository, db: Session) ->
             encryption_mode = (rinfo.get("encryption") or {}).get("mode")
             # Borg 1 `info --json` exposes repo-level dedup size in cache.stats;
             # Borg 2 `repo-info --json` does not (remote size is unknowable).
-            stats = (rinfo.get("cache") or {}).get("stats") or {}
-            size_bytes = stats.get("unique_csize") or stats.get("unique_size")
-            if isinstance(size_bytes, (int, float)) and size_bytes > 0:
-                total_size = format_bytes(int(size_bytes))
+            apply_repository_info(repository, rinfo)
         except Exception as e:
             logger.warning(
                 "agent repo-info for stats refresh failed",
@@ -883,8 +938,6 @@ async def _update_agent_repository_stats(repository: Repository, db: Session) ->
                 repository.last_backup = last_backup_time
         if encryption_mode:
             repository.encryption = encryption_mode
-        if total_size:
-            repository.total_size = total_size
         db.commit()
         logger.info(
             "Updated agent repository stats",
@@ -902,9 +955,13 @@ async def _update_agent_repository_stats(repository: Repository, db: Session) ->
         return False
 
 
-async def update_repository_stats(repository: Repository, db: Session) -> bool:
+async def update_repository_stats(
+    repository: Repository, db: Session, refresh_size: bool = True
+) -> bool:
     """
     Update the archive count and repository size stats by querying Borg.
+    With ``refresh_size=False`` only the archive list is read and the
+    incrementally maintained size columns are kept as they are.
     Returns True if successful, False otherwise.
     """
     if is_agent_executor(repository):
@@ -924,11 +981,13 @@ async def update_repository_stats(repository: Repository, db: Session) -> bool:
 
         router = BorgRouter(repository)
 
-        # Get archive list and count
-        archives = await router.list_archives(env=stats_env)
+        # Get archive list and count. A full resync also bypasses the
+        # archive list cache.
+        archives = await router.list_archives(
+            env=stats_env, db=None if refresh_size else db
+        )
 
         archive_count = 0
-        total_size = None
         last_backup_time = None
 
         try:
@@ -976,29 +1035,27 @@ async def update_repository_stats(repository: Repository, db: Session) -> bool:
         # Get timeouts from DB settings (with fallback to config)
         timeouts = get_operation_timeouts(db)
 
-        try:
-            total_size_bytes = await router.calculate_total_size_bytes(
-                env=env,
-                info_timeout=timeouts["info_timeout"],
-                use_bypass_lock=use_bypass_lock,
-                temp_key_file=temp_key_file,
-            )
-            if total_size_bytes > 0:
-                total_size = format_bytes(total_size_bytes)
-        except Exception as e:
-            logger.warning(
-                "Failed to get repository size",
-                repository=repository.name,
-                error=str(e),
-            )
-
-        # Update repository
         old_count = repository.archive_count
         old_size = repository.total_size
+        if refresh_size:
+            try:
+                await router.refresh_size_stats(
+                    env=env,
+                    info_timeout=timeouts["info_timeout"],
+                    use_bypass_lock=use_bypass_lock,
+                    temp_key_file=temp_key_file,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to get repository size",
+                    repository=repository.name,
+                    error=str(e),
+                )
+        total_size = repository.total_size
+
+        # Update repository
         old_last_backup = repository.last_backup
         repository.archive_count = archive_count
-        if total_size:
-            repository.total_size = total_size
         if last_backup_time:
             repository.last_backup = last_backup_time
 
@@ -1253,6 +1310,7 @@ class RepositoryUpdate(BaseModel):
     bypass_lock: Optional[bool] = None  # Use --bypass-lock for read-only storage access
     custom_flags: Optional[str] = None  # Custom command-line flags for borg create
     upload_ratelimit_kib: Optional[int] = None
+    process_priorities: Optional[Dict[str, str]] = None  # operation -> class
     source_connection_id: Optional[int] = (
         None  # SSH connection ID for remote data source
     )
@@ -2915,47 +2973,26 @@ async def get_repositories(
 ):
     """Get all repositories"""
     try:
-        # Admins and wildcard-assigned users see all repos.
-        if current_user.role == "admin" or current_user.all_repositories_role:
-            repositories = db.query(Repository).all()
-        else:
-            permitted_ids = {
-                p.repository_id
-                for p in db.query(UserRepositoryPermission)
-                .filter_by(user_id=current_user.id)
-                .all()
-            }
-            repositories = (
-                db.query(Repository).filter(Repository.id.in_(permitted_ids)).all()
-            )
+        query = db.query(Repository)
+        visibility = get_repository_permissions(db, current_user).repository_filter(
+            Repository.id
+        )
+        if visibility is not None:
+            query = query.filter(visibility)
+        repositories = query.all()
+
+        # Repositories with running check, compact, or prune jobs
+        maintenance_repo_ids = {
+            repository_id
+            for job_model in (CheckJob, CompactJob, PruneJob)
+            for (repository_id,) in db.query(job_model.repository_id)
+            .filter(job_model.status == "running")
+            .distinct()
+        }
 
-        # Check for running maintenance jobs for each repository
         repo_list = []
         log_save_policy = get_log_save_policy(db)
         for repo in repositories:
-            # Check if this repository has running check, compact, or prune jobs
-            has_check = (
-                db.query(CheckJob)
-                .filter(CheckJob.repository_id == repo.id, CheckJob.status == "running")
-                .first()
-                is not None
-            )
-
-            has_compact = (
-                db.query(CompactJob)
-                .filter(
-                    CompactJob.repository_id == repo.id, CompactJob.status == "running"
-                )
-                .first()
-                is not None
-            )
-
-            has_prune = (
-                db.query(PruneJob)
-                .filter(PruneJob.repository_id == repo.id, PruneJob.status == "running")
-                .first()
-                is not None
-            )
             schedule_summary = _get_repository_schedule_summary(repo.id, db)
             source_directories = _decode_json_list_field(repo.source_directories)
 
@@ -3004,7 +3041,8 @@ async def get_repositories(
                 "bypass_lock": repo.bypass_lock or False,
                 "custom_flags": repo.custom_flags,
                 "upload_ratelimit_kib": repo.upload_ratelimit_kib,
-                "has_running_maintenance": has_check or has_compact or has_prune,
+                "process_priorities": repo.process_priorities,
+                "has_running_maintenance": repo.id in maintenance_repo_ids,
                 "has_schedule": schedule_summary["has_schedule"],
                 "schedule_enabled": schedule_summary["schedule_enabled"],
                 "schedule_name": schedule_summary["schedule_name"],
@@ -4103,6 +4141,10 @@ async def update_repository(
         update_data = repo_data.model_dump(exclude_unset=True)
         if "upload_ratelimit_kib" in update_data:
             _validate_upload_ratelimit_kib(repo_data.upload_ratelimit_kib)
+        if "process_priorities" in update_data:
+            process_priorities = _validate_process_priorities(
+                repo_data.process_priorities
+            )
 
         # Update fields
         if repo_data.name is not None:
@@ -4643,6 +4685,7 @@ async def update_repository(
             # If path changed, check if new path is a valid borg repository
             # If not, initialize it (like create mode does)
             if path_changed:
+                archive_list_cache.invalidate(repo_id)
                 logger.info(
                     "Repository path changed - checking if new path is valid borg repository",
                     repo_id=repo_id,
@@ -4838,6 +4881,9 @@ async def update_repository(
         if "upload_ratelimit_kib" in update_data:
             repository.upload_ratelimit_kib = repo_data.upload_ratelimit_kib
 
+        if "process_priorities" in update_data:
+            repository.process_priorities = process_priorities
+
         executor_changed = (
             "executor_type" in update_data or repo_data.execution_target is not None
         )
@@ -4955,6 +5001,7 @@ async def delete_repository(
         # Some tables don't have CASCADE delete, so we must manually handle them
 
         from app.database.models import (
+            MetricPoint,
             RepositoryScript,
             RestoreJob,
             CheckJob,
@@ -5078,9 +5125,15 @@ async def delete_repository(
                 "Unlinked script executions", repo_id=repo_id, count=script_exec_count
             )
 
-        # 6. Finally, delete the repository itself
+        # 6. Drop the repository's metric history (has CASCADE but delete explicitly)
+        db.query(MetricPoint).filter(MetricPoint.repository_id == repo_id).delete(
+            synchronize_session=False
+        )
+
+        # 7. Finally, delete the repository itself
         db.delete(repository)
         db.commit()
+        archive_list_cache.invalidate(repo_id)
 
         logger.info("Repository deleted", repo_id=repo_id, user=current_user.username)
 
@@ -5194,10 +5247,17 @@ async def check_repository(
             if request
             else None
         )
-        try:
-            validate_check_flags_for_max_duration(check_extra_flags, max_duration)
-        except CheckFlagConflictError as exc:
-            _raise_check_flag_conflict(exc)
+        verify_archives_per_run = _parse_verify_archives_per_run(
+            request.get("verify_archives_per_run") if request else None
+        )
+        if is_agent_executor(repository):
+            # Agents run plain ``borg check``; rotation needs the server's cache
+            verify_archives_per_run = None
+        if verify_archives_per_run is None:
+            try:
+                validate_check_flags_for_max_duration(check_extra_flags, max_duration)
+            except CheckFlagConflictError as exc:
+                _raise_check_flag_conflict(exc)
 
         if is_agent_executor(repository):
             ensure_repository_admission(
@@ -5240,6 +5300,9 @@ async def check_repository(
                 "message": "backend.success.repo.checkJobStarted",
             }
 
+        extra_fields = {"max_duration": max_duration, "extra_flags": check_extra_flags}
+        if verify_archives_per_run:
+            extra_fields["verify_archives_per_run"] = verify_archives_per_run
         check_job = start_background_maintenance_job(
             db,
             repository,
@@ -5249,10 +5312,7 @@ async def check_repository(
                 _dispatch_router_check,
                 _router_repo_snapshot(repository),
             ),
-            extra_fields={
-                "max_duration": max_duration,
-                "extra_flags": check_extra_flags,
-            },
+            extra_fields=extra_fields,
         )
 
         logger.info(
@@ -5347,6 +5407,64 @@ async def restore_check_repository(
         )
 
 
+@router.post("/{repo_id}/compression-tuning")
+async def start_compression_tuning(
+    repo_id: int,
+    request: CompressionTuningRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Benchmark compression specs on a sample of the repository's sources."""
+    try:
+        repository = get_repository_with_access(
+            db, current_user, repo_id, required_role="operator"
+        )
+        state = compression_tuning_service.start(
+            db,
+            repository,
+            apply=request.apply,
+            target_ratio=request.target_ratio,
+        )
+        asyncio.create_task(
+            compression_tuning_service.run(
+                repo_id, apply=request.apply, target_ratio=request.target_ratio
+            )
+        )
+        logger.info(
+            "Compression tuning started",
+            repository_id=repo_id,
+            apply=request.apply,
+            user=current_user.username,
+        )
+        return {
+            "tuning": state,
+            "message": "backend.success.repo.compressionTuningStarted",
+        }
+    except CompressionTuningError as e:
+        raise HTTPException(status_code=e.status_code, detail={"key": e.detail_key})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to start compression tuning", error=str(e))
+        raise HTTPException(
+            status_code=500,
+            detail={"key": "backend.errors.repo.failedToStartCompressionTuning"},
+        )
+
+
+@router.get("/{repo_id}/compression-tuning")
+async def get_compression_tuning(
+    repo_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Latest compression tuning result next to observed backup speeds."""
+    repository = get_repository_with_access(
+        db, current_user, repo_id, required_role="viewer"
+    )
+    return compression_tuning_service.serialize(db, repository)
+
+
 @router.post("/{repo_id}/compact")
 async def compact_repository(
     repo_id: int,
@@ -5606,6 +5724,118 @@ async def prune_repository(
         )
 
 
+def _estimate_prune_reclaim(db: Session, pruned: list) -> tuple[int, int]:
+    """Sum the deduplicated size each pruned archive added when it was created.
+
+    Returns ``(bytes, archives_without_size)``. Chunks a pruned archive shares
+    with kept archives stay, so this is an estimate, not what compact frees.
+    """
+    job_ids = {
+        decision.archive.get("backup_job_id")
+        for decision in pruned
+        if decision.archive.get("backup_job_id")
+    }
+    sizes = {}
+    if job_ids:
+        sizes = dict(
+            db.query(BackupJob.id, BackupJob.deduplicated_size)
+            .filter(BackupJob.id.in_(job_ids))
+            .all()
+        )
+    reclaim = 0
+    without_size = 0
+    for decision in pruned:
+        size = sizes.get(decision.archive.get("backup_job_id"))
+        if size:
+            reclaim += size
+        else:
+            without_size += 1
+    return reclaim, without_size
+
+
+@router.post("/{repo_id}/prune-preview")
+async def preview_prune(
+    repo_id: int,
+    request: PrunePreviewRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Show what a prune would keep and delete, without running Borg.
+
+    Borg's retention rules are evaluated over the cached archive list, so
+    adjusting the policy does not take the repository lock or open an SSH
+    connection. The real prune still runs through borg.
+    """
+    keep_within = _normalize_prune_keep_within(request.keep_within)
+    try:
+        tz = ZoneInfo(request.timezone) if request.timezone else None
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(
+            status_code=422,
+            detail={"key": "backend.errors.repo.invalidPruneTimezone"},
+        )
+
+    listing = await list_repository_archives(
+        repo_id,
+        sort=DEFAULT_ARCHIVE_SORT,
+        limit=None,
+        cursor=None,
+        name=None,
+        since=None,
+        until=None,
+        current_user=current_user,
+        db=db,
+    )
+    try:
+        simulation = simulate_prune(
+            listing["archives"],
+            keep_hourly=request.keep_hourly,
+            keep_daily=request.keep_daily,
+            keep_weekly=request.keep_weekly,
+            keep_monthly=request.keep_monthly,
+            keep_quarterly=request.keep_quarterly,
+            keep_yearly=request.keep_yearly,
+            keep_within=keep_within,
+            name_glob=request.name_glob,
+            tz=tz,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=422,
+            detail={"key": "backend.errors.repo.invalidPruneKeepWithin"},
+        )
+
+    pruned = simulation.pruned
+    reclaim_bytes, without_size = _estimate_prune_reclaim(db, pruned)
+    return {
+        "dry_run": True,
+        "archives": [
+            {
+                "name": decision.name,
+                "id": decision.archive.get("id"),
+                "start": decision.time.isoformat(),
+                "keep": decision.keep,
+                "reason": decision.reason,
+            }
+            for decision in simulation.decisions
+        ],
+        "kept_count": len(simulation.decisions) - len(pruned),
+        "pruned_count": len(pruned),
+        "unmatched_count": simulation.unmatched,
+        "undated_count": simulation.undated,
+        "estimated_reclaim_bytes": reclaim_bytes,
+        "archives_without_size": without_size,
+        # Same shape as a borg dry run so the prune dialog renders it as is
+        "prune_result": {
+            "success": True,
+            "stdout": "\n".join(
+                format_prune_line(decision) for decision in simulation.decisions
+            ),
+            "stderr": "",
+        },
+    }
+
+
 @router.post("/{repo_id}/wipe-preview")
 async def preview_repository_wipe(
     repo_id: int,
@@ -5941,13 +6171,70 @@ async def initialize_borg_repository(
     return result
 
 
+def _archive_page(archives: list, page_options: dict) -> ArchivePage:
+    try:
+        return page_archives(archives, **page_options)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={"key": "backend.errors.repo.invalidArchiveListQuery"},
+        )
+
+
+def _archive_list_response(
+    repository: Repository, archives: list, db: Session, page_options: dict
+) -> dict:
+    """Page the archive list, then enrich only the archives being returned."""
+    page = _archive_page(archives, page_options)
+    return {
+        "success": True,
+        "archives": enrich_archives_with_backup_metadata(page.archives, repository, db),
+        "total": page.total,
+        "next_cursor": page.next_cursor,
+        "repository": {
+            "id": repository.id,
+            "name": repository.name,
+            "path": repository.path,
+        },
+    }
+
+
 @router.get("/{repo_id}/archives")
 async def list_repository_archives(
     repo_id: int,
+    sort: str = DEFAULT_ARCHIVE_SORT,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List all archives in a repository using borg list"""
+    """List archives in a repository using borg list.
+
+    ``sort`` is one of oldest (default), newest, name_asc or name_desc.
+    ``name`` is a shell-style glob and ``since``/``until`` bound the archive
+    start time. With ``limit`` the response holds one page and
+    ``next_cursor`` fetches the next; ``total`` counts all matches.
+    """
+    page_options = {
+        "sort": sort,
+        "limit": limit,
+        "cursor": cursor,
+        "name_glob": name,
+        "since": since,
+        "until": until,
+    }
+    repository = _load_repository_with_access(repo_id, current_user, db, "viewer")
+    # Reject bad paging input before running borg list.
+    _archive_page([], page_options)
+
+    # Served from the archive list cache when still current, without waiting
+    # for the repository command lock.
+    cached_archives, cache_ticket = await archive_list_cache.lookup(repository, db)
+    if cached_archives is not None:
+        return _archive_list_response(repository, cached_archives, db, page_options)
 
     async def _operation():
         repository = _load_repository_with_access(repo_id, current_user, db, "viewer")
@@ -5965,22 +6252,13 @@ async def list_repository_archives(
             )
             archives_data = _parse_agent_json_result(result)
             archives = archives_data.get("archives", [])
-            archives = enrich_archives_with_backup_metadata(archives, repository, db)
             logger.info(
                 "Agent repository archives listed successfully",
                 repo_id=repo_id,
                 agent_job_id=agent_job.id,
                 count=len(archives),
             )
-            return {
-                "success": True,
-                "archives": archives,
-                "repository": {
-                    "id": repository.id,
-                    "name": repository.name,
-                    "path": repository.path,
-                },
-            }
+            return _archive_list_response(repository, archives, db, page_options)
 
         use_bypass_lock, source = _resolve_bypass_lock(
             repository, db, "bypass_lock_on_list"
@@ -6008,21 +6286,13 @@ async def list_repository_archives(
         try:
             archives_data = json.loads(stdout.decode())
             archives = archives_data.get("archives", [])
-            archives = enrich_archives_with_backup_metadata(archives, repository, db)
+            archive_list_cache.store(cache_ticket, archives)
 
             logger.info(
                 "Archives listed successfully", repo_id=repo_id, count=len(archives)
             )
 
-            return {
-                "success": True,
-                "archives": archives,
-                "repository": {
-                    "id": repository.id,
-                    "name": repository.name,
-                    "path": repository.path,
-                },
-            }
+            return _archive_list_response(repository, archives, db, page_options)
         except json.JSONDecodeError as e:
             logger.error("Failed to parse borg list output", error=str(e))
             raise HTTPException(
@@ -6237,7 +6507,7 @@ async def get_repository_stats(
         }
 
         # Try to get archive count
-        archives_data = await router.list_archives(env=env)
+        archives_data = await router.list_archives(env=env, db=db)
         if archives_data is not None:
             try:
                 if archives_data:
@@ -6741,7 +7011,16 @@ async def update_check_schedule(
                 request.get("check_extra_flags")
             )
 
-        if repo.check_cron_expression and repo.check_schedule_enabled:
+        if "verify_archives_per_run" in request:
+            repo.check_verify_archives_per_run = _parse_verify_archives_per_run(
+                request.get("verify_archives_per_run")
+            )
+
+        if (
+            repo.check_cron_expression
+            and repo.check_schedule_enabled
+            and not repo.check_verify_archives_per_run
+        ):
             try:
                 validate_check_flags_for_max_duration(
                     repo.check_extra_flags, repo.check_max_duration
@@ -6797,6 +7076,7 @@ async def update_check_schedule(
                 "next_scheduled_check": serialize_datetime(repo.next_scheduled_check),
                 "check_max_duration": repo.check_max_duration,
                 "check_extra_flags": repo.check_extra_flags,
+                "check_verify_archives_per_run": repo.check_verify_archives_per_run,
                 "notify_on_check_success": repo.notify_on_check_success,
                 "notify_on_check_failure": repo.notify_on_check_failure,
             },
@@ -7039,6 +7319,7 @@ async def get_check_schedule(
             "next_scheduled_check": serialize_datetime(repo.next_scheduled_check),
             "check_max_duration": repo.check_max_duration,
             "check_extra_flags": repo.check_extra_flags,
+            "check_verify_archives_per_run": repo.check_verify_archives_per_run,
             "notify_on_check_success": repo.notify_on_check_success,
             "notify_on_check_failure": repo.notify_on_check_failure,
             # "enabled" means "will actually run": cron is set AND toggle is on.
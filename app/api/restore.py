@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel, Field
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 import structlog
 from typing import List, Literal, Optional
@@ -14,8 +15,10 @@ from app.core.borg_router import BorgRouter
 from app.core.security import (
     get_current_user,
     check_repo_access,
+    get_repository_permissions,
     require_repository_access_by_path,
 )
+from app.services.change_versions import conditional_etag
 from app.services.log_policy import get_log_save_policy, job_has_logs_by_policy
 from app.services.restore_service import restore_service
 from app.utils.datetime_utils import serialize_datetime
@@ -250,25 +253,33 @@ async def start_restore(
 
 @router.get("/jobs")
 async def get_restore_jobs(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     limit: int = 50,
 ):
     """Get all restore jobs (most recent first)"""
+    not_modified = conditional_etag(
+        request,
+        response,
+        ("jobs", "repositories", "settings", "permissions"),
+        current_user,
+    )
+    if not_modified:
+        return not_modified
     try:
-        jobs = db.query(RestoreJob).order_by(RestoreJob.id.desc()).limit(limit).all()
-        visible_jobs = []
-        for job in jobs:
-            repo = _get_restore_job_repository(db, job.repository)
-            if repo is None:
-                if current_user.role == "admin":
-                    visible_jobs.append(job)
-                continue
-            try:
-                check_repo_access(db, current_user, repo, "viewer")
-                visible_jobs.append(job)
-            except HTTPException:
-                continue
+        query = db.query(RestoreJob)
+        if current_user.role != "admin":
+            # Jobs whose repository no longer exists are only shown to admins
+            visible_paths = select(Repository.path)
+            visibility = get_repository_permissions(db, current_user).repository_filter(
+                Repository.id
+            )
+            if visibility is not None:
+                visible_paths = visible_paths.where(visibility)
+            query = query.filter(RestoreJob.repository.in_(visible_paths))
+        jobs = query.order_by(RestoreJob.id.desc()).limit(limit).all()
 
         log_save_policy = get_log_save_policy(db)
         return {
@@ -296,7 +307,7 @@ async def get_restore_jobs(
                         "estimated_time_remaining": job.estimated_time_remaining or 0,
                     },
                 }
-                for job in visible_jobs
+                for job in jobs
             ]
         }
     except Exception as e:
@@ -1196,49 +1196,25 @@ async def update_system_settings(
 
 async def _run_stats_refresh_background(repo_ids: list, username: str):
     """Background task to refresh stats for all repositories"""
-    from app.core.borg_router import BorgRouter
-    from app.database.database import SessionLocal
+    from app.services.stats_refresh_scheduler import stats_refresh_scheduler
 
-    db = SessionLocal()
     try:
-        success_count = 0
-        error_count = 0
-
-        for repo_id in repo_ids:
-            repo = db.query(Repository).filter(Repository.id == repo_id).first()
-            if not repo:
-                continue
-            try:
-                result = await BorgRouter(repo).update_stats(db)
-                if result:
-                    success_count += 1
-                else:
-                    error_count += 1
-            except Exception as e:
-                logger.error(
-                    "Error refreshing stats for repository",
-                    repo_id=repo.id,
-                    repo_name=repo.name,
-                    error=str(e),
-                )
-                error_count += 1
-
-        # Update last_stats_refresh timestamp
-        settings = db.query(SystemSettings).first()
-        if settings:
-            settings.last_stats_refresh = datetime.utcnow()
-            db.commit()
+        # A manual refresh bypasses the unchanged-repository probe and
+        # resyncs sizes with a full `borg info`.
+        progress = await stats_refresh_scheduler.refresh_repositories(
+            repo_ids, force=True
+        )
+        if progress is None:
+            return
 
         logger.info(
             "Background stats refresh completed",
             user=username,
-            success=success_count,
-            errors=error_count,
+            success=progress.succeeded,
+            errors=progress.failed,
         )
     except Exception as e:
         logger.error("Background stats refresh failed", error=str(e))
-    finally:
-        db.close()
 
 
 @router.post("/refresh-stats")
@@ -1290,6 +1266,15 @@ async def refresh_all_stats(
         )
 
 
+@router.get("/refresh-stats/status")
+async def get_stats_refresh_status(current_user: User = Depends(get_current_user)):
+    """Progress of the current (or most recent) repository stats refresh."""
+    del current_user
+    from app.services.stats_refresh_scheduler import stats_refresh_scheduler
+
+    return stats_refresh_scheduler.progress.to_dict()
+
+
 @router.post("/backup-monitoring/run")
 async def run_backup_monitoring_now(
     current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Query
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 import contextlib
 import math
 import structlog
@@ -16,6 +16,7 @@ from app.database.models import (
     User,
     SSHKey,
     SSHConnection,
+    SSHConnectionSample,
     Repository,
     BackupJob,
     RestoreJob,
@@ -23,6 +24,13 @@ from app.database.models import (
 )
 from app.core.authorization import authorize_request
 from app.core.security import get_current_user, encrypt_secret, decrypt_secret
+from app.services.connection_storage_prober import (
+    ConnectionProbeResult,
+    connection_history,
+    latest_connection_measurements,
+    record_connection_sample,
+    storage_growth_per_day,
+)
 from app.config import settings
 from app.utils.datetime_utils import serialize_datetime
 from app.utils.ssh_host_validation import normalize_ssh_host
@@ -57,6 +65,12 @@ def _is_ssh_dns_resolution_error(error_msg: str) -> bool:
     )
 
 
+def format_signed_bytes(bytes_size: float) -> str:
+    """Format a byte delta with its sign (e.g., '+1.23 GB', '-512.00 B')"""
+    sign = "-" if bytes_size < 0 else "+"
+    return sign + format_bytes(abs(bytes_size))
+
+
 def format_bytes(bytes_size: int) -> str:
     """Format bytes to human readable string (e.g., '1.23 GB')"""
     for unit in ["B", "KB", "MB", "GB", "TB", "PB"]:
@@ -1098,15 +1112,23 @@ async def deploy_ssh_key(
 async def get_ssh_connections(
     current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
-    """Get all SSH connections with storage information"""
+    """Get all SSH connections with storage information
+
+    Served from the values and history the background prober stores; no SSH
+    session is opened here.
+    """
     try:
         connections = db.query(SSHConnection).all()
+        connection_ids = [conn.id for conn in connections]
+        growth = storage_growth_per_day(db, connection_ids)
+        measurements = latest_connection_measurements(db, connection_ids)
 
         result_connections = []
         for conn in connections:
             # Format storage info if available
             storage = None
             if conn.storage_total is not None:
+                growth_per_day = growth.get(conn.id)
                 storage = {
                     "total": conn.storage_total,
                     "total_formatted": format_bytes(conn.storage_total),
@@ -1116,7 +1138,14 @@ async def get_ssh_connections(
                     "available_formatted": format_bytes(conn.storage_available),
                     "percent_used": conn.storage_percent_used,
                     "last_check": serialize_datetime(conn.last_storage_check),
+                    "growth_per_day": growth_per_day,
+                    "growth_per_day_formatted": (
+                        format_signed_bytes(growth_per_day)
+                        if growth_per_day is not None
+                        else None
+                    ),
                 }
+            measurement = measurements.get(conn.id)
 
             result_connections.append(
                 {
@@ -1136,6 +1165,10 @@ async def get_ssh_connections(
                     "last_success": serialize_datetime(conn.last_success),
                     "error_message": conn.error_message,
                     "storage": storage,
+                    "latency_ms": measurement.latency_ms if measurement else None,
+                    "throughput_mbps": (
+                        measurement.throughput_mbps if measurement else None
+                    ),
                     "created_at": serialize_datetime(conn.created_at),
                 }
             )
@@ -1523,6 +1556,27 @@ async def run_ssh_connection_diagnostics(
             os.unlink(key_file_path)
 
 
+async def measure_ssh_throughput(
+    connection: SSHConnection,
+    ssh_key: SSHKey,
+    *,
+    timeout_seconds: float,
+    probe_size_bytes: int,
+) -> dict[str, Any]:
+    """Run the diagnostics speed probe on its own, for background sampling."""
+    key_file_path = write_ssh_key_to_tempfile(ssh_key)
+    try:
+        return await _run_ssh_throughput_probe(
+            connection,
+            key_file_path,
+            timeout_seconds=timeout_seconds,
+            probe_size_bytes=probe_size_bytes,
+        )
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(key_file_path)
+
+
 def _resolve_connection_ssh_key(connection: SSHConnection, db: Session) -> SSHKey:
     ssh_key = connection.ssh_key
     if ssh_key:
@@ -1863,17 +1917,16 @@ async def refresh_connection_storage(
         )
 
         # Collect storage information
+        started_at = _monotonic()
         storage_info = await collect_storage_info(connection, ssh_key)
-
+        probe = ConnectionProbeResult(storage=storage_info)
         if storage_info:
-            # Update connection with storage info
-            connection.storage_total = storage_info["total"]
-            connection.storage_used = storage_info["used"]
-            connection.storage_available = storage_info["available"]
-            connection.storage_percent_used = storage_info["percent_used"]
-            connection.last_storage_check = datetime.utcnow()
+            probe.latency_ms = round((_monotonic() - started_at) * 1000, 1)
+        # Manual refreshes are part of the history like background probes
+        record_connection_sample(db, connection, probe)
+        db.commit()
 
-            db.commit()
+        if storage_info:
             db.refresh(connection)
 
             logger.info(
@@ -1924,6 +1977,48 @@ async def refresh_connection_storage(
         )
 
 
+@router.get("/connections/{connection_id}/history")
+async def get_connection_history(
+    connection_id: int,
+    days: int = Query(30, ge=1, le=730),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Storage, latency and throughput samples recorded for an SSH connection"""
+    connection = (
+        db.query(SSHConnection).filter(SSHConnection.id == connection_id).first()
+    )
+    if not connection:
+        raise HTTPException(
+            status_code=404,
+            detail={"key": "backend.errors.ssh.sshConnectionNotFound"},
+        )
+
+    since = datetime.utcnow() - timedelta(days=days)
+    samples = connection_history(db, connection_id, since=since)
+    return {
+        "success": True,
+        "connection_id": connection_id,
+        "growth_per_day": storage_growth_per_day(db, [connection_id]).get(
+            connection_id
+        ),
+        "samples": [
+            {
+                "sampled_at": serialize_datetime(sample.sampled_at),
+                "resolution": sample.resolution,
+                "sample_count": sample.sample_count,
+                "failures": sample.failures,
+                "storage_total": sample.storage_total,
+                "storage_used": sample.storage_used,
+                "storage_available": sample.storage_available,
+                "latency_ms": sample.latency_ms,
+                "throughput_mbps": sample.throughput_mbps,
+            }
+            for sample in samples
+        ],
+    }
+
+
 @router.post("/connections/{connection_id}/test")
 async def test_existing_connection(
     connection_id: int,
@@ -2209,6 +2304,9 @@ async def delete_ssh_connection(
         db.query(ScheduledJob).filter(
             ScheduledJob.source_ssh_connection_id == connection_id
         ).update({"source_ssh_connection_id": None}, synchronize_session=False)
+        db.query(SSHConnectionSample).filter(
+            SSHConnectionSample.connection_id == connection_id
+        ).delete(synchronize_session=False)
 
         db.delete(connection)
         db.commit()
@@ -10,11 +10,18 @@ import asyncio
 import re
 import tempfile  # noqa: F401 - retained as a patch target in download endpoint tests
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 import structlog
 
-from app.api.archive_download import extract_file_download
+from app.api.archive_download import (
+    STREAM_CHUNK_SIZE,
+    extract_file_download,
+    lookup_cached_file_size,
+    stream_extracted_file,
+)
 from app.database.database import get_db
 from app.database.models import User, Repository, DeleteArchiveJob, SystemSettings
 from app.core.security import get_current_user, get_current_download_user
@@ -34,7 +41,11 @@ from app.services.repository_executor import (
     wait_for_agent_repository_operation_job,
 )
 from app.services.v2.archive_browse import get_browse_depth, is_fast_browse_enabled
-from app.utils.borg_env import repository_borg_env
+from app.utils.borg_env import (
+    build_repository_borg_env,
+    cleanup_temp_key_file,
+    repository_borg_env,
+)
 from app.utils.datetime_utils import serialize_datetime
 
 logger = structlog.get_logger()
@@ -597,11 +608,49 @@ async def delete_archive(
 # ── Download file from archive ─────────────────────────────────────────────────
 
 
+async def _stream_v2_file(
+    repo: Repository,
+    db: Session,
+    archive_selector: str,
+    file_path: str,
+    size: Optional[int],
+    range_header: Optional[str],
+    on_empty=None,
+):
+    env, temp_key_file = (
+        build_repository_borg_env(repo, db)
+        if _repo_needs_custom_env(repo)
+        else (None, None)
+    )
+
+    async def open_process():
+        return await borg2.open_extract_stdout(
+            repo.path,
+            archive_selector,
+            file_path,
+            passphrase=repo.passphrase,
+            remote_path=repo.remote_path,
+            bypass_lock=repo.bypass_lock,
+            env=env,
+            read_limit=STREAM_CHUNK_SIZE,
+        )
+
+    return await stream_extracted_file(
+        file_path,
+        size,
+        open_process,
+        range_header=range_header,
+        on_close=lambda: cleanup_temp_key_file(temp_key_file),
+        on_empty=on_empty,
+    )
+
+
 @router.get("/download")
 async def download_file_from_archive(
     repository: str,
     archive: str,
     file_path: str,
+    range_header: Optional[str] = Header(None, alias="Range"),
     current_user: User = Depends(get_current_download_user),
     db: Session = Depends(get_db),
 ):
@@ -622,6 +671,7 @@ async def download_file_from_archive(
                         remote_path=repo.remote_path,
                         bypass_lock=repo.bypass_lock,
                         env=env,
+                        repository_record=repo,
                     )
             return await borg2.extract_archive(
                 repo.path,
@@ -631,13 +681,37 @@ async def download_file_from_archive(
                 passphrase=repo.passphrase,
                 remote_path=repo.remote_path,
                 bypass_lock=repo.bypass_lock,
+                repository_record=repo,
             )
 
-        return await extract_file_download(
+        async def temp_dir_download():
+            return await extract_file_download(
+                file_path,
+                extract,
+                temp_dir_factory=tempfile.mkdtemp,
+                path_exists=os.path.exists,
+            )
+
+        # Stream from `borg2 extract --stdout`. The size from a cached listing
+        # enables Content-Length and Range; without it the file is sent
+        # chunked. Only directories, for which borg writes nothing, go
+        # through a temp dir.
+        size = await lookup_cached_file_size(
+            repo.id,
+            file_path,
+            [
+                _get_browse_raw_cache_key(archive),
+                _get_browse_cache_key(archive, os.path.dirname(file_path.strip("/"))),
+            ],
+        )
+        return await _stream_v2_file(
+            repo,
+            db,
+            archive_selector,
             file_path,
-            extract,
-            temp_dir_factory=tempfile.mkdtemp,
-            path_exists=os.path.exists,
+            size,
+            range_header,
+            on_empty=temp_dir_download,
         )
     except HTTPException:
         raise
@@ -8,7 +8,7 @@ freed automatically after delete or prune).
 import json
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from typing import Optional
 import structlog
@@ -80,6 +80,8 @@ class CheckV2Request(BaseModel):
     repository_id: int
     max_duration: Optional[int] = None
     check_extra_flags: Optional[str] = None
+    # Verify this many archives' data instead of running borg check
+    verify_archives_per_run: Optional[int] = Field(default=None, ge=0)
 
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
@@ -133,6 +135,7 @@ async def run_backup(
 
     backup_job = BackupJob(
         repository=repo.path,
+        repository_id=repo.id,
         status="pending",
         source_ssh_connection_id=repo.source_ssh_connection_id,
     )
@@ -325,14 +328,18 @@ async def check_repository(
     check_extra_flags = (
         data.check_extra_flags.strip() if data.check_extra_flags else None
     )
-    try:
-        validate_check_flags_for_max_duration(check_extra_flags, data.max_duration)
-    except CheckFlagConflictError as exc:
-        _raise_check_flag_conflict(exc)
+    verify_archives_per_run = data.verify_archives_per_run or None
+    if verify_archives_per_run is None:
+        try:
+            validate_check_flags_for_max_duration(check_extra_flags, data.max_duration)
+        except CheckFlagConflictError as exc:
+            _raise_check_flag_conflict(exc)
 
     extra_fields = {"max_duration": data.max_duration}
     if check_extra_flags:
         extra_fields["extra_flags"] = check_extra_flags
+    if verify_archives_per_run:
+        extra_fields["verify_archives_per_run"] = verify_archives_per_run
 
     check_job = start_background_maintenance_job(
         db,
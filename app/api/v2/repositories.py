@@ -7,6 +7,7 @@ The borg2 core wrapper is the ONLY borg binary interaction here — never borg.p
 import json
 import os
 import re
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
@@ -20,6 +21,7 @@ from app.core.security import get_current_user
 from app.core.features import require_feature
 from app.core.borg2 import borg2, BORG2_ENCRYPTION_MODES
 from app.core.borg_errors import is_lock_error
+from app.services.archive_list_cache import archive_list_cache
 from app.services.agent_job_dispatcher import dispatch_agent_job_best_effort
 from app.services.repository_command_lock import run_serialized_repository_command
 from app.services.repository_executor import (
@@ -31,6 +33,7 @@ from app.services.v2.repository_service import repository_v2_service
 from app.utils.fs import calculate_path_size_bytes
 from app.utils.borg_env import repository_borg_env
 from app.utils.archive_job_metadata import enrich_archives_with_backup_metadata
+from app.utils.archive_listing import DEFAULT_ARCHIVE_SORT, page_archives
 from app.utils.repository_paths import build_ssh_repository_path
 from app.utils.source_locations import legacy_source_fields, normalize_source_locations
 
@@ -649,10 +652,58 @@ async def get_repository_info(
 @router.get("/{repo_id}/archives")
 async def list_archives(
     repo_id: int,
+    sort: str = DEFAULT_ARCHIVE_SORT,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List all archives in a Borg 2 repository."""
+    """List archives in a Borg 2 repository.
+
+    Accepts the same sort, paging and filter parameters as the v1 archive
+    list endpoint.
+    """
+
+    def _archive_list_response(repo: Repository, archives: list) -> dict:
+        try:
+            page = page_archives(
+                archives,
+                sort=sort,
+                limit=limit,
+                cursor=cursor,
+                name_glob=name,
+                since=since,
+                until=until,
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail={"key": "backend.errors.repo.invalidArchiveListQuery"},
+            )
+        return {
+            "archives": enrich_archives_with_backup_metadata(page.archives, repo, db),
+            "total": page.total,
+            "next_cursor": page.next_cursor,
+            "borg_version": 2,
+        }
+
+    cached_repo = (
+        db.query(Repository)
+        .filter(Repository.id == repo_id, Repository.borg_version == 2)
+        .first()
+    )
+    cache_ticket = None
+    if cached_repo:
+        # Reject bad paging input before running borg list.
+        _archive_list_response(cached_repo, [])
+        # Served from the archive list cache when still current, without
+        # waiting for the repository command lock.
+        cached_archives, cache_ticket = await archive_list_cache.lookup(cached_repo, db)
+        if cached_archives is not None:
+            return _archive_list_response(cached_repo, cached_archives)
 
     async def _operation():
         repo = (
@@ -707,10 +758,9 @@ async def list_archives(
         except json.JSONDecodeError:
             data = {}
 
-        archives = enrich_archives_with_backup_metadata(
-            data.get("archives", []), repo, db
-        )
-        return {"archives": archives, "borg_version": 2}
+        if cache_ticket is not None and isinstance(data.get("archives"), list):
+            archive_list_cache.store(cache_ticket, data["archives"])
+        return _archive_list_response(repo, data.get("archives", []))
 
     return await run_serialized_repository_command(repo_id, _operation)
 
@@ -188,6 +188,10 @@ class Settings(BaseSettings):
     # Cache behavior settings
     cache_ttl_seconds: int = 7200  # 2 hours
     cache_max_size_mb: int = 2048  # 2GB
+    # Archive list cache: repositories whose directory can't be probed for
+    # changes (restricted SSH shells, sftp/rclone) reuse a cached list this long
+    archive_list_cache_ttl_seconds: int = 300
+    archive_list_cache_probe_timeout: int = 10
 
     # Backup settings
     max_backup_jobs: int = 5
@@ -214,6 +218,111 @@ class Settings(BaseSettings):
     )
     scan_timeout_seconds: int = 15  # Source discovery database scan timeout
 
+    # Repository stats refresh (periodic and manual "refresh all")
+    stats_refresh_concurrency: int = 8  # Repositories refreshed at the same time
+    stats_refresh_per_host_concurrency: int = (
+        2  # Concurrent refreshes against one SSH host, agent or local disk
+    )
+    stats_refresh_repository_timeout: int = (
+        1800  # 30 minutes - per-repository budget for list + info
+    )
+    stats_refresh_probe_timeout: int = (
+        30  # Cheap change probe run before the full refresh
+    )
+
+    # SSH connections are probed in the background for free space, latency
+    # and throughput (0 minutes disables it). Probes run concurrently, bounded
+    # globally and per host; samples are kept at full resolution for the raw
+    # window and then as one row per day. 0 throughput bytes skips the speed
+    # probe
+    connection_probe_interval_minutes: int = 15
+    connection_probe_concurrency: int = 8
+    connection_probe_per_host_concurrency: int = 1
+    connection_probe_timeout: int = 60
+    connection_probe_throughput_bytes: int = 262_144
+    connection_probe_raw_retention_hours: int = 48
+    connection_probe_daily_retention_days: int = 730
+
+    # Repository size and backup performance history: raw points are folded
+    # into hourly rows every hour, hourly rows into daily and daily into
+    # weekly rows once they age past these windows
+    metric_history_hourly_retention_days: int = 14
+    metric_history_daily_retention_days: int = 400
+    metric_history_weekly_retention_days: int = 1825
+
+    # MQTT state publishing: change-triggered syncs within the debounce window
+    # share one pass (0 = sync immediately) and backup progress topics are
+    # republished at most this often while a job keeps running
+    mqtt_sync_debounce_seconds: float = 2.0
+    mqtt_progress_min_interval_seconds: float = 30.0
+
+    # Large local restores run several `borg extract` processes in parallel,
+    # partitioned using the cached archive listing (0 = one per core, up to 8;
+    # 1 = always a single extract)
+    restore_parallel_shards: int = 0
+    restore_parallel_min_size_mb: int = 1024
+
+    # Restores to SSH destinations: "auto" streams `borg export-tar` into a
+    # remote `tar -x` when the host has a shell with tar and otherwise extracts
+    # through SSHFS; "tar" and "sshfs" force one transport
+    restore_ssh_transport: str = "auto"
+
+    # Restore checks hash a `borg export-tar` stream in process instead of
+    # extracting into a scratch directory under data_dir, so they need no
+    # free disk space; false goes back to extracting
+    restore_check_streaming: bool = True
+
+    # Remote SSH backup sources are mounted with SSHFS. SSHFS inode numbers
+    # change on every mount, so the files cache compares mtime and size only;
+    # the mount itself uses larger reads, kernel caching, fast ciphers and
+    # several SFTP connections (sshfs >= 3.7)
+    sshfs_source_profile: bool = True
+    sshfs_source_files_cache: str = "mtime,size"
+    sshfs_source_max_read_kib: int = 1024
+    sshfs_source_max_conns: int = 4
+    sshfs_source_ciphers: str = (
+        "aes128-gcm@openssh.com,chacha20-poly1305@openssh.com,aes128-ctr"
+    )
+    sshfs_source_compression: bool = False
+
+    # Priority class ("normal", "low" or "idle") of the processes each kind of
+    # job spawns; repositories can override it per operation. "low" is nice 10
+    # with best-effort I/O level 7, "idle" is nice 19 with idle I/O
+    process_priority_backup: str = "normal"
+    process_priority_restore: str = "normal"
+    process_priority_check: str = "low"
+    process_priority_compact: str = "low"
+    process_priority_prune: str = "normal"
+    process_priority_script: str = "normal"
+    # Optional cgroup v2 limits for the low and idle classes: a delegated,
+    # writable cgroup directory plus cpu.max / io.max values in kernel syntax
+    process_cgroup_root: str = ""
+    process_cgroup_low_cpu_max: str = ""
+    process_cgroup_low_io_max: str = ""
+    process_cgroup_idle_cpu_max: str = ""
+    process_cgroup_idle_io_max: str = ""
+
+    # Upload bandwidth budget in KiB/s shared by all running backups to SSH
+    # repositories, overall and per destination host (0 = no budget). Jobs
+    # are relayed through a token bucket that is rebalanced periodically
+    upload_bandwidth_budget_kib: int = 0
+    upload_bandwidth_destination_budget_kib: int = 0
+    upload_bandwidth_rebalance_seconds: int = 5
+
+    # Source size for backup progress: "incremental" reuses the previous
+    # archive's original size while a sample of source directories is mostly
+    # unchanged and the baseline is recent (0 days = no age limit); "du"
+    # always walks the sources
+    source_size_estimation: str = "incremental"
+    source_size_sample_dirs: int = 200
+    source_size_changed_threshold: float = 0.1
+    source_size_max_age_days: int = 7
+
+    # Compression auto-tune: bytes sampled from local sources and the time
+    # allowed for each candidate backup of the sample
+    compression_tuning_sample_mb: int = 64
+    compression_tuning_timeout: int = 600
+
     # Rclone-backed repository storage
     rclone_config_root: str = ""
     rclone_cache_root: str = ""
@@ -134,6 +134,9 @@ ENDPOINT_POLICIES: Dict[Tuple[str, str], EndpointPolicy] = {
     ("POST", "/api/repositories/{repo_id}/prune"): EndpointPolicy(
         ("admin",), "backend.errors.repo.adminAccessRequired"
     ),
+    ("POST", "/api/repositories/{repo_id}/compression-tuning"): EndpointPolicy(
+        ("admin",), "backend.errors.repo.adminAccessRequired"
+    ),
     ("POST", "/api/repositories/{repo_id}/wipe-preview"): EndpointPolicy(
         ("admin",), "backend.errors.repo.adminAccessRequired"
     ),
@@ -6,6 +6,7 @@ import structlog
 from typing import Dict, List
 from datetime import datetime, timezone
 from app.config import settings
+from app.utils.process_priority import ProcessPriority, resolve_process_priority
 from app.utils.ssh_utils import public_key_only_ssh_args
 
 logger = structlog.get_logger()
@@ -63,13 +64,8 @@ class BorgInterface:
 
         return os.path.expanduser("~/.cache/borg")
 
-    async def _execute_command(
-        self, cmd: List[str], timeout: int = 3600, cwd: str = None, env: dict = None
-    ) -> Dict:
-        """Execute a command with real-time output capture"""
-        logger.info("Executing command", command=" ".join(cmd), cwd=cwd)
-
-        # Set up environment with SSH options for remote repositories
+    def _base_env(self, env: dict = None) -> dict:
+        """Build the process environment shared by borg commands."""
         exec_env = os.environ.copy()
 
         # Configure lock behavior with quick timeout
@@ -100,6 +96,20 @@ class BorgInterface:
         # Merge any additional environment variables
         if env:
             exec_env.update(env)
+        return exec_env
+
+    async def _execute_command(
+        self,
+        cmd: List[str],
+        timeout: int = 3600,
+        cwd: str = None,
+        env: dict = None,
+        priority: ProcessPriority = None,
+    ) -> Dict:
+        """Execute a command with real-time output capture"""
+        logger.info("Executing command", command=" ".join(cmd), cwd=cwd)
+
+        exec_env = self._base_env(env)
 
         try:
             process = await asyncio.create_subprocess_exec(
@@ -109,6 +119,8 @@ class BorgInterface:
                 cwd=cwd,
                 env=exec_env,
             )
+            if priority is not None:
+                priority.apply(process.pid)
 
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(), timeout=timeout
@@ -462,6 +474,7 @@ class BorgInterface:
         archive_name: str = None,
         remote_path: str = None,
         passphrase: str = None,
+        repository_record=None,
     ) -> Dict:
         """Execute backup operation with direct parameters"""
         if not repository:
@@ -507,7 +520,10 @@ class BorgInterface:
             env["BORG_PASSPHRASE"] = passphrase
 
         return await self._execute_command(
-            cmd, timeout=settings.backup_timeout, env=env if env else None
+            cmd,
+            timeout=settings.backup_timeout,
+            env=env if env else None,
+            priority=resolve_process_priority("backup", repository_record),
         )
 
     async def list_archives(
@@ -612,6 +628,7 @@ class BorgInterface:
         bypass_lock: bool = False,
         env: dict = None,
         strip_components: int = None,
+        repository_record=None,
     ) -> Dict:
         """Extract files from an archive"""
         cmd = [self.borg_cmd, "extract", "--umask", "0022"]
@@ -649,6 +666,44 @@ class BorgInterface:
             timeout=settings.backup_timeout,
             cwd=destination,
             env=exec_env if exec_env else None,
+            priority=resolve_process_priority("restore", repository_record),
+        )
+
+    async def open_extract_stdout(
+        self,
+        repository: str,
+        archive: str,
+        file_path: str,
+        remote_path: str = None,
+        passphrase: str = None,
+        bypass_lock: bool = False,
+        env: dict = None,
+        read_limit: int = 2**16,
+    ) -> asyncio.subprocess.Process:
+        """Start `borg extract --stdout` for a single file.
+
+        The caller owns the returned process: it reads stdout (buffered up to
+        ``read_limit`` bytes, so a slow reader pauses borg) and must drain
+        stderr and reap or kill the process.
+        """
+        cmd = [self.borg_cmd, "extract", "--stdout"]
+        if remote_path:
+            cmd.extend(["--remote-path", remote_path])
+        if bypass_lock:
+            cmd.append("--bypass-lock")
+        cmd.extend([f"{repository}::{archive}", file_path])
+
+        exec_env = env.copy() if env else {}
+        if passphrase:
+            exec_env["BORG_PASSPHRASE"] = passphrase
+
+        logger.info("Executing command", command=" ".join(cmd))
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._base_env(exec_env),
+            limit=read_limit,
         )
 
     async def delete_archive(
@@ -683,6 +738,7 @@ class BorgInterface:
         remote_path: str = None,
         passphrase: str = None,
         keep_within: str | None = None,
+        repository_record=None,
     ) -> Dict:
         """Prune old archives
 
@@ -698,6 +754,7 @@ class BorgInterface:
             remote_path: Path to remote borg binary
             passphrase: Repository passphrase
             keep_within: Keep all archives within Borg interval
+            repository_record: Repository row whose priority overrides apply
         """
         cmd = [self.borg_cmd, "prune"]
         if remote_path:
@@ -734,10 +791,18 @@ class BorgInterface:
         if passphrase:
             env["BORG_PASSPHRASE"] = passphrase
 
-        return await self._execute_command(cmd, env=env if env else None)
+        return await self._execute_command(
+            cmd,
+            env=env if env else None,
+            priority=resolve_process_priority("prune", repository_record),
+        )
 
     async def check_repository(
-        self, repository: str, remote_path: str = None, passphrase: str = None
+        self,
+        repository: str,
+        remote_path: str = None,
+        passphrase: str = None,
+        repository_record=None,
     ) -> Dict:
         """Check repository integrity"""
         cmd = [self.borg_cmd, "check"]
@@ -749,10 +814,18 @@ class BorgInterface:
         if passphrase:
             env["BORG_PASSPHRASE"] = passphrase
 
-        return await self._execute_command(cmd, env=env if env else None)
+        return await self._execute_command(
+            cmd,
+            env=env if env else None,
+            priority=resolve_process_priority("check", repository_record),
+        )
 
     async def compact_repository(
-        self, repository: str, remote_path: str = None, passphrase: str = None
+        self,
+        repository: str,
+        remote_path: str = None,
+        passphrase: str = None,
+        repository_record=None,
     ) -> Dict:
         """Compact repository to save space"""
         cmd = [self.borg_cmd, "compact"]
@@ -764,7 +837,11 @@ class BorgInterface:
         if passphrase:
             env["BORG_PASSPHRASE"] = passphrase
 
-        return await self._execute_command(cmd, env=env if env else None)
+        return await self._execute_command(
+            cmd,
+            env=env if env else None,
+            priority=resolve_process_priority("compact", repository_record),
+        )
 
     async def get_repository_info(
         self, repository_path: str, remote_path: str = None, bypass_lock: bool = False
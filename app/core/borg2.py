@@ -39,6 +39,7 @@ from typing import Dict, List, Optional
 import structlog
 
 from app.config import settings
+from app.utils.process_priority import ProcessPriority, resolve_process_priority
 from app.utils.ssh_utils import public_key_only_ssh_args
 
 logger = structlog.get_logger()
@@ -140,6 +141,7 @@ class Borg2Interface:
         timeout: int = 3600,
         cwd: Optional[str] = None,
         env: Optional[Dict] = None,
+        priority: Optional[ProcessPriority] = None,
     ) -> Dict:
         """Execute a borg2 command and capture output."""
         logger.info("Executing borg2 command", command=" ".join(cmd), cwd=cwd)
@@ -152,6 +154,8 @@ class Borg2Interface:
                 cwd=cwd,
                 env=exec_env,
             )
+            if priority is not None:
+                priority.apply(process.pid)
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(), timeout=timeout
             )
@@ -431,6 +435,7 @@ class Borg2Interface:
         archive_name: Optional[str] = None,
         passphrase: Optional[str] = None,
         remote_path: Optional[str] = None,
+        repository_record=None,
     ) -> Dict:
         """Create a new archive (backup)."""
         if not repository:
@@ -465,7 +470,12 @@ class Borg2Interface:
             cmd.extend(["--remote-path", remote_path])
         cmd.extend(source_paths)
         env = {"BORG_PASSPHRASE": passphrase} if passphrase else {}
-        return await self._run(cmd, timeout=settings.backup_timeout, env=env or None)
+        return await self._run(
+            cmd,
+            timeout=settings.backup_timeout,
+            env=env or None,
+            priority=resolve_process_priority("backup", repository_record),
+        )
 
     async def extract_archive(
         self,
@@ -478,6 +488,7 @@ class Borg2Interface:
         remote_path: Optional[str] = None,
         bypass_lock: bool = False,
         env: Optional[Dict] = None,
+        repository_record=None,
     ) -> Dict:
         """Extract files from an archive."""
         cmd = [self.borg_cmd, "-r", repository, "extract", "--umask", "0022"]
@@ -494,7 +505,45 @@ class Borg2Interface:
         if passphrase:
             exec_env["BORG_PASSPHRASE"] = passphrase
         return await self._run(
-            cmd, timeout=settings.backup_timeout, cwd=destination, env=exec_env or None
+            cmd,
+            timeout=settings.backup_timeout,
+            cwd=destination,
+            env=exec_env or None,
+            priority=resolve_process_priority("restore", repository_record),
+        )
+
+    async def open_extract_stdout(
+        self,
+        repository: str,
+        archive: str,
+        file_path: str,
+        passphrase: Optional[str] = None,
+        remote_path: Optional[str] = None,
+        bypass_lock: bool = False,
+        env: Optional[Dict] = None,
+        read_limit: int = 2**16,
+    ) -> asyncio.subprocess.Process:
+        """Start `borg2 extract --stdout` for a single file.
+
+        The caller owns the returned process: it reads stdout (buffered up to
+        ``read_limit`` bytes) and must drain stderr and reap or kill it.
+        """
+        cmd = [self.borg_cmd, "-r", repository, "extract", "--stdout"]
+        if remote_path:
+            cmd.extend(["--remote-path", remote_path])
+        if bypass_lock:
+            cmd.append("--bypass-lock")
+        cmd.extend([archive, file_path])
+        exec_env = env.copy() if env else {}
+        if passphrase:
+            exec_env["BORG_PASSPHRASE"] = passphrase
+        logger.info("Executing borg2 command", command=" ".join(cmd))
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._base_env(exec_env),
+            limit=read_limit,
         )
 
     async def delete_archive(
@@ -531,6 +580,7 @@ class Borg2Interface:
         passphrase: Optional[str] = None,
         remote_path: Optional[str] = None,
         keep_within: Optional[str] = None,
+        repository_record=None,
     ) -> Dict:
         """Prune old archives.
 
@@ -558,7 +608,11 @@ class Borg2Interface:
         if dry_run:
             cmd.append("--dry-run")
         env = {"BORG_PASSPHRASE": passphrase} if passphrase else {}
-        return await self._run(cmd, env=env or None)
+        return await self._run(
+            cmd,
+            env=env or None,
+            priority=resolve_process_priority("prune", repository_record),
+        )
 
     async def compact(
         self,
@@ -566,6 +620,7 @@ class Borg2Interface:
         passphrase: Optional[str] = None,
         remote_path: Optional[str] = None,
         env: Optional[Dict] = None,
+        repository_record=None,
     ) -> Dict:
         """Compact repository to free space.
 
@@ -578,7 +633,11 @@ class Borg2Interface:
         exec_env = env.copy() if env else {}
         if passphrase:
             exec_env["BORG_PASSPHRASE"] = passphrase
-        return await self._run(cmd, env=exec_env or None)
+        return await self._run(
+            cmd,
+            env=exec_env or None,
+            priority=resolve_process_priority("compact", repository_record),
+        )
 
     async def check_repository(
         self,
@@ -586,6 +645,7 @@ class Borg2Interface:
         passphrase: Optional[str] = None,
         remote_path: Optional[str] = None,
         env: Optional[Dict] = None,
+        repository_record=None,
     ) -> Dict:
         """Check repository integrity."""
         cmd = [self.borg_cmd, "-r", repository, "check"]
@@ -594,7 +654,11 @@ class Borg2Interface:
         exec_env = env.copy() if env else {}
         if passphrase:
             exec_env["BORG_PASSPHRASE"] = passphrase
-        return await self._run(cmd, env=exec_env or None)
+        return await self._run(
+            cmd,
+            env=exec_env or None,
+            priority=resolve_process_priority("check", repository_record),
+        )
 
     async def break_lock(
         self,
@@ -180,6 +180,7 @@ class BorgRouter:
         remote_path: str = None,
         bypass_lock: bool = False,
         strip_components: Optional[int] = None,
+        patterns_from: Optional[str] = None,
     ) -> List[str]:
         if self.is_v2:
             from app.services.v2.restore_service import restore_v2_service
@@ -191,6 +192,7 @@ class BorgRouter:
                 remote_path=remote_path,
                 bypass_lock=bypass_lock,
                 strip_components=strip_components,
+                patterns_from=patterns_from,
             )
 
         cmd = ["borg", "extract", "--progress", "--log-json", "--umask", "0022"]
@@ -200,11 +202,97 @@ class BorgRouter:
             cmd.append("--bypass-lock")
         if strip_components:
             cmd.extend(["--strip-components", str(strip_components)])
+        if patterns_from:
+            cmd.extend(["--patterns-from", patterns_from])
         cmd.append(f"{repository_path}::{archive_name}")
         if paths:
             cmd.extend(paths)
         return cmd
 
+    def build_restore_export_tar_command(
+        self,
+        repository_path: str,
+        archive_name: str,
+        paths: List[str],
+        remote_path: str = None,
+        bypass_lock: bool = False,
+        strip_components: Optional[int] = None,
+    ) -> List[str]:
+        """Build an export-tar command that writes the restore to stdout."""
+        if self.is_v2:
+            from app.services.v2.restore_service import restore_v2_service
+
+            return restore_v2_service.build_export_tar_command(
+                repository_path=repository_path,
+                archive_name=archive_name,
+                paths=paths,
+                remote_path=remote_path,
+                bypass_lock=bypass_lock,
+                strip_components=strip_components,
+            )
+
+        cmd = ["borg", "export-tar", "--list", "--log-json"]
+        if remote_path:
+            cmd.extend(["--remote-path", remote_path])
+        if bypass_lock:
+            cmd.append("--bypass-lock")
+        if strip_components:
+            cmd.extend(["--strip-components", str(strip_components)])
+        cmd.extend([f"{repository_path}::{archive_name}", "-"])
+        if paths:
+            cmd.extend(paths)
+        return cmd
+
+    def build_verify_archive_command(
+        self, archive_name: str, archive_id: Optional[str] = None
+    ) -> List[str]:
+        """Build a dry-run extract that reads and authenticates every chunk.
+
+        Used by rotating data verification: unlike ``check --verify-data``,
+        which always reads the whole repository, this covers one archive.
+        Borg 2 selects the archive by id when known, as names may repeat.
+        """
+        repo = self.repo
+        if self.is_v2:
+            from app.core.borg2 import borg2
+
+            cmd = [
+                borg2.borg_cmd,
+                "-r",
+                repo.path,
+                "extract",
+                "--dry-run",
+                "--log-json",
+            ]
+        else:
+            from app.core.borg import borg
+
+            cmd = [borg.borg_cmd, "extract", "--dry-run", "--log-json"]
+        if repo.remote_path:
+            cmd.extend(["--remote-path", repo.remote_path])
+        if repo.bypass_lock:
+            cmd.append("--bypass-lock")
+        if self.is_v2:
+            cmd.append(f"aid:{archive_id}" if archive_id else archive_name)
+        else:
+            cmd.append(f"{repo.path}::{archive_name}")
+        return cmd
+
+    def build_unencrypted_init_command(self, repository_path: str) -> List[str]:
+        """Build the version-aware command creating a scratch repository."""
+        if self.is_v2:
+            from app.core.borg2 import borg2
+
+            return [
+                borg2.borg_cmd,
+                "-r",
+                repository_path,
+                "repo-create",
+                "--encryption",
+                "none",
+            ]
+        return ["borg", "init", "--encryption", "none", repository_path]
+
     def build_break_lock_command(
         self, repository_path: str, remote_path: str = None
     ) -> List[str]:
@@ -388,6 +476,7 @@ class BorgRouter:
             "remote_path": self.repo.remote_path,
             "passphrase": self.repo.passphrase,
             "bypass_lock": self.repo.bypass_lock,
+            "repository_record": self.repo,
         }
         if env is not None:
             kwargs["env"] = env
@@ -431,15 +520,51 @@ class BorgRouter:
             env=env,
         )
 
-    async def update_stats(self, db: Session) -> bool:
+    async def update_stats(self, db: Session, *, refresh_size: bool = True) -> bool:
         """Refresh archive count and size stats for this repository.
 
-        v2: computes on-disk size via du and persists to repository.total_size.
+        v2: computes on-disk size via du and persists the size columns.
         v1: delegates to the existing update_repository_stats helper.
+        ``refresh_size=False`` skips the size probe and keeps the
+        incrementally maintained sizes.
         """
         from app.api.repositories import update_repository_stats
 
-        return await update_repository_stats(self.repo, db)
+        return await update_repository_stats(self.repo, db, refresh_size=refresh_size)
+
+    async def refresh_size_stats(
+        self,
+        *,
+        env: dict = None,
+        info_timeout: int = 60,
+        use_bypass_lock: bool = False,
+        temp_key_file: str = None,
+    ) -> bool:
+        """Resync the repository's integer size columns from Borg.
+
+        v1 seeds original/compressed/deduplicated sizes from ``borg info``;
+        v2 records the measured on-disk size. Returns True when updated.
+        """
+        from app.services.repository_stats import (
+            apply_measured_size,
+            apply_repository_info,
+        )
+
+        if self.is_v2:
+            size_bytes = await self.calculate_total_size_bytes(
+                temp_key_file=temp_key_file
+            )
+            if size_bytes <= 0:
+                return False
+            apply_measured_size(self.repo, size_bytes)
+            return True
+
+        info_data = await self._load_repository_info(
+            env=env, info_timeout=info_timeout, use_bypass_lock=use_bypass_lock
+        )
+        if info_data is None:
+            return False
+        return apply_repository_info(self.repo, info_data)
 
     async def calculate_total_size_bytes(
         self,
@@ -459,6 +584,23 @@ class BorgRouter:
                 timeout=30,
             )
 
+        info_data = await self._load_repository_info(
+            env=env, info_timeout=info_timeout, use_bypass_lock=use_bypass_lock
+        )
+        if info_data is None:
+            return 0
+
+        cache = info_data.get("cache", {}).get("stats", {})
+        return cache.get("unique_csize", 0) or 0
+
+    async def _load_repository_info(
+        self,
+        *,
+        env: dict = None,
+        info_timeout: int = 60,
+        use_bypass_lock: bool = False,
+    ) -> Optional[dict]:
+        """Run Borg 1 ``borg info --json`` for the repository, or None on failure."""
         import json
         from app.core.borg import borg
 
@@ -470,11 +612,8 @@ class BorgRouter:
 
         info_result = await borg._execute_command(cmd, timeout=info_timeout, env=env)
         if not info_result["success"]:
-            return 0
-
-        info_data = json.loads(info_result["stdout"])
-        cache = info_data.get("cache", {}).get("stats", {})
-        return cache.get("unique_csize", 0) or 0
+            return None
+        return json.loads(info_result["stdout"])
 
     def _is_agent(self) -> bool:
         """Whether this repository is executed by a managed agent.
@@ -728,13 +867,55 @@ class BorgRouter:
                 job_id, self.repo.id, archive_name
             )
 
-    async def list_archives(self, env: dict = None) -> list:
+    async def delete_archives(self, job_id: int, archive_names: list[str]) -> None:
+        """Delete several archives as one job.
+
+        v1 passes every name to a single ``borg delete``; v2 deletes each
+        selector and compacts once at the end. Agent repositories are not
+        supported; the API rejects them before a job is created.
+        """
+        if self._is_agent():
+            raise ValueError("Bulk archive deletion is not supported for agents")
+        if self.is_v2:
+            from app.services.v2.delete_archive_service import delete_archive_v2_service
+
+            await delete_archive_v2_service.execute_bulk_delete(
+                job_id, self.repo.id, archive_names
+            )
+        else:
+            from app.services.delete_archive_service import delete_archive_service
+
+            await delete_archive_service.execute_bulk_delete(
+                job_id, self.repo.id, archive_names
+            )
+
+    async def list_archives(
+        self, env: dict = None, *, db=None, strict: bool = False
+    ) -> list:
         """Return the list of archives for this repository.
 
         Used as a version-aware guard before repository deletion.
         v2: calls borg2 list and parses the JSON archives array.
         v1: calls borg list and returns the archives list.
+        Passing ``db`` serves the list from the archive list cache when it
+        is still current; guards that must see the live repository omit it.
+        A failed listing returns an empty list, or raises ``RuntimeError``
+        with ``strict``.
         """
+        if db is None:
+            archives = await self._load_archives(env)
+        else:
+            from app.services.archive_list_cache import archive_list_cache
+
+            archives = await archive_list_cache.get_or_load(
+                self.repo, db, lambda: self._load_archives(env)
+            )
+        if archives is None and strict:
+            raise RuntimeError("Failed to list repository archives")
+        return archives or []
+
+    async def _load_archives(self, env: dict = None) -> Optional[list]:
+        """Run `borg list`; None when the command failed."""
         import json
 
         def _parse_archives_payload(payload) -> list:
@@ -762,7 +943,7 @@ class BorgRouter:
                 env=env,
             )
             if not result["success"]:
-                return []
+                return None
             return _parse_archives_payload(result.get("stdout", "{}"))
         else:
             from app.core.borg import borg
@@ -775,7 +956,7 @@ class BorgRouter:
                 env=env,
             )
             if not result["success"]:
-                return []
+                return None
             return _parse_archives_payload(result.get("stdout", ""))
 
     async def verify_repository(
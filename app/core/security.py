@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta
 from typing import Annotated, Optional
 import jwt
@@ -7,7 +8,8 @@ from pydantic import AfterValidator
 import hashlib
 from fastapi import HTTPException, status, Depends, Request
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
 import structlog
 from cryptography.fernet import Fernet
 from cryptography.fernet import InvalidToken
@@ -602,30 +604,127 @@ def require_role_dependency(
     return dependency
 
 
+# Explicit per-repository roles are cached per user for a few seconds so the
+# endpoints the frontend polls do not re-query them on every request. Writes to
+# UserRepositoryPermission invalidate the cache (see the mapper events below).
+REPOSITORY_PERMISSION_CACHE_SECONDS = 5.0
+_SESSION_PERMISSIONS_KEY = "repository_permissions"
+_permission_cache: dict[int, tuple[float, dict[int, str]]] = {}
+
+
+class RepositoryPermissions:
+    """Effective repository roles of one user, loaded in a single query."""
+
+    def __init__(
+        self,
+        global_role: Optional[str],
+        all_repositories_role: Optional[str],
+        roles: dict[int, str],
+    ):
+        self.is_admin = global_role == "admin"
+        self.all_repositories_role = all_repositories_role
+        self.roles = roles
+
+    def role_for(self, repository_id: int) -> Optional[str]:
+        effective_role = self.all_repositories_role
+        role = self.roles.get(repository_id)
+        if role and (
+            effective_role is None
+            or REPO_ROLE_RANK.get(role, 0) > REPO_ROLE_RANK.get(effective_role, 0)
+        ):
+            effective_role = role
+        return effective_role
+
+    def allows(self, repository_id: int, required_role: str) -> bool:
+        if self.is_admin:
+            return True
+        effective_role = self.role_for(repository_id)
+        return effective_role is not None and REPO_ROLE_RANK.get(
+            effective_role, 0
+        ) >= REPO_ROLE_RANK.get(required_role, 0)
+
+    def repository_ids(self, required_role: str = "viewer") -> Optional[set[int]]:
+        """Repository ids with at least ``required_role``; ``None`` means all."""
+        if self.is_admin or (
+            self.all_repositories_role is not None
+            and REPO_ROLE_RANK.get(self.all_repositories_role, 0)
+            >= REPO_ROLE_RANK.get(required_role, 0)
+        ):
+            return None
+        return {
+            repository_id
+            for repository_id in self.roles
+            if self.allows(repository_id, required_role)
+        }
+
+    def repository_filter(self, column, required_role: str = "viewer"):
+        """SQL clause restricting ``column`` to visible repository ids, or ``None``."""
+        repository_ids = self.repository_ids(required_role)
+        if repository_ids is None:
+            return None
+        return column.in_(repository_ids)
+
+
+def _load_repository_roles(db: Session, user_id: int) -> dict[int, str]:
+    cached = _permission_cache.get(user_id)
+    now = time.monotonic()
+    if cached and cached[0] > now:
+        return cached[1]
+    roles = dict(
+        db.query(UserRepositoryPermission.repository_id, UserRepositoryPermission.role)
+        .filter(UserRepositoryPermission.user_id == user_id)
+        .all()
+    )
+    _permission_cache[user_id] = (now + REPOSITORY_PERMISSION_CACHE_SECONDS, roles)
+    return roles
+
+
+def get_repository_permissions(db: Session, user: User) -> RepositoryPermissions:
+    """Permission snapshot for ``user``, shared by every check in this session."""
+    snapshots = db.info.setdefault(_SESSION_PERMISSIONS_KEY, {})
+    roles = snapshots.get(user.id)
+    if roles is None:
+        roles = {} if user.role == "admin" else _load_repository_roles(db, user.id)
+        snapshots[user.id] = roles
+    return RepositoryPermissions(
+        user.role, getattr(user, "all_repositories_role", None), roles
+    )
+
+
+def invalidate_repository_permissions(user_id: Optional[int] = None) -> None:
+    """Drop cached repository roles for ``user_id`` (or every user)."""
+    if user_id is None:
+        _permission_cache.clear()
+    else:
+        _permission_cache.pop(user_id, None)
+
+
+def _on_permission_change(mapper, connection, target) -> None:
+    invalidate_repository_permissions(target.user_id)
+    session = object_session(target)
+    if session is not None:
+        session.info.get(_SESSION_PERMISSIONS_KEY, {}).pop(target.user_id, None)
+
+
+def _on_user_delete(mapper, connection, target) -> None:
+    invalidate_repository_permissions(target.id)
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(UserRepositoryPermission, _event_name, _on_permission_change)
+event.listen(User, "after_delete", _on_user_delete)
+
+
 def check_repo_access(db: Session, user: User, repo, required_role: str) -> None:
     """Raise HTTP 403 if user lacks required_role on the given repository.
 
-    Admin users always pass. For operator/viewer, checks UserRepositoryPermission.
-    required_role is 'viewer' or 'operator'.
+    Admin users always pass. For operator/viewer, checks the user's
+    repository permission snapshot. required_role is 'viewer' or 'operator'.
     """
     if user.role == "admin":
         return
 
-    effective_role = getattr(user, "all_repositories_role", None)
-    perm = (
-        db.query(UserRepositoryPermission)
-        .filter_by(user_id=user.id, repository_id=repo.id)
-        .first()
-    )
-    if perm and (
-        effective_role is None
-        or REPO_ROLE_RANK.get(perm.role, 0) > REPO_ROLE_RANK.get(effective_role, 0)
-    ):
-        effective_role = perm.role
-
-    if effective_role is None or REPO_ROLE_RANK.get(
-        effective_role, 0
-    ) < REPO_ROLE_RANK.get(required_role, 0):
+    if not get_repository_permissions(db, user).allows(repo.id, required_role):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={"key": "backend.errors.auth.notEnoughPermissions"},
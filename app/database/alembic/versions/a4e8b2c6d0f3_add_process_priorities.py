@@ -0,0 +1,39 @@
+"""add process priorities
+
+Revision ID: a4e8b2c6d0f3
+Revises: f1c7d3e9a2b6
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a4e8b2c6d0f3"
+down_revision = "f1c7d3e9a2b6"
+branch_labels = None
+depends_on = None
+
+JOB_TABLES = (
+    "backup_jobs",
+    "restore_jobs",
+    "check_jobs",
+    "compact_jobs",
+    "prune_jobs",
+)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.add_column(sa.Column("process_priorities", sa.JSON(), nullable=True))
+    for table in JOB_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column("process_priority", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    for table in reversed(JOB_TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column("process_priority")
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.drop_column("process_priorities")
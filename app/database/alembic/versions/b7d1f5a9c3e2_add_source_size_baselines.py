@@ -0,0 +1,27 @@
+"""add source size baselines
+
+Revision ID: b7d1f5a9c3e2
+Revises: a4e8b2c6d0f3
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b7d1f5a9c3e2"
+down_revision = "a4e8b2c6d0f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.add_column(
+            sa.Column("source_size_baselines", sa.JSON(), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.drop_column("source_size_baselines")
@@ -0,0 +1,31 @@
+"""add bulk archive delete
+
+Revision ID: c3a9e7f1b5d4
+Revises: b7d1f5a9c3e2
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c3a9e7f1b5d4"
+down_revision = "b7d1f5a9c3e2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("delete_archive_jobs") as batch_op:
+        batch_op.add_column(sa.Column("archive_names", sa.JSON(), nullable=True))
+        batch_op.add_column(
+            sa.Column(
+                "archives_deleted", sa.Integer(), nullable=False, server_default="0"
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("delete_archive_jobs") as batch_op:
+        batch_op.drop_column("archives_deleted")
+        batch_op.drop_column("archive_names")
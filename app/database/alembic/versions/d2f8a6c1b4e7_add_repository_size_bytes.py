@@ -0,0 +1,83 @@
+"""add integer repository size columns
+
+Revision ID: d2f8a6c1b4e7
+Revises: c7e4f8a1d2b3
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d2f8a6c1b4e7"
+down_revision = "c7e4f8a1d2b3"
+branch_labels = None
+depends_on = None
+
+
+_UNITS = [
+    ("PB", 1024**5),
+    ("TB", 1024**4),
+    ("GB", 1024**3),
+    ("MB", 1024**2),
+    ("KB", 1024),
+    ("B", 1),
+]
+
+
+def _parse_size(size_str):
+    normalized = (size_str or "").strip().upper().replace(" ", "")
+    if not normalized:
+        return None
+    for unit, multiplier in _UNITS:
+        if normalized.endswith(unit):
+            try:
+                return int(float(normalized[: -len(unit)]) * multiplier)
+            except ValueError:
+                return None
+    try:
+        return int(float(normalized))
+    except ValueError:
+        return None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.add_column(
+            sa.Column("original_size_bytes", sa.BigInteger(), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("compressed_size_bytes", sa.BigInteger(), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("unique_size_bytes", sa.BigInteger(), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("size_stats_refreshed_at", sa.DateTime(), nullable=True)
+        )
+
+    # Backfill the deduplicated size from the formatted string so SQL
+    # aggregates are correct before the next refresh. Original/compressed
+    # sizes were never stored and stay NULL until then; leaving
+    # size_stats_refreshed_at NULL forces that exact resync.
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, total_size FROM repositories WHERE total_size IS NOT NULL")
+    ).fetchall()
+    for repo_id, total_size in rows:
+        size_bytes = _parse_size(total_size)
+        if size_bytes is not None:
+            bind.execute(
+                sa.text(
+                    "UPDATE repositories SET unique_size_bytes = :size WHERE id = :id"
+                ),
+                {"size": size_bytes, "id": repo_id},
+            )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.drop_column("size_stats_refreshed_at")
+        batch_op.drop_column("unique_size_bytes")
+        batch_op.drop_column("compressed_size_bytes")
+        batch_op.drop_column("original_size_bytes")
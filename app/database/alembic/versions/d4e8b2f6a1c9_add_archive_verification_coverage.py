@@ -0,0 +1,64 @@
+"""add rotating archive data verification coverage
+
+Revision ID: d4e8b2f6a1c9
+Revises: c3a9e7f1b5d4
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d4e8b2f6a1c9"
+down_revision = "c3a9e7f1b5d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.add_column(
+            sa.Column("check_verify_archives_per_run", sa.Integer(), nullable=True)
+        )
+    with op.batch_alter_table("check_jobs") as batch_op:
+        batch_op.add_column(
+            sa.Column("verify_archives_per_run", sa.Integer(), nullable=True)
+        )
+        batch_op.add_column(sa.Column("archives_verified", sa.Integer(), nullable=True))
+
+    op.create_table(
+        "archive_verifications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "repository_id",
+            sa.Integer(),
+            sa.ForeignKey("repositories.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("archive_id", sa.String(), nullable=False),
+        sa.Column("archive_name", sa.String(), nullable=False),
+        sa.Column("archive_start", sa.DateTime(), nullable=True),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("verified_at", sa.DateTime(), nullable=False),
+        sa.Column("check_job_id", sa.Integer(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.UniqueConstraint("repository_id", "archive_id"),
+    )
+    op.create_index(
+        "idx_archive_verifications_repository_id",
+        "archive_verifications",
+        ["repository_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_archive_verifications_repository_id",
+        table_name="archive_verifications",
+    )
+    op.drop_table("archive_verifications")
+    with op.batch_alter_table("check_jobs") as batch_op:
+        batch_op.drop_column("archives_verified")
+        batch_op.drop_column("verify_archives_per_run")
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.drop_column("check_verify_archives_per_run")
@@ -0,0 +1,27 @@
+"""add backup files cache hit rate
+
+Revision ID: e5b9c3a7d1f4
+Revises: d2f8a6c1b4e7
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e5b9c3a7d1f4"
+down_revision = "d2f8a6c1b4e7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("backup_jobs") as batch_op:
+        batch_op.add_column(
+            sa.Column("files_cache_hit_rate", sa.Float(), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("backup_jobs") as batch_op:
+        batch_op.drop_column("files_cache_hit_rate")
@@ -0,0 +1,59 @@
+"""add ssh connection storage and latency samples
+
+Revision ID: e7a1c5d9b3f2
+Revises: d4e8b2f6a1c9
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e7a1c5d9b3f2"
+down_revision = "d4e8b2f6a1c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ssh_connection_samples",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "connection_id",
+            sa.Integer(),
+            sa.ForeignKey("ssh_connections.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("resolution", sa.String(), nullable=False),
+        sa.Column("sampled_at", sa.DateTime(), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("failures", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("storage_total", sa.BigInteger(), nullable=True),
+        sa.Column("storage_used", sa.BigInteger(), nullable=True),
+        sa.Column("storage_available", sa.BigInteger(), nullable=True),
+        sa.Column("latency_ms", sa.Float(), nullable=True),
+        sa.Column("throughput_mbps", sa.Float(), nullable=True),
+    )
+    op.create_index(
+        "idx_ssh_connection_samples_connection_time",
+        "ssh_connection_samples",
+        ["connection_id", "sampled_at"],
+    )
+    op.create_index(
+        "idx_ssh_connection_samples_resolution_time",
+        "ssh_connection_samples",
+        ["resolution", "sampled_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_ssh_connection_samples_resolution_time",
+        table_name="ssh_connection_samples",
+    )
+    op.drop_index(
+        "idx_ssh_connection_samples_connection_time",
+        table_name="ssh_connection_samples",
+    )
+    op.drop_table("ssh_connection_samples")
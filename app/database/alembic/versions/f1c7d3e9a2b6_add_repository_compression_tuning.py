@@ -0,0 +1,25 @@
+"""add repository compression tuning
+
+Revision ID: f1c7d3e9a2b6
+Revises: e5b9c3a7d1f4
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f1c7d3e9a2b6"
+down_revision = "e5b9c3a7d1f4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.add_column(sa.Column("compression_tuning", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("repositories") as batch_op:
+        batch_op.drop_column("compression_tuning")
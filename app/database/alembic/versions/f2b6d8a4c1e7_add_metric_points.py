@@ -0,0 +1,52 @@
+"""add metric points for repository and backup time series
+
+Revision ID: f2b6d8a4c1e7
+Revises: e7a1c5d9b3f2
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f2b6d8a4c1e7"
+down_revision = "e7a1c5d9b3f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "metric_points",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "repository_id",
+            sa.Integer(),
+            sa.ForeignKey("repositories.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("metric", sa.String(), nullable=False),
+        sa.Column("resolution", sa.String(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("total", sa.Float(), nullable=False),
+        sa.Column("minimum", sa.Float(), nullable=False),
+        sa.Column("maximum", sa.Float(), nullable=False),
+        sa.Column("last", sa.Float(), nullable=False),
+    )
+    op.create_index(
+        "idx_metric_points_series",
+        "metric_points",
+        ["metric", "repository_id", "resolution", "bucket_start"],
+    )
+    op.create_index(
+        "idx_metric_points_resolution_time",
+        "metric_points",
+        ["resolution", "bucket_start"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_metric_points_resolution_time", table_name="metric_points")
+    op.drop_index("idx_metric_points_series", table_name="metric_points")
+    op.drop_table("metric_points")
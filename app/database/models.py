@@ -246,6 +246,13 @@ class Repository(Base):
     last_compact = Column(DateTime, nullable=True)  # Last successful compact completion
     total_size = Column(String, nullable=True)
     archive_count = Column(Integer, default=0)
+    # Integer sizes in bytes, maintained by app.services.repository_stats
+    original_size_bytes = Column(BigInteger, nullable=True)
+    compressed_size_bytes = Column(BigInteger, nullable=True)
+    unique_size_bytes = Column(BigInteger, nullable=True)  # Deduplicated size
+    size_stats_refreshed_at = Column(
+        DateTime, nullable=True
+    )  # Last exact resync from borg info
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
 
@@ -324,6 +331,15 @@ class Repository(Base):
     upload_ratelimit_kib = Column(
         Integer, nullable=True
     )  # Default Borg upload rate limit in KiB/s for create commands
+    compression_tuning = Column(
+        JSON, nullable=True
+    )  # Latest compression auto-tune run (app.services.compression_tuning)
+    process_priorities = Column(
+        JSON, nullable=True
+    )  # Per-operation priority class overrides (app.utils.process_priority)
+    source_size_baselines = Column(
+        JSON, nullable=True
+    )  # Last archive size per source set (app.services.source_size_estimator)
 
     # Data source location (for pull-based backups)
     source_ssh_connection_id = Column(
@@ -350,6 +366,9 @@ class Repository(Base):
     check_extra_flags = Column(
         Text, nullable=True
     )  # Extra command-line flags for borg check (advanced users)
+    check_verify_archives_per_run = Column(
+        Integer, nullable=True
+    )  # Rotating data verification: archives verified per check run (None = off)
     notify_on_check_success = Column(
         Boolean, default=False, nullable=False
     )  # Per-repository override
@@ -478,6 +497,34 @@ class SSHConnection(Base):
     ssh_key = relationship("SSHKey", back_populates="connections")
 
 
+class SSHConnectionSample(Base):
+    """Storage, latency and throughput of an SSH connection over time."""
+
+    __tablename__ = "ssh_connection_samples"
+    __table_args__ = (
+        Index(
+            "idx_ssh_connection_samples_connection_time",
+            "connection_id",
+            "sampled_at",
+        ),
+        Index("idx_ssh_connection_samples_resolution_time", "resolution", "sampled_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    connection_id = Column(
+        Integer, ForeignKey("ssh_connections.id", ondelete="CASCADE"), nullable=False
+    )
+    resolution = Column(String, nullable=False)  # raw (one probe), day (rollup)
+    sampled_at = Column(DateTime, nullable=False)  # Start of the day for rollups
+    sample_count = Column(Integer, default=1, nullable=False)  # Probes folded in
+    failures = Column(Integer, default=0, nullable=False)  # Probes that failed
+    storage_total = Column(BigInteger, nullable=True)  # Bytes; last reading
+    storage_used = Column(BigInteger, nullable=True)
+    storage_available = Column(BigInteger, nullable=True)
+    latency_ms = Column(Float, nullable=True)  # Mean SSH round trip
+    throughput_mbps = Column(Float, nullable=True)  # Mean download speed, MiB/s
+
+
 class RcloneRemote(Base):
     __tablename__ = "rclone_remotes"
 
@@ -567,6 +614,39 @@ class RepositoryStorage(Base):
     rclone_remote = relationship("RcloneRemote", back_populates="storages")
 
 
+class MetricPoint(Base):
+    """One bucket of a repository metric's time series.
+
+    Raw points are single observations; hour, day and week rows aggregate the
+    points folded into them (see app.services.metric_history).
+    """
+
+    __tablename__ = "metric_points"
+    __table_args__ = (
+        Index(
+            "idx_metric_points_series",
+            "metric",
+            "repository_id",
+            "resolution",
+            "bucket_start",
+        ),
+        Index("idx_metric_points_resolution_time", "resolution", "bucket_start"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    repository_id = Column(
+        Integer, ForeignKey("repositories.id", ondelete="CASCADE"), nullable=False
+    )
+    metric = Column(String, nullable=False)  # e.g. repository_size_bytes
+    resolution = Column(String, nullable=False)  # raw, hour, day, week
+    bucket_start = Column(DateTime, nullable=False)  # Observation time for raw
+    count = Column(Integer, default=1, nullable=False)  # Observations folded in
+    total = Column(Float, nullable=False)  # Sum of the observations
+    minimum = Column(Float, nullable=False)
+    maximum = Column(Float, nullable=False)
+    last = Column(Float, nullable=False)  # Latest observation in the bucket
+
+
 class RcloneSyncJob(Base):
     __tablename__ = "rclone_sync_jobs"
 
@@ -647,6 +727,9 @@ class BackupJob(Base):
         BigInteger, default=0
     )  # Total size of source directories (calculated before backup)
     estimated_time_remaining = Column(Integer, default=0)  # Estimated seconds remaining
+    files_cache_hit_rate = Column(
+        Float, nullable=True
+    )  # Share of files unchanged per Borg's files cache (0.0-1.0)
 
     # Archive name created by this backup
     archive_name = Column(
@@ -666,6 +749,9 @@ class BackupJob(Base):
     )  # SSH connection for remote execution
     remote_process_pid = Column(Integer, nullable=True)  # PID on remote host
     remote_hostname = Column(String, nullable=True)  # Remote hostname for reference
+    process_priority = Column(
+        JSON, nullable=True
+    )  # Priority class the job's processes ran with (app.utils.process_priority)
 
     # Retry lineage metadata. Original attempts default to attempt 1; retry
     # attempts point at the original and immediate source rows.
@@ -766,6 +852,9 @@ class RestoreJob(Base):
     )  # For local→SSH two-phase restore
     destination_hostname = Column(String(255), nullable=True)  # For display purposes
     repository_type = Column(String(50), default="local")  # 'local' or 'ssh'
+    process_priority = Column(
+        JSON, nullable=True
+    )  # Priority class the job's processes ran with (app.utils.process_priority)
 
     created_at = Column(DateTime, default=utc_now)
 
@@ -1206,9 +1295,40 @@ class CheckJob(Base):
     scheduled_check = Column(
         Boolean, default=False, nullable=False
     )  # True if triggered by scheduler, False if manual
+    process_priority = Column(
+        JSON, nullable=True
+    )  # Priority class the job's processes ran with (app.utils.process_priority)
+    verify_archives_per_run = Column(
+        Integer, nullable=True
+    )  # Rotating data verification batch size; None runs borg check
+    archives_verified = Column(
+        Integer, nullable=True
+    )  # Archives whose data a rotating verification run verified
     created_at = Column(DateTime, default=utc_now)
 
 
+class ArchiveVerification(Base):
+    """Last data verification of one archive, for rotating check coverage."""
+
+    __tablename__ = "archive_verifications"
+    __table_args__ = (
+        UniqueConstraint("repository_id", "archive_id"),
+        Index("idx_archive_verifications_repository_id", "repository_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    repository_id = Column(
+        Integer, ForeignKey("repositories.id", ondelete="CASCADE"), nullable=False
+    )
+    archive_id = Column(String, nullable=False)  # Borg archive id; name if absent
+    archive_name = Column(String, nullable=False)
+    archive_start = Column(DateTime, nullable=True)
+    status = Column(String, nullable=False)  # verified, failed
+    verified_at = Column(DateTime, nullable=False)
+    check_job_id = Column(Integer, nullable=True)
+    error_message = Column(Text, nullable=True)
+
+
 class RestoreCheckJob(Base):
     __tablename__ = "restore_check_jobs"
     __table_args__ = (
@@ -1285,6 +1405,9 @@ class CompactJob(Base):
     process_start_time = Column(
         BigInteger, nullable=True
     )  # Process start time in jiffies for PID uniqueness
+    process_priority = Column(
+        JSON, nullable=True
+    )  # Priority class the job's processes ran with (app.utils.process_priority)
     created_at = Column(DateTime, default=utc_now)
 
 
@@ -1310,6 +1433,9 @@ class PruneJob(Base):
     scheduled_prune = Column(
         Boolean, default=False, nullable=False
     )  # True if triggered by scheduler, False if manual
+    process_priority = Column(
+        JSON, nullable=True
+    )  # Priority class the job's processes ran with (app.utils.process_priority)
     created_at = Column(DateTime, default=utc_now)
 
 
@@ -1324,6 +1450,9 @@ class DeleteArchiveJob(Base):
         String, nullable=True
     )  # Captured at job creation for display even if repo is deleted
     archive_name = Column(String, nullable=False)  # Name of the archive being deleted
+    # Bulk deletes: every selected archive; archive_name then holds a summary
+    archive_names = Column(JSON, nullable=True)
+    archives_deleted = Column(Integer, default=0, server_default="0", nullable=False)
     status = Column(
         String, default="pending"
     )  # pending, running, completed, failed, cancelled
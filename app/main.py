@@ -400,6 +400,13 @@ async def startup_event():
     app.state.background_tasks.append(task2)
     logger.info("Stats refresh scheduler started")
 
+    # Start SSH connection storage prober (background task)
+    from app.services.connection_storage_prober import connection_storage_prober
+
+    task3 = asyncio.create_task(connection_storage_prober.start())
+    app.state.background_tasks.append(task3)
+    logger.info("Connection storage prober started")
+
     # Initialize MQTT service from database settings (using new implementation)
     from app.services.mqtt_service import mqtt_service, build_mqtt_runtime_config
     from app.database.database import SessionLocal
@@ -459,6 +466,14 @@ async def startup_event():
     app.state.background_tasks.append(task6)
     logger.info("Job history retention scheduler started")
 
+    # Start metric history rollup (background task): folds repository size and
+    # backup performance points into hourly, daily and weekly rows.
+    from app.services.metric_history import start_metric_history_rollup
+
+    task7 = asyncio.create_task(start_metric_history_rollup())
+    app.state.background_tasks.append(task7)
+    logger.info("Metric history rollup started")
+
     logger.info("Borg Web UI started successfully")
 
 
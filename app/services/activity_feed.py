@@ -0,0 +1,303 @@
+"""
+Keyset-paginated selection of the activity feed.
+
+Every job table contributes one branch to a single ``UNION ALL`` query. Each
+branch selects only ``(source, id, sort_at)`` with the type, status,
+repository and visibility filters applied in SQL, ordered and limited on its
+own so the outer sort never sees more than ``limit + 1`` rows per source. The
+page is ordered by ``(sort_at, source, id)`` descending and the cursor is the
+key of the last row returned, so pages stay stable while new jobs start.
+
+Callers load the rows of a page per source in bulk, which keeps the query
+count per page constant regardless of its size.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import DateTime, and_, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.database.models import (
+    AvailabilityScheduleSkip,
+    BackupJob,
+    BackupPlanRun,
+    CheckJob,
+    CompactJob,
+    PackageInstallJob,
+    PruneJob,
+    RcloneSyncJob,
+    Repository,
+    RestoreCheckJob,
+    RestoreJob,
+    ScriptExecution,
+)
+
+# Sort value of jobs that have neither a start nor a creation time; they go last
+UNDATED = datetime(1970, 1, 1)
+
+RCLONE_ACTIVITY_OPERATIONS = {
+    "rclone_sync": "sync",
+    "rclone_hydrate": "hydrate",
+}
+
+
+class InvalidActivityCursor(ValueError):
+    """Raised for a cursor that cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class ActivitySource:
+    key: str  # Unique per branch; breaks ties between rows of different tables
+    job_types: tuple[str, ...]  # ``job_type`` filter values that select it
+    model: Any
+    sort_at: Any
+    status: Any = None  # None: every row is a "skipped" record
+    repository_id: Any = None
+    repository_path: Any = None
+    where: tuple = ()
+
+
+ACTIVITY_SOURCES: tuple[ActivitySource, ...] = (
+    ActivitySource(
+        "backup",
+        ("backup",),
+        BackupJob,
+        BackupJob.started_at,
+        BackupJob.status,
+        repository_path=BackupJob.repository,
+    ),
+    # Availability skips are plan-run and schedule records, not jobs: Borg was
+    # never invoked, so they carry their own time column.
+    ActivitySource(
+        "backup_plan_skip",
+        ("availability_check",),
+        BackupPlanRun,
+        func.coalesce(BackupPlanRun.completed_at, BackupPlanRun.created_at),
+        where=(
+            BackupPlanRun.status == "skipped",
+            BackupPlanRun.trigger == "availability",
+        ),
+    ),
+    ActivitySource(
+        "schedule_skip",
+        ("availability_check",),
+        AvailabilityScheduleSkip,
+        AvailabilityScheduleSkip.occurred_at,
+    ),
+    ActivitySource(
+        "restore",
+        ("restore",),
+        RestoreJob,
+        RestoreJob.started_at,
+        RestoreJob.status,
+        repository_path=RestoreJob.repository,
+    ),
+    ActivitySource(
+        "check",
+        ("check",),
+        CheckJob,
+        func.coalesce(CheckJob.started_at, CheckJob.created_at),
+        CheckJob.status,
+        repository_id=CheckJob.repository_id,
+    ),
+    ActivitySource(
+        "restore_check",
+        ("restore_check",),
+        RestoreCheckJob,
+        func.coalesce(RestoreCheckJob.started_at, RestoreCheckJob.created_at),
+        RestoreCheckJob.status,
+        repository_id=RestoreCheckJob.repository_id,
+    ),
+    ActivitySource(
+        "compact",
+        ("compact",),
+        CompactJob,
+        CompactJob.started_at,
+        CompactJob.status,
+        repository_id=CompactJob.repository_id,
+    ),
+    ActivitySource(
+        "prune",
+        ("prune",),
+        PruneJob,
+        PruneJob.started_at,
+        PruneJob.status,
+        repository_id=PruneJob.repository_id,
+    ),
+    ActivitySource(
+        "package",
+        ("package",),
+        PackageInstallJob,
+        PackageInstallJob.started_at,
+        PackageInstallJob.status,
+    ),
+    ActivitySource(
+        "script_execution",
+        ("script_execution",),
+        ScriptExecution,
+        ScriptExecution.started_at,
+        ScriptExecution.status,
+        repository_id=ScriptExecution.repository_id,
+    ),
+    ActivitySource(
+        "rclone",
+        tuple(RCLONE_ACTIVITY_OPERATIONS),
+        RcloneSyncJob,
+        func.coalesce(RcloneSyncJob.started_at, RcloneSyncJob.created_at),
+        RcloneSyncJob.status,
+        repository_id=RcloneSyncJob.repository_id,
+    ),
+)
+
+ACTIVITY_SOURCES_BY_KEY = {source.key: source for source in ACTIVITY_SOURCES}
+
+
+@dataclass(frozen=True)
+class ActivityRow:
+    source: str
+    id: int
+    sort_at: datetime
+
+
+def encode_activity_cursor(row: ActivityRow) -> str:
+    payload = json.dumps(
+        [row.sort_at.isoformat(), row.source, row.id], separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_activity_cursor(cursor: str) -> ActivityRow:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_at, source, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        row = ActivityRow(source, int(row_id), datetime.fromisoformat(sort_at))
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidActivityCursor(cursor)
+    if row.source not in ACTIVITY_SOURCES_BY_KEY:
+        raise InvalidActivityCursor(cursor)
+    return row
+
+
+def _after_cursor(source: ActivitySource, sort_at, after: ActivityRow):
+    """Rows of ``source`` whose ``(sort_at, source, id)`` sorts below ``after``."""
+    if source.key < after.source:
+        return sort_at <= after.sort_at
+    if source.key > after.source:
+        return sort_at < after.sort_at
+    return or_(
+        sort_at < after.sort_at,
+        and_(sort_at == after.sort_at, source.model.id < after.id),
+    )
+
+
+def _source_filters(
+    source: ActivitySource,
+    *,
+    job_type: Optional[str],
+    status: Optional[str],
+    repository_id: Optional[int],
+    visible_repository_ids: Optional[set[int]],
+) -> Optional[list]:
+    """SQL filters for one branch, or ``None`` when it cannot match at all."""
+    if job_type and job_type not in source.job_types:
+        return None
+    filters = list(source.where)
+    if source.model is RcloneSyncJob:
+        operations = (
+            [RCLONE_ACTIVITY_OPERATIONS[job_type]]
+            if job_type
+            else list(RCLONE_ACTIVITY_OPERATIONS.values())
+        )
+        filters.append(RcloneSyncJob.operation.in_(operations))
+
+    if status:
+        if source.status is None:
+            if status != "skipped":
+                return None
+        else:
+            filters.append(source.status == status)
+
+    def repository_clause(repository_ids):
+        if source.repository_id is not None:
+            return source.repository_id.in_(repository_ids)
+        return source.repository_path.in_(
+            select(Repository.path).where(Repository.id.in_(repository_ids))
+        )
+
+    has_repository = source.repository_id is not None or (
+        source.repository_path is not None
+    )
+    if repository_id is not None:
+        if not has_repository:
+            return None
+        filters.append(repository_clause([repository_id]))
+    if visible_repository_ids is not None and has_repository:
+        clause = repository_clause(visible_repository_ids)
+        if source.model is ScriptExecution:
+            # Hooks that ran outside a repository are not repository data
+            clause = or_(ScriptExecution.repository_id.is_(None), clause)
+        filters.append(clause)
+    return filters
+
+
+def select_activity_page(
+    db: Session,
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    job_type: Optional[str] = None,
+    status: Optional[str] = None,
+    repository_id: Optional[int] = None,
+    visible_repository_ids: Optional[set[int]] = None,
+) -> tuple[list[ActivityRow], Optional[str]]:
+    """Return ``(rows, next_cursor)`` for one page of the activity feed.
+
+    ``visible_repository_ids`` restricts repository-bound rows to those
+    repositories; ``None`` shows every row.
+    """
+    after = decode_activity_cursor(cursor) if cursor else None
+    branches = []
+    for source in ACTIVITY_SOURCES:
+        filters = _source_filters(
+            source,
+            job_type=job_type,
+            status=status,
+            repository_id=repository_id,
+            visible_repository_ids=visible_repository_ids,
+        )
+        if filters is None:
+            continue
+        sort_at = func.coalesce(source.sort_at, literal(UNDATED, DateTime()))
+        if after is not None:
+            filters.append(_after_cursor(source, sort_at, after))
+        branch = (
+            select(
+                literal(source.key).label("source"),
+                source.model.id.label("id"),
+                sort_at.label("sort_at"),
+            )
+            .where(*filters)
+            .order_by(sort_at.desc(), source.model.id.desc())
+            .limit(limit + 1)
+        )
+        branches.append(select(branch.subquery()))
+
+    if not branches:
+        return [], None
+    feed = union_all(*branches).subquery()
+    result = db.execute(
+        select(feed.c.source, feed.c.id, feed.c.sort_at)
+        .order_by(feed.c.sort_at.desc(), feed.c.source.desc(), feed.c.id.desc())
+        .limit(limit + 1)
+    ).all()
+    rows = [ActivityRow(source, row_id, sort_at) for source, row_id, sort_at in result]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_activity_cursor(rows[-1])
+    return rows, next_cursor
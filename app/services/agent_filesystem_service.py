@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.core.agent_constants import AGENT_FILESYSTEM_BROWSE_MAX_ITEMS
 from app.database.models import AgentMachine
+from app.utils.directory_paging import browse_sort_key, select_page
 from app.services.agent_connection_manager import (
     AgentCommandError,
     AgentCommandTimeout,
@@ -48,17 +49,23 @@ async def browse_agent_filesystem(
     path: str,
     include_hidden: bool = False,
     timeout_seconds: int = 15,
+    limit: int | None = None,
+    cursor: str | None = None,
+    name_filter: str | None = None,
 ) -> dict[str, Any]:
     agent = _require_browse_agent(db, agent_machine_id)
+    payload = {
+        "path": path or "/",
+        "include_hidden": include_hidden,
+        "max_items": AGENT_FILESYSTEM_BROWSE_MAX_ITEMS,
+    }
+    if limit:
+        payload.update({"limit": limit, "cursor": cursor, "name_filter": name_filter})
     try:
         result = await agent_connection_manager.send_command(
             agent.id,
             command="filesystem.browse",
-            payload={
-                "path": path or "/",
-                "include_hidden": include_hidden,
-                "max_items": AGENT_FILESYSTEM_BROWSE_MAX_ITEMS,
-            },
+            payload=payload,
             timeout_seconds=timeout_seconds,
             wait_for_result=True,
         )
@@ -92,6 +99,9 @@ async def browse_agent_filesystem(
         )
 
     items = result.get("items")
+    if limit and "next_cursor" not in result and isinstance(items, list):
+        # Agents without paging return the (capped) whole listing
+        return _page_agent_items(result, items, limit, cursor, name_filter)
     if isinstance(items, list) and len(items) > AGENT_FILESYSTEM_BROWSE_MAX_ITEMS:
         result = {
             **result,
@@ -102,3 +112,35 @@ async def browse_agent_filesystem(
         result.setdefault("items_truncated", False)
 
     return result
+
+
+def _page_agent_items(
+    result: dict[str, Any],
+    items: list[dict[str, Any]],
+    limit: int,
+    cursor: str | None,
+    name_filter: str | None,
+) -> dict[str, Any]:
+    try:
+        page, next_cursor, total = select_page(
+            items,
+            key=lambda item: browse_sort_key(
+                str(item.get("name") or ""), item.get("type") == "directory"
+            ),
+            name=lambda item: str(item.get("name") or ""),
+            limit=limit,
+            cursor=cursor,
+            name_filter=name_filter,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"key": "backend.errors.filesystem.invalidCursor"},
+        ) from exc
+    return {
+        **result,
+        "items": page,
+        "next_cursor": next_cursor,
+        "total_items": total,
+        "items_truncated": bool(result.get("items_truncated")),
+    }
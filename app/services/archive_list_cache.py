@@ -0,0 +1,184 @@
+"""
+Per-repository cache of `borg list` archive lists.
+
+Opening the archives page, refreshing stats and preparing restore checks all
+need the repository's archive list, and each `borg list` takes the repository
+lock. The cache keeps the last list per repository and decides whether it is
+still current without touching Borg:
+
+- our own write operations (backup, prune, delete, compact, wipe) call
+  ``invalidate`` when they finish;
+- before a cached list is reused the repository directory is probed
+  (``probe_directory_fingerprint``) so writes by other Borg clients are seen;
+- repositories that cannot be probed fall back to a short TTL.
+
+Agent repositories are listed on the agent machine and are never cached.
+"""
+
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from app.config import settings
+from app.database.models import Repository
+from app.utils.fs import probe_directory_fingerprint
+from app.utils.ssh_utils import resolve_repo_ssh_key_file
+
+logger = structlog.get_logger()
+
+
+async def probe_repository_fingerprint(
+    repository: Repository, db, timeout: int
+) -> Optional[str]:
+    """Cheap change fingerprint, or None when the repository can't be probed."""
+    from app.services.repository_executor import is_agent_executor
+
+    path = repository.path or ""
+    if is_agent_executor(repository) or (
+        "://" in path and not path.startswith("ssh://")
+    ):
+        return None
+
+    key_file = (
+        resolve_repo_ssh_key_file(repository, db) if path.startswith("ssh://") else None
+    )
+    try:
+        return await probe_directory_fingerprint(
+            path, timeout=timeout, key_file=key_file
+        )
+    finally:
+        if key_file and os.path.exists(key_file):
+            try:
+                os.unlink(key_file)
+            except OSError:
+                pass
+
+
+@dataclass(frozen=True)
+class ArchiveListTicket:
+    """State captured before a `borg list` runs, used to store its result."""
+
+    repository_id: int
+    generation: int
+    fingerprint: Optional[str]
+    cacheable: bool = True
+
+
+@dataclass
+class _CachedArchiveList:
+    archives: List[dict]
+    generation: int
+    fingerprint: Optional[str]
+    cached_at: float
+
+
+class ArchiveListCache:
+    """In-memory archive lists keyed by repository id."""
+
+    def __init__(self):
+        self._entries: Dict[int, _CachedArchiveList] = {}
+        # Bumped by invalidate(); a list loaded under an older generation
+        # raced with a write and must not be stored.
+        self._generations: Dict[int, int] = defaultdict(int)
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, repository_id: Optional[int]) -> None:
+        """Drop the cached list after a write to the repository."""
+        if repository_id is None:
+            return
+        self._generations[repository_id] += 1
+        if self._entries.pop(repository_id, None) is not None:
+            logger.debug("Archive list cache invalidated", repo_id=repository_id)
+
+    def clear(self) -> None:
+        for repository_id in set(self._entries) | set(self._generations):
+            self.invalidate(repository_id)
+
+    async def lookup(
+        self, repository: Repository, db
+    ) -> Tuple[Optional[List[dict]], ArchiveListTicket]:
+        """Return ``(archives, ticket)``; ``archives`` is None on a miss.
+
+        On a miss, load the list and pass it to ``store`` with the ticket.
+        The probe runs here, before the caller's `borg list`, so a write
+        landing during the list leaves a stale fingerprint behind rather
+        than a stale list.
+        """
+        from app.services.repository_executor import is_agent_executor
+
+        generation = self._generations[repository.id]
+        if is_agent_executor(repository):
+            return None, ArchiveListTicket(repository.id, generation, None, False)
+
+        fingerprint = await probe_repository_fingerprint(
+            repository, db, timeout=settings.archive_list_cache_probe_timeout
+        )
+        ticket = ArchiveListTicket(repository.id, generation, fingerprint)
+
+        entry = self._entries.get(repository.id)
+        if entry is not None and entry.generation == generation:
+            if fingerprint is not None:
+                fresh = entry.fingerprint == fingerprint
+            else:
+                age = time.monotonic() - entry.cached_at
+                fresh = (
+                    entry.fingerprint is None
+                    and age < settings.archive_list_cache_ttl_seconds
+                )
+            if fresh:
+                self.hits += 1
+                logger.debug(
+                    "Archive list cache hit",
+                    repo_id=repository.id,
+                    count=len(entry.archives),
+                )
+                return list(entry.archives), ticket
+
+        self.misses += 1
+        return None, ticket
+
+    def store(self, ticket: ArchiveListTicket, archives: List[dict]) -> None:
+        """Cache a freshly loaded list unless a write invalidated it meanwhile."""
+        if not ticket.cacheable:
+            return
+        if self._generations[ticket.repository_id] != ticket.generation:
+            return
+        self._entries[ticket.repository_id] = _CachedArchiveList(
+            archives=list(archives),
+            generation=ticket.generation,
+            fingerprint=ticket.fingerprint,
+            cached_at=time.monotonic(),
+        )
+
+    async def get_or_load(
+        self,
+        repository: Repository,
+        db,
+        loader: Callable[[], Awaitable[Optional[List[dict]]]],
+    ) -> Optional[List[dict]]:
+        """Return the cached list, or run ``loader`` and cache its result.
+
+        ``loader`` returns None on failure; failures are never cached.
+        """
+        archives, ticket = await self.lookup(repository, db)
+        if archives is not None:
+            return archives
+        archives = await loader()
+        if archives is not None:
+            self.store(ticket, archives)
+        return archives
+
+    def get_stats(self) -> dict:
+        return {
+            "repositories": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+archive_list_cache = ArchiveListCache()
@@ -53,7 +53,7 @@ from app.services.repository_executor import (
     wait_for_agent_backup_job,
     wait_for_agent_script_job,
 )
-from app.services.upload_ratelimit_policies import resolve_scheduled_upload_ratelimit
+from app.services.upload_ratelimit_policies import UploadRatelimitSchedule
 from app.services.script_executor import execute_script
 from app.services.template_service import get_system_variables
 from app.utils.archive_names import build_archive_name
@@ -129,6 +129,7 @@ class RepositoryRunContext:
     custom_flags: Optional[str]
     upload_ratelimit_kib: Optional[int]
     failure_behavior: str
+    upload_ratelimit_schedule: Optional[UploadRatelimitSchedule] = None
 
 
 def _json_list(value: Optional[str]) -> list[str]:
@@ -1220,12 +1221,16 @@ class BackupPlanExecutionService:
             )
             repositories = []
             for link in enabled_links:
-                base_upload_ratelimit_kib = (
-                    link.upload_ratelimit_kib_override
-                    if link.upload_ratelimit_kib_override is not None
-                    else context.upload_ratelimit_kib
-                    if context.upload_ratelimit_kib is not None
-                    else link.repository.upload_ratelimit_kib
+                upload_ratelimit_schedule = UploadRatelimitSchedule(
+                    base_upload_ratelimit_kib=(
+                        link.upload_ratelimit_kib_override
+                        if link.upload_ratelimit_kib_override is not None
+                        else context.upload_ratelimit_kib
+                        if context.upload_ratelimit_kib is not None
+                        else link.repository.upload_ratelimit_kib
+                    ),
+                    policies=context.upload_ratelimit_schedule_policies,
+                    timezone_name=plan.timezone,
                 )
                 repositories.append(
                     RepositoryRunContext(
@@ -1245,15 +1250,13 @@ class BackupPlanExecutionService:
                             if link.custom_flags_override is not None
                             else context.custom_flags
                         ),
-                        upload_ratelimit_kib=resolve_scheduled_upload_ratelimit(
-                            base_upload_ratelimit_kib=base_upload_ratelimit_kib,
-                            policies=context.upload_ratelimit_schedule_policies,
-                            run_at=upload_policy_now,
-                            timezone_name=plan.timezone,
+                        upload_ratelimit_kib=upload_ratelimit_schedule.resolve(
+                            upload_policy_now
                         ),
                         failure_behavior=(
                             link.failure_behavior_override or context.failure_behavior
                         ),
+                        upload_ratelimit_schedule=upload_ratelimit_schedule,
                     )
                 )
 
@@ -2060,6 +2063,7 @@ class BackupPlanExecutionService:
                     compression_override=repository_context.compression,
                     custom_flags_override=repository_context.custom_flags,
                     upload_ratelimit_kib=repository_context.upload_ratelimit_kib,
+                    upload_ratelimit_schedule=repository_context.upload_ratelimit_schedule,
                 )
 
                 db.refresh(backup_job)
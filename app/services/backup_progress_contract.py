@@ -34,6 +34,7 @@ BACKUP_PROGRESS_FIELDS_BY_VERSION: dict[int, tuple[str, ...]] = {
         "backup_speed",
         "total_expected_size",
         "estimated_time_remaining",
+        "files_cache_hit_rate",
     ),
     2: (
         "original_size",
@@ -43,6 +44,7 @@ BACKUP_PROGRESS_FIELDS_BY_VERSION: dict[int, tuple[str, ...]] = {
         "backup_speed",
         "total_expected_size",
         "estimated_time_remaining",
+        "files_cache_hit_rate",
     ),
 }
 
@@ -66,6 +68,7 @@ def serialize_backup_progress_details(
         "estimated_time_remaining": job.estimated_time_remaining or 0,
         "nfiles": job.nfiles or 0,
         "original_size": job.original_size or 0,
+        "files_cache_hit_rate": job.files_cache_hit_rate,
     }
     if "compressed_size" in supported_fields:
         progress_details["compressed_size"] = job.compressed_size or 0
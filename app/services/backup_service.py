@@ -14,8 +14,16 @@ from app.database.database import SessionLocal
 from app.config import settings
 from app.core.borg_router import BorgRouter
 from app.core.borg_errors import format_error_message, is_lock_error
+from app.services.borg_progress import (
+    MB,
+    CurrentFileTracker,
+    FilesCacheStats,
+    SpeedWindow,
+    estimate_seconds_remaining,
+)
 from app.services.notification_service import notification_service
 from app.services.script_executor import execute_script
+from app.services.upload_ratelimit_policies import UploadRatelimitSchedule
 from app.services.script_library_executor import ScriptLibraryExecutor
 from app.services.mqtt_service import mqtt_service
 from app.services.rclone_repository_service import rclone_repository_service
@@ -38,10 +46,20 @@ from app.utils.borg_env import (
     cleanup_temp_key_file,
     setup_borg_env,
 )
+from app.services.archive_list_cache import archive_list_cache
+from app.services.bandwidth_budget import bandwidth_budget_service
+from app.services.source_size_estimator import source_size_estimator
+from app.services.repository_stats import (
+    apply_archive_created,
+    apply_repository_info,
+    format_size,
+    needs_full_size_refresh,
+)
 from app.services.repository_command_lock import (
     acquire_repository_command_lock,
     run_serialized_repository_command,
 )
+from app.utils.process_priority import resolve_process_priority
 from app.utils.ssh_utils import (
     resolve_repo_ssh_key_file,  # noqa: F401
     resolve_ssh_key_file_by_id,
@@ -80,6 +98,23 @@ class BackupService:
         self.ssh_mounts = {}  # Track SSH mount IDs by job_id: {job_id: [mount_id, ...]}
         self.filesystem_snapshots = {}  # Track btrfs/zfs snapshots by job_id
 
+    @staticmethod
+    def _sshfs_files_cache_flags(
+        ssh_mount_info: list[tuple[str, str]], custom_flags: list[str]
+    ) -> list[str]:
+        """``--files-cache`` for backups reading from SSHFS mounts.
+
+        SSHFS inode numbers change on every mount, so Borg's default
+        ``ctime,size,inode`` files cache would miss on every file. Custom
+        flags that already choose a mode win.
+        """
+        if not ssh_mount_info or not settings.sshfs_source_profile:
+            return []
+        mode = (settings.sshfs_source_files_cache or "").strip()
+        if not mode or any(flag.startswith("--files-cache") for flag in custom_flags):
+            return []
+        return ["--files-cache", mode]
+
     def _resolve_grouped_source_paths(
         self, db: Session, source_locations: list[dict]
     ) -> list[str]:
@@ -476,7 +511,12 @@ class BackupService:
         archive_name: str,
         env: dict,
     ):
-        """Update backup job with final archive statistics"""
+        """Update backup job with final archive statistics.
+
+        Returns the archive's ``stats`` dict so the repository totals can be
+        advanced incrementally, or None when they could not be read.
+        """
+        archive_stats = None
         try:
             job = db.query(BackupJob).filter(BackupJob.id == job_id).first()
             if not job:
@@ -498,6 +538,7 @@ class BackupService:
             timeouts = self._get_operation_timeouts(db)
 
             async def _operation():
+                nonlocal archive_stats
                 info_cmd = router.build_archive_info_command(
                     repository_path, archive_name
                 )
@@ -518,6 +559,8 @@ class BackupService:
                         if archives:
                             archive_info = archives[0]
                             stats = archive_info.get("stats", {})
+                            if stats:
+                                archive_stats = stats
 
                             # Update job with final statistics
                             job.original_size = stats.get(
@@ -562,10 +605,21 @@ class BackupService:
         except Exception as e:
             logger.error("Failed to update archive stats", job_id=job_id, error=str(e))
 
+        return archive_stats
+
     async def _update_repository_stats(
-        self, db: Session, repository_path: str, env: dict
+        self,
+        db: Session,
+        repository_path: str,
+        env: dict,
+        archive_stats: dict | None = None,
     ):
-        """Update repository statistics after a successful backup"""
+        """Update repository statistics after a successful backup.
+
+        When ``archive_stats`` from the new archive are available and the
+        repository has a recent exact baseline, sizes are advanced
+        incrementally and the full ``borg info`` call is skipped.
+        """
         try:
             repo_record = (
                 db.query(Repository).filter(Repository.path == repository_path).first()
@@ -582,6 +636,12 @@ class BackupService:
             timeouts = self._get_operation_timeouts(db)
 
             async def _operation():
+                incremental = (
+                    archive_stats is not None
+                    and not needs_full_size_refresh(repo_record)
+                    and apply_archive_created(repo_record, archive_stats)
+                )
+
                 list_cmd = router.build_repo_list_command(repository_path)
                 list_process = await asyncio.create_subprocess_exec(
                     *list_cmd,
@@ -606,34 +666,39 @@ class BackupService:
                     except json.JSONDecodeError as e:
                         logger.warning("Failed to parse borg list output", error=str(e))
 
-                info_cmd = router.build_repo_info_command(repository_path)
-                info_process = await asyncio.create_subprocess_exec(
-                    *info_cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env=env,
-                )
-                info_stdout, info_stderr = await asyncio.wait_for(
-                    info_process.communicate(), timeout=timeouts["info_timeout"]
-                )
-
-                if info_process.returncode == 0:
-                    try:
-                        info_data = json.loads(info_stdout.decode())
-                        cache_stats = info_data.get("cache", {}).get("stats", {})
+                if incremental:
+                    # Sizes were advanced from this archive's stats; the
+                    # exact count from `list` above wins over the increment.
+                    logger.info(
+                        "Updated repository size incrementally",
+                        repository=repository_path,
+                        size=repo_record.total_size,
+                    )
+                else:
+                    info_cmd = router.build_repo_info_command(repository_path)
+                    info_process = await asyncio.create_subprocess_exec(
+                        *info_cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        env=env,
+                    )
+                    info_stdout, info_stderr = await asyncio.wait_for(
+                        info_process.communicate(), timeout=timeouts["info_timeout"]
+                    )
 
-                        # Get total repository size (unique_size is deduplicated size)
-                        unique_size = cache_stats.get("unique_size", 0)
-                        if unique_size > 0:
-                            # Format size to human readable
-                            repo_record.total_size = self._format_bytes(unique_size)
-                            logger.info(
-                                "Updated repository size",
-                                repository=repository_path,
-                                size=repo_record.total_size,
+                    if info_process.returncode == 0:
+                        try:
+                            info_data = json.loads(info_stdout.decode())
+                            if apply_repository_info(repo_record, info_data):
+                                logger.info(
+                                    "Updated repository size",
+                                    repository=repository_path,
+                                    size=repo_record.total_size,
+                                )
+                        except json.JSONDecodeError as e:
+                            logger.warning(
+                                "Failed to parse borg info output", error=str(e)
                             )
-                    except json.JSONDecodeError as e:
-                        logger.warning("Failed to parse borg info output", error=str(e))
 
                 # Update last_backup timestamp
                 repo_record.last_backup = datetime.utcnow()
@@ -641,8 +706,8 @@ class BackupService:
                 db.commit()
                 logger.info("Repository statistics updated", repository=repository_path)
 
-                # Publish a full DB-derived MQTT snapshot immediately after stats changes.
-                mqtt_service.sync_state_with_db(db, reason="repository stats updated")
+                # Queue a DB-derived MQTT snapshot; bursts of updates share one sync.
+                mqtt_service.request_sync(reason="repository stats updated")
 
             await run_serialized_repository_command(repo_record.id, _operation)
 
@@ -659,11 +724,7 @@ class BackupService:
 
     def _format_bytes(self, bytes_value: int) -> str:
         """Format bytes to human readable string"""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} PB"
+        return format_size(bytes_value)
 
     async def _calculate_source_size(
         self,
@@ -771,7 +832,12 @@ class BackupService:
         return targets
 
     async def _calculate_and_update_size_background(
-        self, job_id: int, source_paths: list[str], exclude_patterns: list[str] = None
+        self,
+        job_id: int,
+        source_paths: list[str],
+        exclude_patterns: list[str] = None,
+        repository_id: int = None,
+        source_labels: list[str] = None,
     ):
         """
         Background task to calculate source size and update job record
@@ -781,6 +847,9 @@ class BackupService:
             job_id: The backup job ID
             source_paths: List of source directory paths
             exclude_patterns: List of patterns to exclude (same format as Borg excludes)
+            repository_id: Repository whose source size baselines may replace du
+            source_labels: Configured paths of the sources, when source_paths
+                are per-job snapshot staging paths
         """
         temp_source_key_files = set()
         try:
@@ -795,9 +864,30 @@ class BackupService:
                 exclude_count=len(exclude_patterns),
             )
 
+            total_expected_size = None
+            if repository_id is not None and source_size_estimator.enabled:
+                db = SessionLocal()
+                try:
+                    repo_record = (
+                        db.query(Repository)
+                        .filter(Repository.id == repository_id)
+                        .first()
+                    )
+                    total_expected_size = await source_size_estimator.estimate(
+                        repo_record,
+                        job_id,
+                        source_paths,
+                        exclude_patterns,
+                        source_labels=source_labels,
+                    )
+                finally:
+                    db.close()
+
             key_files_by_ssh_target = None
             login_relative_ssh_targets = None
-            if any(path.startswith("ssh://") for path in source_paths):
+            if total_expected_size is None and any(
+                path.startswith("ssh://") for path in source_paths
+            ):
                 db = SessionLocal()
                 try:
                     key_files_by_ssh_target = self._resolve_source_size_ssh_key_files(
@@ -812,12 +902,13 @@ class BackupService:
                 finally:
                     db.close()
 
-            total_expected_size = await self._calculate_source_size(
-                source_paths,
-                exclude_patterns,
-                key_files_by_ssh_target=key_files_by_ssh_target,
-                login_relative_ssh_targets=login_relative_ssh_targets,
-            )
+            if total_expected_size is None:
+                total_expected_size = await self._calculate_source_size(
+                    source_paths,
+                    exclude_patterns,
+                    key_files_by_ssh_target=key_files_by_ssh_target,
+                    login_relative_ssh_targets=login_relative_ssh_targets,
+                )
 
             if total_expected_size > 0:
                 # Update the job record with the calculated size
@@ -860,6 +951,19 @@ class BackupService:
             for key_file in temp_source_key_files:
                 cleanup_temp_key_file(key_file)
 
+    def _record_source_size_baseline(
+        self, db: Session, repo_record: Repository, job: BackupJob
+    ) -> None:
+        """Keep the archive size as the next backup's source size estimate."""
+        try:
+            if source_size_estimator.record_baseline(repo_record, job):
+                db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(
+                "Failed to record source size baseline", job_id=job.id, error=str(e)
+            )
+
     def _validate_local_source_paths_exist(
         self, source_paths: list[str], skip_paths: set[str] | None = None
     ) -> None:
@@ -1025,6 +1129,7 @@ class BackupService:
                         # with faithful symlink handling (no dereference, keep
                         # absolute/broken links). See mount_service._sshfs_symlink_options.
                         "preserve_symlinks": True,
+                        "source_profile": settings.sshfs_source_profile,
                     }
                     if shared_ssh_temp_root is not None:
                         mount_kwargs["temp_root"] = shared_ssh_temp_root
@@ -1410,6 +1515,7 @@ class BackupService:
         compression_override: str = None,
         custom_flags_override: str = None,
         upload_ratelimit_kib: int = None,
+        upload_ratelimit_schedule: UploadRatelimitSchedule = None,
     ):
         """Execute backup using borg directly for better control
 
@@ -1427,6 +1533,8 @@ class BackupService:
             compression_override: Optional compression override for backup plans.
             custom_flags_override: Optional custom flags override for backup plans.
             upload_ratelimit_kib: Optional Borg upload rate limit in KiB/s.
+            upload_ratelimit_schedule: Optional base limit and policy windows that the
+                        shared bandwidth budget re-evaluates while the backup runs.
         """
 
         # Use provided session or create a new one
@@ -1437,6 +1545,7 @@ class BackupService:
         temp_key_file = None  # Track SSH key file for cleanup
         borg_command_lock = None
         sshfs_cache_lock = None
+        bandwidth_job_registered = False
 
         try:
             # Get job
@@ -1518,7 +1627,7 @@ class BackupService:
                 job.status = "running"
                 job.started_at = datetime.utcnow()
                 db.commit()
-                mqtt_service.sync_state_with_db(db, reason="backup started")
+                mqtt_service.request_sync(reason="backup started")
             except Exception as status_error:
                 # Job was deleted while starting - exit gracefully
                 logger.warning(
@@ -1967,9 +2076,14 @@ class BackupService:
                 job_id=job_id,
                 exclude_patterns=exclude_patterns,
             )
+            source_size_estimator.begin(job_id)
             asyncio.create_task(
                 self._calculate_and_update_size_background(
-                    job_id, source_paths, exclude_patterns
+                    job_id,
+                    source_paths,
+                    exclude_patterns,
+                    repository_id=repo_record.id if repo_record else None,
+                    source_labels=source_paths_for_existence_check,
                 )
             )
 
@@ -1999,9 +2113,7 @@ class BackupService:
                 )
                 job.completed_at = datetime.utcnow()
                 db.commit()
-                mqtt_service.sync_state_with_db(
-                    db, reason="backup failed: no valid source paths"
-                )
+                mqtt_service.request_sync(reason="backup failed: no valid source paths")
                 return
             logger.info(
                 "Source paths prepared",
@@ -2039,6 +2151,21 @@ class BackupService:
                             error=str(e),
                         )
 
+            custom_flag_list.extend(
+                self._sshfs_files_cache_flags(ssh_mount_info, custom_flag_list)
+            )
+
+            # With a shared bandwidth budget or policy windows, SSH uploads are
+            # shaped by the relay for the whole run instead of a fixed limit.
+            bandwidth_schedule = upload_ratelimit_schedule or UploadRatelimitSchedule(
+                base_upload_ratelimit_kib=effective_upload_ratelimit_kib
+            )
+            relay_bandwidth = bandwidth_budget_service.should_relay(
+                actual_repository_path, bandwidth_schedule, env
+            )
+            if relay_bandwidth:
+                effective_upload_ratelimit_kib = None
+
             cmd = router.build_backup_create_command(
                 repository_path=actual_repository_path,
                 archive_name=archive_name,
@@ -2092,6 +2219,23 @@ class BackupService:
                     )
                     return
 
+            if relay_bandwidth:
+                rate_file = bandwidth_budget_service.register(
+                    job_id, actual_repository_path, bandwidth_schedule
+                )
+                bandwidth_job_registered = True
+                env["BORG_RSH"] = bandwidth_budget_service.relay_command(
+                    rate_file, env["BORG_RSH"]
+                )
+                logger.info(
+                    "Shaping backup upload with the shared bandwidth budget",
+                    job_id=job_id,
+                    repository=actual_repository_path,
+                )
+
+            priority = resolve_process_priority("backup", repo_record)
+            job.process_priority = priority.to_dict()
+
             # Execute command - NO LOG FILE FOR MAXIMUM PERFORMANCE
             process = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -2100,6 +2244,7 @@ class BackupService:
                 env=env,
                 cwd=backup_cwd,  # Use cwd for SSH mounts to get cleaner archive paths
             )
+            priority.apply(process.pid)
             process_wait_task = asyncio.get_running_loop().create_task(process.wait())
 
             # Track this process so it can be cancelled
@@ -2156,12 +2301,12 @@ class BackupService:
                         log_file_handle.write(line + "\n")
 
             # Smart current_file tracking: Only show files taking >3 seconds
-            file_start_times = {}  # Track when each file started processing
+            current_files = CurrentFileTracker(threshold=3.0)
+            files_cache_stats = FilesCacheStats()
             last_shown_file = None
 
             # Speed tracking: Moving average over 30-second window
-            speed_tracking = []  # List of (timestamp, original_size) tuples
-            SPEED_WINDOW_SECONDS = 30  # Calculate speed over last 30 seconds
+            speed = SpeedWindow()
 
             async def check_cancellation():
                 """Periodic heartbeat to check for cancellation independent of log output"""
@@ -2198,7 +2343,6 @@ class BackupService:
                     cancelled, \
                     last_commit_time, \
                     last_shown_file, \
-                    speed_tracking, \
                     captured_exit_code, \
                     live_progress_exposed
                 try:
@@ -2234,6 +2378,7 @@ class BackupService:
                             if line_str and line_str[0] == "{":
                                 json_msg = json.loads(line_str)
                                 msg_type = json_msg.get("type")
+                                files_cache_stats.feed(json_msg)
 
                                 # Parse archive_progress messages for real-time stats
                                 if msg_type == "archive_progress":
@@ -2250,38 +2395,11 @@ class BackupService:
                                     # Calculate backup speed using moving average (30-second window)
                                     if job.original_size > 0:
                                         current_time = asyncio.get_event_loop().time()
-
-                                        # Add current data point
-                                        speed_tracking.append(
-                                            (current_time, job.original_size)
-                                        )
-
-                                        # Remove data points older than window
-                                        speed_tracking[:] = [
-                                            (t, s)
-                                            for t, s in speed_tracking
-                                            if current_time - t <= SPEED_WINDOW_SECONDS
-                                        ]
-
-                                        # Calculate speed from moving average (need at least 2 data points)
-                                        if len(speed_tracking) >= 2:
-                                            time_diff = (
-                                                speed_tracking[-1][0]
-                                                - speed_tracking[0][0]
-                                            )
-                                            size_diff = (
-                                                speed_tracking[-1][1]
-                                                - speed_tracking[0][1]
-                                            )
-
-                                            if time_diff > 0 and size_diff > 0:
-                                                # Speed in MB/s
-                                                job.backup_speed = (
-                                                    size_diff / (1024 * 1024)
-                                                ) / time_diff
-                                            elif time_diff > 0:
-                                                # No size change yet (early in backup or deduplication)
-                                                job.backup_speed = 0.0
+                                        speed.add(current_time, job.original_size)
+                                        rate = speed.rate()
+                                        if rate is not None:
+                                            # Speed in MB/s
+                                            job.backup_speed = rate / MB
 
                                         # Calculate progress percentage if we have expected size
                                         if (
@@ -2298,73 +2416,35 @@ class BackupService:
                                             )
 
                                             # Calculate estimated time remaining (in seconds)
-                                            remaining_bytes = (
-                                                job.total_expected_size
-                                                - job.original_size
-                                            )
-                                            if (
-                                                remaining_bytes > 0
-                                                and job.backup_speed > 0
-                                            ):
-                                                # Speed is in MB/s, convert remaining bytes to MB
-                                                remaining_mb = remaining_bytes / (
-                                                    1024 * 1024
-                                                )
-                                                job.estimated_time_remaining = int(
-                                                    remaining_mb / job.backup_speed
+                                            job.estimated_time_remaining = (
+                                                estimate_seconds_remaining(
+                                                    job.total_expected_size
+                                                    - job.original_size,
+                                                    rate,
                                                 )
-                                            else:
-                                                job.estimated_time_remaining = 0
+                                            )
 
                                     # SMART CURRENT_FILE TRACKING: Only show files taking >3 seconds
                                     current_path = json_msg.get("path", "")
                                     if current_path:
                                         current_time = asyncio.get_event_loop().time()
-
-                                        # Track when this file started
-                                        if current_path not in file_start_times:
-                                            file_start_times[current_path] = (
-                                                current_time
-                                            )
-
-                                        # Check how long this file has been processing
-                                        file_duration = (
-                                            current_time
-                                            - file_start_times[current_path]
+                                        shown = current_files.observe(
+                                            current_path, current_time
                                         )
-
-                                        if file_duration > 3.0:
-                                            # Large/slow file - worth showing to user
-                                            if current_path != job.current_file:
-                                                job.current_file = current_path
-                                                last_shown_file = current_path
-                                                # Commit immediately so frontend sees it on next poll
-                                                db.commit()
-                                                last_commit_time = (
-                                                    asyncio.get_event_loop().time()
-                                                )
-                                        elif current_path != last_shown_file:
-                                            # Fast file - don't show it, keep showing last large file or clear it
-                                            if (
-                                                last_shown_file
-                                                and last_shown_file
-                                                not in file_start_times
-                                            ):
-                                                # Last shown file is done, clear the display
+                                        if shown is None:
+                                            # Last shown file is done, clear the display
+                                            if last_shown_file:
                                                 job.current_file = None
                                                 last_shown_file = None
-
-                                        # Clean up old file tracking (keep memory usage low)
-                                        if len(file_start_times) > 100:
-                                            # Remove files we finished more than 10 seconds ago
-                                            old_files = [
-                                                f
-                                                for f, t in file_start_times.items()
-                                                if current_time - t > 10.0
-                                                and f != current_path
-                                            ]
-                                            for old_file in old_files:
-                                                del file_start_times[old_file]
+                                        elif shown != last_shown_file:
+                                            # Large/slow file - worth showing to user
+                                            job.current_file = shown
+                                            last_shown_file = shown
+                                            # Commit immediately so frontend sees it on next poll
+                                            db.commit()
+                                            last_commit_time = (
+                                                asyncio.get_event_loop().time()
+                                            )
 
                                     # Check if finished
                                     finished = json_msg.get("finished", False)
@@ -2445,11 +2525,8 @@ class BackupService:
                                     path = json_msg.get("path", "")
                                     if path:
                                         # Apply same smart filtering
-                                        file_duration = (
-                                            asyncio.get_event_loop().time()
-                                            - file_start_times.get(
-                                                path, asyncio.get_event_loop().time()
-                                            )
+                                        file_duration = current_files.elapsed(
+                                            path, asyncio.get_event_loop().time()
                                         )
                                         if file_duration > 3.0:
                                             job.current_file = f"[{status}] {path}"
@@ -2521,9 +2598,7 @@ class BackupService:
                 try:
                     while not cancelled and not process_wait_task.done():
                         # Sync state with DB every 15 seconds to publish progress updates
-                        mqtt_service.sync_state_with_db(
-                            db, reason="backup progress update"
-                        )
+                        mqtt_service.request_sync(reason="backup progress update")
                         try:
                             await asyncio.wait_for(
                                 asyncio.shield(process_wait_task), timeout=15.0
@@ -2563,7 +2638,19 @@ class BackupService:
                 if job.completed_at is None:
                     job.completed_at = datetime.utcnow()
                 db.commit()
-                mqtt_service.sync_state_with_db(db, reason=reason)
+                mqtt_service.request_sync(reason=reason)
+
+            job.files_cache_hit_rate = files_cache_stats.hit_rate
+            if job.files_cache_hit_rate is not None:
+                logger.info(
+                    "Borg files cache hit rate",
+                    job_id=job_id,
+                    hit_rate=round(job.files_cache_hit_rate, 4),
+                    unchanged=files_cache_stats.counts["U"],
+                    modified=files_cache_stats.counts["M"],
+                    added=files_cache_stats.counts["A"],
+                    sshfs_sources=bool(ssh_mount_info),
+                )
 
             # Use the actual exit code from the process, or fall back to captured code from logs
             # This handles cases where borg sends the exit code in log messages but process.returncode is 0
@@ -2632,11 +2719,14 @@ class BackupService:
                 job.progress = 100
                 publish_terminal_state("backup completed: borg create finished")
                 # Update archive statistics with final deduplicated size
-                await self._update_archive_stats(
+                archive_stats = await self._update_archive_stats(
                     db, job_id, repository, archive_name, env
                 )
                 # Update repository statistics after successful backup
-                await self._update_repository_stats(db, repository, env)
+                await self._update_repository_stats(
+                    db, repository, env, archive_stats=archive_stats
+                )
+                self._record_source_size_baseline(db, repo_record, job)
                 rclone_sync_ok = await self._sync_rclone_after_borg(
                     db, repo_record, job
                 )
@@ -2748,11 +2838,14 @@ class BackupService:
                     "backup completed with warnings: borg create finished"
                 )
                 # Update archive statistics with final deduplicated size
-                await self._update_archive_stats(
+                archive_stats = await self._update_archive_stats(
                     db, job_id, repository, archive_name, env
                 )
                 # Update repository statistics even with warnings
-                await self._update_repository_stats(db, repository, env)
+                await self._update_repository_stats(
+                    db, repository, env, archive_stats=archive_stats
+                )
+                self._record_source_size_baseline(db, repo_record, job)
                 await self._sync_rclone_after_borg(db, repo_record, job)
 
                 # Run post-backup hooks even with warnings (script library or inline)
@@ -3087,7 +3180,7 @@ class BackupService:
 
             db.commit()
             logger.info("Backup completed", job_id=job_id, status=job.status)
-            mqtt_service.sync_state_with_db(db, reason="backup completed")
+            mqtt_service.request_sync(reason="backup completed")
 
             # Send failure notification if backup failed
             if job.status == "failed":
@@ -3133,9 +3226,7 @@ class BackupService:
                 if not job.logs:
                     job.logs = failure_text
                 db.commit()
-                mqtt_service.sync_state_with_db(
-                    db, reason="backup failed with exception"
-                )
+                mqtt_service.request_sync(reason="backup failed with exception")
 
                 # Send failure notification
                 try:
@@ -3179,8 +3270,8 @@ class BackupService:
                         if not retry_job.logs:
                             retry_job.logs = str(e)
                         retry_db.commit()
-                        mqtt_service.sync_state_with_db(
-                            retry_db, reason="backup failed with exception (retry)"
+                        mqtt_service.request_sync(
+                            reason="backup failed with exception (retry)"
                         )
                     else:
                         logger.warning(
@@ -3208,6 +3299,10 @@ class BackupService:
                     pass
                 borg_command_lock = None
 
+            # The new archive (or a failed run's checkpoint) changed the list
+            if "repo_record" in locals() and repo_record is not None:
+                archive_list_cache.invalidate(repo_record.id)
+
             # Ensure log file handle is closed
             if "log_file_handle" in locals() and log_file_handle:
                 try:
@@ -3258,6 +3353,10 @@ class BackupService:
                     pass
                 sshfs_cache_lock = None
 
+            if bandwidth_job_registered:
+                bandwidth_budget_service.unregister(job_id)
+            source_size_estimator.discard(job_id)
+
             # Clean up temporary SSH key file if it exists
             try:
                 cleanup_temp_key_file(temp_key_file)
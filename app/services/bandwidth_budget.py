@@ -0,0 +1,224 @@
+"""Upload bandwidth budget shared by concurrent backups to SSH repositories.
+
+A per-job ``--upload-ratelimit`` is fixed when Borg starts: concurrent jobs
+each get the full limit and a job keeps the limit of the policy window it
+started in. Instead, jobs registered here run their ssh transport through
+``app/utils/bandwidth_relay.py``. Every few seconds the coordinator
+re-evaluates each job's policy window, splits the global and per-destination
+budgets fairly between the running jobs and rewrites the rate file that each
+relay reads.
+"""
+
+import asyncio
+import os
+import shlex
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Mapping, Optional
+from urllib.parse import urlparse
+
+import structlog
+
+from app.config import settings
+from app.services.upload_ratelimit_policies import UploadRatelimitSchedule
+
+logger = structlog.get_logger()
+
+RELAY_SCRIPT = Path(__file__).resolve().parent.parent / "utils" / "bandwidth_relay.py"
+
+
+@dataclass
+class BandwidthJob:
+    job_id: int
+    destination: str
+    schedule: UploadRatelimitSchedule
+    rate_file: str
+    rate_kib: Optional[int] = None
+
+
+def destination_key(repository_path: str) -> str:
+    """Host that a repository's uploads share a link with."""
+    if repository_path.startswith("ssh://"):
+        parsed = urlparse(repository_path)
+        if parsed.hostname:
+            return parsed.hostname.lower()
+    return repository_path
+
+
+def fair_share(
+    budget: Optional[float], caps: dict[int, Optional[float]]
+) -> dict[int, Optional[float]]:
+    """Split ``budget`` max-min fairly; ``None`` means unlimited."""
+    if budget is None:
+        return dict(caps)
+
+    shares: dict[int, Optional[float]] = {}
+    remaining = float(budget)
+    pending = sorted(
+        caps, key=lambda key: float("inf") if caps[key] is None else caps[key]
+    )
+    while pending:
+        share = remaining / len(pending)
+        key = pending[0]
+        cap = caps[key]
+        if cap is not None and cap <= share:
+            shares[key] = cap
+            remaining -= cap
+            pending.pop(0)
+            continue
+        for key in pending:
+            shares[key] = share
+        break
+    return shares
+
+
+def allocate_rates(
+    jobs: dict[int, tuple[str, Optional[int]]],
+    *,
+    global_budget_kib: Optional[int],
+    destination_budget_kib: Optional[int],
+) -> dict[int, Optional[int]]:
+    """Rate in KiB/s for each job given its destination and own limit."""
+    caps: dict[int, Optional[float]] = {}
+    destinations: dict[str, list[int]] = {}
+    for job_id, (destination, limit) in jobs.items():
+        destinations.setdefault(destination, []).append(job_id)
+
+    for job_ids in destinations.values():
+        caps.update(
+            fair_share(
+                destination_budget_kib,
+                {job_id: jobs[job_id][1] for job_id in job_ids},
+            )
+        )
+
+    rates = fair_share(global_budget_kib, caps)
+    return {
+        job_id: None if rate is None else max(1, int(rate))
+        for job_id, rate in rates.items()
+    }
+
+
+def _budget(value: int) -> Optional[int]:
+    return value if value and value > 0 else None
+
+
+class BandwidthBudgetService:
+    def __init__(self):
+        self._jobs: dict[int, BandwidthJob] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._rate_dir: Optional[str] = None
+
+    @property
+    def global_budget_kib(self) -> Optional[int]:
+        return _budget(settings.upload_bandwidth_budget_kib)
+
+    @property
+    def destination_budget_kib(self) -> Optional[int]:
+        return _budget(settings.upload_bandwidth_destination_budget_kib)
+
+    def should_relay(
+        self,
+        repository_path: str,
+        schedule: UploadRatelimitSchedule,
+        env: Mapping[str, str],
+    ) -> bool:
+        """Whether a backup to ``repository_path`` needs the shaping relay.
+
+        Only ``ssh://`` repositories reach Borg through ``BORG_RSH``, and the
+        relay wraps the ``BORG_RSH`` in ``env``; local and rclone repositories,
+        and SSH ones without a ``BORG_RSH``, keep the static
+        ``--upload-ratelimit``.
+        """
+        if not repository_path.startswith("ssh://") or not env.get("BORG_RSH"):
+            return False
+        return bool(
+            self.global_budget_kib or self.destination_budget_kib or schedule.policies
+        )
+
+    def register(
+        self, job_id: int, repository_path: str, schedule: UploadRatelimitSchedule
+    ) -> str:
+        """Add a running job and return the path of its rate file."""
+        if self._rate_dir is None or not os.path.isdir(self._rate_dir):
+            self._rate_dir = tempfile.mkdtemp(prefix="borg-ui-bandwidth-")
+        job = BandwidthJob(
+            job_id=job_id,
+            destination=destination_key(repository_path),
+            schedule=schedule,
+            rate_file=os.path.join(self._rate_dir, f"job-{job_id}.rate"),
+        )
+        self._jobs[job_id] = job
+        self.rebalance()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._rebalance_loop())
+        return job.rate_file
+
+    def unregister(self, job_id: int) -> None:
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        try:
+            os.unlink(job.rate_file)
+        except OSError:
+            pass
+        self.rebalance()
+
+    def relay_command(self, rate_file: str, rsh: str) -> str:
+        """``BORG_RSH`` that runs ``rsh`` through the relay for ``rate_file``."""
+        return " ".join(
+            [
+                shlex.quote(sys.executable),
+                shlex.quote(str(RELAY_SCRIPT)),
+                shlex.quote(rate_file),
+                rsh,
+            ]
+        )
+
+    def rebalance(self, now: Optional[datetime] = None) -> dict[int, Optional[int]]:
+        """Recompute every job's rate and write the changed rate files."""
+        now = now or datetime.now(timezone.utc)
+        rates = allocate_rates(
+            {
+                job.job_id: (job.destination, job.schedule.resolve(now))
+                for job in self._jobs.values()
+            },
+            global_budget_kib=self.global_budget_kib,
+            destination_budget_kib=self.destination_budget_kib,
+        )
+        for job_id, rate in rates.items():
+            job = self._jobs[job_id]
+            if rate == job.rate_kib and os.path.exists(job.rate_file):
+                continue
+            self._write_rate(job.rate_file, rate)
+            if job.rate_kib is not None or rate is not None:
+                logger.info(
+                    "Upload bandwidth allocation changed",
+                    job_id=job_id,
+                    destination=job.destination,
+                    rate_kib=rate,
+                    previous_rate_kib=job.rate_kib,
+                )
+            job.rate_kib = rate
+        return rates
+
+    @staticmethod
+    def _write_rate(rate_file: str, rate: Optional[int]) -> None:
+        temp_file = f"{rate_file}.tmp"
+        with open(temp_file, "w", encoding="ascii") as handle:
+            handle.write(str(rate or 0))
+        os.replace(temp_file, rate_file)
+
+    async def _rebalance_loop(self) -> None:
+        while self._jobs:
+            await asyncio.sleep(max(1, settings.upload_bandwidth_rebalance_seconds))
+            try:
+                self.rebalance()
+            except Exception as e:
+                logger.warning("Failed to rebalance upload bandwidth", error=str(e))
+
+
+bandwidth_budget_service = BandwidthBudgetService()
@@ -0,0 +1,254 @@
+"""
+Bounded-memory bookkeeping for borg ``--log-json`` progress.
+
+Backup, restore, check and compact all follow borg's JSON progress messages
+to report counters, speed and an ETA. Everything here keeps a fixed amount
+of state no matter how many files the operation touches:
+
+- files are counted when the reported path changes, which is exact because
+  borg walks an archive (or a source tree) one item at a time and never
+  returns to a path it already left;
+- speed is a moving average over a fixed window kept in at most
+  ``SPEED_WINDOW_SLOTS`` samples;
+- status-message throttling remembers only the last message.
+"""
+
+import json
+import re
+from collections import deque
+from typing import Callable, Optional
+
+MB = 1024 * 1024
+SPEED_WINDOW_SECONDS = 30.0
+SPEED_WINDOW_SLOTS = 30
+# Non-progress output lines kept for job logs.
+MAX_LOG_LINES = 1000
+
+_COUNTS_SUFFIX = re.compile(r"\s*\(\d+/\d+\)$")
+
+
+def parse_log_json(line: str) -> Optional[dict]:
+    """The message of one ``--log-json`` line, or None for plain text."""
+    if not line or line[0] != "{":
+        return None
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def is_progress_message(message: Optional[dict]) -> bool:
+    return bool(message) and message.get("type") in (
+        "progress_percent",
+        "progress_message",
+        "archive_progress",
+    )
+
+
+async def read_lines(stream, on_line: Callable[[str], None]) -> None:
+    """Feed each non-empty line of ``stream`` to ``on_line``.
+
+    Borg ends in-place progress updates with ``\\r`` instead of ``\\n``.
+    """
+    buffer = b""
+    while True:
+        chunk = await stream.read(8192)
+        if not chunk:
+            break
+        buffer += chunk
+        *lines, buffer = buffer.replace(b"\r", b"\n").split(b"\n")
+        for line in lines:
+            text = line.decode("utf-8", errors="replace").strip()
+            if text:
+                on_line(text)
+    text = buffer.decode("utf-8", errors="replace").strip()
+    if text:
+        on_line(text)
+
+
+def estimate_seconds_remaining(remaining: int, rate: Optional[float]) -> int:
+    """Whole seconds left at ``rate`` units per second, 0 when unknown."""
+    if remaining <= 0 or not rate or rate <= 0:
+        return 0
+    return int(remaining / rate)
+
+
+class SpeedWindow:
+    """Moving-average rate of a growing counter over the last ``window`` seconds.
+
+    Samples closer together than ``window / slots`` are folded into the most
+    recent value, so the window never holds more than ``slots + 1`` samples.
+    """
+
+    def __init__(
+        self,
+        window: float = SPEED_WINDOW_SECONDS,
+        slots: int = SPEED_WINDOW_SLOTS,
+    ):
+        self.window = window
+        self._spacing = window / slots
+        self._samples: deque = deque(maxlen=slots + 1)
+        self._latest: Optional[tuple] = None
+
+    def add(self, now: float, value: int) -> None:
+        while self._samples and now - self._samples[0][0] > self.window:
+            self._samples.popleft()
+        if not self._samples or now - self._samples[-1][0] >= self._spacing:
+            self._samples.append((now, value))
+        self._latest = (now, value)
+
+    def rate(self) -> Optional[float]:
+        """Units per second, or None until the window spans some time."""
+        if not self._samples or self._latest is None:
+            return None
+        first_time, first_value = self._samples[0]
+        last_time, last_value = self._latest
+        if last_time <= first_time:
+            return None
+        return max(0.0, (last_value - first_value) / (last_time - first_time))
+
+
+class FileCounter:
+    """Counts distinct paths in a stream of per-item progress messages."""
+
+    def __init__(self):
+        self.count = 0
+        self.current = ""
+
+    def observe(self, path: str) -> None:
+        if path and path != self.current:
+            self.count += 1
+            self.current = path
+
+
+class CurrentFileTracker:
+    """Which file to show while a backup runs.
+
+    Only a file still being processed after ``threshold`` seconds is shown;
+    once it finished it stays visible for ``linger`` seconds unless another
+    slow file replaces it.
+    """
+
+    def __init__(self, threshold: float = 3.0, linger: float = 10.0):
+        self.threshold = threshold
+        self.linger = linger
+        self.path = ""
+        self.started = 0.0
+        self.shown: Optional[str] = None
+        self._shown_finished: Optional[float] = None
+
+    def elapsed(self, path: str, now: float) -> float:
+        """Seconds ``path`` has been in progress (0 when it is not current)."""
+        return now - self.started if path and path == self.path else 0.0
+
+    def observe(self, path: str, now: float) -> Optional[str]:
+        if path != self.path:
+            if self.shown is not None and self.shown == self.path:
+                self._shown_finished = now
+            self.path = path
+            self.started = now
+        if path and now - self.started > self.threshold:
+            self.shown = path
+            self._shown_finished = None
+        elif (
+            self._shown_finished is not None
+            and now - self._shown_finished > self.linger
+        ):
+            self.shown = None
+            self._shown_finished = None
+        return self.shown
+
+
+class MessageThrottle:
+    """Rate-limits a status message that embeds changing counts.
+
+    ``"Checking segments (5/100)"`` and ``"Checking segments (6/100)"`` are
+    the same message; a different one (a new phase) always goes through.
+    """
+
+    def __init__(self, interval: float = 2.0):
+        self.interval = interval
+        self._last_key: Optional[str] = None
+        self._last_time = 0.0
+
+    def allow(self, text: str, now: float) -> bool:
+        key = _COUNTS_SUFFIX.sub("", text)
+        if key == self._last_key and now - self._last_time < self.interval:
+            return False
+        self._last_key = key
+        self._last_time = now
+        return True
+
+
+class ExtractProgress:
+    """Counters for one ``borg extract --progress --log-json`` process."""
+
+    def __init__(self):
+        self.restored = 0
+        self.total = 0
+        self.files = FileCounter()
+
+    @property
+    def nfiles(self) -> int:
+        return self.files.count
+
+    @property
+    def current_file(self) -> str:
+        return self.files.current
+
+    def feed(self, message: Optional[dict]) -> bool:
+        """Apply one message; True when it was an extract progress update."""
+        if (
+            not message
+            or message.get("type") != "progress_percent"
+            or message.get("finished")
+        ):
+            return False
+        self.restored = message.get("current", 0) or 0
+        self.total = message.get("total", 0) or 0
+        info = message.get("info") or []
+        if info:
+            self.files.observe(str(info[0]))
+        return True
+
+
+class FilesCacheStats:
+    """Files-cache hits of one ``borg create`` run.
+
+    An unchanged file (status ``U``) was skipped thanks to the files cache;
+    added and modified files were read and chunked. Borg 2 reports the
+    counts in ``archive_progress.files_stats``; Borg 1.4+ prints them with
+    ``--stats``.
+    """
+
+    _STATS_LINE = re.compile(r"^(Added|Modified|Unchanged) files:\s*(\d+)\s*$")
+    _STATUS_BY_LABEL = {"Added": "A", "Modified": "M", "Unchanged": "U"}
+
+    def __init__(self):
+        self.counts = {"A": 0, "M": 0, "U": 0}
+        self.seen = False
+
+    def feed(self, message: Optional[dict]) -> None:
+        if not message:
+            return
+        files_stats = message.get("files_stats")
+        if message.get("type") == "archive_progress" and isinstance(files_stats, dict):
+            for status in self.counts:
+                if isinstance(files_stats.get(status), int):
+                    self.counts[status] = files_stats[status]
+                    self.seen = True
+        elif message.get("type") == "log_message":
+            for line in str(message.get("message") or "").splitlines():
+                match = self._STATS_LINE.match(line.strip())
+                if match:
+                    self.counts[self._STATUS_BY_LABEL[match[1]]] = int(match[2])
+                    self.seen = True
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Share of regular files served from the files cache (0.0-1.0)."""
+        total = sum(self.counts.values())
+        if not self.seen or total == 0:
+            return None
+        return self.counts["U"] / total
@@ -668,6 +668,25 @@ class ArchiveCacheService:
             self._handle_redis_failure()
             return None
 
+    async def get_archive_listing(
+        self, repo_id: int, archive_name: str
+    ) -> Optional[List[Dict]]:
+        """
+        Get the full item listing the archive browser cached for an archive.
+
+        Borg 1 browsing caches it under the archive name, Borg 2 browsing
+        under the archive selector with a ``::raw`` suffix.
+        """
+        for cache_name in (
+            archive_name,
+            f"{archive_name}::raw",
+            f"aid:{archive_name}::raw",
+        ):
+            items = await self.get(repo_id, cache_name)
+            if items:
+                return items
+        return None
+
     async def set(self, repo_id: int, archive_name: str, items: List[Dict]) -> bool:
         """
         Cache archive items.
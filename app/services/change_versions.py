@@ -0,0 +1,166 @@
+"""
+Change-version counters for the list endpoints the frontend polls.
+
+The jobs, backup plan and activity pages poll every one to three seconds and
+most of those polls return the same data. Each resource family below has a
+monotonic counter that is bumped when a transaction writing one of its tables
+commits. Polled endpoints build an ETag from the counters they read (plus the
+user and the query string) before running any query, and answer a matching
+``If-None-Match`` with 304.
+
+Counters live in process memory, which is correct for the single app worker
+the image runs. Every process starts a new epoch, so ETags issued before a
+restart never match.
+"""
+
+import hashlib
+import threading
+import uuid
+from typing import Iterable, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+FAMILY_TABLES: dict[str, frozenset[str]] = {
+    "jobs": frozenset(
+        {
+            "backup_jobs",
+            "backup_job_retry_lineage",
+            "restore_jobs",
+            "check_jobs",
+            "restore_check_jobs",
+            "compact_jobs",
+            "prune_jobs",
+            "delete_archive_jobs",
+            "repository_wipe_jobs",
+            "rclone_sync_jobs",
+            "package_install_jobs",
+            "installed_packages",
+            "agent_jobs",
+            "agent_job_logs",
+            "script_executions",
+        }
+    ),
+    "backup_plans": frozenset(
+        {
+            "backup_plans",
+            "backup_plan_repositories",
+            "backup_plan_scripts",
+            "backup_plan_runs",
+            "backup_plan_run_repositories",
+            "backup_plan_run_retry_lineage",
+            "scripts",
+        }
+    ),
+    "repositories": frozenset({"repositories", "repository_storage"}),
+    "schedules": frozenset(
+        {
+            "scheduled_jobs",
+            "scheduled_job_repositories",
+            "availability_schedule_skips",
+        }
+    ),
+    "settings": frozenset({"system_settings"}),
+    # The user's own roles are part of the ETag scope; the users table is not
+    # tracked because proxy auth writes last_login on every request.
+    "permissions": frozenset({"user_repository_permissions"}),
+}
+
+_TABLE_FAMILIES: dict[str, str] = {
+    table: family for family, tables in FAMILY_TABLES.items() for table in tables
+}
+_PENDING_KEY = "changed_families"
+
+
+class ChangeVersions:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._epoch = uuid.uuid4().hex[:8]
+        self._versions = {family: 0 for family in FAMILY_TABLES}
+
+    def bump(self, *families: str) -> None:
+        with self._lock:
+            for family in families:
+                self._versions[family] = self._versions.get(family, 0) + 1
+
+    def get(self, family: str) -> int:
+        return self._versions.get(family, 0)
+
+    def etag(self, families: Iterable[str], *scope: object) -> str:
+        """Weak ETag for a response built from ``families`` for ``scope``."""
+        parts = [self._epoch]
+        parts.extend(f"{family}:{self.get(family)}" for family in sorted(families))
+        parts.extend(str(part) for part in scope)
+        digest = hashlib.sha256("\x1f".join(parts).encode()).hexdigest()[:20]
+        return f'W/"{digest}"'
+
+
+change_versions = ChangeVersions()
+
+
+def families_for_tables(tables: Iterable[str]) -> set[str]:
+    return {_TABLE_FAMILIES[table] for table in tables if table in _TABLE_FAMILIES}
+
+
+def _mark_changed(session: Session, tables: Iterable[str]) -> None:
+    families = families_for_tables(tables)
+    if families:
+        session.info.setdefault(_PENDING_KEY, set()).update(families)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_changes(session: Session, flush_context) -> None:
+    _mark_changed(
+        session,
+        (
+            instance.__table__.name
+            for instance in (*session.new, *session.dirty, *session.deleted)
+            if hasattr(instance, "__table__")
+        ),
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_changes(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None:
+        _mark_changed(orm_execute_state.session, [mapper.local_table.name])
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_changes(session: Session) -> None:
+    families = session.info.pop(_PENDING_KEY, None)
+    if families:
+        change_versions.bump(*families)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def conditional_etag(
+    request: Request, response: Response, families: Iterable[str], user
+) -> Optional[Response]:
+    """Set the ETag on ``response``; return a 304 when the client has it.
+
+    Call this before querying so that a write landing while the response is
+    built bumps the version the next poll compares against.
+    """
+    etag = change_versions.etag(
+        families,
+        request.url.path,
+        request.url.query,
+        user.id,
+        user.role,
+        getattr(user, "all_repositories_role", None),
+    )
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
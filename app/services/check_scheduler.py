@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.api.maintenance_jobs import start_background_maintenance_job
 from app.core.borg_router import BorgRouter
 from app.database.models import CheckJob, Repository, SystemSettings
+from app.services.repository_executor import is_agent_executor
 from app.utils.process_utils import is_process_alive
 from app.utils.schedule_time import (
     DEFAULT_SCHEDULE_TIMEZONE,
@@ -187,6 +188,11 @@ async def run_due_scheduled_checks(db: Session, now: Optional[datetime] = None)
                     ),
                     "extra_flags": repo.check_extra_flags,
                     "scheduled_check": True,
+                    "verify_archives_per_run": (
+                        None
+                        if is_agent_executor(repo)
+                        else repo.check_verify_archives_per_run
+                    ),
                 },
             )
 
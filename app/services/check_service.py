@@ -9,9 +9,12 @@ from app.database.models import CheckJob, Repository
 from app.database.database import SessionLocal
 from app.config import settings
 from app.core.borg import borg
+from app.services.borg_progress import MessageThrottle
+from app.services.check_verify_rotation import run_verify_rotation
 from app.services.notification_service import NotificationService
 from app.utils.db_retries import commit_with_retry
 from app.utils.borg_env import build_repository_borg_env, cleanup_temp_key_file
+from app.utils.process_priority import resolve_process_priority
 
 logger = structlog.get_logger()
 
@@ -102,6 +105,14 @@ class CheckService:
             if temp_key_file:
                 logger.info("Using SSH key for check", job_id=job_id)
 
+            if isinstance(job.verify_archives_per_run, int) and (
+                job.verify_archives_per_run > 0
+            ):
+                await run_verify_rotation(
+                    db, job, repository, env, self.running_processes, self.log_dir
+                )
+                return
+
             # Build command
             cmd = [borg.borg_cmd, "check", "--progress", "--log-json"]
 
@@ -143,6 +154,9 @@ class CheckService:
                 command=" ".join(cmd),
             )
 
+            priority = resolve_process_priority("check", repository)
+            job.process_priority = priority.to_dict()
+
             # Execute command
             # Note: --progress writes to stderr, not stdout, so we need to capture stderr separately
             process = await asyncio.create_subprocess_exec(
@@ -151,6 +165,7 @@ class CheckService:
                 stderr=asyncio.subprocess.PIPE,  # Capture stderr separately for progress
                 env=env,
             )
+            priority.apply(process.pid)
 
             # Store PID and start time for orphan detection on container restart
             process_start_time = get_process_start_time(process.pid)
@@ -185,11 +200,9 @@ class CheckService:
             last_commit_time = asyncio.get_event_loop().time()
             COMMIT_INTERVAL = 3.0  # Commit every 3 seconds
 
-            # Progress message throttling to prevent spam
-            last_progress_update = {}  # Track last update time per message
-            PROGRESS_THROTTLE_INTERVAL = (
-                2.0  # Only update progress message every 2 seconds for same message
-            )
+            # Progress message throttling to prevent spam: the same message
+            # with new counts is shown at most every 2 seconds
+            progress_throttle = MessageThrottle(interval=2.0)
 
             # In-memory log buffer
             log_buffer = []
@@ -268,17 +281,10 @@ class CheckService:
 
                                         # Throttle progress message updates to prevent spam
                                         # Only update if this is a new message or enough time has passed
-                                        last_update_time = last_progress_update.get(
-                                            progress_msg, 0
-                                        )
-                                        if (
-                                            current_time - last_update_time
-                                            >= PROGRESS_THROTTLE_INTERVAL
+                                        if progress_throttle.allow(
+                                            progress_msg, current_time
                                         ):
                                             job.progress_message = progress_msg
-                                            last_progress_update[progress_msg] = (
-                                                current_time
-                                            )
                                     # Don't update progress_message when message is empty (keeps last good message)
 
                                     if not finished:
@@ -0,0 +1,434 @@
+"""
+Rotating data verification for repository checks.
+
+``borg check --verify-data`` reads every chunk in the repository on every run,
+so on large repositories it never finishes inside a maintenance window, and
+``--max-duration`` only bounds the repository phase, not data verification. A
+check job with ``verify_archives_per_run`` set verifies a batch of archives
+instead, each with ``borg extract --dry-run``: Borg fetches, decrypts and
+authenticates every chunk the archive references without writing files.
+
+Each run picks the archives that were never verified first (oldest first),
+then failed ones, then those verified longest ago, and records the outcome
+per archive in ``archive_verifications``. Successive runs therefore sweep the
+whole repository, and the share of archives with a current verification is
+the coverage reported on the dashboard and in ``/metrics``. Borg does not
+expose which segments hold an archive's chunks, so coverage is tracked per
+archive rather than per segment.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import structlog
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.borg_router import BorgRouter
+from app.database.models import ArchiveVerification, CheckJob, Repository
+from app.services.notification_service import NotificationService
+from app.utils.archive_job_metadata import archive_entry_name, parse_archive_time
+from app.utils.db_retries import commit_with_retry
+from app.utils.process_priority import resolve_process_priority
+
+logger = structlog.get_logger()
+
+MAX_LOG_LINES = 1000
+
+
+@dataclass
+class VerifyCoverage:
+    archive_count: int
+    archives_verified: int
+    oldest_verified_at: Optional[datetime] = None
+    last_verified_at: Optional[datetime] = None
+
+    @property
+    def percent(self) -> float:
+        if not self.archive_count:
+            return 0.0
+        return round(min(100.0, 100 * self.archives_verified / self.archive_count), 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "archive_count": self.archive_count,
+            "archives_verified": min(self.archives_verified, self.archive_count),
+            "percent": self.percent,
+            "oldest_verified_at": self.oldest_verified_at,
+            "last_verified_at": self.last_verified_at,
+        }
+
+
+def archive_key(archive: dict) -> Optional[str]:
+    """Identity of an archive in ``archive_verifications``: its id, else its name."""
+    archive_id = archive.get("id") if isinstance(archive, dict) else None
+    if isinstance(archive_id, str) and archive_id:
+        return archive_id
+    return archive_entry_name(archive)
+
+
+def select_verification_batch(
+    archives: Iterable[dict],
+    verifications: dict[str, ArchiveVerification],
+    batch_size: int,
+) -> list[dict]:
+    """Pick the next ``batch_size`` archives to verify."""
+    unverified = []
+    verified = []
+    for archive in archives:
+        key = archive_key(archive)
+        if key is None:
+            continue
+        row = verifications.get(key)
+        if row is None:
+            unverified.append(archive)
+        else:
+            verified.append((row.status == "verified", row.verified_at, archive))
+    unverified.sort(key=lambda archive: parse_archive_time(archive) or datetime.min)
+    verified.sort(key=lambda item: item[:2])
+    return (unverified + [archive for _, _, archive in verified])[:batch_size]
+
+
+def verify_coverage(
+    db: Session, repositories: Iterable[Repository]
+) -> dict[int, VerifyCoverage]:
+    """Coverage of repositories that use rotating verification or have records."""
+    repositories = list(repositories)
+    if not repositories:
+        return {}
+    rows = (
+        db.query(
+            ArchiveVerification.repository_id,
+            func.count(ArchiveVerification.id),
+            func.min(ArchiveVerification.verified_at),
+            func.max(ArchiveVerification.verified_at),
+        )
+        .filter(
+            ArchiveVerification.repository_id.in_([repo.id for repo in repositories]),
+            ArchiveVerification.status == "verified",
+        )
+        .group_by(ArchiveVerification.repository_id)
+        .all()
+    )
+    verified = {row[0]: row[1:] for row in rows}
+    coverage = {}
+    for repo in repositories:
+        if not repo.check_verify_archives_per_run and repo.id not in verified:
+            continue
+        count, oldest, last = verified.get(repo.id, (0, None, None))
+        coverage[repo.id] = VerifyCoverage(
+            archive_count=repo.archive_count or 0,
+            archives_verified=count,
+            oldest_verified_at=oldest,
+            last_verified_at=last,
+        )
+    return coverage
+
+
+async def _verify_archive(
+    db: Session,
+    job: CheckJob,
+    cmd: list[str],
+    env: dict,
+    priority,
+    running_processes: dict,
+    log_lines: list[str],
+) -> tuple[Optional[int], Optional[str]]:
+    """Run one dry-run extract; return ``(returncode, last error)``.
+
+    The return code is ``None`` when the job was cancelled meanwhile.
+    """
+    from app.services.check_service import get_process_start_time
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+    )
+    priority.apply(process.pid)
+    running_processes[job.id] = process
+    process_start_time = get_process_start_time(process.pid)
+
+    def persist_pid_tracking():
+        job.process_pid = process.pid
+        job.process_start_time = process_start_time
+
+    await commit_with_retry(
+        db,
+        prepare=persist_pid_tracking,
+        logger=logger,
+        action="check_verify_store_pid",
+        job_id=job.id,
+        repository_id=job.repository_id,
+    )
+
+    cancelled = False
+    last_error = None
+
+    async def watch_cancellation():
+        nonlocal cancelled
+        while process.returncode is None:
+            await asyncio.sleep(3)
+            db.refresh(job)
+            if job.status == "cancelled":
+                cancelled = True
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                return
+
+    async def read_errors():
+        nonlocal last_error
+        async for line in process.stderr:
+            line_str = line.decode("utf-8", errors="replace").strip()
+            if not line_str:
+                continue
+            log_lines.append(line_str)
+            if len(log_lines) > MAX_LOG_LINES:
+                log_lines.pop(0)
+            try:
+                message = json.loads(line_str)
+            except ValueError:
+                last_error = line_str
+                continue
+            if isinstance(message, dict) and message.get("levelname") in (
+                "ERROR",
+                "CRITICAL",
+            ):
+                last_error = message.get("message") or last_error
+
+    watcher = asyncio.create_task(watch_cancellation())
+    try:
+        await read_errors()
+        await process.wait()
+    finally:
+        watcher.cancel()
+        running_processes.pop(job.id, None)
+    if cancelled:
+        return None, None
+    return process.returncode, last_error
+
+
+async def run_verify_rotation(
+    db: Session,
+    job: CheckJob,
+    repository: Repository,
+    env: dict,
+    running_processes: dict,
+    log_dir: Path,
+) -> None:
+    """Run a rotating verification check job to completion.
+
+    ``job.max_duration`` bounds the run: once it is spent no further archive
+    is started, and the ones left over are first in line next time.
+    """
+    router = BorgRouter(repository)
+    archives = await router.list_archives(env=env, db=db, strict=True)
+    keys = {key for archive in archives if (key := archive_key(archive))}
+    verifications = {}
+
+    def reconcile_verifications():
+        verifications.clear()
+        rows = (
+            db.query(ArchiveVerification)
+            .filter(ArchiveVerification.repository_id == repository.id)
+            .all()
+        )
+        for row in rows:
+            if row.archive_id in keys:
+                verifications[row.archive_id] = row
+            else:
+                db.delete(row)  # Archive was pruned or deleted
+
+    await commit_with_retry(
+        db,
+        prepare=reconcile_verifications,
+        logger=logger,
+        action="check_verify_reconcile",
+        job_id=job.id,
+        repository_id=repository.id,
+    )
+
+    batch = select_verification_batch(
+        archives, verifications, job.verify_archives_per_run
+    )
+    priority = resolve_process_priority("check", repository)
+    job.process_priority = priority.to_dict()
+    deadline = (
+        time.monotonic() + job.max_duration
+        if job.max_duration and job.max_duration > 0
+        else None
+    )
+    log_lines: list[str] = []
+    verified = 0
+    warnings = 0
+    failures: list[str] = []
+    cancelled = False
+
+    for index, archive in enumerate(batch):
+        db.refresh(job)
+        if job.status == "cancelled":
+            cancelled = True
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.info(
+                "Verification time budget spent",
+                job_id=job.id,
+                verified=verified,
+                remaining=len(batch) - index,
+            )
+            break
+        name = archive_entry_name(archive)
+        key = archive_key(archive)
+        progress = int(index / len(batch) * 100)
+        progress_message = f"Verifying archive {index + 1}/{len(batch)}: {name}"
+
+        def persist_progress():
+            job.progress = progress
+            job.progress_message = progress_message
+
+        await commit_with_retry(
+            db,
+            prepare=persist_progress,
+            logger=logger,
+            action="check_verify_progress",
+            job_id=job.id,
+            repository_id=repository.id,
+        )
+
+        cmd = router.build_verify_archive_command(name, archive.get("id"))
+        log_lines.append(f"$ {' '.join(cmd)}")
+        returncode, last_error = await _verify_archive(
+            db, job, cmd, env, priority, running_processes, log_lines
+        )
+        if returncode is None:
+            cancelled = True
+            break
+
+        succeeded = returncode == 0 or returncode == 1 or 100 <= returncode <= 127
+        if succeeded:
+            verified += 1
+            warnings += returncode != 0
+        else:
+            failures.append(name)
+            logger.error(
+                "Archive data verification failed",
+                job_id=job.id,
+                archive=name,
+                exit_code=returncode,
+                error=last_error,
+            )
+        verified_at = datetime.utcnow()
+        error_message = (
+            None if succeeded else last_error or f"borg exited with code {returncode}"
+        )
+
+        def persist_verification():
+            row = (
+                db.query(ArchiveVerification)
+                .filter(
+                    ArchiveVerification.repository_id == repository.id,
+                    ArchiveVerification.archive_id == key,
+                )
+                .first()
+            )
+            if row is None:
+                row = ArchiveVerification(repository_id=repository.id, archive_id=key)
+                db.add(row)
+            row.archive_name = name
+            row.archive_start = parse_archive_time(archive)
+            row.status = "verified" if succeeded else "failed"
+            row.verified_at = verified_at
+            row.check_job_id = job.id
+            row.error_message = error_message
+            job.archives_verified = verified
+
+        await commit_with_retry(
+            db,
+            prepare=persist_verification,
+            logger=logger,
+            action="check_verify_record",
+            job_id=job.id,
+            repository_id=repository.id,
+        )
+
+    job.archives_verified = verified
+    job.completed_at = datetime.utcnow()
+    if cancelled:
+        job.status = "cancelled"
+    elif failures:
+        job.status = "failed"
+        job.error_message = (
+            f"Data verification failed for {len(failures)} archive(s): "
+            + ", ".join(failures)
+        )
+    else:
+        job.status = "completed_with_warnings" if warnings else "completed"
+        job.progress = 100
+        job.progress_message = f"Verified {verified} of {len(archives)} archive(s)"
+        if warnings:
+            job.error_message = (
+                f"Data verification completed with warnings for {warnings} archive(s)"
+            )
+        repository.last_check = job.completed_at
+
+    if log_lines:
+        log_file = (
+            log_dir
+            / f"check_job_{job.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        )
+        try:
+            log_file.write_text("\n".join(log_lines))
+            job.log_file_path = str(log_file)
+            job.has_logs = True
+            job.logs = f"Logs saved to: {log_file.name}"
+        except Exception as e:
+            job.has_logs = False
+            job.logs = f"Failed to save logs: {e}"
+            logger.error("Failed to save check logs", job_id=job.id, error=str(e))
+
+    await commit_with_retry(
+        db,
+        logger=logger,
+        action="check_verify_finalize",
+        job_id=job.id,
+        repository_id=repository.id,
+    )
+    logger.info(
+        "Rotating data verification finished",
+        job_id=job.id,
+        status=job.status,
+        verified=verified,
+        failed=len(failures),
+        archives=len(archives),
+    )
+
+    if job.status in ("completed", "failed"):
+        try:
+            duration_seconds = None
+            if job.started_at and job.completed_at:
+                duration_seconds = int(
+                    (job.completed_at - job.started_at).total_seconds()
+                )
+            await NotificationService.send_check_completion(
+                db=db,
+                repository_name=repository.name,
+                repository_path=repository.path,
+                status=job.status,
+                duration_seconds=duration_seconds,
+                error_message=job.error_message if job.status == "failed" else None,
+                check_type="scheduled" if job.scheduled_check else "manual",
+            )
+        except Exception as e:
+            logger.error(
+                "Failed to send check notification", job_id=job.id, error=str(e)
+            )
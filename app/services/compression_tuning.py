@@ -0,0 +1,520 @@
+"""
+Recommend a compression spec for a repository from a sample of its sources.
+
+Compression is a fixed per-repository ``--compression`` string. Tuning copies
+a bounded sample of the repository's local source files (one chunk from each
+of a random selection of files) into a scratch directory and backs it up
+once per candidate spec into a throwaway unencrypted repository, using the
+repository's own Borg version. For each candidate it keeps the wall-clock
+time and the bytes the scratch repository stored.
+
+The recommendation is the fastest candidate whose ratio (stored / sampled
+bytes) stays within a target. Without an explicit target that is the best
+ratio seen plus ``DEFAULT_RATIO_TOLERANCE``, so a much faster spec wins when
+a slower one saves only a few percent.
+
+Sources on SSH hosts and agents are not sampled: reading them over the
+network would measure the link rather than the compressor.
+"""
+
+import asyncio
+import os
+import random
+import shutil
+import stat
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+import structlog
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.borg_router import BorgRouter
+from app.database.database import SessionLocal
+from app.database.models import BackupJob, Repository
+from app.services.backup_route_planner import source_locations_for_repository
+from app.services.borg_progress import MB, parse_log_json
+from app.services.repository_executor import is_agent_executor
+from app.utils.datetime_utils import serialize_datetime
+
+logger = structlog.get_logger()
+
+CANDIDATE_COMPRESSIONS = (
+    "lz4",
+    "zstd,1",
+    "zstd,3",
+    "zstd,6",
+    "zstd,10",
+    "auto,zstd,6",
+)
+SAMPLE_CHUNK_BYTES = MB
+# Files looked at while picking the sample; huge trees are sampled from the
+# first entries walked.
+MAX_SCANNED_ENTRIES = 200_000
+DEFAULT_RATIO_TOLERANCE = 0.05
+OBSERVED_BACKUP_LIMIT = 10
+SAMPLE_ARCHIVE_NAME = "compression-sample"
+
+
+class CompressionTuningError(Exception):
+    """Raised when a repository cannot be tuned."""
+
+    def __init__(self, detail_key: str, *, status_code: int = 400):
+        self.detail_key = detail_key
+        self.status_code = status_code
+        super().__init__(detail_key)
+
+
+@dataclass
+class SourceSample:
+    files: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class CandidateResult:
+    compression: str
+    seconds: float = 0.0
+    sample_bytes: int = 0
+    stored_bytes: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Stored bytes per sampled byte; lower is better."""
+        if self.error or self.sample_bytes <= 0:
+            return None
+        return self.stored_bytes / self.sample_bytes
+
+    @property
+    def mb_per_second(self) -> Optional[float]:
+        if self.error or self.seconds <= 0:
+            return None
+        return self.sample_bytes / MB / self.seconds
+
+    def to_dict(self) -> dict:
+        ratio = self.ratio
+        speed = self.mb_per_second
+        return {
+            "compression": self.compression,
+            "seconds": round(self.seconds, 3),
+            "stored_bytes": self.stored_bytes,
+            "ratio": round(ratio, 4) if ratio is not None else None,
+            "mb_per_second": round(speed, 1) if speed is not None else None,
+            "error": self.error,
+        }
+
+
+def _iter_regular_files(paths: List[str]) -> Iterator[Tuple[str, int]]:
+    for root in paths:
+        if os.path.isfile(root):
+            walk = [(os.path.dirname(root), [], [os.path.basename(root)])]
+        else:
+            walk = os.walk(root)
+        for directory, dirnames, filenames in walk:
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = os.path.join(directory, name)
+                try:
+                    info = os.lstat(path)
+                except OSError:
+                    continue
+                if stat.S_ISREG(info.st_mode) and info.st_size > 0:
+                    yield path, info.st_size
+
+
+def pick_sample_files(
+    paths: List[str],
+    max_files: int,
+    rng: random.Random,
+    max_entries: int = MAX_SCANNED_ENTRIES,
+) -> List[Tuple[str, int]]:
+    """Reservoir-sample up to ``max_files`` regular files below ``paths``."""
+    chosen: List[Tuple[str, int]] = []
+    for seen, entry in enumerate(_iter_regular_files(paths)):
+        if seen >= max_entries:
+            break
+        if len(chosen) < max_files:
+            chosen.append(entry)
+            continue
+        slot = rng.randrange(seen + 1)
+        if slot < max_files:
+            chosen[slot] = entry
+    return chosen
+
+
+def write_sample(
+    files: List[Tuple[str, int]],
+    directory: str,
+    budget: int,
+    rng: random.Random,
+    chunk_size: int = SAMPLE_CHUNK_BYTES,
+) -> SourceSample:
+    """Copy one chunk from a random offset of each file until ``budget``."""
+    sample = SourceSample()
+    for index, (path, size) in enumerate(files):
+        if sample.bytes >= budget:
+            break
+        length = min(chunk_size, size, budget - sample.bytes)
+        offset = rng.randrange(size - length + 1)
+        try:
+            with open(path, "rb") as source:
+                source.seek(offset)
+                data = source.read(length)
+        except OSError:
+            continue
+        if not data:
+            continue
+        with open(os.path.join(directory, f"{index:05d}.bin"), "wb") as target:
+            target.write(data)
+        sample.files += 1
+        sample.bytes += len(data)
+    return sample
+
+
+def collect_sample(
+    paths: List[str],
+    directory: str,
+    budget: int,
+    seed: Optional[int] = None,
+    chunk_size: int = SAMPLE_CHUNK_BYTES,
+) -> SourceSample:
+    rng = random.Random(seed)
+    # Small files yield less than a chunk, so pick more files than needed.
+    max_files = max(1, budget // chunk_size) * 4
+    files = pick_sample_files(paths, max_files, rng)
+    return write_sample(files, directory, budget, rng, chunk_size)
+
+
+def recommend_compression(
+    results: List[CandidateResult], target_ratio: Optional[float] = None
+) -> Optional[CandidateResult]:
+    """The fastest measured candidate within ``target_ratio``.
+
+    Falls back to the best ratio when no candidate reaches the target.
+    """
+    measured = [result for result in results if result.ratio is not None]
+    if not measured:
+        return None
+    if target_ratio is None:
+        target_ratio = min(result.ratio for result in measured) * (
+            1 + DEFAULT_RATIO_TOLERANCE
+        )
+    within = [result for result in measured if result.ratio <= target_ratio]
+    if not within:
+        return min(measured, key=lambda result: (result.ratio, result.seconds))
+    return min(within, key=lambda result: (result.seconds, result.ratio))
+
+
+def _tree_size(path: str) -> int:
+    total = 0
+    for directory, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(directory, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _error_tail(stderr: bytes) -> str:
+    lines = []
+    for line in stderr.decode("utf-8", errors="replace").splitlines():
+        message = parse_log_json(line.strip())
+        if message is None:
+            lines.append(line.strip())
+        elif message.get("type") == "log_message" and message.get("message"):
+            lines.append(str(message["message"]))
+    lines = [line for line in lines if line]
+    return lines[-1][:500] if lines else ""
+
+
+def scratch_borg_env(workdir: str) -> dict:
+    """Environment for scratch repositories, isolated from the real ones."""
+    env = {
+        key: value for key, value in os.environ.items() if not key.startswith("BORG_")
+    }
+    env.update(
+        {
+            "BORG_BASE_DIR": os.path.join(workdir, "borg-home"),
+            "BORG_UNKNOWN_UNENCRYPTED_REPO_ACCESS_IS_OK": "yes",
+            "BORG_RELOCATED_REPO_ACCESS_IS_OK": "yes",
+        }
+    )
+    return env
+
+
+async def _run(
+    cmd: List[str], env: dict, cwd: str, timeout: int
+) -> Tuple[Optional[int], str]:
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        env=env,
+    )
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return None, f"Timed out after {timeout}s"
+    return process.returncode, _error_tail(stderr)
+
+
+async def benchmark_candidate(
+    router: BorgRouter,
+    compression: str,
+    sample_dir: str,
+    sample_bytes: int,
+    repository_path: str,
+    env: dict,
+    timeout: int,
+) -> CandidateResult:
+    """Back the sample up into a fresh scratch repository with ``compression``."""
+    result = CandidateResult(compression=compression, sample_bytes=sample_bytes)
+    try:
+        returncode, error = await _run(
+            router.build_unencrypted_init_command(repository_path),
+            env,
+            sample_dir,
+            timeout,
+        )
+        if returncode != 0:
+            result.error = error or f"init exited with {returncode}"
+            return result
+        data_dir = os.path.join(repository_path, "data")
+        baseline = _tree_size(data_dir)
+        cmd = router.build_backup_create_command(
+            repository_path=repository_path,
+            archive_name=SAMPLE_ARCHIVE_NAME,
+            compression=compression,
+            exclude_patterns=[],
+            custom_flags=[],
+        )
+        started = time.monotonic()
+        returncode, error = await _run([*cmd, "."], env, sample_dir, timeout)
+        result.seconds = time.monotonic() - started
+        if returncode not in (0, 1):
+            result.error = error or f"create exited with {returncode}"
+            return result
+        result.stored_bytes = max(0, _tree_size(data_dir) - baseline)
+        return result
+    except OSError as exc:
+        result.error = str(exc)
+        return result
+    finally:
+        shutil.rmtree(repository_path, ignore_errors=True)
+
+
+def observed_backup_speeds(
+    db: Session, repository_id: int, limit: int = OBSERVED_BACKUP_LIMIT
+) -> List[dict]:
+    """Throughput and compression ratio of the latest finished backups."""
+    jobs = (
+        db.query(BackupJob)
+        .filter(
+            BackupJob.repository_id == repository_id,
+            BackupJob.status.in_(("completed", "completed_with_warnings")),
+            BackupJob.started_at.isnot(None),
+            BackupJob.completed_at.isnot(None),
+        )
+        .order_by(BackupJob.completed_at.desc())
+        .limit(limit)
+        .all()
+    )
+    observed = []
+    for job in jobs:
+        seconds = (job.completed_at - job.started_at).total_seconds()
+        original = job.original_size or 0
+        observed.append(
+            {
+                "job_id": job.id,
+                "completed_at": serialize_datetime(job.completed_at),
+                "seconds": round(seconds, 1),
+                "original_size": original,
+                "mb_per_second": (
+                    round(original / MB / seconds, 1) if seconds > 0 else None
+                ),
+                "ratio": (
+                    round((job.compressed_size or 0) / original, 4)
+                    if original
+                    else None
+                ),
+            }
+        )
+    return observed
+
+
+def local_source_paths(repository: Repository) -> List[str]:
+    return [
+        path
+        for location in source_locations_for_repository(repository)
+        if location["source_type"] == "local"
+        for path in location["paths"]
+    ]
+
+
+class CompressionTuningService:
+    def __init__(self):
+        self._running: set = set()
+
+    def start(
+        self,
+        db: Session,
+        repository: Repository,
+        *,
+        apply: bool,
+        target_ratio: Optional[float],
+    ) -> dict:
+        """Record a pending run; the caller schedules ``run``."""
+        if is_agent_executor(repository):
+            raise CompressionTuningError(
+                "backend.errors.repo.compressionTuningAgentUnsupported"
+            )
+        if not local_source_paths(repository):
+            raise CompressionTuningError(
+                "backend.errors.repo.compressionTuningNoLocalSources"
+            )
+        if repository.id in self._running:
+            raise CompressionTuningError(
+                "backend.errors.repo.compressionTuningAlreadyRunning",
+                status_code=409,
+            )
+        state = {
+            "status": "running",
+            "started_at": serialize_datetime(datetime.utcnow()),
+            "apply": apply,
+            "target_ratio": target_ratio,
+        }
+        repository.compression_tuning = state
+        db.commit()
+        self._running.add(repository.id)
+        return state
+
+    def serialize(self, db: Session, repository: Repository) -> dict:
+        tuning = dict(repository.compression_tuning or {}) or None
+        if (
+            tuning
+            and tuning.get("status") == "running"
+            and repository.id not in self._running
+        ):
+            # The server restarted while tuning ran.
+            tuning["status"] = "interrupted"
+        return {
+            "compression": repository.compression,
+            "tuning": tuning,
+            "observed_backups": observed_backup_speeds(db, repository.id),
+        }
+
+    async def run(
+        self,
+        repository_id: int,
+        *,
+        apply: bool = False,
+        target_ratio: Optional[float] = None,
+    ) -> None:
+        db = SessionLocal()
+        workdir = None
+        repository = None
+        state = {}
+        try:
+            repository = (
+                db.query(Repository).filter(Repository.id == repository_id).first()
+            )
+            if not repository:
+                return
+            state = dict(repository.compression_tuning or {})
+            workdir = tempfile.mkdtemp(prefix="borg-ui-compression-")
+            sample_dir = os.path.join(workdir, "sample")
+            os.mkdir(sample_dir)
+            sample = await asyncio.to_thread(
+                collect_sample,
+                local_source_paths(repository),
+                sample_dir,
+                settings.compression_tuning_sample_mb * MB,
+            )
+            if sample.bytes == 0:
+                raise CompressionTuningError(
+                    "backend.errors.repo.compressionTuningEmptySample"
+                )
+
+            router = BorgRouter(repository)
+            env = scratch_borg_env(workdir)
+            results = []
+            for index, compression in enumerate(CANDIDATE_COMPRESSIONS):
+                results.append(
+                    await benchmark_candidate(
+                        router,
+                        compression,
+                        sample_dir,
+                        sample.bytes,
+                        os.path.join(workdir, f"repo-{index}"),
+                        env,
+                        settings.compression_tuning_timeout,
+                    )
+                )
+
+            recommended = recommend_compression(results, target_ratio)
+            previous = repository.compression
+            applied = bool(
+                apply and recommended and recommended.compression != previous
+            )
+            if applied:
+                repository.compression = recommended.compression
+            state.update(
+                {
+                    "status": "completed" if recommended else "failed",
+                    "completed_at": serialize_datetime(datetime.utcnow()),
+                    "sample_files": sample.files,
+                    "sample_bytes": sample.bytes,
+                    "candidates": [result.to_dict() for result in results],
+                    "recommended": recommended.compression if recommended else None,
+                    "applied": applied,
+                    "previous_compression": previous if applied else None,
+                    "error": None
+                    if recommended
+                    else "backend.errors.repo.compressionTuningNoCandidate",
+                }
+            )
+            repository.compression_tuning = state
+            db.commit()
+            logger.info(
+                "Compression tuning finished",
+                repository_id=repository_id,
+                sample_bytes=sample.bytes,
+                recommended=state["recommended"],
+                applied=applied,
+            )
+        except Exception as exc:
+            db.rollback()
+            logger.error(
+                "Compression tuning failed",
+                repository_id=repository_id,
+                error=str(exc),
+            )
+            if repository is not None:
+                state.update(
+                    {
+                        "status": "failed",
+                        "completed_at": serialize_datetime(datetime.utcnow()),
+                        "error": exc.detail_key
+                        if isinstance(exc, CompressionTuningError)
+                        else str(exc),
+                    }
+                )
+                repository.compression_tuning = state
+                db.commit()
+        finally:
+            self._running.discard(repository_id)
+            if workdir:
+                shutil.rmtree(workdir, ignore_errors=True)
+            db.close()
+
+
+compression_tuning_service = CompressionTuningService()
@@ -0,0 +1,446 @@
+"""
+Connection Storage Prober
+
+Periodically probes every SSH connection for free space (`df`), round-trip
+latency and, optionally, download throughput, so the Remote Machines page can
+be served from the database instead of waiting on live SSH calls, and growth
+can be read from history.
+
+Connections are probed concurrently, bounded globally and per host, each with
+its own database session and time budget. Every probe updates the latest
+values on ``SSHConnection`` and appends a sample to
+``ssh_connection_samples``. Samples are kept at full resolution for
+``connection_probe_raw_retention_hours`` and then folded into one row per
+connection and day, which is kept for ``connection_probe_daily_retention_days``.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import structlog
+from sqlalchemy.orm import Session
+
+from app.config import settings as app_settings
+from app.database.database import SessionLocal
+from app.database.models import SSHConnection, SSHConnectionSample, SSHKey
+
+logger = structlog.get_logger()
+
+RESOLUTION_RAW = "raw"
+RESOLUTION_DAY = "day"
+# Growth is fitted over this window of history
+GROWTH_WINDOW_DAYS = 30
+# First pass waits for startup to settle instead of opening SSH sessions to
+# every host while the application is still coming up
+STARTUP_DELAY_SECONDS = 60
+
+
+@dataclass
+class ConnectionProbeResult:
+    storage: Optional[dict] = None  # ``collect_storage_info`` result
+    latency_ms: Optional[float] = None  # Round trip of the df command
+    throughput_mbps: Optional[float] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.storage is not None
+
+
+def connection_host_key(connection: SSHConnection) -> str:
+    """Group connections that share a host for per-host limits."""
+    return (connection.host or "").strip().lower()
+
+
+def record_connection_sample(
+    db: Session,
+    connection: SSHConnection,
+    result: ConnectionProbeResult,
+    sampled_at: Optional[datetime] = None,
+) -> SSHConnectionSample:
+    """Store ``result`` as the connection's latest values and as a sample.
+
+    The caller commits.
+    """
+    sampled_at = sampled_at or datetime.utcnow()
+    storage = result.storage or {}
+    if result.succeeded:
+        connection.storage_total = storage["total"]
+        connection.storage_used = storage["used"]
+        connection.storage_available = storage["available"]
+        connection.storage_percent_used = storage["percent_used"]
+        connection.last_storage_check = sampled_at
+    sample = SSHConnectionSample(
+        connection_id=connection.id,
+        resolution=RESOLUTION_RAW,
+        sampled_at=sampled_at,
+        sample_count=1,
+        failures=0 if result.succeeded else 1,
+        storage_total=storage.get("total"),
+        storage_used=storage.get("used"),
+        storage_available=storage.get("available"),
+        latency_ms=result.latency_ms,
+        throughput_mbps=result.throughput_mbps,
+    )
+    db.add(sample)
+    return sample
+
+
+def _mean(values: List[float], weights: List[int]) -> Optional[float]:
+    total = sum(weights)
+    if not values or not total:
+        return None
+    return round(sum(v * w for v, w in zip(values, weights)) / total, 2)
+
+
+def downsample_connection_samples(db: Session, now: Optional[datetime] = None) -> int:
+    """Fold raw samples past their retention into daily rows; drop expired days.
+
+    A daily row keeps the last capacity reading of the day and the averages of
+    latency and throughput over the probes that measured them. Returns the
+    number of raw samples folded.
+    """
+    now = now or datetime.utcnow()
+    raw_cutoff = now - timedelta(
+        hours=max(1, app_settings.connection_probe_raw_retention_hours)
+    )
+    # Only whole days are folded so a day never ends up split across rows
+    raw_cutoff = raw_cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+    expired = (
+        db.query(SSHConnectionSample)
+        .filter(
+            SSHConnectionSample.resolution == RESOLUTION_RAW,
+            SSHConnectionSample.sampled_at < raw_cutoff,
+        )
+        .order_by(SSHConnectionSample.sampled_at)
+        .all()
+    )
+
+    groups: Dict[tuple, List[SSHConnectionSample]] = defaultdict(list)
+    for sample in expired:
+        day = sample.sampled_at.replace(hour=0, minute=0, second=0, microsecond=0)
+        groups[(sample.connection_id, day)].append(sample)
+
+    for (connection_id, day), samples in groups.items():
+        row = (
+            db.query(SSHConnectionSample)
+            .filter(
+                SSHConnectionSample.connection_id == connection_id,
+                SSHConnectionSample.resolution == RESOLUTION_DAY,
+                SSHConnectionSample.sampled_at == day,
+            )
+            .first()
+        )
+        if row is None:
+            row = SSHConnectionSample(
+                connection_id=connection_id,
+                resolution=RESOLUTION_DAY,
+                sampled_at=day,
+                sample_count=0,
+                failures=0,
+            )
+            db.add(row)
+        members = ([row] if row.sample_count else []) + samples
+        measured = [s for s in members if s.latency_ms is not None]
+        row.latency_ms = _mean(
+            [s.latency_ms for s in measured],
+            [s.sample_count - s.failures or 1 for s in measured],
+        )
+        probed = [s for s in members if s.throughput_mbps is not None]
+        row.throughput_mbps = _mean(
+            [s.throughput_mbps for s in probed], [1 for _ in probed]
+        )
+        for sample in reversed(samples):
+            if sample.storage_total is not None:
+                row.storage_total = sample.storage_total
+                row.storage_used = sample.storage_used
+                row.storage_available = sample.storage_available
+                break
+        row.sample_count += sum(s.sample_count for s in samples)
+        row.failures += sum(s.failures for s in samples)
+        for sample in samples:
+            db.delete(sample)
+
+    day_cutoff = now - timedelta(
+        days=max(1, app_settings.connection_probe_daily_retention_days)
+    )
+    db.query(SSHConnectionSample).filter(
+        SSHConnectionSample.resolution == RESOLUTION_DAY,
+        SSHConnectionSample.sampled_at < day_cutoff,
+    ).delete(synchronize_session=False)
+    return len(expired)
+
+
+def connection_history(
+    db: Session, connection_id: int, since: Optional[datetime] = None
+) -> List[SSHConnectionSample]:
+    """Samples of one connection, oldest first, daily rows before raw ones."""
+    query = db.query(SSHConnectionSample).filter(
+        SSHConnectionSample.connection_id == connection_id
+    )
+    if since is not None:
+        query = query.filter(SSHConnectionSample.sampled_at >= since)
+    return query.order_by(SSHConnectionSample.sampled_at).all()
+
+
+def latest_connection_measurements(
+    db: Session, connection_ids: Iterable[int]
+) -> Dict[int, SSHConnectionSample]:
+    """Most recent raw sample with a latency reading, by connection."""
+    connection_ids = list(connection_ids)
+    if not connection_ids:
+        return {}
+    since = datetime.utcnow() - timedelta(
+        hours=max(1, app_settings.connection_probe_raw_retention_hours)
+    )
+    latest = {}
+    rows = (
+        db.query(SSHConnectionSample)
+        .filter(
+            SSHConnectionSample.connection_id.in_(connection_ids),
+            SSHConnectionSample.resolution == RESOLUTION_RAW,
+            SSHConnectionSample.sampled_at >= since,
+            SSHConnectionSample.latency_ms.isnot(None),
+        )
+        .order_by(SSHConnectionSample.sampled_at)
+        .all()
+    )
+    for row in rows:
+        latest[row.connection_id] = row
+    return latest
+
+
+def storage_growth_per_day(
+    db: Session, connection_ids: Iterable[int], now: Optional[datetime] = None
+) -> Dict[int, float]:
+    """Change of used bytes per day over the growth window, by connection.
+
+    Compares the oldest and newest capacity reading in the window; connections
+    with less than a day of history are left out.
+    """
+    connection_ids = list(connection_ids)
+    if not connection_ids:
+        return {}
+    since = (now or datetime.utcnow()) - timedelta(days=GROWTH_WINDOW_DAYS)
+    rows = (
+        db.query(
+            SSHConnectionSample.connection_id,
+            SSHConnectionSample.sampled_at,
+            SSHConnectionSample.storage_used,
+        )
+        .filter(
+            SSHConnectionSample.connection_id.in_(connection_ids),
+            SSHConnectionSample.sampled_at >= since,
+            SSHConnectionSample.storage_used.isnot(None),
+        )
+        .order_by(SSHConnectionSample.sampled_at)
+        .all()
+    )
+    first: Dict[int, tuple] = {}
+    last: Dict[int, tuple] = {}
+    for connection_id, sampled_at, used in rows:
+        first.setdefault(connection_id, (sampled_at, used))
+        last[connection_id] = (sampled_at, used)
+    growth = {}
+    for connection_id, (started, used_before) in first.items():
+        ended, used_after = last[connection_id]
+        days = (ended - started).total_seconds() / 86400
+        if days >= 1:
+            growth[connection_id] = round((used_after - used_before) / days)
+    return growth
+
+
+async def probe_connection(
+    connection: SSHConnection, ssh_key: SSHKey
+) -> ConnectionProbeResult:
+    """Measure one connection: df with its round trip, then throughput."""
+    from app.api.ssh_keys import collect_storage_info, measure_ssh_throughput
+
+    result = ConnectionProbeResult()
+    started_at = time.monotonic()
+    result.storage = await collect_storage_info(connection, ssh_key)
+    if result.storage is None:
+        return result
+    result.latency_ms = round((time.monotonic() - started_at) * 1000, 1)
+
+    probe_bytes = app_settings.connection_probe_throughput_bytes
+    if probe_bytes > 0:
+        throughput = await measure_ssh_throughput(
+            connection,
+            ssh_key,
+            timeout_seconds=max(1, app_settings.connection_probe_timeout),
+            probe_size_bytes=probe_bytes,
+        )
+        if throughput.get("status") == "success":
+            result.throughput_mbps = throughput["mbps"]
+    return result
+
+
+@dataclass
+class ConnectionProbePass:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class ConnectionStorageProber:
+    """Scheduler for periodic storage probes of every SSH connection"""
+
+    def __init__(self):
+        self.running = False
+        self.last_pass = ConnectionProbePass()
+        self._pass_lock = asyncio.Lock()
+
+    async def probe_connections(
+        self, connection_ids: Optional[List[int]] = None
+    ) -> Optional[ConnectionProbePass]:
+        """Run one concurrent probe pass; None when one is already running."""
+        if self._pass_lock.locked():
+            logger.info("Connection probe already in progress, skipping")
+            return None
+        async with self._pass_lock:
+            try:
+                return await self._run_pass(connection_ids)
+            except Exception as e:
+                logger.error("Error in connection probe pass", error=str(e))
+                return self.last_pass
+
+    async def _run_pass(
+        self, connection_ids: Optional[List[int]]
+    ) -> ConnectionProbePass:
+        db = SessionLocal()
+        try:
+            query = db.query(SSHConnection)
+            if connection_ids is not None:
+                query = query.filter(SSHConnection.id.in_(connection_ids))
+            targets = [(conn.id, connection_host_key(conn)) for conn in query.all()]
+        finally:
+            db.close()
+
+        progress = ConnectionProbePass(total=len(targets), started_at=datetime.utcnow())
+        self.last_pass = progress
+
+        global_slots = asyncio.Semaphore(
+            max(1, app_settings.connection_probe_concurrency)
+        )
+        host_slots = defaultdict(
+            lambda: asyncio.Semaphore(
+                max(1, app_settings.connection_probe_per_host_concurrency)
+            )
+        )
+
+        async def probe_target(connection_id: int, host_key: str):
+            # Take the host slot first so a slow host cannot hold global slots
+            async with host_slots[host_key]:
+                async with global_slots:
+                    outcome = await self._probe_one(connection_id)
+            if outcome == "probed":
+                progress.succeeded += 1
+            else:
+                progress.failed += 1
+                if outcome == "timeout":
+                    progress.timed_out += 1
+
+        await asyncio.gather(
+            *(probe_target(connection_id, host) for connection_id, host in targets)
+        )
+
+        db = SessionLocal()
+        try:
+            downsample_connection_samples(db)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning("Failed to downsample connection samples", error=str(e))
+        finally:
+            db.close()
+
+        progress.finished_at = datetime.utcnow()
+        logger.info(
+            "Completed connection storage probe",
+            total=progress.total,
+            success=progress.succeeded,
+            errors=progress.failed,
+            timed_out=progress.timed_out,
+            duration_seconds=round(
+                (progress.finished_at - progress.started_at).total_seconds(), 1
+            ),
+        )
+        return progress
+
+    async def _probe_one(self, connection_id: int) -> str:
+        """Probe one connection in its own session.
+
+        Returns ``probed``, ``failed`` or ``timeout``.
+        """
+        db = SessionLocal()
+        try:
+            connection = (
+                db.query(SSHConnection)
+                .filter(SSHConnection.id == connection_id)
+                .first()
+            )
+            if not connection:
+                return "failed"
+            ssh_key = connection.ssh_key or (
+                db.query(SSHKey).filter(SSHKey.is_system_key == True).first()  # noqa: E712
+            )
+            if not ssh_key:
+                return "failed"
+            try:
+                result = await asyncio.wait_for(
+                    probe_connection(connection, ssh_key),
+                    timeout=max(1, app_settings.connection_probe_timeout),
+                )
+                outcome = "probed" if result.succeeded else "failed"
+            except asyncio.TimeoutError:
+                result = ConnectionProbeResult()
+                outcome = "timeout"
+                logger.warning(
+                    "Timed out probing SSH connection",
+                    connection_id=connection_id,
+                    timeout_seconds=app_settings.connection_probe_timeout,
+                )
+            record_connection_sample(db, connection, result)
+            db.commit()
+            return outcome
+        except Exception as e:
+            db.rollback()
+            logger.error(
+                "Error probing SSH connection",
+                connection_id=connection_id,
+                error=str(e),
+            )
+            return "failed"
+        finally:
+            db.close()
+
+    async def start(self):
+        """Start the prober loop; runs every ``connection_probe_interval_minutes``."""
+        interval = app_settings.connection_probe_interval_minutes
+        if interval <= 0:
+            logger.info("Connection storage prober disabled (interval=0)")
+            return
+        self.running = True
+        logger.info("Connection storage prober started", interval_minutes=interval)
+        await asyncio.sleep(STARTUP_DELAY_SECONDS)
+        while self.running:
+            try:
+                await self.probe_connections()
+            except Exception as e:
+                logger.error("Connection storage prober error", error=str(e))
+            await asyncio.sleep(interval * 60)
+        logger.info("Connection storage prober stopped")
+
+    def stop(self):
+        self.running = False
+
+
+# Global instance
+connection_storage_prober = ConnectionStorageProber()
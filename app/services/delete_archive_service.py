@@ -1,4 +1,6 @@
 import asyncio
+import re
+import time
 from datetime import datetime
 from pathlib import Path
 import structlog
@@ -7,11 +9,21 @@ from app.database.models import DeleteArchiveJob, Repository
 from app.database.database import SessionLocal
 from app.config import settings
 from app.core.borg import borg
+from app.services.archive_list_cache import archive_list_cache
+from app.services.repository_stats import apply_archives_removed
 from app.utils.db_retries import commit_with_retry
 from app.utils.borg_env import build_repository_borg_env, cleanup_temp_key_file
 
 logger = structlog.get_logger()
 
+# Line `borg delete --list` logs before it removes each archive of a bulk delete
+_DELETING_ARCHIVE_RE = re.compile(r"^Deleting archive: .*\((\d+)/(\d+)\)\s*$")
+# Minimum seconds between per-archive progress commits
+PROGRESS_COMMIT_INTERVAL = 2.0
+# How long to keep reading stderr after borg exits; the last lines carry
+# the deleted-archive list and the "Deleted data" stats row.
+LOG_DRAIN_TIMEOUT = 10.0
+
 
 def get_process_start_time(pid: int) -> int:
     """
@@ -43,6 +55,22 @@ class DeleteArchiveService:
         self, job_id: int, repository_id: int, archive_name: str, db: Session = None
     ):
         """Execute archive delete operation with progress tracking"""
+        await self._execute(job_id, repository_id, [archive_name], bulk=False)
+
+    async def execute_bulk_delete(
+        self, job_id: int, repository_id: int, archive_names: list[str]
+    ):
+        """Delete several archives with one ``borg delete`` invocation.
+
+        Borg takes the repository lock, rewrites the manifest and commits once
+        for the whole selection instead of once per archive.
+        """
+        await self._execute(job_id, repository_id, archive_names, bulk=True)
+
+    async def _execute(
+        self, job_id: int, repository_id: int, archive_names: list[str], bulk: bool
+    ):
+        archive_label = f"{len(archive_names)} archives" if bulk else archive_names[0]
 
         # Create a new database session for this background task
         db = SessionLocal()
@@ -105,15 +133,21 @@ class DeleteArchiveService:
 
             # Build command
             cmd = [borg.borg_cmd, "delete", "--stats", "--progress"]
+            if bulk:
+                cmd.append("--list")
             if repository.remote_path:
                 cmd.extend(["--remote-path", repository.remote_path])
-            cmd.append(f"{repository.path}::{archive_name}")
+            if bulk:
+                cmd.append(repository.path)
+                cmd.extend(archive_names)
+            else:
+                cmd.append(f"{repository.path}::{archive_names[0]}")
 
             logger.info(
                 "Starting borg delete",
                 job_id=job_id,
                 repository=repository.path,
-                archive=archive_name,
+                archive=archive_label,
                 command=" ".join(cmd),
             )
 
@@ -131,8 +165,8 @@ class DeleteArchiveService:
             def persist_pid_tracking():
                 job.process_pid = process.pid
                 job.process_start_time = process_start_time
-                job.progress = 50
-                job.progress_message = f"Deleting archive {archive_name}"
+                job.progress = 0 if bulk else 50
+                job.progress_message = f"Deleting archive {archive_label}"
 
             await commit_with_retry(
                 db,
@@ -158,6 +192,33 @@ class DeleteArchiveService:
 
             # In-memory log buffer
             log_buffer = []
+            # 1-based positions in archive_names that borg reported deleting
+            deleted_positions: set[int] = set()
+            last_progress_commit = 0.0
+
+            async def record_progress(position: int, total: int):
+                nonlocal last_progress_commit
+                deleted_positions.add(position)
+                now = time.monotonic()
+                if now - last_progress_commit < PROGRESS_COMMIT_INTERVAL:
+                    return
+                last_progress_commit = now
+                # The line is logged as borg starts on an archive
+                done = position - 1
+
+                def persist_progress():
+                    job.archives_deleted = done
+                    job.progress = int(done * 100 / max(total, 1))
+                    job.progress_message = f"Deleting archive {position} of {total}"
+
+                await commit_with_retry(
+                    db,
+                    prepare=persist_progress,
+                    logger=logger,
+                    action="delete_progress",
+                    job_id=job_id,
+                    repository_id=repository_id,
+                )
 
             async def check_cancellation():
                 """Periodic heartbeat to check for cancellation"""
@@ -192,6 +253,11 @@ class DeleteArchiveService:
                         line_str = line.decode("utf-8", errors="replace").strip()
                         if line_str:
                             log_buffer.append(line_str)
+                            match = bulk and _DELETING_ARCHIVE_RE.match(line_str)
+                            if match:
+                                await record_progress(
+                                    int(match.group(1)), int(match.group(2))
+                                )
 
                 except Exception as e:
                     logger.error("Error reading process output", error=str(e))
@@ -203,13 +269,26 @@ class DeleteArchiveService:
             # Wait for process to complete
             await process.wait()
 
-            # Cancel background tasks
             cancellation_task.cancel()
-            log_task.cancel()
+            try:
+                await asyncio.wait_for(log_task, timeout=LOG_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out reading delete output", job_id=job_id)
 
             # Clean up process tracking
             self.running_processes.pop(job_id, None)
 
+            if process.returncode == 0 or not bulk:
+                deleted_names = set(archive_names)
+            else:
+                # Borg skips archives it cannot find and warns; only cascade
+                # for the ones it reported deleting
+                deleted_names = {
+                    archive_names[position - 1]
+                    for position in deleted_positions
+                    if 0 < position <= len(archive_names)
+                }
+
             # Handle process completion
             if cancelled:
                 job.status = "cancelled"
@@ -218,13 +297,13 @@ class DeleteArchiveService:
             elif process.returncode == 0:
                 job.status = "completed"
                 job.progress = 100
-                job.progress_message = f"Archive {archive_name} deleted successfully"
+                job.progress_message = f"Archive {archive_label} deleted successfully"
                 logger.info("Delete job completed", job_id=job_id)
             elif process.returncode == 1 or (100 <= process.returncode <= 127):
                 # Warning (legacy exit code 1 or modern exit codes 100-127)
                 job.status = "completed_with_warnings"
                 job.progress = 100
-                job.progress_message = f"Archive {archive_name} deleted with warnings (exit code {process.returncode})"
+                job.progress_message = f"Archive {archive_label} deleted with warnings (exit code {process.returncode})"
                 job.error_message = f"Archive deletion completed with warnings (exit code {process.returncode})"
                 if log_buffer:
                     job.error_message += "\n\n" + "\n".join(
@@ -252,7 +331,9 @@ class DeleteArchiveService:
                     purge_jobs_for_pruned_archives,
                 )
 
-                purge_jobs_for_pruned_archives(db, repository_id, {archive_name})
+                job.archives_deleted = len(deleted_names)
+                purge_jobs_for_pruned_archives(db, repository_id, deleted_names)
+                apply_archives_removed(repository, len(deleted_names), log_buffer)
 
             # Save logs
             if log_buffer:
@@ -269,6 +350,7 @@ class DeleteArchiveService:
             final_error_message = job.error_message
             final_log_file_path = job.log_file_path
             final_has_logs = job.has_logs
+            final_archives_deleted = job.archives_deleted
 
             def persist_final_state():
                 job.status = final_status
@@ -277,6 +359,7 @@ class DeleteArchiveService:
                 job.error_message = final_error_message
                 job.log_file_path = final_log_file_path
                 job.has_logs = final_has_logs
+                job.archives_deleted = final_archives_deleted
                 job.completed_at = completed_at
 
             await commit_with_retry(
@@ -311,6 +394,7 @@ class DeleteArchiveService:
             except:
                 pass
         finally:
+            archive_list_cache.invalidate(repository_id)
             cleanup_temp_key_file(temp_key_file)
             db.close()
 
@@ -0,0 +1,446 @@
+"""Time series of repository growth and backup performance.
+
+The dashboard and /metrics used to derive everything from the current
+``Repository`` columns and the raw job rows, so there was no history of
+repository size or backup throughput, and job rows are deleted by the job
+history retention anyway. Every change is now also recorded as a point in
+``metric_points``:
+
+  repository_size_bytes, repository_original_bytes, repository_archives,
+  repository_dedup_savings_percent
+                          whenever a flush changes a repository's size or
+                          archive count columns, whichever code path did it
+                          (backups, refreshes, prune, compact, agents).
+  backup_duration_seconds, backup_throughput_bytes_per_second, backup_success
+                          when a backup job reaches a final status.
+
+Points are appended from a ``before_flush`` hook, so they commit or roll back
+with the change they describe and concurrent writers never contend on a row.
+An hourly pass then folds them into coarser rows (count, sum, min, max and
+last observation per bucket):
+
+  raw  -> hour  once the hour is over
+  hour -> day   after metric_history_hourly_retention_days
+  day  -> week  after metric_history_daily_retention_days
+  week rows are dropped after metric_history_weekly_retention_days
+
+A year of daily trend is therefore a few hundred rows per series, read with
+one indexed query.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import structlog
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import settings as app_settings
+from app.database.models import BackupJob, MetricPoint, Repository
+from app.services.repository_stats import dedup_ratio_percent, repository_size_bytes
+from app.utils.schedule_time import to_utc_naive
+
+logger = structlog.get_logger()
+
+RESOLUTION_RAW = "raw"
+RESOLUTION_HOUR = "hour"
+RESOLUTION_DAY = "day"
+RESOLUTION_WEEK = "week"
+RESOLUTIONS = (RESOLUTION_RAW, RESOLUTION_HOUR, RESOLUTION_DAY, RESOLUTION_WEEK)
+
+METRIC_REPOSITORY_SIZE = "repository_size_bytes"
+METRIC_REPOSITORY_ORIGINAL = "repository_original_bytes"
+METRIC_REPOSITORY_ARCHIVES = "repository_archives"
+METRIC_REPOSITORY_DEDUP_SAVINGS = "repository_dedup_savings_percent"
+METRIC_BACKUP_DURATION = "backup_duration_seconds"
+METRIC_BACKUP_THROUGHPUT = "backup_throughput_bytes_per_second"
+METRIC_BACKUP_SUCCESS = "backup_success"  # 1 or 0; the average is the success rate
+METRICS = (
+    METRIC_REPOSITORY_SIZE,
+    METRIC_REPOSITORY_ORIGINAL,
+    METRIC_REPOSITORY_ARCHIVES,
+    METRIC_REPOSITORY_DEDUP_SAVINGS,
+    METRIC_BACKUP_DURATION,
+    METRIC_BACKUP_THROUGHPUT,
+    METRIC_BACKUP_SUCCESS,
+)
+
+_REPOSITORY_FIELDS = (
+    "archive_count",
+    "original_size_bytes",
+    "unique_size_bytes",
+    "total_size",
+)
+_BACKUP_SUCCEEDED = ("completed", "completed_with_warnings")
+_BACKUP_FINISHED = _BACKUP_SUCCEEDED + ("failed",)
+
+# Source rows folded per transaction, as in job_history_retention
+CHUNK_SIZE = 1000
+
+
+def bucket_start(moment: datetime, resolution: str) -> datetime:
+    """Start of the ``resolution`` bucket containing ``moment`` (weeks start Monday)."""
+    if resolution == RESOLUTION_RAW:
+        return moment
+    hour = moment.replace(minute=0, second=0, microsecond=0)
+    if resolution == RESOLUTION_HOUR:
+        return hour
+    day = hour.replace(hour=0)
+    if resolution == RESOLUTION_DAY:
+        return day
+    return day - timedelta(days=day.weekday())
+
+
+def _point(repository_id: int, metric: str, at: datetime, value) -> MetricPoint:
+    value = float(value)
+    return MetricPoint(
+        repository_id=repository_id,
+        metric=metric,
+        resolution=RESOLUTION_RAW,
+        bucket_start=at,
+        count=1,
+        total=value,
+        minimum=value,
+        maximum=value,
+        last=value,
+    )
+
+
+def repository_points(repository: Repository, at: datetime) -> List[MetricPoint]:
+    """Points for the repository's current size and archive count."""
+    points = []
+    if repository.unique_size_bytes is not None or repository.total_size:
+        points.append(
+            _point(
+                repository.id,
+                METRIC_REPOSITORY_SIZE,
+                at,
+                repository_size_bytes(repository),
+            )
+        )
+    if repository.original_size_bytes is not None:
+        points.append(
+            _point(
+                repository.id,
+                METRIC_REPOSITORY_ORIGINAL,
+                at,
+                repository.original_size_bytes,
+            )
+        )
+    if repository.archive_count is not None:
+        points.append(
+            _point(
+                repository.id, METRIC_REPOSITORY_ARCHIVES, at, repository.archive_count
+            )
+        )
+    savings = dedup_ratio_percent(repository)
+    if savings is not None:
+        points.append(
+            _point(repository.id, METRIC_REPOSITORY_DEDUP_SAVINGS, at, savings)
+        )
+    return points
+
+
+def backup_job_points(job: BackupJob) -> List[MetricPoint]:
+    """Points for a backup job that has just reached a final status."""
+    # Agent reports arrive with aware timestamps, the scheduler stores naive UTC
+    started = to_utc_naive(job.started_at) if job.started_at else None
+    completed = to_utc_naive(job.completed_at) if job.completed_at else None
+    at = completed or datetime.utcnow()
+    succeeded = job.status in _BACKUP_SUCCEEDED
+    points = [
+        _point(job.repository_id, METRIC_BACKUP_SUCCESS, at, 1 if succeeded else 0)
+    ]
+    if started and completed:
+        duration = (completed - started).total_seconds()
+        if duration > 0:
+            points.append(
+                _point(job.repository_id, METRIC_BACKUP_DURATION, at, duration)
+            )
+            if succeeded and job.original_size:
+                points.append(
+                    _point(
+                        job.repository_id,
+                        METRIC_BACKUP_THROUGHPUT,
+                        at,
+                        job.original_size / duration,
+                    )
+                )
+    return points
+
+
+def _repository_stats_changed(repository: Repository) -> bool:
+    attrs = inspect(repository).attrs
+    return any(attrs[name].history.has_changes() for name in _REPOSITORY_FIELDS)
+
+
+def _backup_just_finished(session: Session, job: BackupJob) -> bool:
+    if job.repository_id is None or job.status not in _BACKUP_FINISHED:
+        return False
+    history = inspect(job).attrs.status.history
+    if not history.has_changes():
+        return False
+    previous = list(history.deleted)
+    if not previous and job.id is not None:
+        # A commit expires the row, so the stored status is not in the history
+        previous = [
+            session.query(BackupJob.status).filter(BackupJob.id == job.id).scalar()
+        ]
+    # completed -> completed_with_warnings is the same run finishing
+    return not any(status in _BACKUP_FINISHED for status in previous)
+
+
+@event.listens_for(Session, "before_flush")
+def _record_flushed_metrics(session: Session, flush_context, instances) -> None:
+    points = []
+    now = datetime.utcnow()
+    for instance in session.dirty:
+        if isinstance(instance, Repository) and _repository_stats_changed(instance):
+            points.extend(repository_points(instance, now))
+    for instance in (*session.new, *session.dirty):
+        if isinstance(instance, BackupJob) and _backup_just_finished(session, instance):
+            points.extend(backup_job_points(instance))
+    if points:
+        session.add_all(points)
+
+
+@dataclass
+class SeriesPoint:
+    bucket_start: datetime
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+    last: float
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, row) -> None:
+        self.count += row.count
+        self.total += row.total
+        self.minimum = min(self.minimum, row.minimum)
+        self.maximum = max(self.maximum, row.maximum)
+        self.last = row.last
+
+
+def metric_series(
+    db: Session,
+    metric: str,
+    resolution: str,
+    since: datetime,
+    repository_ids: Optional[Iterable[int]] = None,
+) -> Dict[int, List[SeriesPoint]]:
+    """Points of ``metric`` since ``since`` at ``resolution``, by repository.
+
+    Finer rows are aggregated into ``resolution`` buckets; periods only kept
+    at a coarser resolution keep their coarser buckets.
+    """
+    rank = RESOLUTIONS.index(resolution)
+    query = db.query(MetricPoint).filter(
+        MetricPoint.metric == metric,
+        MetricPoint.bucket_start >= bucket_start(since, RESOLUTION_WEEK),
+    )
+    if repository_ids is not None:
+        query = query.filter(MetricPoint.repository_id.in_(list(repository_ids)))
+    rows = query.order_by(MetricPoint.bucket_start, MetricPoint.id).all()
+
+    series: Dict[int, Dict[datetime, SeriesPoint]] = {}
+    for row in rows:
+        if RESOLUTIONS.index(row.resolution) <= rank:
+            effective = resolution
+        else:
+            effective = row.resolution
+        start = bucket_start(row.bucket_start, effective)
+        if start < bucket_start(since, effective):
+            continue
+        buckets = series.setdefault(row.repository_id, {})
+        point = buckets.get(start)
+        if point is None:
+            buckets[start] = SeriesPoint(
+                start, row.count, row.total, row.minimum, row.maximum, row.last
+            )
+        else:
+            point.merge(row)
+    return {
+        repository_id: sorted(buckets.values(), key=lambda p: p.bucket_start)
+        for repository_id, buckets in series.items()
+    }
+
+
+def series_growth_per_day(points: List[SeriesPoint]) -> Optional[float]:
+    """Change of the last observation per day; None below a day of history."""
+    if len(points) < 2:
+        return None
+    days = (points[-1].bucket_start - points[0].bucket_start).total_seconds() / 86400
+    if days < 1:
+        return None
+    return (points[-1].last - points[0].last) / days
+
+
+def series_average(points: List[SeriesPoint]) -> Optional[float]:
+    count = sum(point.count for point in points)
+    if not count:
+        return None
+    return sum(point.total for point in points) / count
+
+
+def combined_last_series(
+    series: Dict[int, List[SeriesPoint]],
+) -> List[tuple[datetime, float]]:
+    """Sum of every repository's latest observation at each bucket.
+
+    A repository without a point in a bucket contributes its previous value.
+    """
+    starts = sorted(
+        {point.bucket_start for points in series.values() for point in points}
+    )
+    latest: Dict[int, float] = {}
+    by_start = {
+        repository_id: {point.bucket_start: point.last for point in points}
+        for repository_id, points in series.items()
+    }
+    combined = []
+    for start in starts:
+        for repository_id, values in by_start.items():
+            if start in values:
+                latest[repository_id] = values[start]
+        combined.append((start, sum(latest.values())))
+    return combined
+
+
+def _fold(db: Session, source: str, target: str, cutoff: datetime) -> int:
+    """Fold ``source`` rows older than ``cutoff`` into ``target`` buckets."""
+    folded = 0
+    while True:
+        rows = (
+            db.query(MetricPoint)
+            .filter(
+                MetricPoint.resolution == source,
+                MetricPoint.bucket_start < cutoff,
+            )
+            .order_by(MetricPoint.bucket_start, MetricPoint.id)
+            .limit(CHUNK_SIZE)
+            .all()
+        )
+        if not rows:
+            return folded
+
+        starts = {bucket_start(row.bucket_start, target) for row in rows}
+        existing = {
+            (row.repository_id, row.metric, row.bucket_start): row
+            for row in db.query(MetricPoint).filter(
+                MetricPoint.resolution == target,
+                MetricPoint.bucket_start.in_(starts),
+            )
+        }
+        for row in rows:
+            key = (
+                row.repository_id,
+                row.metric,
+                bucket_start(row.bucket_start, target),
+            )
+            bucket = existing.get(key)
+            if bucket is None:
+                bucket = MetricPoint(
+                    repository_id=row.repository_id,
+                    metric=row.metric,
+                    resolution=target,
+                    bucket_start=key[2],
+                    count=row.count,
+                    total=row.total,
+                    minimum=row.minimum,
+                    maximum=row.maximum,
+                    last=row.last,
+                )
+                db.add(bucket)
+                existing[key] = bucket
+            else:
+                bucket.count += row.count
+                bucket.total += row.total
+                bucket.minimum = min(bucket.minimum, row.minimum)
+                bucket.maximum = max(bucket.maximum, row.maximum)
+                bucket.last = row.last
+        db.query(MetricPoint).filter(
+            MetricPoint.id.in_([row.id for row in rows])
+        ).delete(synchronize_session=False)
+        db.commit()
+        folded += len(rows)
+
+
+def roll_up_metric_points(db: Session, now: Optional[datetime] = None) -> Dict:
+    """Fold aged points into coarser rows and drop expired weekly rows."""
+    now = now or datetime.utcnow()
+    hourly_days = max(1, app_settings.metric_history_hourly_retention_days)
+    daily_days = max(hourly_days, app_settings.metric_history_daily_retention_days)
+    weekly_days = max(daily_days, app_settings.metric_history_weekly_retention_days)
+
+    results = {
+        "hour": _fold(
+            db, RESOLUTION_RAW, RESOLUTION_HOUR, bucket_start(now, RESOLUTION_HOUR)
+        ),
+        "day": _fold(
+            db,
+            RESOLUTION_HOUR,
+            RESOLUTION_DAY,
+            bucket_start(now - timedelta(days=hourly_days), RESOLUTION_DAY),
+        ),
+        "week": _fold(
+            db,
+            RESOLUTION_DAY,
+            RESOLUTION_WEEK,
+            bucket_start(now - timedelta(days=daily_days), RESOLUTION_WEEK),
+        ),
+    }
+    results["expired"] = (
+        db.query(MetricPoint)
+        .filter(
+            MetricPoint.resolution == RESOLUTION_WEEK,
+            MetricPoint.bucket_start < now - timedelta(days=weekly_days),
+        )
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    if any(results.values()):
+        logger.info("Rolled up metric history", **results)
+    return results
+
+
+def run_rollup_once() -> Dict:
+    """Session-owning wrapper for the scheduler."""
+    from app.database.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return roll_up_metric_points(db)
+    finally:
+        db.close()
+
+
+async def start_metric_history_rollup(
+    interval_seconds: float = 3600.0,
+    initial_delay_seconds: float = 300.0,
+) -> None:
+    """Background loop: fold metric points shortly after startup, then hourly."""
+    import asyncio
+
+    logger.info(
+        "Metric history rollup started",
+        interval_seconds=interval_seconds,
+        initial_delay_seconds=initial_delay_seconds,
+    )
+    delay = initial_delay_seconds
+    while True:
+        try:
+            await asyncio.sleep(delay)
+            await asyncio.to_thread(run_rollup_once)
+        except asyncio.CancelledError:
+            logger.info("Metric history rollup stopped")
+            raise
+        except Exception as exc:  # never let the loop die on a transient error
+            logger.warning("Metric history rollup tick failed", error=str(exc))
+        delay = interval_seconds
@@ -14,6 +14,7 @@ import shutil
 import uuid
 import platform
 import json
+import re
 from datetime import datetime, timezone
 from enum import Enum
 from dataclasses import dataclass, asdict
@@ -46,6 +47,19 @@ SSHFS_NO_SUCH_FILE_MARKERS = (
     "not found",
 )
 
+# Errors meaning sshfs, FUSE or ssh rejected one of the tuning options.
+SSHFS_REJECTED_OPTION_MARKERS = (
+    "unknown option",
+    "bad value",
+    "invalid argument",
+    "bad ssh2 cipher spec",
+    "no matching cipher",
+    "unsupported option",
+)
+
+# sshfs started to open several SFTP connections with this release.
+SSHFS_MAX_CONNS_VERSION = (3, 7)
+
 
 class MountUnavailableError(Exception):
     """Raised when archive mounting is unavailable in the runtime environment."""
@@ -88,6 +102,44 @@ def _sshfs_symlink_options(preserve_symlinks: bool) -> list[str]:
     return ["-o", "follow_symlinks"]
 
 
+def _sshfs_source_profile_options(
+    sshfs_version: Optional[Tuple[int, int]],
+) -> list[str]:
+    """Read-throughput tuning for mounts that only serve as backup sources.
+
+    Bigger reads and the kernel page cache cut SFTP round trips, a fast AEAD
+    cipher without compression keeps the CPU cost of the stream low, and
+    sshfs 3.7+ spreads reads over several SFTP connections.
+    """
+    options = [
+        "-o",
+        "kernel_cache",
+        "-o",
+        f"max_read={settings.sshfs_source_max_read_kib * 1024}",
+        "-o",
+        f"Compression={'yes' if settings.sshfs_source_compression else 'no'}",
+    ]
+    if settings.sshfs_source_ciphers:
+        options.extend(["-o", f"Ciphers={settings.sshfs_source_ciphers}"])
+    if (
+        settings.sshfs_source_max_conns > 1
+        and sshfs_version is not None
+        and sshfs_version >= SSHFS_MAX_CONNS_VERSION
+    ):
+        options.extend(["-o", f"max_conns={settings.sshfs_source_max_conns}"])
+    return options
+
+
+def _sshfs_rejected_option(error_message: str) -> bool:
+    normalized = (error_message or "").lower()
+    return any(marker in normalized for marker in SSHFS_REJECTED_OPTION_MARKERS)
+
+
+def _parse_sshfs_version(output: str) -> Optional[Tuple[int, int]]:
+    match = re.search(r"SSHFS version (\d+)\.(\d+)", output or "")
+    return (int(match[1]), int(match[2])) if match else None
+
+
 def _sshfs_missing_remote_path(error_message: str) -> bool:
     normalized = (error_message or "").lower()
     return any(marker in normalized for marker in SSHFS_NO_SUCH_FILE_MARKERS)
@@ -146,6 +198,7 @@ class MountService:
         self.mount_base_dir = Path(settings.data_dir) / "mounts"
         self.mount_base_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = Path(settings.data_dir) / "mount_state.json"
+        self._sshfs_version: Optional[Tuple[int, int]] = None
 
         # Load persisted mounts on init
         self._load_state()
@@ -560,6 +613,7 @@ class MountService:
         job_id: Optional[int] = None,
         temp_root: Optional[str] = None,
         preserve_symlinks: bool = False,
+        source_profile: bool = False,
     ) -> Tuple[str, List[Tuple[str, str]]]:
         """
         Mount multiple remote SSH directories from the same connection under a single shared temp root.
@@ -572,6 +626,8 @@ class MountService:
             temp_root: Optional existing temporary root to reuse across source connections
             preserve_symlinks: Mount for faithful symlink fidelity (backup sources
                 and restore destinations); browse/cloud-mirror keep follow_symlinks
+            source_profile: Tune the mounts for reading backup sources (see
+                ``_sshfs_source_profile_options``)
 
         Returns:
             Tuple of (temp_root, mount_info_list)
@@ -810,6 +866,7 @@ class MountService:
                         mount_point=mount_dir,
                         temp_key_file=temp_key_file,
                         preserve_symlinks=preserve_symlinks,
+                        source_profile=source_profile,
                     )
 
                     # Verify mount with READ-ONLY check (NEVER write to user data!)
@@ -1416,6 +1473,27 @@ class MountService:
         except Exception:
             return False
 
+    async def _get_sshfs_version(self) -> Optional[Tuple[int, int]]:
+        """Installed sshfs version as ``(major, minor)``, probed once."""
+        if self._sshfs_version is None:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    "sshfs",
+                    "-V",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
+                    stdin=asyncio.subprocess.DEVNULL,
+                )
+                output, _ = await asyncio.wait_for(process.communicate(), timeout=10)
+            except Exception as exc:
+                logger.info("Could not determine sshfs version", error=str(exc))
+                return None
+            # (0, 0) marks an unrecognised version so it is not probed again.
+            self._sshfs_version = _parse_sshfs_version(
+                output.decode(errors="replace") if output else ""
+            ) or (0, 0)
+        return self._sshfs_version
+
     async def _check_remote_is_file(
         self, connection: SSHConnection, remote_path: str, temp_key_file: str
     ) -> bool:
@@ -1616,12 +1694,15 @@ class MountService:
         mount_point: str,
         temp_key_file: str,
         preserve_symlinks: bool = False,
+        source_profile: bool = False,
     ):
         """Execute SSHFS mount command with SSH key authentication.
 
         ``preserve_symlinks`` selects faithful symlink handling for backup sources
         and restore destinations (see ``_sshfs_symlink_options``); browse and
         cloud-mirror keep the default ``follow_symlinks`` behavior.
+        ``source_profile`` adds the backup-source read tuning; when the host or
+        the local sshfs rejects those options the mount is retried without them.
         """
         sftp_server_path = None
         use_sudo = getattr(connection, "use_sudo", False)
@@ -1686,7 +1767,13 @@ class MountService:
         current_uid = os.getuid()
         current_gid = os.getgid()
 
-        def build_sshfs_command(path_to_mount: str) -> list[str]:
+        profile_options = []
+        if source_profile:
+            profile_options = _sshfs_source_profile_options(
+                await self._get_sshfs_version()
+            )
+
+        def build_sshfs_command(path_to_mount: str, tuned: bool) -> list[str]:
             # Build SSHFS command WITH IdentityFile (this is the fix!)
             cmd = [
                 "sshfs",
@@ -1716,6 +1803,7 @@ class MountService:
                 f"gid={current_gid}",
                 "-o",
                 "workaround=rename",
+                *(profile_options if tuned else []),
             ]
 
             # When use_sudo is enabled, tell SSHFS to run the remote sftp-server via sudo.
@@ -1743,8 +1831,11 @@ class MountService:
         if login_relative_path and login_relative_path != remote_path:
             mount_attempts.append(login_relative_path)
 
-        for attempt_index, path_to_mount in enumerate(mount_attempts):
-            cmd = build_sshfs_command(path_to_mount)
+        tuned = bool(profile_options)
+        attempt_index = 0
+        while attempt_index < len(mount_attempts):
+            path_to_mount = mount_attempts[attempt_index]
+            cmd = build_sshfs_command(path_to_mount, tuned)
 
             logger.info(
                 "Executing SSHFS mount",
@@ -1773,6 +1864,14 @@ class MountService:
                     error_msg = (
                         stderr.decode(errors="replace") if stderr else "Unknown error"
                     )
+                    if tuned and _sshfs_rejected_option(error_msg):
+                        logger.warning(
+                            "SSHFS rejected source tuning options, retrying without them",
+                            remote_path=path_to_mount,
+                            error=error_msg.strip(),
+                        )
+                        tuned = False
+                        continue
                     if (
                         attempt_index == 0
                         and login_relative_path
@@ -1784,6 +1883,7 @@ class MountService:
                             retry_remote_path=login_relative_path,
                             error=error_msg.strip(),
                         )
+                        attempt_index += 1
                         continue
                     raise Exception(f"SSHFS mount failed: {error_msg}")
                 return
@@ -5,19 +5,26 @@ Home Assistant sensor state is always published from database state so that:
 - state can be fully reconstructed from DB records
 - reconnect/startup/periodic sync all use one code path
 - change-triggered syncs stay simple
+
+Publishing is incremental: the service remembers the last payload queued per
+topic and skips unchanged ones, change-triggered syncs are coalesced into one
+debounced pass and live progress topics are rate-limited.
 """
 
 import datetime
 import json
-from typing import Any, Dict, List, Optional, Set
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import structlog
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.config import get_runtime_app_version
+from app.config import get_runtime_app_version, settings
 from app.database.database import SessionLocal
 from app.database.models import BackupJob, MQTTSyncState, Repository
+from app.services.repository_stats import parse_size_string, repository_size_bytes
 from app.utils.datetime_utils import serialize_datetime
 
 import paho.mqtt.client as mqtt
@@ -183,6 +190,71 @@ class MQTTSyncStateStore:
             db.commit()
 
 
+class PublishedPayloadCache:
+    """
+    Last payload queued per topic, so syncs only send what changed.
+
+    Entries hold a signature of the payload (its JSON without volatile keys),
+    the payload's status/job identity and when it was queued. Throttled topics
+    skip changes within their interval unless that identity changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[str, Tuple[Any, Any], float]] = {}
+
+    @staticmethod
+    def signature(payload: Dict[str, Any], volatile_keys: Sequence[str] = ()) -> str:
+        if volatile_keys:
+            payload = {
+                key: value for key, value in payload.items() if key not in volatile_keys
+            }
+        return json.dumps(payload, sort_keys=True)
+
+    @staticmethod
+    def identity(payload: Dict[str, Any]) -> Tuple[Any, Any]:
+        return payload.get("status"), payload.get("job_id")
+
+    def should_publish(
+        self,
+        topic: str,
+        signature: str,
+        identity: Tuple[Any, Any],
+        min_interval: float = 0.0,
+        now: Optional[float] = None,
+    ) -> bool:
+        with self._lock:
+            entry = self._entries.get(topic)
+        if entry is None:
+            return True
+        last_signature, last_identity, queued_at = entry
+        if last_signature == signature:
+            return False
+        if min_interval > 0 and last_identity == identity:
+            now = time.monotonic() if now is None else now
+            return now - queued_at >= min_interval
+        return True
+
+    def remember(
+        self,
+        topic: str,
+        signature: str,
+        identity: Tuple[Any, Any],
+        now: Optional[float] = None,
+    ) -> None:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._entries[topic] = (signature, identity, now)
+
+    def forget(self, topic: str) -> None:
+        with self._lock:
+            self._entries.pop(topic, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class BackupJobQueryService:
     """Read-model queries for per-repository backup jobs."""
 
@@ -630,7 +702,12 @@ class ServerStatePublisher:
         success = True
         if not self._mqtt_service.publish("backup/status", status_payload, qos=1):
             success = False
-        if not self._mqtt_service.publish("backup/progress", progress_payload, qos=1):
+        if not self._mqtt_service.publish(
+            "backup/progress",
+            progress_payload,
+            qos=1,
+            min_interval=settings.mqtt_progress_min_interval_seconds,
+        ):
             success = False
         if not self._mqtt_service.publish("backup/last", last_payload, qos=1):
             success = False
@@ -655,7 +732,7 @@ class RepositoryStatePublisher:
         """Publish all per-repository state topics from repository table."""
         try:
             success = True
-            size_bytes = self.parse_size_to_bytes(repository.total_size or "0")
+            size_bytes = repository_size_bytes(repository)
             if not self._mqtt_service.publish_repository_size(
                 repository.id,
                 size_bytes,
@@ -785,31 +862,7 @@ class RepositoryStatePublisher:
     @staticmethod
     def parse_size_to_bytes(size_str: str) -> int:
         """Parse human-readable size string to bytes."""
-        if not size_str:
-            return 0
-
-        normalized = size_str.strip().upper().replace(" ", "")
-        multipliers = [
-            ("PB", 1024**5),
-            ("TB", 1024**4),
-            ("GB", 1024**3),
-            ("MB", 1024**2),
-            ("KB", 1024),
-            ("B", 1),
-        ]
-
-        for unit, multiplier in multipliers:
-            if normalized.endswith(unit):
-                try:
-                    number = float(normalized[: -len(unit)])
-                    return int(number * multiplier)
-                except ValueError:
-                    return 0
-
-        try:
-            return int(float(normalized))
-        except ValueError:
-            return 0
+        return parse_size_string(size_str)
 
     @staticmethod
     def get_repository_status(
@@ -889,6 +942,10 @@ class MQTTService:
         self._discovery_publisher = HomeAssistantDiscoveryPublisher(self)
         self._server_state_publisher = ServerStatePublisher(self)
         self._repository_state_publisher = RepositoryStatePublisher(self)
+        self._published = PublishedPayloadCache()
+        self._sync_lock = threading.Lock()
+        self._sync_timer: Optional[threading.Timer] = None
+        self._pending_sync_reasons: Set[str] = set()
 
     # ------------------------------------------------------------------
     # Configuration
@@ -899,6 +956,7 @@ class MQTTService:
         self.config.update(config)
         self.config["enabled"] = bool(config.get("enabled", False))
         self._validate_config()
+        self._published.clear()
 
         # Always tear down existing client before re-initializing.
         if self.client:
@@ -995,7 +1053,9 @@ class MQTTService:
         if rc == 0:
             logger.info("Connected to MQTT broker successfully")
             self.connected = True
-            # Re-publish a full DB-derived snapshot on every connect/reconnect.
+            # Re-publish a full DB-derived snapshot on every connect/reconnect;
+            # the broker may have lost retained state while we were away.
+            self._published.clear()
             self.sync_state(reason="mqtt_connect")
         else:
             logger.error(
@@ -1037,8 +1097,16 @@ class MQTTService:
         payload: Dict[str, Any],
         qos: Optional[int] = None,
         use_base_topic: bool = True,
+        volatile_keys: Sequence[str] = (),
+        min_interval: float = 0.0,
     ):
-        """Publish a message to MQTT broker."""
+        """
+        Publish a message to MQTT broker.
+
+        Payloads equal to the last one queued for the topic (ignoring
+        ``volatile_keys``) are skipped. With ``min_interval`` changes are sent
+        at most that often unless the payload's status or job changes.
+        """
         if not self.is_configured():
             logger.debug("MQTT not configured, skipping publish")
             return False
@@ -1055,6 +1123,13 @@ class MQTTService:
 
             payload_json = json.dumps(payload)
             final_qos = qos if qos is not None else self.config["qos"]
+            signature = PublishedPayloadCache.signature(payload, volatile_keys)
+            identity = PublishedPayloadCache.identity(payload)
+            if not self._published.should_publish(
+                full_topic, signature, identity, min_interval
+            ):
+                logger.debug("MQTT payload unchanged or throttled", topic=full_topic)
+                return True
 
             result = self.client.publish(
                 full_topic,
@@ -1064,6 +1139,7 @@ class MQTTService:
             )
 
             if result.rc == mqtt.MQTT_ERR_SUCCESS:
+                self._published.remember(full_topic, signature, identity)
                 logger.debug(
                     "MQTT message queued",
                     topic=full_topic,
@@ -1116,6 +1192,7 @@ class MQTTService:
                 retain=True,
             )
             if result.rc == mqtt.MQTT_ERR_SUCCESS:
+                self._published.forget(full_topic)
                 logger.debug("MQTT raw message queued", topic=full_topic, qos=final_qos)
                 return True
 
@@ -1216,7 +1293,12 @@ class MQTTService:
             payload["repository"] = repository
         if archive:
             payload["archive"] = archive
-        return self.publish(f"repositories/{repository_id}/status", payload, qos=1)
+        return self.publish(
+            f"repositories/{repository_id}/status",
+            payload,
+            qos=1,
+            volatile_keys=("timestamp",),
+        )
 
     def publish_repository_size(self, repository_id: int, total: int):
         if not self.config["enabled"]:
@@ -1321,6 +1403,7 @@ class MQTTService:
             f"repositories/{repository_id}/backup/progress",
             payload,
             qos=1,
+            min_interval=settings.mqtt_progress_min_interval_seconds,
         )
 
     # ------------------------------------------------------------------
@@ -1339,6 +1422,39 @@ class MQTTService:
         finally:
             db.close()
 
+    def request_sync(self, reason: str = "manual") -> bool:
+        """
+        Schedule a DB state sync shortly, coalescing bursts of requests.
+
+        Requests arriving while a sync is pending share that one pass, which
+        runs on a timer thread with its own session.
+        """
+        if not self.config["enabled"]:
+            logger.debug("MQTT not enabled, skipping DB state sync", reason=reason)
+            return False
+
+        delay = settings.mqtt_sync_debounce_seconds
+        if delay <= 0:
+            return self.sync_state(reason=reason)
+
+        with self._sync_lock:
+            self._pending_sync_reasons.add(reason)
+            if self._sync_timer is not None:
+                return True
+            timer = threading.Timer(delay, self._run_requested_sync)
+            timer.daemon = True
+            self._sync_timer = timer
+        timer.start()
+        return True
+
+    def _run_requested_sync(self) -> None:
+        with self._sync_lock:
+            reasons = sorted(self._pending_sync_reasons)
+            self._pending_sync_reasons = set()
+            self._sync_timer = None
+        if reasons:
+            self.sync_state(reason=", ".join(reasons))
+
     def sync_state_with_db(self, db: Session, reason: str = "manual") -> bool:
         """Publish server and repository Home Assistant state from DB."""
         if not self.config["enabled"]:
@@ -1545,6 +1661,12 @@ class MQTTService:
     # ------------------------------------------------------------------
 
     def disconnect(self):
+        with self._sync_lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            self._pending_sync_reasons = set()
+        self._published.clear()
         if self.client:
             try:
                 self.client.loop_stop()
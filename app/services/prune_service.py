@@ -7,8 +7,11 @@ from app.database.models import PruneJob, Repository
 from app.database.database import SessionLocal
 from app.config import settings
 from app.core.borg import borg
+from app.services.archive_list_cache import archive_list_cache
+from app.services.repository_stats import apply_archives_removed
 from app.utils.db_retries import commit_with_retry
 from app.utils.borg_env import build_repository_borg_env, cleanup_temp_key_file
+from app.utils.process_priority import resolve_process_priority
 
 logger = structlog.get_logger()
 
@@ -173,12 +176,15 @@ class PruneService:
             )
 
             # Execute command
+            priority = resolve_process_priority("prune", repository)
+            job.process_priority = priority.to_dict()
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 env=env,
             )
+            priority.apply(process.pid)
 
             # Track this process so it can be cancelled
             self.running_processes[job_id] = process
@@ -297,11 +303,11 @@ class PruneService:
                     purge_jobs_for_pruned_archives,
                 )
 
-                purge_jobs_for_pruned_archives(
-                    db,
-                    repository_id,
-                    archive_names_from_prune_output("\n".join(log_buffer)),
-                )
+                pruned_names = archive_names_from_prune_output("\n".join(log_buffer))
+                purge_jobs_for_pruned_archives(db, repository_id, pruned_names)
+                # Keep the repository size columns current without a full
+                # `borg info`: count from --list, sizes from --stats.
+                apply_archives_removed(repository, len(pruned_names), log_buffer)
 
             # Save logs for all completed/failed/cancelled/warning jobs
             if job.status in [
@@ -402,6 +408,9 @@ class PruneService:
             if job_id in self.running_processes:
                 del self.running_processes[job_id]
 
+            if not dry_run:
+                archive_list_cache.invalidate(repository_id)
+
             # Clean up temporary SSH key file
             cleanup_temp_key_file(temp_key_file)
 
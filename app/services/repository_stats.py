@@ -0,0 +1,306 @@
+"""Integer repository size bookkeeping.
+
+Repository sizes used to live only in ``Repository.total_size`` as a formatted
+string that every reader re-parsed. The byte columns are now the source of
+truth: a full ``borg info --json`` seeds them, and our own write operations
+(backup, prune, archive delete, compact) adjust them incrementally so most
+repositories never need the periodic full ``info`` refresh. ``total_size`` is
+still written alongside for API compatibility.
+
+Size semantics follow what Borg reports:
+
+- ``original_size_bytes``   -- sum of all archives' original sizes
+- ``compressed_size_bytes`` -- sum of all archives' compressed sizes
+- ``unique_size_bytes``     -- deduplicated, compressed size (``unique_csize``);
+  for Borg 2 repositories, which expose no client-side size, the on-disk size
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from app.database.models import Repository
+
+# A repository whose sizes are maintained incrementally still gets an exact
+# resync from `borg info` this often, bounding any drift from rounded deltas.
+FULL_SIZE_REFRESH_MAX_AGE = timedelta(days=7)
+
+_BINARY_UNITS = [
+    ("PB", 1024**5),
+    ("TB", 1024**4),
+    ("GB", 1024**3),
+    ("MB", 1024**2),
+    ("KB", 1024),
+    ("B", 1),
+]
+
+# Borg formats sizes with decimal prefixes (kB, MB, GB, ...).
+_DECIMAL_UNITS = {
+    "B": 1,
+    "KB": 1000,
+    "MB": 1000**2,
+    "GB": 1000**3,
+    "TB": 1000**4,
+    "PB": 1000**5,
+    "EB": 1000**6,
+}
+
+_BORG_SIZE = r"(-?[\d.]+\s*[kKMGTPE]?B)"
+_BORG_STATS_ROW = re.compile(
+    r"(Deleted data|All archives|This archive):\s+"
+    + _BORG_SIZE
+    + r"\s+"
+    + _BORG_SIZE
+    + r"\s+"
+    + _BORG_SIZE
+)
+_COMPACT_FREED = re.compile(r"freed\s+(?:about\s+)?" + _BORG_SIZE)
+
+
+def format_size(bytes_value: int) -> str:
+    """Format bytes the way ``Repository.total_size`` has always been stored."""
+    value = float(bytes_value)
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if value < 1024.0:
+            return f"{value:.2f} {unit}"
+        value /= 1024.0
+    return f"{value:.2f} PB"
+
+
+def parse_size_string(size_str: Optional[str]) -> int:
+    """Parse a legacy ``total_size`` string (binary units) into bytes."""
+    if not size_str:
+        return 0
+
+    normalized = size_str.strip().upper().replace(" ", "")
+    for unit, multiplier in _BINARY_UNITS:
+        if normalized.endswith(unit):
+            try:
+                return int(float(normalized[: -len(unit)]) * multiplier)
+            except ValueError:
+                return 0
+
+    try:
+        return int(float(normalized))
+    except ValueError:
+        return 0
+
+
+def parse_borg_size(size_str: str) -> int:
+    """Parse a Borg-formatted size such as ``-1.29 kB`` into (signed) bytes."""
+    normalized = size_str.strip().upper().replace(" ", "")
+    for unit in sorted(_DECIMAL_UNITS, key=len, reverse=True):
+        if normalized.endswith(unit):
+            try:
+                return int(float(normalized[: -len(unit)]) * _DECIMAL_UNITS[unit])
+            except ValueError:
+                return 0
+    return 0
+
+
+def repository_size_bytes(repository: Repository) -> int:
+    """Deduplicated repository size in bytes.
+
+    Falls back to the legacy string for rows that have never been refreshed
+    since the byte columns were introduced.
+    """
+    if repository.unique_size_bytes is not None:
+        return int(repository.unique_size_bytes)
+    return parse_size_string(repository.total_size)
+
+
+def dedup_ratio_percent(repository: Repository) -> Optional[int]:
+    """Space saved by deduplication and compression, as a whole percentage."""
+    original = repository.original_size_bytes or 0
+    unique = repository.unique_size_bytes
+    if original <= 0 or unique is None:
+        return None
+    return max(0, int((1 - (unique / original)) * 100))
+
+
+def _message_texts(lines: Iterable[str]) -> Iterable[str]:
+    """Yield human-readable text from raw or ``--log-json`` borg output lines."""
+    for line in lines:
+        if not line:
+            continue
+        # Prune/compact logs may be prefixed with the stream name.
+        text = re.sub(r"^\[(stdout|stderr)\]\s*", "", line)
+        if text.startswith("{"):
+            try:
+                payload = json.loads(text)
+            except json.JSONDecodeError:
+                yield text
+                continue
+            if isinstance(payload, dict) and payload.get("message"):
+                yield from str(payload["message"]).splitlines()
+            continue
+        yield text
+
+
+def parse_stats_rows(lines: Iterable[str]) -> dict[str, tuple[int, int, int]]:
+    """Extract Borg ``--stats`` table rows keyed by label.
+
+    Returns e.g. ``{"Deleted data": (original, compressed, deduplicated)}``
+    with sizes in bytes (deleted sizes are negative, as Borg prints them).
+    """
+    rows: dict[str, tuple[int, int, int]] = {}
+    for text in _message_texts(lines):
+        match = _BORG_STATS_ROW.search(text)
+        if match:
+            label, original, compressed, deduplicated = match.groups()
+            rows[label] = (
+                parse_borg_size(original),
+                parse_borg_size(compressed),
+                parse_borg_size(deduplicated),
+            )
+    return rows
+
+
+def parse_compact_freed_bytes(lines: Iterable[str]) -> Optional[int]:
+    """Bytes freed according to ``borg compact --verbose``, if reported."""
+    freed = None
+    for text in _message_texts(lines):
+        match = _COMPACT_FREED.search(text)
+        if match:
+            freed = abs(parse_borg_size(match.group(1)))
+    return freed
+
+
+def _set_sizes(
+    repository: Repository,
+    *,
+    original: Optional[int] = None,
+    compressed: Optional[int] = None,
+    unique: Optional[int] = None,
+) -> None:
+    if original is not None:
+        repository.original_size_bytes = max(0, int(original))
+    if compressed is not None:
+        repository.compressed_size_bytes = max(0, int(compressed))
+    if unique is not None:
+        repository.unique_size_bytes = max(0, int(unique))
+        repository.total_size = format_size(repository.unique_size_bytes)
+
+
+def apply_repository_info(
+    repository: Repository, info_data: dict, *, now: Optional[datetime] = None
+) -> bool:
+    """Seed the byte columns from Borg 1 ``borg info --json`` output.
+
+    Returns False when the output carries no usable cache stats.
+    """
+    stats = (info_data.get("cache") or {}).get("stats") or {}
+    unique = stats.get("unique_csize") or stats.get("unique_size")
+    if not isinstance(unique, (int, float)) or unique <= 0:
+        return False
+
+    _set_sizes(
+        repository,
+        original=stats.get("total_size"),
+        compressed=stats.get("total_csize"),
+        unique=unique,
+    )
+    repository.size_stats_refreshed_at = now or datetime.utcnow()
+    return True
+
+
+def apply_measured_size(
+    repository: Repository, size_bytes: int, *, now: Optional[datetime] = None
+) -> None:
+    """Record a directly measured on-disk size (Borg 2 / du based)."""
+    _set_sizes(repository, unique=size_bytes)
+    repository.size_stats_refreshed_at = now or datetime.utcnow()
+
+
+def apply_archive_created(repository: Repository, archive_stats: dict) -> bool:
+    """Add a freshly created archive's ``archive.stats`` to the totals.
+
+    Only applied once the repository has a baseline from a full refresh;
+    otherwise the running totals would start from zero.
+    """
+    if repository.unique_size_bytes is None:
+        return False
+
+    repository.archive_count = (repository.archive_count or 0) + 1
+    _set_sizes(
+        repository,
+        original=(repository.original_size_bytes or 0)
+        + (archive_stats.get("original_size") or 0),
+        compressed=(repository.compressed_size_bytes or 0)
+        + (archive_stats.get("compressed_size") or 0),
+        unique=repository.unique_size_bytes
+        + (archive_stats.get("deduplicated_size") or 0),
+    )
+    return True
+
+
+def apply_archives_removed(
+    repository: Repository,
+    removed_count: int,
+    output_lines: Iterable[str] = (),
+) -> bool:
+    """Account for archives removed by prune or delete.
+
+    ``output_lines`` is the command output; when it contains a ``--stats``
+    ``Deleted data`` row the size deltas are applied too. Returns True when
+    sizes were adjusted.
+    """
+    if removed_count > 0 and repository.archive_count is not None:
+        repository.archive_count = max(0, repository.archive_count - removed_count)
+
+    if repository.unique_size_bytes is None or repository.borg_version == 2:
+        # Borg 2 sizes are on-disk: deleting frees nothing until compact.
+        return False
+
+    deleted = parse_stats_rows(output_lines).get("Deleted data")
+    if not deleted:
+        return False
+
+    original, compressed, deduplicated = (abs(value) for value in deleted)
+    _set_sizes(
+        repository,
+        original=(repository.original_size_bytes or 0) - original,
+        compressed=(repository.compressed_size_bytes or 0) - compressed,
+        unique=repository.unique_size_bytes - deduplicated,
+    )
+    return True
+
+
+def apply_compact_result(repository: Repository, output_lines: Iterable[str]) -> bool:
+    """Apply space freed by compact to on-disk (Borg 2) sizes.
+
+    Borg 1 ``unique_csize`` already dropped when prune/delete released the
+    chunks, so compact does not change it there.
+    """
+    if repository.borg_version != 2 or repository.unique_size_bytes is None:
+        return False
+
+    freed = parse_compact_freed_bytes(output_lines)
+    if not freed:
+        return False
+
+    _set_sizes(repository, unique=repository.unique_size_bytes - freed)
+    return True
+
+
+def needs_full_size_refresh(
+    repository: Repository, *, now: Optional[datetime] = None
+) -> bool:
+    """Whether a periodic stats pass must run the full ``borg info``.
+
+    Observe-only repositories are written by someone else, so our incremental
+    updates never see their changes. Everything else only needs a periodic
+    exact resync once its byte columns have a baseline.
+    """
+    if (
+        repository.unique_size_bytes is None
+        or repository.size_stats_refreshed_at is None
+    ):
+        return True
+    if (repository.mode or "full") == "observe":
+        return True
+    now = now or datetime.utcnow()
+    return now - repository.size_stats_refreshed_at >= FULL_SIZE_REFRESH_MAX_AGE
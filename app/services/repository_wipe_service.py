@@ -23,6 +23,7 @@ from app.database.models import (
     RestoreJob,
     User,
 )
+from app.services.archive_list_cache import archive_list_cache
 from app.services.log_policy import DEFAULT_LOG_SAVE_POLICY, job_has_logs_by_policy
 from app.services.repository_command_lock import run_serialized_repository_command
 from app.utils.borg_env import build_repository_borg_env, cleanup_temp_key_file
@@ -454,6 +455,7 @@ class RepositoryWipeService:
                 if job.status in TERMINAL_EXECUTION_STATUSES:
                     job.completed_at = datetime.utcnow()
                 db.commit()
+            archive_list_cache.invalidate(repository_id)
             cleanup_temp_key_file(temp_key_file)
             if close_db:
                 db.close()
@@ -461,6 +463,7 @@ class RepositoryWipeService:
     async def _best_effort_post_wipe_refresh(
         self, db: Session, repository: Repository
     ) -> None:
+        archive_list_cache.invalidate(repository.id)
         try:
             await BorgRouter(repository).update_stats(db)
         except Exception as exc:
@@ -482,7 +485,7 @@ class RepositoryWipeService:
         try:
             from app.services.mqtt_service import mqtt_service
 
-            mqtt_service.sync_state_with_db(db, reason="repository wipe")
+            mqtt_service.request_sync(reason="repository wipe")
         except Exception as exc:
             logger.warning(
                 "Failed to sync MQTT after repository wipe",
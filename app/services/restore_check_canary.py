@@ -179,3 +179,50 @@ def verify_restored_canary(repository: Repository, restore_destination: str) ->
         verified_files.append(relative_path)
 
     return {"verified_files": verified_files, "manifest_path": str(manifest_path)}
+
+
+def is_canary_manifest_path(archive_path: str) -> bool:
+    return archive_path.endswith(f"{CANARY_DIRNAME}/{CANARY_MANIFEST}")
+
+
+def verify_streamed_canary(repository: Repository, digest) -> dict:
+    """Check the digests of a streamed restore (``TarDigest``) against the manifest.
+
+    The streaming counterpart of ``verify_restored_canary``; the manifest must
+    have been kept in memory with ``is_canary_manifest_path``.
+    """
+    archive_root = None
+    manifest_path = None
+    for candidate_root in (
+        _canary_archive_root(repository),
+        _legacy_canary_archive_root(repository),
+    ):
+        candidate = f"{candidate_root}/{CANARY_DIRNAME}/{CANARY_MANIFEST}"
+        if candidate in digest.kept:
+            manifest_path = candidate
+            archive_root = candidate_root
+            break
+
+    if manifest_path is None or archive_root is None:
+        raise FileNotFoundError(
+            "The Borg UI canary file was not found in the latest archive. "
+            "Run a backup while canary mode is enabled, then run this restore check again."
+        )
+
+    manifest = json.loads(digest.kept[manifest_path].decode("utf-8"))
+    files = manifest.get("files", [])
+    verified_files = []
+    for file_entry in files:
+        relative_path = file_entry["path"]
+        member = digest.members.get(f"{archive_root}/{relative_path}")
+        if member is None:
+            raise FileNotFoundError(
+                f"Canary file missing from restore stream: {relative_path}"
+            )
+        if member.sha256 != file_entry["sha256"]:
+            raise ValueError(f"Canary hash mismatch for {relative_path}")
+        if member.size != file_entry["size"]:
+            raise ValueError(f"Canary size mismatch for {relative_path}")
+        verified_files.append(relative_path)
+
+    return {"verified_files": verified_files, "manifest_path": manifest_path}
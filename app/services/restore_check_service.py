@@ -20,8 +20,11 @@ from app.services.restore_check_canary import (
     CANARY_MANIFEST,
     get_legacy_restore_canary_archive_paths,
     get_restore_canary_archive_paths,
+    is_canary_manifest_path,
     verify_restored_canary,
+    verify_streamed_canary,
 )
+from app.services.restore_check_stream import StreamingRestoreCheck
 from app.utils.borg_env import build_repository_borg_env, cleanup_temp_key_file
 
 logger = structlog.get_logger()
@@ -100,7 +103,7 @@ def _is_borg_warning_exit_code(returncode: int | None) -> bool:
 
 
 class RestoreCheckService:
-    """Restore latest archive into a disposable temp directory to verify restorability."""
+    """Restore the latest archive, streamed or into a temp directory, to verify it."""
 
     def __init__(self):
         self.log_dir = Path(settings.data_dir) / "logs"
@@ -234,7 +237,7 @@ class RestoreCheckService:
                 job.probe_paths or repository.restore_check_paths
             )
             use_canary = not full_archive and not probe_paths
-            archives = await BorgRouter(repository).list_archives(env=env)
+            archives = await BorgRouter(repository).list_archives(env=env, db=db)
             archive = _select_latest_archive(archives)
             archive_name = _get_archive_name(archive)
             if not archive_name:
@@ -269,21 +272,24 @@ class RestoreCheckService:
                 )
                 return
 
+            streaming = settings.restore_check_streaming
+            destination = "for verification" if streaming else "to temporary directory"
             job.archive_name = archive_name
             job.progress = 15
             job.progress_message = (
-                f"Restoring full archive {archive_name} to temporary directory"
+                f"Restoring full archive {archive_name} {destination}"
                 if full_archive
-                else "Restoring managed canary payload to temporary directory"
+                else f"Restoring managed canary payload {destination}"
                 if use_canary
-                else f"Restoring selected probe paths from {archive_name} to temporary directory"
+                else f"Restoring selected probe paths from {archive_name} {destination}"
             )
             db.commit()
 
-            temp_restore_dir = tempfile.mkdtemp(
-                prefix=f"restore-check-{repository.id}-",
-                dir=settings.data_dir,
-            )
+            if not streaming:
+                temp_restore_dir = tempfile.mkdtemp(
+                    prefix=f"restore-check-{repository.id}-",
+                    dir=settings.data_dir,
+                )
 
             if full_archive:
                 restore_paths = []
@@ -301,8 +307,49 @@ class RestoreCheckService:
                     f"Archive: {archive_name}",
                     f"Mode: {restore_mode}",
                     f"Restore paths: {', '.join(restore_paths) if restore_paths else 'full archive'}",
+                    "Verification: "
+                    + (
+                        "streamed and hashed in memory"
+                        if streaming
+                        else "extracted to a temporary directory"
+                    ),
                 ]
             )
+            stream: StreamingRestoreCheck | None = None
+
+            async def run_stream(paths: list[str]) -> int | None:
+                nonlocal stream
+                cmd = BorgRouter(repository).build_restore_export_tar_command(
+                    repository_path=repository.path,
+                    archive_name=archive_name,
+                    paths=paths,
+                    remote_path=repository.remote_path,
+                    bypass_lock=repository.bypass_lock,
+                )
+                stream = await StreamingRestoreCheck.start(cmd, env)
+
+                self.running_processes[job_id] = stream
+                job.process_pid = stream.pid
+                job.process_start_time = get_process_start_time(stream.pid)
+                db.commit()
+
+                returncode = await stream.run(keep=is_canary_manifest_path)
+                raw_logs.extend(stream.log_lines)
+                if stream.digest is None:
+                    # Borg exiting cleanly or with a warning does not help
+                    # when the data it wrote could not be read back
+                    raw_logs.append(
+                        stream.stream_error or "Restore stream was not verified"
+                    )
+                    if returncode == 0 or _is_borg_warning_exit_code(returncode):
+                        returncode = 2
+                else:
+                    raw_logs.append(
+                        f"Streamed {stream.digest.entries} entries, hashed "
+                        f"{len(stream.digest.members)} files "
+                        f"({stream.digest.bytes_hashed} bytes)"
+                    )
+                return returncode
 
             async def run_extract(paths: list[str]) -> int | None:
                 cmd = BorgRouter(repository).build_restore_extract_command(
@@ -353,7 +400,11 @@ class RestoreCheckService:
                         f"{', '.join(attempt_paths)}"
                     )
 
-                returncode = await run_extract(attempt_paths)
+                returncode = await (
+                    run_stream(attempt_paths)
+                    if streaming
+                    else run_extract(attempt_paths)
+                )
                 warning_exit = _is_borg_warning_exit_code(returncode)
 
                 if not use_canary:
@@ -361,8 +412,10 @@ class RestoreCheckService:
 
                 if returncode == 0 or warning_exit:
                     try:
-                        verification = verify_restored_canary(
-                            repository, temp_restore_dir
+                        verification = (
+                            verify_streamed_canary(repository, stream.digest)
+                            if streaming
+                            else verify_restored_canary(repository, temp_restore_dir)
                         )
                         restore_paths = attempt_paths
                         break
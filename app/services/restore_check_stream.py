@@ -0,0 +1,239 @@
+"""
+Verify a restore check from a `borg export-tar` stream.
+
+Extracting the probe paths into a scratch directory needs as much free disk
+as the data being verified and writes every byte once more than necessary.
+Instead, `borg export-tar` writes the selected paths to stdout and the tar
+stream is parsed here as it arrives: each regular file is run through
+SHA-256 and then discarded, so a restore check uses constant disk space no
+matter how large the probe is.
+
+    borg export-tar REPO::ARCHIVE - PATHS  |  sha256 per member (in process)
+
+Borg authenticates every chunk it decrypts, so a complete stream with a clean
+exit proves the data is restorable; the digests are compared against the
+canary manifest when there is one. Only members selected by ``keep`` (the
+canary manifest, a few hundred bytes) are held in memory.
+"""
+
+import asyncio
+import hashlib
+import tarfile
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from app.services.borg_progress import MAX_LOG_LINES, parse_log_json
+from app.services.restore_tar_stream import PIPE_CHUNK_SIZE, TAR_BLOCK_SIZE
+
+# Members kept in memory for the caller are capped so a mislabelled file
+# cannot grow the process
+MAX_KEPT_MEMBER_SIZE = 1024 * 1024
+_FILE_TYPES = (tarfile.REGTYPE, tarfile.AREGTYPE, tarfile.CONTTYPE)
+
+
+def _padded(size: int) -> int:
+    return -(-size // TAR_BLOCK_SIZE) * TAR_BLOCK_SIZE
+
+
+class TarStreamError(ValueError):
+    """Raised for a tar stream that is truncated or malformed."""
+
+
+@dataclass
+class StreamedMember:
+    path: str
+    size: int
+    sha256: str
+
+
+@dataclass
+class TarDigest:
+    members: dict[str, StreamedMember] = field(default_factory=dict)
+    kept: dict[str, bytes] = field(default_factory=dict)  # Contents of ``keep`` hits
+    entries: int = 0  # Every entry, directories and links included
+    bytes_hashed: int = 0
+
+
+async def _read_exactly(stream, size: int) -> bytes:
+    try:
+        return await stream.readexactly(size)
+    except asyncio.IncompleteReadError:
+        raise TarStreamError("Tar stream ended in the middle of an entry")
+
+
+async def _read_data(stream, size: int) -> bytes:
+    data = await _read_exactly(stream, size)
+    await _read_exactly(stream, _padded(size) - size)
+    return data
+
+
+def _parse_pax(data: bytes) -> dict[str, str]:
+    """Records of a pax extended header: ``"<len> <key>=<value>\\n"``."""
+    records = {}
+    position = 0
+    while position < len(data):
+        space = data.find(b" ", position)
+        if space < 0:
+            break
+        try:
+            length = int(data[position:space])
+        except ValueError:
+            raise TarStreamError("Malformed pax header")
+        if length <= 0:
+            raise TarStreamError("Malformed pax header")
+        key, _, value = data[space + 1 : position + length - 1].partition(b"=")
+        records[key.decode("utf-8", errors="replace")] = value.decode(
+            "utf-8", errors="surrogateescape"
+        )
+        position += length
+    return records
+
+
+async def hash_tar_stream(
+    stream,
+    keep: Optional[Callable[[str], bool]] = None,
+    chunk_size: int = PIPE_CHUNK_SIZE,
+) -> TarDigest:
+    """Hash every regular file of the tar stream read from ``stream``.
+
+    Understands the GNU and pax formats `borg export-tar` writes (long names,
+    pax path and size records). Hard links get the digest of their target.
+    Raises ``TarStreamError`` when the stream ends before its end marker.
+    """
+    digest = TarDigest()
+    long_name = long_link = None
+    pax: dict[str, str] = {}
+    while True:
+        header = await _read_exactly(stream, TAR_BLOCK_SIZE)
+        try:
+            info = tarfile.TarInfo.frombuf(header, "utf-8", "surrogateescape")
+        except tarfile.EOFHeaderError:
+            break
+        except tarfile.HeaderError as exc:
+            raise TarStreamError(f"Malformed tar header: {exc}")
+
+        size = int(pax.get("size", info.size))
+        if info.type in (tarfile.GNUTYPE_LONGNAME, tarfile.GNUTYPE_LONGLINK):
+            value = (await _read_data(stream, size)).rstrip(b"\0")
+            value = value.decode("utf-8", errors="surrogateescape")
+            if info.type == tarfile.GNUTYPE_LONGNAME:
+                long_name = value
+            else:
+                long_link = value
+            continue
+        if info.type == tarfile.XHDTYPE:
+            pax = _parse_pax(await _read_data(stream, size))
+            continue
+        if info.type == tarfile.XGLTYPE:
+            await _read_data(stream, size)
+            continue
+
+        path = (pax.get("path") or long_name or info.name).strip("/")
+        linkname = (pax.get("linkpath") or long_link or info.linkname).strip("/")
+        long_name = long_link = None
+        pax = {}
+        digest.entries += 1
+
+        if info.type == tarfile.LNKTYPE:
+            target = digest.members.get(linkname)
+            if target is not None:
+                digest.members[path] = StreamedMember(path, target.size, target.sha256)
+            await _read_data(stream, size)
+            continue
+        if info.type not in _FILE_TYPES:
+            await _read_data(stream, size)
+            continue
+
+        hasher = hashlib.sha256()
+        keeping = keep is not None and keep(path) and size <= MAX_KEPT_MEMBER_SIZE
+        kept = []
+        remaining = size
+        while remaining:
+            chunk = await _read_exactly(stream, min(chunk_size, remaining))
+            hasher.update(chunk)
+            if keeping:
+                kept.append(chunk)
+            remaining -= len(chunk)
+        await _read_exactly(stream, _padded(size) - size)
+        digest.members[path] = StreamedMember(path, size, hasher.hexdigest())
+        digest.bytes_hashed += size
+        if keeping:
+            digest.kept[path] = b"".join(kept)
+
+    # Read the zero padding up to the record boundary so borg can exit
+    while await stream.read(chunk_size):
+        pass
+    return digest
+
+
+class StreamingRestoreCheck:
+    """A `borg export-tar` process whose stdout is hashed in this process.
+
+    Exposes ``pid``/``returncode``/``terminate``/``kill``/``wait`` so it can
+    sit in ``RestoreCheckService.running_processes`` like an extract process.
+    """
+
+    def __init__(self, process):
+        self.process = process
+        self.log_lines: deque = deque(maxlen=MAX_LOG_LINES)
+        self.digest: Optional[TarDigest] = None
+        self.stream_error: Optional[str] = None
+
+    @classmethod
+    async def start(cls, export_cmd: List[str], env: dict) -> "StreamingRestoreCheck":
+        process = await asyncio.create_subprocess_exec(
+            *export_cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        return cls(process)
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self.process.returncode
+
+    def terminate(self) -> None:
+        if self.process.returncode is None:
+            self.process.terminate()
+
+    def kill(self) -> None:
+        if self.process.returncode is None:
+            self.process.kill()
+
+    async def wait(self) -> Optional[int]:
+        return await self.process.wait()
+
+    async def run(self, keep: Optional[Callable[[str], bool]] = None) -> Optional[int]:
+        """Hash the stream until borg exits; return borg's exit code."""
+        await asyncio.gather(self._hash(keep), self._read_log())
+        return await self.process.wait()
+
+    async def _hash(self, keep) -> None:
+        stdout = self.process.stdout
+        try:
+            self.digest = await hash_tar_stream(stdout, keep)
+        except TarStreamError as exc:
+            self.stream_error = str(exc)
+            # Drain the pipe: asyncio reports the exit only once it is closed
+            while await stdout.read(PIPE_CHUNK_SIZE):
+                pass
+
+    async def _read_log(self) -> None:
+        async for raw_line in self.process.stderr:
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            if not line:
+                continue
+            message = parse_log_json(line)
+            if message is None:
+                self.log_lines.append(line)
+            elif message.get("name") == "borg.output.list":
+                continue  # One line per member; the digest counts them
+            elif message.get("message"):
+                self.log_lines.append(str(message["message"]))
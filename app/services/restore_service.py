@@ -3,20 +3,51 @@ import structlog
 import json
 import os
 import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional
 from types import SimpleNamespace
 
+from app.config import settings
 from app.database.models import RestoreJob, Repository, SSHConnection
 from app.database.database import SessionLocal
 from app.core.borg_router import BorgRouter
+from app.services.borg_progress import (
+    MAX_LOG_LINES,
+    MB,
+    ExtractProgress,
+    SpeedWindow,
+    estimate_seconds_remaining,
+    is_progress_message,
+    parse_log_json,
+    read_lines,
+)
+from app.services.cache_service import archive_cache
 from app.services.notification_service import notification_service
+from app.services.restore_shards import (
+    RestoreShardPlan,
+    ShardedExtract,
+    directory_patterns,
+    plan_restore_shards,
+    resolve_shard_count,
+    shard_patterns,
+    write_patterns_file,
+)
+from app.services.restore_tar_stream import (
+    TarStreamPipeline,
+    build_remote_ssh_command,
+    build_remote_untar_command,
+    estimate_cached_tar_size,
+    probe_remote_tar,
+)
 from app.utils.borg_env import (
     build_repository_borg_env,
     cleanup_temp_key_file,
     get_standard_ssh_opts,
 )
+from app.utils.process_priority import ProcessPriority, resolve_process_priority
+from app.utils.ssh_utils import resolve_ssh_key_file_by_id
 from app.utils.restore_layout import (
     RESTORE_LAYOUT_PRESERVE_PATH,
     compute_restore_strip_components,
@@ -41,6 +72,46 @@ _AGENT_RESTORE_CLAIM_TIMEOUT_SECONDS = 120
 _AGENT_RESTORE_STALL_TIMEOUT_SECONDS = 600
 
 
+class _RestoreProgress:
+    """Job progress for restores that count restored bytes themselves."""
+
+    def __init__(self, job: RestoreJob, db_session, expected_size: Optional[int]):
+        self.job = job
+        self.db_session = db_session
+        self.expected_size = expected_size
+        self._speed = SpeedWindow()
+        self._last_commit = time.monotonic()
+        if expected_size:
+            job.original_size = expected_size
+
+    def update(self, restored: int, nfiles: int, current_file: str) -> None:
+        job = self.job
+        now = time.monotonic()
+        job.restored_size = restored
+        job.nfiles = nfiles
+        if current_file:
+            job.current_file = f"Extracting: {current_file}"
+        if self.expected_size:
+            # Estimates come from the archive listing; 100% is only reported
+            # once the restore has finished.
+            job.progress_percent = min(99.0, (restored / self.expected_size) * 100.0)
+
+        self._speed.add(now, restored)
+        rate = self._speed.rate()
+        if rate:
+            job.restore_speed = rate / MB
+            job.estimated_time_remaining = estimate_seconds_remaining(
+                (self.expected_size or 0) - restored, rate
+            )
+
+        if now - self._last_commit >= 2.0:
+            try:
+                self.db_session.commit()
+                self._last_commit = now
+            except Exception:
+                self.db_session.rollback()
+
+
 def _http_detail_text(exc) -> str:
     detail = getattr(exc, "detail", None)
     if isinstance(detail, dict):
@@ -545,10 +616,12 @@ class RestoreService:
                 .filter(Repository.path == repository_path)
                 .first()
             )
+            priority = resolve_process_priority("restore", repository)
 
             # Update job status to running - may fail if job was deleted after we queried it
             try:
                 job.status = "running"
+                job.process_priority = priority.to_dict()
                 job.started_at = datetime.now(timezone.utc)
                 db_session.commit()
             except Exception as status_error:
@@ -602,14 +675,15 @@ class RestoreService:
                     bypass_lock=False,
                     passphrase=None,
                 )
-                cmd = BorgRouter(repo_for_routing).build_restore_extract_command(
-                    repository_path=repository_path,
-                    archive_name=archive_name,
-                    paths=paths or [],
-                    remote_path=repository.remote_path if repository else None,
-                    bypass_lock=repository.bypass_lock if repository else False,
-                    strip_components=strip_components,
-                )
+                router = BorgRouter(repo_for_routing)
+                borg_command_args = {
+                    "repository_path": repository_path,
+                    "archive_name": archive_name,
+                    "paths": paths or [],
+                    "remote_path": repository.remote_path if repository else None,
+                    "bypass_lock": repository.bypass_lock if repository else False,
+                    "strip_components": strip_components,
+                }
 
                 # Set up environment
                 if repository:
@@ -624,228 +698,38 @@ class RestoreService:
                     env["BORG_RELOCATED_REPO_ACCESS_IS_OK"] = "yes"
                     env["BORG_RSH"] = f"ssh {' '.join(get_standard_ssh_opts())}"
 
-                logger.info(
-                    "Executing restore command", command=" ".join(cmd), cwd=destination
+                shard_plan = await self._plan_restore_shards(
+                    repository, archive_name, paths
                 )
-
-                # Execute command with progress tracking
-                # Extract directly to destination (no temp directory)
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    stdin=asyncio.subprocess.PIPE,  # Pipe stdin so we can close it
-                    cwd=destination,
-                    env=env,
-                )
-
-                # Close stdin immediately to prevent hanging on prompts
-                if process.stdin:
-                    process.stdin.close()
-
-                # Track this process so it can be cancelled
-                self.running_processes[job_id] = process
-
-                # Track progress
-                current_file = ""
-                stdout_lines = []
-                stderr_lines = []
-                last_update_time = datetime.now(timezone.utc)
-                seen_files = set()  # Track unique files
-                nfiles = 0
-
-                # Speed tracking: Moving average over 30-second window (same as backup jobs)
-                speed_tracking = []  # List of (timestamp, restored_size) tuples
-                SPEED_WINDOW_SECONDS = 30  # Calculate speed over last 30 seconds
-
-                # Read stderr for progress (borg writes progress to stderr)
-                # With --log-json, we get JSON progress messages
-                async def read_stderr():
-                    nonlocal current_file, last_update_time, nfiles, speed_tracking
-                    buffer = b""
-
-                    while True:
-                        chunk = await process.stderr.read(8192)  # Read in chunks
-                        if not chunk:
-                            break
-
-                        buffer += chunk
-
-                        # Split on both \r and \n to handle progress updates
-                        while b"\r" in buffer or b"\n" in buffer:
-                            # Find the next separator
-                            r_pos = buffer.find(b"\r")
-                            n_pos = buffer.find(b"\n")
-
-                            # Use whichever comes first
-                            if r_pos == -1:
-                                pos = n_pos
-                                sep_len = 1
-                            elif n_pos == -1:
-                                pos = r_pos
-                                sep_len = 1
-                            else:
-                                pos = min(r_pos, n_pos)
-                                sep_len = 1
-
-                            if pos == -1:
-                                break
-
-                            line_bytes = buffer[:pos]
-                            buffer = buffer[pos + sep_len :]
-
-                            if not line_bytes:
-                                continue
-
-                            line_text = line_bytes.decode(
-                                "utf-8", errors="replace"
-                            ).strip()
-                            if line_text:
-                                stderr_lines.append(line_text)
-
-                                # Parse JSON progress messages from stderr
-                                try:
-                                    # Check if line is JSON (starts with {)
-                                    if line_text and line_text[0] == "{":
-                                        json_msg = json.loads(line_text)
-                                        msg_type = json_msg.get("type")
-
-                                        # Parse progress_percent messages for restore progress
-                                        if (
-                                            msg_type == "progress_percent"
-                                            and not json_msg.get("finished")
-                                        ):
-                                            # Extract byte counts and current file
-                                            restored_size = json_msg.get("current", 0)
-                                            original_size = json_msg.get("total", 0)
-                                            file_info = json_msg.get("info", [])
-                                            current_file = (
-                                                file_info[0] if file_info else ""
-                                            )
-
-                                            # Update job with size stats
-                                            job.restored_size = restored_size
-                                            job.original_size = original_size
-
-                                            # Calculate progress percentage
-                                            if original_size > 0:
-                                                job.progress_percent = min(
-                                                    100.0,
-                                                    (restored_size / original_size)
-                                                    * 100.0,
-                                                )
-
-                                            # Count unique files
-                                            if (
-                                                current_file
-                                                and current_file not in seen_files
-                                            ):
-                                                seen_files.add(current_file)
-                                                nfiles = len(seen_files)
-
-                                            job.current_file = current_file
-                                            job.nfiles = nfiles
-
-                                            # Calculate restore speed using moving average (30-second window)
-                                            if restored_size > 0:
-                                                current_time = (
-                                                    asyncio.get_event_loop().time()
-                                                )
-
-                                                # Add current data point
-                                                speed_tracking.append(
-                                                    (current_time, restored_size)
-                                                )
-
-                                                # Remove data points older than window
-                                                speed_tracking[:] = [
-                                                    (t, s)
-                                                    for t, s in speed_tracking
-                                                    if current_time - t
-                                                    <= SPEED_WINDOW_SECONDS
-                                                ]
-
-                                                # Calculate speed from moving average (need at least 2 data points)
-                                                if len(speed_tracking) >= 2:
-                                                    time_diff = (
-                                                        speed_tracking[-1][0]
-                                                        - speed_tracking[0][0]
-                                                    )
-                                                    size_diff = (
-                                                        speed_tracking[-1][1]
-                                                        - speed_tracking[0][1]
-                                                    )
-
-                                                    if time_diff > 0 and size_diff > 0:
-                                                        # Speed in MB/s
-                                                        job.restore_speed = (
-                                                            size_diff / (1024 * 1024)
-                                                        ) / time_diff
-                                                    elif time_diff > 0:
-                                                        # No size change yet
-                                                        job.restore_speed = 0.0
-
-                                                    # Calculate estimated time remaining (in seconds)
-                                                    remaining_bytes = (
-                                                        original_size - restored_size
-                                                    )
-                                                    if (
-                                                        remaining_bytes > 0
-                                                        and job.restore_speed > 0
-                                                    ):
-                                                        # Speed is in MB/s, convert remaining bytes to MB
-                                                        remaining_mb = (
-                                                            remaining_bytes
-                                                            / (1024 * 1024)
-                                                        )
-                                                        job.estimated_time_remaining = (
-                                                            int(
-                                                                remaining_mb
-                                                                / job.restore_speed
-                                                            )
-                                                        )
-                                                    else:
-                                                        job.estimated_time_remaining = 0
-
-                                            # Commit every 2 seconds to reduce database load
-                                            now = datetime.now(timezone.utc)
-                                            if (
-                                                now - last_update_time
-                                            ).total_seconds() >= 2.0:
-                                                try:
-                                                    db_session.commit()
-                                                    last_update_time = now
-                                                    logger.info(
-                                                        "Restore progress update",
-                                                        job_id=job_id,
-                                                        percent=job.progress_percent,
-                                                        nfiles=nfiles,
-                                                        speed_mb_s=job.restore_speed,
-                                                        eta_seconds=job.estimated_time_remaining,
-                                                        file=current_file[:50]
-                                                        if current_file
-                                                        else "",
-                                                    )
-                                                except:
-                                                    db_session.rollback()
-                                except json.JSONDecodeError:
-                                    # Not JSON, ignore (might be non-JSON log messages)
-                                    pass
-                                except Exception as e:
-                                    logger.debug(
-                                        "Failed to parse progress line",
-                                        line=line_text[:100],
-                                        error=str(e),
-                                    )
-
-                # Read stdout for any output
-                async def read_stdout():
-                    async for line in process.stdout:
-                        stdout_lines.append(line.decode().strip())
-
-                # Wait for both streams and process completion
-                await asyncio.gather(read_stderr(), read_stdout())
-                await process.wait()
+                if shard_plan:
+                    (
+                        process,
+                        stdout_lines,
+                        stderr_lines,
+                        nfiles,
+                        current_file,
+                    ) = await self._run_sharded_extract(
+                        job_id,
+                        job,
+                        db_session,
+                        router,
+                        borg_command_args,
+                        env,
+                        destination,
+                        shard_plan,
+                        priority,
+                    )
+                else:
+                    cmd = router.build_restore_extract_command(**borg_command_args)
+                    (
+                        process,
+                        stdout_lines,
+                        stderr_lines,
+                        nfiles,
+                        current_file,
+                    ) = await self._run_local_extract(
+                        job_id, job, db_session, cmd, env, destination, priority
+                    )
 
                 # Final update
                 if current_file:
@@ -1078,6 +962,204 @@ class RestoreService:
             cleanup_temp_key_file(temp_key_file)
             db_session.close()
 
+    async def _run_local_extract(
+        self,
+        job_id: int,
+        job: RestoreJob,
+        db_session,
+        cmd,
+        env,
+        destination: str,
+        priority: Optional[ProcessPriority] = None,
+    ):
+        """Run one ``borg extract`` into ``destination``, tracking progress.
+
+        Returns ``(process, stdout_lines, stderr_lines, nfiles, current_file)``.
+        """
+        logger.info("Executing restore command", command=" ".join(cmd), cwd=destination)
+
+        # Execute command with progress tracking
+        # Extract directly to destination (no temp directory)
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.PIPE,  # Pipe stdin so we can close it
+            cwd=destination,
+            env=env,
+        )
+        if priority is not None:
+            priority.apply(process.pid)
+
+        # Close stdin immediately to prevent hanging on prompts
+        if process.stdin:
+            process.stdin.close()
+
+        # Track this process so it can be cancelled
+        self.running_processes[job_id] = process
+
+        stdout_lines = deque(maxlen=MAX_LOG_LINES)
+
+        async def read_stdout():
+            async for line in process.stdout:
+                stdout_lines.append(line.decode().strip())
+
+        stderr_lines, progress = await self._follow_extract(
+            job_id, job, db_session, process, read_stdout()
+        )
+        nfiles, current_file = progress.nfiles, progress.current_file
+
+        return process, stdout_lines, stderr_lines, nfiles, current_file
+
+    async def _follow_extract(
+        self, job_id: int, job: RestoreJob, db_session, process, read_stdout
+    ):
+        """Mirror ``borg extract`` progress onto ``job`` until it exits.
+
+        Returns ``(stderr_lines, progress)``: the last non-progress stderr
+        lines and the :class:`ExtractProgress` counters.
+        """
+        progress = ExtractProgress()
+        speed = SpeedWindow()
+        stderr_lines = deque(maxlen=MAX_LOG_LINES)
+        last_commit = time.monotonic()
+
+        def on_line(line: str) -> None:
+            nonlocal last_commit
+            message = parse_log_json(line)
+            if not progress.feed(message):
+                if not is_progress_message(message):
+                    stderr_lines.append(line)
+                return
+            job.restored_size = progress.restored
+            job.original_size = progress.total
+            if progress.total > 0:
+                job.progress_percent = min(
+                    100.0, (progress.restored / progress.total) * 100.0
+                )
+            job.current_file = progress.current_file
+            job.nfiles = progress.nfiles
+
+            now = time.monotonic()
+            if progress.restored > 0:
+                speed.add(now, progress.restored)
+                rate = speed.rate()
+                if rate is not None:
+                    job.restore_speed = rate / MB
+                    job.estimated_time_remaining = estimate_seconds_remaining(
+                        progress.total - progress.restored, rate
+                    )
+
+            # Commit every 2 seconds to reduce database load
+            if now - last_commit >= 2.0:
+                try:
+                    db_session.commit()
+                    last_commit = now
+                    logger.info(
+                        "Restore progress update",
+                        job_id=job_id,
+                        percent=job.progress_percent,
+                        nfiles=progress.nfiles,
+                        speed_mb_s=job.restore_speed,
+                        eta_seconds=job.estimated_time_remaining,
+                        file=progress.current_file[:50],
+                    )
+                except Exception:
+                    db_session.rollback()
+
+        # borg writes --progress/--log-json output to stderr
+        await asyncio.gather(read_lines(process.stderr, on_line), read_stdout)
+        await process.wait()
+        return stderr_lines, progress
+
+    async def _plan_restore_shards(
+        self, repository: Optional[Repository], archive_name: str, paths
+    ) -> Optional[RestoreShardPlan]:
+        """Shard plan for a large local restore, or None for a single extract."""
+        shard_count = resolve_shard_count(settings.restore_parallel_shards)
+        if shard_count < 2 or repository is None or repository.borg_version == 2:
+            return None
+        items = await archive_cache.get_archive_listing(repository.id, archive_name)
+        if not items:
+            return None
+        return await asyncio.to_thread(
+            plan_restore_shards,
+            items,
+            paths,
+            shard_count,
+            min_size=settings.restore_parallel_min_size_mb * 1024 * 1024,
+        )
+
+    async def _run_sharded_extract(
+        self,
+        job_id: int,
+        job: RestoreJob,
+        db_session,
+        router: BorgRouter,
+        borg_command_args: dict,
+        env,
+        destination: str,
+        plan: RestoreShardPlan,
+        priority: Optional[ProcessPriority] = None,
+    ):
+        """Run one ``borg extract`` per shard of ``plan`` concurrently.
+
+        Returns the same tuple as ``_run_local_extract``.
+        """
+        pattern_files = []
+        try:
+            commands = []
+            for shard in plan.shards:
+                pattern_files.append(write_patterns_file(shard_patterns(shard)))
+                commands.append(
+                    router.build_restore_extract_command(
+                        **{**borg_command_args, "paths": []},
+                        patterns_from=pattern_files[-1],
+                    )
+                )
+            final_command = None
+            if plan.split_directories:
+                pattern_files.append(
+                    write_patterns_file(directory_patterns(plan.split_directories))
+                )
+                final_command = router.build_restore_extract_command(
+                    **{**borg_command_args, "paths": []},
+                    patterns_from=pattern_files[-1],
+                )
+
+            logger.info(
+                "Executing sharded restore",
+                job_id=job_id,
+                shards=len(commands),
+                shard_sizes=plan.shard_sizes,
+                split_directories=len(plan.split_directories),
+                cwd=destination,
+            )
+            extract = ShardedExtract(
+                commands, env, destination, final_command, priority=priority
+            )
+            self.running_processes[job_id] = extract
+
+            progress = _RestoreProgress(job, db_session, plan.total_size)
+            await extract.run(
+                lambda shards: progress.update(
+                    shards.restored_size, shards.nfiles, shards.current_file
+                )
+            )
+            return (
+                extract,
+                extract.stdout_lines,
+                extract.stderr_lines,
+                extract.nfiles,
+                extract.current_file,
+            )
+        finally:
+            for pattern_file in pattern_files:
+                try:
+                    os.unlink(pattern_file)
+                except OSError:
+                    pass
+
     async def cancel_restore(self, job_id: int) -> bool:
         """
         Cancel a running restore job by terminating its process
@@ -1198,6 +1280,7 @@ class RestoreService:
         db_session = SessionLocal()
         mount_id = None
         temp_key_file = None
+        dest_key_file = None
 
         try:
             # Get job record
@@ -1212,6 +1295,7 @@ class RestoreService:
                 .filter(Repository.path == repository_path)
                 .first()
             )
+            priority = resolve_process_priority("restore", repository)
 
             # Get SSH connection details
             if not destination_connection_id:
@@ -1231,6 +1315,7 @@ class RestoreService:
             try:
                 job.status = "running"
                 job.started_at = datetime.now(timezone.utc)
+                job.process_priority = priority.to_dict()
                 db_session.commit()
             except Exception as status_error:
                 logger.warning(
@@ -1241,7 +1326,7 @@ class RestoreService:
                 return
 
             logger.info(
-                "Starting local→SSH restore via SSHFS",
+                "Starting local→SSH restore",
                 job_id=job_id,
                 repository=repository_path,
                 archive=archive_name,
@@ -1249,40 +1334,6 @@ class RestoreService:
                 restore_layout=restore_layout,
             )
 
-            # Mount SSH destination via SSHFS
-            job.current_file = "Mounting SSH destination..."
-            db_session.commit()
-
-            logger.info("Mounting SSH destination", destination=destination)
-
-            temp_root, mount_info_list = await mount_service.mount_ssh_paths_shared(
-                connection_id=destination_connection_id,
-                remote_paths=[destination],
-                job_id=job_id,
-                # Extract must write faithful symlinks. With follow_symlinks the
-                # mount dereferences each just-created link, so borg's attr step
-                # follows to the (often missing) target and fails with an I/O
-                # error on every symlink. no_contain_symlinks avoids that and
-                # keeps absolute/broken links intact. See _sshfs_symlink_options.
-                preserve_symlinks=True,
-            )
-
-            if not mount_info_list:
-                raise Exception("Failed to mount SSH destination")
-
-            mount_id, relative_path = mount_info_list[0]
-            mount_path = os.path.join(temp_root, relative_path)
-
-            logger.info(
-                "SSH destination mounted",
-                mount_path=mount_path,
-                mount_id=mount_id,
-                destination=destination,
-            )
-
-            # Ensure mount directory exists
-            os.makedirs(mount_path, exist_ok=True)
-
             strip_components = compute_restore_strip_components(
                 paths or [],
                 restore_layout=restore_layout,
@@ -1295,14 +1346,15 @@ class RestoreService:
                 bypass_lock=False,
                 passphrase=None,
             )
-            cmd = BorgRouter(repo_for_routing).build_restore_extract_command(
-                repository_path=repository_path,
-                archive_name=archive_name,
-                paths=paths or [],
-                remote_path=repository.remote_path if repository else None,
-                bypass_lock=repository.bypass_lock if repository else False,
-                strip_components=strip_components,
-            )
+            router = BorgRouter(repo_for_routing)
+            borg_command_args = {
+                "repository_path": repository_path,
+                "archive_name": archive_name,
+                "paths": paths or [],
+                "remote_path": repository.remote_path if repository else None,
+                "bypass_lock": repository.bypass_lock if repository else False,
+                "strip_components": strip_components,
+            }
 
             # Set up environment
             if repository:
@@ -1315,179 +1367,76 @@ class RestoreService:
                 env["BORG_RELOCATED_REPO_ACCESS_IS_OK"] = "yes"
                 env["BORG_RSH"] = f"ssh {' '.join(get_standard_ssh_opts())}"
 
+            transport = settings.restore_ssh_transport
+            if transport != "sshfs":
+                dest_key_file = resolve_ssh_key_file_by_id(
+                    ssh_connection.ssh_key_id, db_session
+                )
+            use_tar = transport == "tar" or (
+                transport != "sshfs"
+                and await probe_remote_tar(ssh_connection, dest_key_file)
+            )
             logger.info(
-                "Executing extraction to SSHFS mount",
-                command=" ".join(cmd),
-                cwd=mount_path,
+                "Selected SSH restore transport",
+                job_id=job_id,
+                transport="tar" if use_tar else "sshfs",
             )
 
-            # Execute extraction (same logic as local restore)
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                stdin=asyncio.subprocess.PIPE,
-                cwd=mount_path,
-                env=env,
-            )
+            if use_tar:
+                cmd = router.build_restore_export_tar_command(**borg_command_args)
+                process, stderr_lines, nfiles = await self._run_tar_stream_restore(
+                    job_id,
+                    job,
+                    db_session,
+                    cmd,
+                    env,
+                    ssh_connection,
+                    dest_key_file,
+                    destination,
+                    repository.id if repository else None,
+                    archive_name,
+                    paths,
+                    priority,
+                )
+            else:
+                # Mount SSH destination via SSHFS
+                job.current_file = "Mounting SSH destination..."
+                db_session.commit()
 
-            if process.stdin:
-                process.stdin.close()
-
-            self.running_processes[job_id] = process
-
-            # Track extraction progress
-            current_file = ""
-            stderr_lines = []
-            last_update_time = datetime.now(timezone.utc)
-            seen_files = set()
-            nfiles = 0
-            speed_tracking = []
-            SPEED_WINDOW_SECONDS = 30
-
-            async def read_stderr():
-                nonlocal current_file, last_update_time, nfiles, speed_tracking
-                buffer = b""
-
-                while True:
-                    chunk = await process.stderr.read(8192)
-                    if not chunk:
-                        break
-
-                    buffer += chunk
-
-                    while b"\r" in buffer or b"\n" in buffer:
-                        r_pos = buffer.find(b"\r")
-                        n_pos = buffer.find(b"\n")
-
-                        if r_pos == -1:
-                            pos = n_pos
-                            sep_len = 1
-                        elif n_pos == -1:
-                            pos = r_pos
-                            sep_len = 1
-                        else:
-                            pos = min(r_pos, n_pos)
-                            sep_len = 1
-
-                        if pos == -1:
-                            break
-
-                        line_bytes = buffer[:pos]
-                        buffer = buffer[pos + sep_len :]
-
-                        if not line_bytes:
-                            continue
-
-                        line_text = line_bytes.decode("utf-8", errors="replace").strip()
-                        if line_text:
-                            stderr_lines.append(line_text)
-
-                            try:
-                                if line_text and line_text[0] == "{":
-                                    json_msg = json.loads(line_text)
-                                    msg_type = json_msg.get("type")
-
-                                    if (
-                                        msg_type == "progress_percent"
-                                        and not json_msg.get("finished")
-                                    ):
-                                        restored_size = json_msg.get("current", 0)
-                                        original_size = json_msg.get("total", 0)
-                                        file_info = json_msg.get("info", [])
-                                        current_file = file_info[0] if file_info else ""
-
-                                        job.restored_size = restored_size
-                                        job.original_size = original_size
-
-                                        if original_size > 0:
-                                            job.progress_percent = min(
-                                                100.0,
-                                                (restored_size / original_size) * 100.0,
-                                            )
-
-                                        if (
-                                            current_file
-                                            and current_file not in seen_files
-                                        ):
-                                            seen_files.add(current_file)
-                                            nfiles = len(seen_files)
-
-                                        job.current_file = f"Extracting: {current_file}"
-                                        job.nfiles = nfiles
-
-                                        # Calculate speed
-                                        if restored_size > 0:
-                                            current_time = (
-                                                asyncio.get_event_loop().time()
-                                            )
-                                            speed_tracking.append(
-                                                (current_time, restored_size)
-                                            )
-                                            speed_tracking[:] = [
-                                                (t, s)
-                                                for t, s in speed_tracking
-                                                if current_time - t
-                                                <= SPEED_WINDOW_SECONDS
-                                            ]
-
-                                            if len(speed_tracking) >= 2:
-                                                time_diff = (
-                                                    speed_tracking[-1][0]
-                                                    - speed_tracking[0][0]
-                                                )
-                                                size_diff = (
-                                                    speed_tracking[-1][1]
-                                                    - speed_tracking[0][1]
-                                                )
-
-                                                if time_diff > 0 and size_diff > 0:
-                                                    job.restore_speed = (
-                                                        size_diff / (1024 * 1024)
-                                                    ) / time_diff
-
-                                                remaining_bytes = (
-                                                    original_size - restored_size
-                                                )
-                                                if (
-                                                    remaining_bytes > 0
-                                                    and job.restore_speed > 0
-                                                ):
-                                                    remaining_mb = remaining_bytes / (
-                                                        1024 * 1024
-                                                    )
-                                                    job.estimated_time_remaining = int(
-                                                        remaining_mb / job.restore_speed
-                                                    )
-                                                else:
-                                                    job.estimated_time_remaining = 0
-
-                                        now = datetime.now(timezone.utc)
-                                        if (
-                                            now - last_update_time
-                                        ).total_seconds() >= 2.0:
-                                            try:
-                                                db_session.commit()
-                                                last_update_time = now
-                                                logger.info(
-                                                    "Restore progress",
-                                                    job_id=job_id,
-                                                    percent=job.progress_percent,
-                                                    file=current_file[:50]
-                                                    if current_file
-                                                    else "",
-                                                )
-                                            except:
-                                                db_session.rollback()
-                            except (json.JSONDecodeError, Exception) as e:
-                                pass
-
-            async def read_stdout():
-                async for line in process.stdout:
-                    pass  # Discard stdout
-
-            await asyncio.gather(read_stderr(), read_stdout())
-            await process.wait()
+                logger.info("Mounting SSH destination", destination=destination)
+
+                temp_root, mount_info_list = await mount_service.mount_ssh_paths_shared(
+                    connection_id=destination_connection_id,
+                    remote_paths=[destination],
+                    job_id=job_id,
+                    # Extract must write faithful symlinks. With follow_symlinks the
+                    # mount dereferences each just-created link, so borg's attr step
+                    # follows to the (often missing) target and fails with an I/O
+                    # error on every symlink. no_contain_symlinks avoids that and
+                    # keeps absolute/broken links intact. See _sshfs_symlink_options.
+                    preserve_symlinks=True,
+                )
+
+                if not mount_info_list:
+                    raise Exception("Failed to mount SSH destination")
+
+                mount_id, relative_path = mount_info_list[0]
+                mount_path = os.path.join(temp_root, relative_path)
+
+                logger.info(
+                    "SSH destination mounted",
+                    mount_path=mount_path,
+                    mount_id=mount_id,
+                    destination=destination,
+                )
+
+                # Ensure mount directory exists
+                os.makedirs(mount_path, exist_ok=True)
+
+                cmd = router.build_restore_extract_command(**borg_command_args)
+                process, stderr_lines, nfiles = await self._run_sshfs_extract(
+                    job_id, job, db_session, cmd, env, mount_path, priority
+                )
 
             # Check exit code (same logic as local restore)
             if (
@@ -1504,13 +1453,13 @@ class RestoreService:
                     if warning_msgs:
                         logger.warning(
                             "Restore completed with warnings",
-                            mount_path=mount_path,
+                            destination=destination,
                             nfiles=nfiles,
                             warnings=warning_msgs[-5:],
                         )
                 logger.info(
                     "Restore extraction successful",
-                    mount_path=mount_path,
+                    destination=destination,
                     nfiles=nfiles,
                 )
             else:
@@ -1538,11 +1487,11 @@ class RestoreService:
             job.progress_percent = 100.0
             job.completed_at = datetime.now(timezone.utc)
             job.current_file = "Restore completed"
-            job.logs = "\n".join(stderr_lines[-100:])
+            job.logs = "\n".join(list(stderr_lines)[-100:])
             db_session.commit()
 
             logger.info(
-                "Local→SSH restore completed successfully via SSHFS",
+                "Local→SSH restore completed successfully",
                 job_id=job_id,
                 repository=repository_path,
                 archive=archive_name,
@@ -1613,11 +1562,109 @@ class RestoreService:
 
             # Remove from running processes
             cleanup_temp_key_file(temp_key_file)
+            cleanup_temp_key_file(dest_key_file)
             if job_id in self.running_processes:
                 del self.running_processes[job_id]
 
             db_session.close()
 
+    async def _run_sshfs_extract(
+        self,
+        job_id: int,
+        job: RestoreJob,
+        db_session,
+        cmd,
+        env,
+        mount_path: str,
+        priority: Optional[ProcessPriority] = None,
+    ):
+        """Run ``borg extract`` inside the SSHFS-mounted destination.
+
+        Returns ``(process, stderr_lines, nfiles)``.
+        """
+        logger.info(
+            "Executing extraction to SSHFS mount",
+            command=" ".join(cmd),
+            cwd=mount_path,
+        )
+
+        # Execute extraction (same logic as local restore)
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.PIPE,
+            cwd=mount_path,
+            env=env,
+        )
+        if priority is not None:
+            priority.apply(process.pid)
+
+        if process.stdin:
+            process.stdin.close()
+
+        self.running_processes[job_id] = process
+
+        async def read_stdout():
+            async for line in process.stdout:
+                pass  # Discard stdout
+
+        stderr_lines, progress = await self._follow_extract(
+            job_id, job, db_session, process, read_stdout()
+        )
+        nfiles = progress.nfiles
+
+        return process, stderr_lines, nfiles
+
+    async def _run_tar_stream_restore(
+        self,
+        job_id: int,
+        job: RestoreJob,
+        db_session,
+        cmd,
+        env,
+        ssh_connection: SSHConnection,
+        key_file: Optional[str],
+        destination: str,
+        repository_id: Optional[int],
+        archive_name: str,
+        paths: Optional[list],
+        priority: Optional[ProcessPriority] = None,
+    ):
+        """Pipe ``borg export-tar`` into ``tar -x`` on the SSH destination.
+
+        Returns ``(pipeline, stderr_lines, nfiles)`` like ``_run_sshfs_extract``.
+        """
+        expected_size = None
+        if repository_id is not None:
+            expected_size = await estimate_cached_tar_size(
+                repository_id, archive_name, paths
+            )
+        remote_cmd = build_remote_ssh_command(
+            ssh_connection,
+            key_file,
+            build_remote_untar_command(destination, ssh_connection),
+        )
+        logger.info(
+            "Streaming restore to SSH destination",
+            command=" ".join(cmd),
+            remote_command=remote_cmd[-1],
+            expected_size=expected_size,
+        )
+
+        pipeline = await TarStreamPipeline.start(
+            cmd, env, remote_cmd, priority=priority
+        )
+        self.running_processes[job_id] = pipeline
+
+        progress = _RestoreProgress(job, db_session, expected_size)
+        await pipeline.run(
+            lambda stream: progress.update(
+                stream.bytes_sent, stream.nfiles, stream.current_file
+            )
+        )
+        return pipeline, pipeline.stderr_lines, pipeline.nfiles
+
 
 # Global instance
 restore_service = RestoreService()
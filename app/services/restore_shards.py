@@ -0,0 +1,365 @@
+"""
+Split a local restore into parallel `borg extract` shards.
+
+One `borg extract` decompresses and decrypts on a single core, which leaves
+most cores and disk bandwidth idle on large restores. When the archive has a
+cached listing, the selected paths are partitioned into balanced shards by
+subtree size and one extract per shard runs against the same archive
+(extract only takes a shared repository lock).
+
+Each shard gets a patterns file instead of PATH arguments, so wide
+directories don't hit the argument length limit. Directories that had to be
+split across shards are extracted once more at the end, on their own, so
+their permissions and mtimes are applied after every shard finished writing
+into them.
+
+Only Borg 1 listings are sharded: they mark hard links (type ``h``), and a
+selection containing one stays a single extract so the links are not
+restored as separate copies. Borg 2 listings don't expose hard links.
+"""
+
+import asyncio
+import heapq
+import os
+import tempfile
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+import structlog
+
+from app.services.borg_progress import (
+    MAX_LOG_LINES,
+    ExtractProgress,
+    is_progress_message,
+    parse_log_json,
+    read_lines,
+)
+from app.utils.process_priority import ProcessPriority
+
+logger = structlog.get_logger()
+
+# What creating one entry (inode, metadata calls) costs, in bytes of content.
+ENTRY_COST_BYTES = 64 * 1024
+# A directory with more children than this is extracted as one unit.
+MAX_SPLIT_CHILDREN = 1000
+MAX_UNITS_PER_SHARD = 64
+MAX_AUTO_SHARDS = 8
+
+_SUCCESS_RETURNCODES = {0, 1, *range(100, 128)}
+
+
+@dataclass
+class RestoreShardPlan:
+    """Path prefixes per shard plus the directories split across shards."""
+
+    shards: List[List[str]]
+    split_directories: List[str]
+    total_size: int
+    shard_sizes: List[int] = field(default_factory=list)
+
+
+def resolve_shard_count(configured: int) -> int:
+    """``configured`` shards, or one per core (capped) when it is 0."""
+    if configured > 0:
+        return configured
+    return max(1, min(os.cpu_count() or 1, MAX_AUTO_SHARDS))
+
+
+def _pattern_safe(path: str) -> bool:
+    # Pattern files are line based and borg strips surrounding whitespace.
+    return path == path.strip() and "\n" not in path and "\r" not in path
+
+
+def _depth(path: str) -> int:
+    return path.count("/")
+
+
+def plan_restore_shards(
+    items: Iterable[dict],
+    paths: Optional[List[str]],
+    shard_count: int,
+    *,
+    min_size: int = 0,
+) -> Optional[RestoreShardPlan]:
+    """Partition the restore of ``paths`` into up to ``shard_count`` shards.
+
+    ``items`` is a raw archive listing (``{"path", "type", "size"}``).
+    Returns None when the restore should stay a single extract: fewer than
+    two shards requested, less than ``min_size`` bytes selected, hard links
+    or pattern-unsafe names in the selection, or nothing worth splitting.
+    """
+    if shard_count < 2:
+        return None
+
+    selected = sorted({path.strip("/") for path in paths or [] if path.strip("/")})
+    # A root nested inside another root is already covered by it.
+    roots_set = {
+        root
+        for root in selected
+        if not any(root.startswith(f"{other}/") for other in selected)
+    }
+
+    def in_selection(path: str) -> bool:
+        if not roots_set:
+            return True
+        return any(path == root or path.startswith(f"{root}/") for root in roots_set)
+
+    def is_root(path: str) -> bool:
+        return path in roots_set if roots_set else "/" not in path
+
+    weight: Dict[str, int] = defaultdict(int)
+    by_depth: Dict[int, set] = defaultdict(set)
+    total_size = 0
+    for item in items:
+        path = str(item.get("path") or "").strip("/")
+        if not path or not in_selection(path):
+            continue
+        if item.get("type") == "h" or not _pattern_safe(path):
+            return None
+        size = item.get("size")
+        size = (
+            size if item.get("type") in ("-", "file") and isinstance(size, int) else 0
+        )
+        total_size += size
+        weight[path] += size + ENTRY_COST_BYTES
+        by_depth[_depth(path)].add(path)
+
+    if total_size < max(min_size, 1):
+        return None
+
+    # Fold subtree weights into their parents, deepest first. Parents missing
+    # from the listing are created on the way up.
+    children: Dict[str, List[str]] = defaultdict(list)
+    for depth in range(max(by_depth, default=0), 0, -1):
+        for path in by_depth.get(depth, ()):
+            if is_root(path):
+                continue
+            parent = path.rpartition("/")[0]
+            weight[parent] += weight[path]
+            children[parent].append(path)
+            by_depth[depth - 1].add(parent)
+
+    roots = [path for path in weight if is_root(path)]
+    total_weight = sum(weight[root] for root in roots)
+    target = total_weight / shard_count
+    max_units = shard_count * MAX_UNITS_PER_SHARD
+
+    # Split the heaviest directory until every unit fits in one shard's share.
+    pending = [(-weight[root], root) for root in roots]
+    heapq.heapify(pending)
+    units: List[str] = []
+    split_directories: List[str] = []
+    while pending:
+        negative_weight, path = heapq.heappop(pending)
+        kids = children.get(path, [])
+        splittable = (
+            -negative_weight > target
+            and kids
+            and len(kids) <= MAX_SPLIT_CHILDREN
+            and len(units) + len(pending) + len(kids) <= max_units
+        )
+        if not splittable:
+            units.append(path)
+            continue
+        split_directories.append(path)
+        for kid in kids:
+            heapq.heappush(pending, (-weight[kid], kid))
+
+    # Longest-processing-time-first assignment onto the lightest shard.
+    loads = [(0, index) for index in range(shard_count)]
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    for path in sorted(units, key=lambda unit: (-weight[unit], unit)):
+        load, index = heapq.heappop(loads)
+        shards[index].append(path)
+        heapq.heappush(loads, (load + weight[path], index))
+
+    shard_sizes = [sum(weight[path] for path in shard) for shard in shards]
+    non_empty = [
+        (sorted(shard), size) for shard, size in zip(shards, shard_sizes) if shard
+    ]
+    if len(non_empty) < 2:
+        return None
+    return RestoreShardPlan(
+        shards=[shard for shard, _ in non_empty],
+        split_directories=sorted(split_directories, key=lambda p: (-_depth(p), p)),
+        total_size=total_size,
+        shard_sizes=[size for _, size in non_empty],
+    )
+
+
+def shard_patterns(paths: List[str]) -> str:
+    """Patterns selecting ``paths`` recursively and nothing else."""
+    lines = [f"+ pp:{path}" for path in paths]
+    lines.append("- sh:**")
+    return "\n".join(lines) + "\n"
+
+
+def directory_patterns(directories: List[str]) -> str:
+    """Patterns selecting only the directory entries themselves."""
+    lines = [f"+ pf:{path}" for path in directories]
+    lines.append("- sh:**")
+    return "\n".join(lines) + "\n"
+
+
+def write_patterns_file(content: str) -> str:
+    """Write a patterns file; the caller removes it."""
+    fd, path = tempfile.mkstemp(prefix="borg-ui-restore-", suffix=".patterns")
+    with os.fdopen(fd, "w", encoding="utf-8", errors="surrogateescape") as handle:
+        handle.write(content)
+    return path
+
+
+def aggregate_returncode(returncodes: List[Optional[int]]) -> Optional[int]:
+    """One exit code for all shards: the first failure, else the worst warning."""
+    if any(code is None for code in returncodes):
+        return None
+    for code in returncodes:
+        if code not in _SUCCESS_RETURNCODES:
+            return code
+    return max(returncodes, default=0)
+
+
+class ShardedExtract:
+    """Concurrent `borg extract` processes presented as one process.
+
+    Exposes ``pid``/``returncode``/``terminate``/``kill``/``wait`` so it can
+    sit in ``RestoreService.running_processes`` and be cancelled like a
+    single extract. A shard that fails stops the others. ``final_command``
+    runs alone once every shard succeeded.
+    """
+
+    def __init__(
+        self,
+        commands: List[List[str]],
+        env: dict,
+        cwd: str,
+        final_command: Optional[List[str]] = None,
+        priority: Optional[ProcessPriority] = None,
+    ):
+        self.commands = commands
+        self.final_command = final_command
+        self.env = env
+        self.cwd = cwd
+        self.priority = priority
+        self.processes: list = []
+        self.progress = [ExtractProgress() for _ in commands]
+        self.current_file = ""
+        self.stdout_lines: deque = deque(maxlen=MAX_LOG_LINES)
+        self.stderr_lines: deque = deque(maxlen=MAX_LOG_LINES)
+        self.failed_returncode: Optional[int] = None
+        self._cancelled = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.processes[0].pid if self.processes else None
+
+    @property
+    def returncode(self) -> Optional[int]:
+        expected = len(self.commands) + (1 if self.final_command else 0)
+        codes = [process.returncode for process in self.processes]
+        if self.failed_returncode is not None and None not in codes:
+            return self.failed_returncode
+        if len(codes) < expected:
+            return None
+        return aggregate_returncode(codes)
+
+    @property
+    def restored_size(self) -> int:
+        return sum(shard.restored for shard in self.progress)
+
+    @property
+    def nfiles(self) -> int:
+        return sum(shard.nfiles for shard in self.progress)
+
+    def terminate(self) -> None:
+        self._cancelled = True
+        self._signal_all("terminate")
+
+    def kill(self) -> None:
+        self._cancelled = True
+        self._signal_all("kill")
+
+    def _signal_all(self, action: str) -> None:
+        for process in self.processes:
+            if process.returncode is None:
+                try:
+                    getattr(process, action)()
+                except ProcessLookupError:
+                    pass
+
+    async def wait(self) -> Optional[int]:
+        await asyncio.gather(*(process.wait() for process in self.processes))
+        return self.returncode
+
+    async def _spawn(self, command: List[str]):
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.DEVNULL,
+            cwd=self.cwd,
+            env=self.env,
+        )
+        if self.priority is not None:
+            self.priority.apply(process.pid)
+        self.processes.append(process)
+        return process
+
+    async def run(
+        self, on_progress: Optional[Callable[["ShardedExtract"], None]] = None
+    ) -> Optional[int]:
+        """Start every shard, follow their progress and wait for all of them."""
+        try:
+            for command in self.commands:
+                if self._cancelled:
+                    break
+                await self._spawn(command)
+        except Exception:
+            self._signal_all("kill")
+            await self.wait()
+            raise
+        if self._cancelled:
+            self._signal_all("terminate")
+        await asyncio.gather(
+            *(
+                self._follow(process, index, on_progress)
+                for index, process in enumerate(list(self.processes))
+            )
+        )
+        if (
+            self.final_command
+            and not self._cancelled
+            and self.failed_returncode is None
+        ):
+            await self._follow(await self._spawn(self.final_command), None, None)
+        return self.returncode
+
+    async def _follow(self, process, index: Optional[int], on_progress) -> None:
+        def on_stderr(line: str) -> None:
+            message = parse_log_json(line)
+            if index is None or not self.progress[index].feed(message):
+                if not is_progress_message(message):
+                    self.stderr_lines.append(line)
+                return
+            self.current_file = self.progress[index].current_file
+            if on_progress:
+                on_progress(self)
+
+        await asyncio.gather(
+            read_lines(process.stderr, on_stderr),
+            read_lines(process.stdout, self.stdout_lines.append),
+        )
+        await process.wait()
+        if (
+            process.returncode not in _SUCCESS_RETURNCODES
+            and self.failed_returncode is None
+            and not self._cancelled
+        ):
+            self.failed_returncode = process.returncode
+            logger.warning(
+                "Restore shard failed, stopping the others",
+                shard=index,
+                returncode=process.returncode,
+            )
+            self._signal_all("terminate")
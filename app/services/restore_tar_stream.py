@@ -0,0 +1,307 @@
+"""
+Stream a restore to an SSH destination as a tar archive.
+
+Extracting through an SSHFS mount costs at least one SFTP round trip per file
+operation (create, write, chmod, utime, ...), which dominates restores of many
+small files over a high-latency link. Instead, `borg export-tar` writes the
+selected paths to stdout and a single SSH session unpacks them with `tar -x`
+on the destination host:
+
+    borg export-tar REPO::ARCHIVE - PATHS  |  ssh host 'tar -xpf - -C DEST'
+
+The bytes are copied through this process so progress can be reported from
+the stream itself; the expected size comes from a cached archive listing
+when the archive has been browsed. Hosts without a usable shell or `tar`
+(SFTP-only storage) keep using SSHFS.
+"""
+
+import asyncio
+import shlex
+from collections import deque
+from typing import AsyncIterator, Callable, Iterable, List, Optional
+
+import structlog
+
+from app.services.borg_progress import MAX_LOG_LINES, parse_log_json
+from app.services.cache_service import archive_cache
+from app.utils.borg_env import get_standard_ssh_opts
+from app.utils.process_priority import ProcessPriority
+from app.utils.ssh_paths import apply_ssh_command_prefix
+
+logger = structlog.get_logger()
+
+PIPE_CHUNK_SIZE = 256 * 1024
+TAR_BLOCK_SIZE = 512
+TAR_RECORD_SIZE = 20 * TAR_BLOCK_SIZE
+# ustar headers hold names up to 100 bytes; longer ones get an extra
+# GNU long-name header plus the padded name.
+TAR_NAME_FIELD_SIZE = 100
+PROBE_TIMEOUT_SECONDS = 15
+# Reported when borg finished but the remote tar did not; anything >= 2
+# fails the restore.
+REMOTE_FAILURE_RETURNCODE = 2
+
+
+def _padded(size: int) -> int:
+    return -(-size // TAR_BLOCK_SIZE) * TAR_BLOCK_SIZE
+
+
+def _selected(path: str, selected: List[str]) -> bool:
+    if not selected:
+        return True
+    return any(path == prefix or path.startswith(f"{prefix}/") for prefix in selected)
+
+
+def estimate_tar_size(items: Iterable[dict], paths: Optional[List[str]]) -> int:
+    """Size of the tar stream `borg export-tar` writes for ``paths``.
+
+    ``items`` is a raw archive listing (``{"path", "type", "size"}``). Every
+    entry costs a header block; regular files add their content padded to
+    whole blocks. The result is exact for plain trees and close enough for
+    progress otherwise (hard links and xattrs are not modelled).
+    """
+    selected = [path.strip("/") for path in paths or [] if path.strip("/")]
+    total = 0
+    for item in items:
+        path = str(item.get("path") or "").strip("/")
+        if not path or not _selected(path, selected):
+            continue
+        total += TAR_BLOCK_SIZE
+        if len(path.encode("utf-8", errors="surrogateescape")) > TAR_NAME_FIELD_SIZE:
+            total += TAR_BLOCK_SIZE + _padded(len(path) + 1)
+        size = item.get("size")
+        if item.get("type") in ("-", "file") and isinstance(size, int):
+            total += _padded(size)
+    # End-of-archive marker, then the last record is filled up.
+    total += 2 * TAR_BLOCK_SIZE
+    return -(-total // TAR_RECORD_SIZE) * TAR_RECORD_SIZE
+
+
+async def estimate_cached_tar_size(
+    repository_id: int, archive_name: str, paths: Optional[List[str]]
+) -> Optional[int]:
+    """Estimate the stream size from a listing the archive browser cached."""
+    items = await archive_cache.get_archive_listing(repository_id, archive_name)
+    if not items:
+        return None
+    return estimate_tar_size(items, paths)
+
+
+def build_remote_ssh_command(
+    connection, key_file: Optional[str], remote_command: str
+) -> List[str]:
+    """Return the ssh argv running ``remote_command`` on ``connection``."""
+    return [
+        "ssh",
+        *get_standard_ssh_opts(key_file, keepalive=True),
+        "-o",
+        "ConnectTimeout=10",
+        "-p",
+        str(connection.port or 22),
+        f"{connection.username}@{connection.host}",
+        remote_command,
+    ]
+
+
+def build_remote_untar_command(destination: str, connection) -> str:
+    """Shell command that unpacks a tar stream from stdin into ``destination``."""
+    target = shlex.quote(
+        apply_ssh_command_prefix(destination, connection.ssh_path_prefix)
+    )
+    return f"mkdir -p {target} && tar -xpf - -C {target}"
+
+
+async def probe_remote_tar(
+    connection, key_file: Optional[str], timeout: int = PROBE_TIMEOUT_SECONDS
+) -> bool:
+    """True when the destination host runs shell commands and has `tar`."""
+    cmd = build_remote_ssh_command(
+        connection, key_file, "command -v tar >/dev/null && command -v mkdir"
+    )
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as exc:
+        logger.info("Cannot run ssh for tar probe", error=str(exc))
+        return False
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        _signal(process, "kill")
+        await process.wait()
+        logger.info("Remote tar probe timed out", host=connection.host)
+        return False
+    if process.returncode != 0:
+        logger.info(
+            "Remote tar unavailable",
+            host=connection.host,
+            returncode=process.returncode,
+            stderr=stderr.decode("utf-8", errors="replace").strip()[-500:],
+        )
+        return False
+    return True
+
+
+def _signal(process, action: str) -> None:
+    if process.returncode is not None:
+        return
+    try:
+        getattr(process, action)()
+    except ProcessLookupError:
+        pass
+
+
+async def _iter_lines(stream) -> AsyncIterator[str]:
+    buffer = b""
+    while True:
+        chunk = await stream.read(8192)
+        if not chunk:
+            break
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            text = line.decode("utf-8", errors="replace").strip()
+            if text:
+                yield text
+    text = buffer.decode("utf-8", errors="replace").strip()
+    if text:
+        yield text
+
+
+class TarStreamPipeline:
+    """`borg export-tar` piped into a remote `tar -x` over one SSH session.
+
+    Exposes ``pid``/``returncode``/``terminate``/``kill``/``wait`` so it can
+    sit in ``RestoreService.running_processes`` and be cancelled like a
+    single extract process.
+    """
+
+    def __init__(self, producer, consumer):
+        self.producer = producer
+        self.consumer = consumer
+        self.bytes_sent = 0
+        self.nfiles = 0
+        self.current_file = ""
+        self.stderr_lines: deque = deque(maxlen=MAX_LOG_LINES)
+
+    @classmethod
+    async def start(
+        cls,
+        export_cmd: List[str],
+        env: dict,
+        remote_cmd: List[str],
+        priority: Optional[ProcessPriority] = None,
+    ) -> "TarStreamPipeline":
+        producer = await asyncio.create_subprocess_exec(
+            *export_cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        if priority is not None:
+            priority.apply(producer.pid)
+        try:
+            consumer = await asyncio.create_subprocess_exec(
+                *remote_cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except Exception:
+            _signal(producer, "kill")
+            await producer.wait()
+            raise
+        return cls(producer, consumer)
+
+    @property
+    def pid(self) -> int:
+        return self.producer.pid
+
+    @property
+    def returncode(self) -> Optional[int]:
+        if self.producer.returncode is None or self.consumer.returncode is None:
+            return None
+        if self.consumer.returncode != 0:
+            return max(REMOTE_FAILURE_RETURNCODE, self.producer.returncode)
+        return self.producer.returncode
+
+    def terminate(self) -> None:
+        _signal(self.producer, "terminate")
+        _signal(self.consumer, "terminate")
+
+    def kill(self) -> None:
+        _signal(self.producer, "kill")
+        _signal(self.consumer, "kill")
+
+    async def wait(self) -> Optional[int]:
+        await asyncio.gather(self.producer.wait(), self.consumer.wait())
+        return self.returncode
+
+    async def run(
+        self,
+        on_progress: Optional[Callable[["TarStreamPipeline"], None]] = None,
+        chunk_size: int = PIPE_CHUNK_SIZE,
+    ) -> Optional[int]:
+        """Copy the archive stream to the remote tar until both sides exit."""
+        await asyncio.gather(
+            self._pump(on_progress, chunk_size),
+            self._read_export_log(on_progress),
+            self._read_remote_errors(),
+        )
+        return await self.wait()
+
+    async def _pump(self, on_progress, chunk_size: int) -> None:
+        stdin = self.consumer.stdin
+        try:
+            while True:
+                chunk = await self.producer.stdout.read(chunk_size)
+                if not chunk:
+                    break
+                stdin.write(chunk)
+                await stdin.drain()
+                if stdin.is_closing():
+                    # asyncio drops writes to a broken pipe instead of raising.
+                    raise BrokenPipeError()
+                self.bytes_sent += len(chunk)
+                if on_progress:
+                    on_progress(self)
+        except (BrokenPipeError, ConnectionResetError):
+            # The remote side exited early; its stderr says why. Stop borg
+            # instead of streaming the rest of the archive into the void.
+            _signal(self.producer, "terminate")
+            # Read to EOF: asyncio only reports the exit once every pipe of
+            # the process is closed.
+            while await self.producer.stdout.read(chunk_size):
+                pass
+        finally:
+            stdin.close()
+            try:
+                await stdin.wait_closed()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    async def _read_export_log(self, on_progress) -> None:
+        async for line in _iter_lines(self.producer.stderr):
+            message = parse_log_json(line)
+            if message is None:
+                self.stderr_lines.append(line)
+                continue
+            if message.get("name") == "borg.output.list":
+                # One --list line per entry written to the stream.
+                self.nfiles += 1
+                self.current_file = str(message.get("message") or "").strip()
+                if on_progress:
+                    on_progress(self)
+            elif message.get("type") == "log_message" and message.get("message"):
+                self.stderr_lines.append(str(message["message"]))
+            else:
+                self.stderr_lines.append(line)
+
+    async def _read_remote_errors(self) -> None:
+        async for line in _iter_lines(self.consumer.stderr):
+            self.stderr_lines.append(f"remote: {line}")
@@ -12,6 +12,8 @@ import time
 from typing import Dict, Optional
 import structlog
 
+from app.utils.process_priority import ProcessPriority, resolve_process_priority
+
 logger = structlog.get_logger()
 
 
@@ -20,6 +22,7 @@ async def execute_script(
     timeout: float = 30.0,
     env: Optional[Dict[str, str]] = None,
     context: str = "script",
+    priority: Optional[ProcessPriority] = None,
 ) -> Dict:
     """
     Execute a shell script with bash.
@@ -32,6 +35,7 @@ async def execute_script(
         timeout: Timeout in seconds
         env: Environment variables (defaults to current environment if None)
         context: Context string for logging (e.g., "test", "pre-backup hook")
+        priority: Process priority (defaults to the server's script class)
 
     Returns:
         Dict with:
@@ -58,6 +62,8 @@ async def execute_script(
         # Use environment if provided, otherwise copy current environment
         script_env = env if env is not None else os.environ.copy()
 
+        priority = priority or resolve_process_priority("script")
+
         # Execute script with bash explicitly
         # This ensures bash-specific syntax (arrays, etc.) works correctly
         process = await asyncio.create_subprocess_exec(
@@ -67,6 +73,7 @@ async def execute_script(
             stderr=asyncio.subprocess.PIPE,
             env=script_env,
         )
+        priority.apply(process.pid)
 
         # Wait for completion with timeout
         try:
@@ -0,0 +1,217 @@
+"""Source size estimates for backup progress without a full ``du`` walk.
+
+Progress and ETA need the expected size of a backup's sources. Walking the
+whole tree with ``du`` costs as much I/O as Borg's own files-cache scan, so
+each successful backup stores a baseline on its repository: the archive's
+``original_size`` and a bounded breadth-first sample of the local source
+directories (directory mtime plus the bytes of the files directly inside).
+
+The next backup of the same sources re-samples those directories. When the
+baseline is recent enough and only a small share of the sampled directories
+changed, the estimate is the previous ``original_size`` adjusted by the byte
+difference of the sample; otherwise the caller falls back to ``du``.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+# Baselines kept per repository, one per distinct set of sources and excludes
+MAX_BASELINES = 8
+
+
+def source_fingerprint(
+    source_paths: list[str], exclude_patterns: Optional[list[str]] = None
+) -> str:
+    """Stable identifier of a backup's sources and excludes."""
+    payload = json.dumps(
+        [sorted(source_paths), sorted(exclude_patterns or [])], separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def sample_directories(
+    source_paths: list[str], max_dirs: int, source_labels: Optional[list[str]] = None
+) -> dict[str, list]:
+    """Breadth-first ``[mtime_ns, file_bytes]`` of up to ``max_dirs`` directories.
+
+    Entries are keyed by the matching ``source_labels`` entry instead of the
+    path that was read, so per-job snapshot staging paths compare across jobs.
+    Remote (``ssh://``) sources are skipped. A source that is a file is sampled
+    as its own entry; a missing source is recorded as ``None`` so that its
+    reappearance counts as a change.
+    """
+    sample: dict[str, list] = {}
+    queue = deque()
+    sources = sorted(zip(source_labels or source_paths, source_paths))
+    for label, source_path in sources:
+        if source_path.startswith("ssh://"):
+            continue
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            sample[label] = None
+            continue
+        if os.path.isdir(source_path):
+            queue.append((source_path, label))
+        else:
+            sample[label] = [stat.st_mtime_ns, stat.st_size]
+
+    while queue and len(sample) < max_dirs:
+        directory, label = queue.popleft()
+        file_bytes = 0
+        subdirectories = []
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            file_bytes += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            sample[label] = None
+            continue
+        sample[label] = [mtime_ns, file_bytes]
+        queue.extend(
+            (path, os.path.join(label, os.path.basename(path)))
+            for path in sorted(subdirectories)
+        )
+    return sample
+
+
+def estimate_from_baseline(
+    baseline: Optional[dict],
+    sample: dict[str, list],
+    *,
+    now: datetime,
+    max_age_days: int,
+    changed_threshold: float,
+) -> tuple[Optional[int], str]:
+    """Estimated size and the reason, or ``(None, reason)`` to fall back to du."""
+    if not baseline or not baseline.get("original_size"):
+        return None, "no_baseline"
+
+    recorded_at = datetime.fromisoformat(baseline["recorded_at"])
+    if max_age_days > 0 and now - recorded_at > timedelta(days=max_age_days):
+        return None, "baseline_expired"
+
+    previous = baseline.get("dirs") or {}
+    paths = set(previous) | set(sample)
+    if not paths:
+        # Only remote sources: nothing was sampled to tell whether they changed
+        return None, "no_change_signal"
+    changed = [path for path in paths if previous.get(path) != sample.get(path)]
+    if len(changed) / len(paths) > changed_threshold:
+        return None, "too_many_changes"
+
+    def sampled_bytes(entries: dict) -> int:
+        return sum(entry[1] for entry in entries.values() if entry)
+
+    estimate = (
+        baseline["original_size"] + sampled_bytes(sample) - sampled_bytes(previous)
+    )
+    return max(estimate, 0), "baseline"
+
+
+class SourceSizeEstimator:
+    def __init__(self):
+        # Sample taken when a backup started, stored as its baseline on success
+        self._pending: dict[int, tuple[str, dict[str, list]]] = {}
+        # Jobs between begin() and discard(); a sample that finishes after its
+        # job ended is dropped instead of kept forever
+        self._active: set[int] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return settings.source_size_estimation == "incremental"
+
+    def begin(self, job_id: int) -> None:
+        """Mark a backup as running so its sample can be kept until it ends."""
+        self._active.add(job_id)
+
+    async def estimate(
+        self,
+        repository,
+        job_id: int,
+        source_paths: list[str],
+        exclude_patterns: Optional[list[str]] = None,
+        now: Optional[datetime] = None,
+        source_labels: Optional[list[str]] = None,
+    ) -> Optional[int]:
+        """Estimate from the repository's baseline; ``None`` means run du.
+
+        ``source_labels`` names the configured sources when ``source_paths``
+        are per-job snapshot staging paths.
+        """
+        if not self.enabled:
+            return None
+
+        fingerprint = source_fingerprint(
+            source_labels or source_paths, exclude_patterns
+        )
+        sample = await asyncio.to_thread(
+            sample_directories,
+            source_paths,
+            max(1, settings.source_size_sample_dirs),
+            source_labels,
+        )
+        if job_id in self._active:
+            self._pending[job_id] = (fingerprint, sample)
+
+        baselines = getattr(repository, "source_size_baselines", None) or {}
+        estimate, reason = estimate_from_baseline(
+            baselines.get(fingerprint),
+            sample,
+            now=now or datetime.now(timezone.utc),
+            max_age_days=settings.source_size_max_age_days,
+            changed_threshold=settings.source_size_changed_threshold,
+        )
+        logger.info(
+            "Source size estimate",
+            job_id=job_id,
+            estimate=estimate,
+            reason=reason,
+            sampled_dirs=len(sample),
+        )
+        return estimate
+
+    def record_baseline(self, repository, job, now: Optional[datetime] = None) -> bool:
+        """Store the finished job's size as the baseline for its sources."""
+        pending = self._pending.pop(job.id, None)
+        if pending is None or repository is None or not job.original_size:
+            return False
+
+        fingerprint, sample = pending
+        baselines = dict(getattr(repository, "source_size_baselines", None) or {})
+        baselines[fingerprint] = {
+            "original_size": job.original_size,
+            "job_id": job.id,
+            "recorded_at": (now or datetime.now(timezone.utc)).isoformat(),
+            "dirs": sample,
+        }
+        newest = sorted(
+            baselines.items(), key=lambda item: item[1]["recorded_at"], reverse=True
+        )
+        repository.source_size_baselines = dict(newest[:MAX_BASELINES])
+        return True
+
+    def discard(self, job_id: int) -> None:
+        self._active.discard(job_id)
+        self._pending.pop(job_id, None)
+
+
+source_size_estimator = SourceSizeEstimator()
@@ -4,103 +4,290 @@ Stats Refresh Scheduler
 Periodically refreshes repository statistics (archive count, size, last archive date)
 for all repositories. This helps keep dashboard and repository data up-to-date,
 especially for observe-only repositories where backups are managed externally.
+
+Repositories are refreshed concurrently, bounded globally and per host, each with
+its own database session and time budget. A cheap directory probe runs first so
+repositories that have not changed since their last refresh are skipped.
 """
 
 import asyncio
+from collections import defaultdict
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
 import structlog
+from app.config import settings as app_settings
 from app.database.models import Repository, SystemSettings
 from app.database.database import SessionLocal
 from app.core.borg_router import BorgRouter
+from app.services.archive_list_cache import probe_repository_fingerprint
+from app.services.repository_stats import needs_full_size_refresh
+from app.utils.datetime_utils import serialize_datetime
 
 logger = structlog.get_logger()
 
 
+@dataclass
+class StatsRefreshProgress:
+    """Counters for one refresh pass, readable while the pass runs."""
+
+    total: int = 0
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    timed_out: int = 0
+    running: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def in_progress(self) -> bool:
+        return self.started_at is not None and self.finished_at is None
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["started_at"] = serialize_datetime(self.started_at)
+        data["finished_at"] = serialize_datetime(self.finished_at)
+        data["in_progress"] = self.in_progress
+        return data
+
+
+def repository_host_key(repo: Repository) -> str:
+    """Group repositories that share a network endpoint for per-host limits."""
+    if repo.agent_machine_id and (repo.executor_type or "server") == "agent":
+        return f"agent:{repo.agent_machine_id}"
+    path = repo.path or ""
+    if "://" in path:
+        parsed = urlparse(path)
+        if parsed.hostname:
+            return f"{parsed.scheme}:{parsed.hostname}"
+    if repo.host:
+        return f"ssh:{repo.host}"
+    if repo.connection_id:
+        return f"connection:{repo.connection_id}"
+    return "local"
+
+
 class StatsRefreshScheduler:
     """Scheduler for periodic repository stats refresh"""
 
     def __init__(self):
         self.running = False
         self._current_interval_minutes = 60  # Default interval
+        self.progress = StatsRefreshProgress()
+        self._pass_lock = asyncio.Lock()
+        # Probe fingerprint recorded after each successful refresh, by repo id
+        self._fingerprints: Dict[int, str] = {}
+
+    @property
+    def is_refreshing(self) -> bool:
+        return self._pass_lock.locked()
 
     async def refresh_all_repository_stats(self):
         """
         Refresh stats for all repositories.
         Called periodically based on the configured interval.
         """
+        await self.refresh_repositories()
+
+    async def refresh_repositories(
+        self, repo_ids: Optional[List[int]] = None, *, force: bool = False
+    ) -> Optional[StatsRefreshProgress]:
+        """Run one concurrent refresh pass.
+
+        ``repo_ids`` limits the pass to those repositories (default: all).
+        ``force`` bypasses the unchanged-repository probe and always resyncs
+        sizes with a full ``borg info``. Returns the pass's progress, or None
+        when another pass is already running.
+        """
+        if self._pass_lock.locked():
+            logger.info(
+                "Stats refresh already in progress, skipping",
+                progress=self.progress.to_dict(),
+            )
+            return None
+
+        async with self._pass_lock:
+            try:
+                return await self._run_pass(repo_ids, force=force)
+            except Exception as e:
+                logger.error("Error in refresh_all_repository_stats", error=str(e))
+                return self.progress
+
+    async def _run_pass(
+        self, repo_ids: Optional[List[int]], *, force: bool
+    ) -> StatsRefreshProgress:
+        now = datetime.utcnow()
         db = SessionLocal()
         try:
-            now = datetime.utcnow()
+            query = db.query(Repository)
+            if repo_ids is not None:
+                query = query.filter(Repository.id.in_(repo_ids))
+            targets = [(repo.id, repository_host_key(repo)) for repo in query.all()]
+        finally:
+            db.close()
 
-            # Get all repositories
-            repos = db.query(Repository).all()
+        progress = StatsRefreshProgress(total=len(targets), started_at=now)
+        self.progress = progress
 
-            if not repos:
-                logger.debug("No repositories to refresh stats for", time=now)
-                return
+        if not targets:
+            logger.debug("No repositories to refresh stats for", time=now)
+            progress.finished_at = datetime.utcnow()
+            return progress
 
-            logger.info("Starting repository stats refresh", count=len(repos), time=now)
+        global_limit = max(1, app_settings.stats_refresh_concurrency)
+        host_limit = max(1, app_settings.stats_refresh_per_host_concurrency)
+        logger.info(
+            "Starting repository stats refresh",
+            count=len(targets),
+            concurrency=global_limit,
+            per_host_concurrency=host_limit,
+            time=now,
+        )
 
-            success_count = 0
-            error_count = 0
+        global_slots = asyncio.Semaphore(global_limit)
+        host_slots = defaultdict(lambda: asyncio.Semaphore(host_limit))
+
+        async def refresh_target(repo_id: int, host_key: str):
+            # Take the host slot first so a busy host cannot hold global slots
+            # that other hosts could use.
+            async with host_slots[host_key]:
+                async with global_slots:
+                    progress.running += 1
+                    try:
+                        outcome = await self._refresh_one(repo_id, force=force)
+                    finally:
+                        progress.running -= 1
+            progress.completed += 1
+            if outcome == "refreshed":
+                progress.succeeded += 1
+            elif outcome == "skipped":
+                progress.skipped += 1
+            else:
+                progress.failed += 1
+                if outcome == "timeout":
+                    progress.timed_out += 1
+            logger.debug(
+                "Stats refresh progress",
+                repo_id=repo_id,
+                outcome=outcome,
+                completed=progress.completed,
+                total=progress.total,
+            )
 
-            for repo in repos:
-                try:
-                    result = await BorgRouter(repo).update_stats(db)
-                    if result:
-                        success_count += 1
-                        logger.debug(
-                            "Refreshed stats for repository",
-                            repo_id=repo.id,
-                            repo_name=repo.name,
-                        )
-                    else:
-                        error_count += 1
-                        logger.warning(
-                            "Failed to refresh stats for repository",
-                            repo_id=repo.id,
-                            repo_name=repo.name,
-                        )
-
-                except Exception as e:
-                    error_count += 1
-                    logger.error(
-                        "Error refreshing stats for repository",
-                        repo_id=repo.id,
-                        repo_name=repo.name if repo else "Unknown",
-                        error=str(e),
-                    )
-                    # Continue with other repositories even if one fails
-                    continue
+        await asyncio.gather(
+            *(refresh_target(repo_id, host_key) for repo_id, host_key in targets)
+        )
+        progress.finished_at = datetime.utcnow()
 
+        db = SessionLocal()
+        try:
             # Update last_stats_refresh timestamp
             settings = db.query(SystemSettings).first()
             if settings:
-                settings.last_stats_refresh = datetime.utcnow()
+                settings.last_stats_refresh = progress.finished_at
                 db.commit()
 
             # Publish one full MQTT snapshot after batch refresh commits.
-            try:
-                from app.services.mqtt_service import mqtt_service
+            if progress.succeeded:
+                try:
+                    from app.services.mqtt_service import mqtt_service
+
+                    mqtt_service.request_sync(reason="repository refresh")
+                    logger.info("Synced MQTT state after stats refresh")
+                except Exception as mqtt_error:
+                    logger.warning(
+                        "Failed to sync MQTT state after stats refresh",
+                        error=str(mqtt_error),
+                    )
+        finally:
+            db.close()
+
+        logger.info(
+            "Completed repository stats refresh",
+            total=progress.total,
+            success=progress.succeeded,
+            skipped=progress.skipped,
+            errors=progress.failed,
+            timed_out=progress.timed_out,
+            duration_seconds=round(
+                (progress.finished_at - progress.started_at).total_seconds(), 1
+            ),
+        )
+        return progress
+
+    async def _refresh_one(self, repo_id: int, *, force: bool) -> str:
+        """Refresh one repository in its own session.
+
+        Returns ``refreshed``, ``skipped``, ``failed`` or ``timeout``.
+        """
+        db = SessionLocal()
+        repo = None
+        try:
+            repo = db.query(Repository).filter(Repository.id == repo_id).first()
+            if not repo:
+                return "skipped"
 
-                mqtt_service.sync_state_with_db(db, reason="repository refresh")
-                logger.info("Synced MQTT state after stats refresh")
-            except Exception as mqtt_error:
+            fingerprint = await probe_repository_fingerprint(
+                repo, db, timeout=app_settings.stats_refresh_probe_timeout
+            )
+            if (
+                not force
+                and fingerprint is not None
+                and self._fingerprints.get(repo.id) == fingerprint
+            ):
+                logger.debug(
+                    "Repository unchanged since last refresh, skipping",
+                    repo_id=repo.id,
+                    repo_name=repo.name,
+                )
+                return "skipped"
+
+            # Sizes maintained incrementally by our own writes only need the
+            # archive list; full `borg info` runs when stale or forced.
+            result = await asyncio.wait_for(
+                BorgRouter(repo).update_stats(
+                    db, refresh_size=force or needs_full_size_refresh(repo)
+                ),
+                timeout=app_settings.stats_refresh_repository_timeout,
+            )
+            if not result:
+                self._fingerprints.pop(repo.id, None)
                 logger.warning(
-                    "Failed to sync MQTT state after stats refresh",
-                    error=str(mqtt_error),
+                    "Failed to refresh stats for repository",
+                    repo_id=repo.id,
+                    repo_name=repo.name,
                 )
-
-            logger.info(
-                "Completed repository stats refresh",
-                total=len(repos),
-                success=success_count,
-                errors=error_count,
-                duration_repos=len(repos),
+                return "failed"
+
+            if fingerprint is not None:
+                self._fingerprints[repo.id] = fingerprint
+            logger.debug(
+                "Refreshed stats for repository",
+                repo_id=repo.id,
+                repo_name=repo.name,
             )
-
+            return "refreshed"
+        except asyncio.TimeoutError:
+            self._fingerprints.pop(repo_id, None)
+            logger.warning(
+                "Timed out refreshing stats for repository",
+                repo_id=repo_id,
+                timeout_seconds=app_settings.stats_refresh_repository_timeout,
+            )
+            return "timeout"
         except Exception as e:
-            logger.error("Error in refresh_all_repository_stats", error=str(e))
+            self._fingerprints.pop(repo_id, None)
+            logger.error(
+                "Error refreshing stats for repository",
+                repo_id=repo_id,
+                repo_name=repo.name if repo else "Unknown",
+                error=str(e),
+            )
+            return "failed"
         finally:
             db.close()
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, time, timezone
 from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -68,3 +69,20 @@ def resolve_scheduled_upload_ratelimit(
             if isinstance(value, int) and value > 0:
                 return value
     return base_upload_ratelimit_kib
+
+
+@dataclass(frozen=True)
+class UploadRatelimitSchedule:
+    """A job's base upload limit plus the policy windows that override it."""
+
+    base_upload_ratelimit_kib: int | None
+    policies: list[dict[str, Any]] = field(default_factory=list)
+    timezone_name: str = "UTC"
+
+    def resolve(self, run_at: datetime) -> int | None:
+        return resolve_scheduled_upload_ratelimit(
+            base_upload_ratelimit_kib=self.base_upload_ratelimit_kib,
+            policies=self.policies,
+            run_at=run_at,
+            timezone_name=self.timezone_name,
+        )
@@ -82,6 +82,7 @@ class BackupV2Service:
             archive_name=archive_name,
             passphrase=repo.passphrase,
             remote_path=repo.remote_path,
+            repository_record=repo,
         )
 
 
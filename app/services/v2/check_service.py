@@ -16,8 +16,11 @@ from app.database.models import CheckJob, Repository
 from app.database.database import SessionLocal
 from app.core.borg2 import _get_borg2_binary
 from app.config import settings
+from app.services.borg_progress import MessageThrottle
+from app.services.check_verify_rotation import run_verify_rotation
 from app.utils.db_retries import commit_with_retry
 from app.utils.borg_env import build_repository_borg_env, cleanup_temp_key_file
+from app.utils.process_priority import resolve_process_priority
 from app.utils.ssh_utils import (
     resolve_repo_ssh_key_file,  # noqa: F401
 )  # Backward-compatible patch target for tests
@@ -93,6 +96,14 @@ class CheckV2Service:
                 show_progress=True,
             )
 
+            if isinstance(job.verify_archives_per_run, int) and (
+                job.verify_archives_per_run > 0
+            ):
+                await run_verify_rotation(
+                    db, job, repo, env, self.running_processes, self.log_dir
+                )
+                return
+
             borg_cmd = _get_borg2_binary()
             cmd = [
                 borg_cmd,
@@ -136,12 +147,15 @@ class CheckV2Service:
                 command=" ".join(cmd),
             )
 
+            priority = resolve_process_priority("check", repo)
+            job.process_priority = priority.to_dict()
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 env=env,
             )
+            priority.apply(process.pid)
 
             process_start_time = _get_process_start_time(process.pid)
 
@@ -163,8 +177,7 @@ class CheckV2Service:
             last_commit_time = asyncio.get_event_loop().time()
             COMMIT_INTERVAL = 1.0
             first_progress_committed = False
-            last_progress_update: dict = {}
-            PROGRESS_THROTTLE = 2.0
+            progress_throttle = MessageThrottle(interval=2.0)
             log_buffer: list = []
             MAX_BUFFER = 1000
 
@@ -220,13 +233,8 @@ class CheckV2Service:
 
                                     if message:
                                         progress_msg = f"{message} ({current}/{total})"
-                                        if (
-                                            now
-                                            - last_progress_update.get(progress_msg, 0)
-                                            >= PROGRESS_THROTTLE
-                                        ):
+                                        if progress_throttle.allow(progress_msg, now):
                                             job.progress_message = progress_msg
-                                            last_progress_update[progress_msg] = now
 
                                     if not finished and total > 0:
                                         job.progress = int((current / total) * 100)
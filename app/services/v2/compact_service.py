@@ -19,9 +19,13 @@ from app.database.models import CompactJob, Repository
 from app.database.database import SessionLocal
 from app.core.borg2 import _get_borg2_binary
 from app.config import settings
+from app.services.borg_progress import MessageThrottle
+from app.services.archive_list_cache import archive_list_cache
 from app.services.maintenance_state import apply_compact_completion
+from app.services.repository_stats import apply_compact_result
 from app.utils.db_retries import commit_with_retry
 from app.utils.borg_env import build_repository_borg_env, cleanup_temp_key_file
+from app.utils.process_priority import resolve_process_priority
 from app.utils.ssh_utils import (
     resolve_repo_ssh_key_file,  # noqa: F401
 )  # Backward-compatible patch target for tests
@@ -147,12 +151,15 @@ class CompactV2Service:
                 command=" ".join(cmd),
             )
 
+            priority = resolve_process_priority("compact", repository)
+            job.process_priority = priority.to_dict()
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 env=env,
             )
+            priority.apply(process.pid)
 
             process_start_time = _get_process_start_time(process.pid)
 
@@ -174,8 +181,7 @@ class CompactV2Service:
             last_commit_time = asyncio.get_event_loop().time()
             COMMIT_INTERVAL = 1.0
             first_progress_committed = False
-            last_progress_update: dict = {}
-            PROGRESS_THROTTLE = 2.0
+            progress_throttle = MessageThrottle(interval=2.0)
             log_buffer: list = []
             MAX_BUFFER = 1000
 
@@ -230,13 +236,8 @@ class CompactV2Service:
 
                                     if message:
                                         progress_msg = f"{message} ({current}/{total})"
-                                        if (
-                                            now
-                                            - last_progress_update.get(progress_msg, 0)
-                                            >= PROGRESS_THROTTLE
-                                        ):
+                                        if progress_throttle.allow(progress_msg, now):
                                             job.progress_message = progress_msg
-                                            last_progress_update[progress_msg] = now
 
                                     if not finished and total > 0:
                                         pct = (current / total) * 100
@@ -344,6 +345,10 @@ class CompactV2Service:
                         "Failed to save borg2 compact logs", job_id=job_id, error=str(e)
                     )
 
+            if job.status in ("completed", "completed_with_warnings"):
+                # Borg 2 sizes are on-disk, so compact is what shrinks them.
+                apply_compact_result(repository, log_buffer)
+
             final_status = job.status
             final_progress = job.progress
             final_progress_message = job.progress_message
@@ -353,6 +358,8 @@ class CompactV2Service:
             final_has_logs = job.has_logs
             final_logs = job.logs
             repository_last_compact = repository.last_compact
+            repository_unique_size_bytes = repository.unique_size_bytes
+            repository_total_size = repository.total_size
 
             def persist_final_state():
                 job.status = final_status
@@ -364,6 +371,8 @@ class CompactV2Service:
                 job.has_logs = final_has_logs
                 job.logs = final_logs
                 repository.last_compact = repository_last_compact
+                repository.unique_size_bytes = repository_unique_size_bytes
+                repository.total_size = repository_total_size
 
             await commit_with_retry(
                 db,
@@ -396,6 +405,7 @@ class CompactV2Service:
                 db.rollback()
         finally:
             self.running_processes.pop(job_id, None)
+            archive_list_cache.invalidate(repository_id)
             cleanup_temp_key_file(temp_key_file)
             db.close()
 
@@ -12,6 +12,8 @@ from app.database.models import DeleteArchiveJob, Repository
 from app.database.database import SessionLocal
 from app.core.borg2 import borg2
 from app.config import settings
+from app.services.archive_list_cache import archive_list_cache
+from app.services.repository_stats import apply_archives_removed
 from app.utils.db_retries import commit_with_retry
 from app.utils.borg_env import build_repository_borg_env, cleanup_temp_key_file
 
@@ -124,6 +126,7 @@ class DeleteArchiveV2Service:
                 passphrase=repo.passphrase,
                 remote_path=repo.remote_path,
                 env=env,
+                repository_record=repo,
             )
 
             if not compact_result["success"]:
@@ -186,6 +189,182 @@ class DeleteArchiveV2Service:
             except Exception:
                 pass
         finally:
+            archive_list_cache.invalidate(repository_id)
+            cleanup_temp_key_file(temp_key_file)
+            db.close()
+
+    async def execute_bulk_delete(
+        self, job_id: int, repository_id: int, archive_names: list[str]
+    ):
+        """Delete several Borg 2 archives, then compact once.
+
+        ``borg2 delete`` removes one archive per call and only drops its
+        archive entry; the expensive part is ``compact``, which runs a single
+        time after the whole selection instead of after each archive.
+        """
+        db = SessionLocal()
+        temp_key_file = None
+        total = len(archive_names)
+        try:
+            job = (
+                db.query(DeleteArchiveJob).filter(DeleteArchiveJob.id == job_id).first()
+            )
+            if not job:
+                logger.error("Borg2 bulk delete job not found", job_id=job_id)
+                return
+
+            repo = db.query(Repository).filter(Repository.id == repository_id).first()
+            if not repo:
+
+                def persist_missing_repo_state():
+                    job.status = "failed"
+                    job.error_message = "Repository not found"
+                    job.completed_at = datetime.now(timezone.utc)
+
+                await commit_with_retry(
+                    db,
+                    prepare=persist_missing_repo_state,
+                    logger=logger,
+                    action="borg2_bulk_delete_missing_repo",
+                    job_id=job_id,
+                    repository_id=repository_id,
+                )
+                return
+
+            started_at = datetime.now(timezone.utc)
+
+            def persist_start_state():
+                job.status = "running"
+                job.started_at = started_at
+                job.progress = 0
+                job.progress_message = f"Deleting archive 1 of {total}"
+
+            await commit_with_retry(
+                db,
+                prepare=persist_start_state,
+                logger=logger,
+                action="borg2_bulk_delete_start",
+                job_id=job_id,
+                repository_id=repository_id,
+            )
+
+            env, temp_key_file = build_repository_borg_env(repo, db, keepalive=True)
+
+            deleted = 0
+            failures = []
+            cancelled = False
+            for position, archive_name in enumerate(archive_names, start=1):
+                db.refresh(job)
+                if job.status == "cancelled":
+                    cancelled = True
+                    break
+                result = await borg2.delete_archive(
+                    repository=repo.path,
+                    archive=archive_name,
+                    passphrase=repo.passphrase,
+                    remote_path=repo.remote_path,
+                    env=env,
+                )
+                if result["success"]:
+                    deleted += 1
+                else:
+                    failures.append(f"{archive_name}: {result['stderr'].strip()}")
+
+                def persist_progress():
+                    job.archives_deleted = deleted
+                    # Leave the last tenth for compact
+                    job.progress = int(position * 90 / total)
+                    job.progress_message = f"Deleted {position} of {total} archives"
+
+                await commit_with_retry(
+                    db,
+                    prepare=persist_progress,
+                    logger=logger,
+                    action="borg2_bulk_delete_progress",
+                    job_id=job_id,
+                    repository_id=repository_id,
+                )
+
+            if deleted:
+                compact_result = await borg2.compact(
+                    repository=repo.path,
+                    passphrase=repo.passphrase,
+                    remote_path=repo.remote_path,
+                    env=env,
+                    repository_record=repo,
+                )
+                if not compact_result["success"]:
+                    # Compact failure is non-fatal: the archives are deleted
+                    logger.warning(
+                        "Borg2 post-delete compact failed",
+                        job_id=job_id,
+                        stderr=compact_result["stderr"],
+                    )
+                apply_archives_removed(repo, deleted)
+
+            completed_at = datetime.now(timezone.utc)
+
+            def persist_final_state():
+                job.archives_deleted = deleted
+                job.completed_at = completed_at
+                if cancelled:
+                    job.status = "cancelled"
+                    job.progress_message = (
+                        f"Archive deletion cancelled after {deleted} of {total}"
+                    )
+                elif not failures:
+                    job.status = "completed"
+                    job.progress = 100
+                    job.progress_message = f"{total} archives deleted and compacted"
+                else:
+                    job.status = "completed_with_warnings" if deleted else "failed"
+                    job.progress = 100
+                    job.progress_message = f"Deleted {deleted} of {total} archives"
+                    job.error_message = "\n".join(failures[-50:])
+
+            await commit_with_retry(
+                db,
+                prepare=persist_final_state,
+                logger=logger,
+                action="borg2_bulk_delete_finalize",
+                job_id=job_id,
+                repository_id=repository_id,
+            )
+            logger.info(
+                "Borg2 bulk delete finished",
+                job_id=job_id,
+                deleted=deleted,
+                failed=len(failures),
+            )
+
+        except Exception as e:
+            logger.error("Borg2 bulk delete service error", job_id=job_id, error=str(e))
+            try:
+                job = (
+                    db.query(DeleteArchiveJob)
+                    .filter(DeleteArchiveJob.id == job_id)
+                    .first()
+                )
+                if job:
+                    completed_at = datetime.now(timezone.utc)
+
+                    def persist_failure_state():
+                        job.status = "failed"
+                        job.error_message = str(e)
+                        job.completed_at = completed_at
+
+                    await commit_with_retry(
+                        db,
+                        prepare=persist_failure_state,
+                        logger=logger,
+                        action="borg2_bulk_delete_fail",
+                        job_id=job_id,
+                        repository_id=repository_id,
+                    )
+            except Exception:
+                pass
+        finally:
+            archive_list_cache.invalidate(repository_id)
             cleanup_temp_key_file(temp_key_file)
             db.close()
 
@@ -11,8 +11,10 @@ from app.core.borg2 import _get_borg2_binary, borg2
 from app.core.borg_router import BorgRouter
 from app.database.database import SessionLocal
 from app.database.models import PruneJob, Repository
+from app.services.archive_list_cache import archive_list_cache
 from app.utils.db_retries import commit_with_retry
 from app.utils.borg_env import build_repository_borg_env, cleanup_temp_key_file
+from app.utils.process_priority import resolve_process_priority
 
 logger = structlog.get_logger()
 
@@ -74,6 +76,7 @@ class PruneV2Service:
             keep_within=keep_within,
             passphrase=repo.passphrase,
             remote_path=repo.remote_path,
+            repository_record=repo,
         )
 
     async def execute_prune(
@@ -164,12 +167,15 @@ class PruneV2Service:
                 command=" ".join(cmd),
             )
 
+            priority = resolve_process_priority("prune", repo)
+            job.process_priority = priority.to_dict()
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 env=env,
             )
+            priority.apply(process.pid)
             self.running_processes[job_id] = process
 
             async def check_cancellation():
@@ -206,6 +212,9 @@ class PruneV2Service:
                 job.log_file_path = str(log_file)
                 job.has_logs = True
 
+            if not dry_run:
+                archive_list_cache.invalidate(repository_id)
+
             if job.status == "cancelled":
                 job.progress_message = "Prune cancelled"
             elif process.returncode == 0:
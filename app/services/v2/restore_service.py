@@ -19,6 +19,7 @@ class RestoreV2Service:
         remote_path: Optional[str] = None,
         bypass_lock: bool = False,
         strip_components: Optional[int] = None,
+        patterns_from: Optional[str] = None,
     ) -> List[str]:
         cmd = [
             borg2.borg_cmd,
@@ -35,11 +36,41 @@ class RestoreV2Service:
             cmd.append("--bypass-lock")
         if strip_components:
             cmd.extend(["--strip-components", str(strip_components)])
+        if patterns_from:
+            cmd.extend(["--patterns-from", patterns_from])
         cmd.append(archive_name)
         if paths:
             cmd.extend(paths)
         return cmd
 
+    def build_export_tar_command(
+        self,
+        repository_path: str,
+        archive_name: str,
+        paths: Optional[List[str]] = None,
+        remote_path: Optional[str] = None,
+        bypass_lock: bool = False,
+        strip_components: Optional[int] = None,
+    ) -> List[str]:
+        cmd = [
+            borg2.borg_cmd,
+            "-r",
+            repository_path,
+            "export-tar",
+            "--list",
+            "--log-json",
+        ]
+        if remote_path:
+            cmd.extend(["--remote-path", remote_path])
+        if bypass_lock:
+            cmd.append("--bypass-lock")
+        if strip_components:
+            cmd.extend(["--strip-components", str(strip_components)])
+        cmd.extend([archive_name, "-"])
+        if paths:
+            cmd.extend(paths)
+        return cmd
+
     async def preview_restore(
         self,
         repo: Repository,
@@ -57,6 +88,7 @@ class RestoreV2Service:
             "passphrase": repo.passphrase,
             "remote_path": repo.remote_path,
             "bypass_lock": repo.bypass_lock,
+            "repository_record": repo,
         }
         if env is not None:
             kwargs["env"] = env
@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 from app.database.models import BackupJob, BackupPlanRun, Repository
 
 
-def _archive_name(archive: Any) -> Optional[str]:
+def archive_entry_name(archive: Any) -> Optional[str]:
     if not isinstance(archive, dict):
         return None
 
@@ -18,16 +18,16 @@ def _archive_name(archive: Any) -> Optional[str]:
     return name if isinstance(name, str) and name else None
 
 
-def _coerce_naive_utc(value: datetime) -> datetime:
+def coerce_naive_utc(value: datetime) -> datetime:
     if value.tzinfo is None:
         return value
     return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 
-def _parse_archive_time(archive: dict) -> Optional[datetime]:
+def parse_archive_time(archive: dict) -> Optional[datetime]:
     value = archive.get("start") or archive.get("time")
     if isinstance(value, datetime):
-        return _coerce_naive_utc(value)
+        return coerce_naive_utc(value)
     if not isinstance(value, str) or not value:
         return None
 
@@ -35,14 +35,14 @@ def _parse_archive_time(archive: dict) -> Optional[datetime]:
         parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
     except ValueError:
         return None
-    return _coerce_naive_utc(parsed)
+    return coerce_naive_utc(parsed)
 
 
 def _job_times(job: BackupJob) -> list[datetime]:
     times = []
     for value in (job.started_at, job.completed_at, job.created_at):
         if isinstance(value, datetime):
-            times.append(_coerce_naive_utc(value))
+            times.append(coerce_naive_utc(value))
     return times
 
 
@@ -81,7 +81,9 @@ def enrich_archives_with_backup_metadata(
     archives: list[Any], repository: Repository, db: Session
 ) -> list[Any]:
     """Return archives enriched with trigger/source metadata from backup jobs."""
-    archive_names = {name for archive in archives if (name := _archive_name(archive))}
+    archive_names = {
+        name for archive in archives if (name := archive_entry_name(archive))
+    }
     if not archive_names:
         return archives
 
@@ -115,13 +117,13 @@ def enrich_archives_with_backup_metadata(
 
     enriched_archives = []
     for archive in archives:
-        name = _archive_name(archive)
+        name = archive_entry_name(archive)
         if not isinstance(archive, dict) or not name:
             enriched_archives.append(archive)
             continue
 
         job = _select_job_for_archive(
-            jobs_by_archive_name.get(name, []), _parse_archive_time(archive)
+            jobs_by_archive_name.get(name, []), parse_archive_time(archive)
         )
         if not job:
             enriched_archives.append(archive)
@@ -0,0 +1,145 @@
+"""Filter, sort and page archive lists for the archive endpoints.
+
+Works on the already-parsed ``borg list --json`` archives (usually served from
+the archive list cache), so large repositories only ship, and only enrich with
+backup job metadata, the page the client asked for.
+
+Cursors are keyset cursors: they encode the sort key of the last archive on
+the previous page, so a page boundary stays stable when archives are added or
+pruned between requests.
+"""
+
+import base64
+import binascii
+import fnmatch
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional
+
+from app.utils.archive_job_metadata import (
+    archive_entry_name,
+    coerce_naive_utc,
+    parse_archive_time,
+)
+
+ARCHIVE_SORTS = ("oldest", "newest", "name_asc", "name_desc")
+DEFAULT_ARCHIVE_SORT = "oldest"  # Borg's own order
+MAX_ARCHIVE_PAGE_SIZE = 1000
+
+
+class InvalidArchiveCursor(ValueError):
+    """Raised for a cursor that is malformed or belongs to another sort."""
+
+
+@dataclass
+class ArchivePage:
+    archives: List[Any]
+    total: int
+    next_cursor: Optional[str]
+
+
+def _sort_key(archive: Any, sort: str) -> tuple:
+    name = archive_entry_name(archive) or ""
+    if sort in ("name_asc", "name_desc"):
+        return (name, "")
+    archive_time = parse_archive_time(archive) if isinstance(archive, dict) else None
+    # Archives without a timestamp sort before everything else.
+    return (archive_time.isoformat() if archive_time else "", name)
+
+
+def _encode_cursor(sort: str, key: tuple) -> str:
+    payload = json.dumps({"s": sort, "k": list(key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key = tuple(payload["k"])
+        cursor_sort = payload["s"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidArchiveCursor(cursor)
+    if cursor_sort != sort or len(key) != 2:
+        raise InvalidArchiveCursor(cursor)
+    return key
+
+
+def _matches(
+    archive: Any,
+    name_glob: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> bool:
+    if name_glob and not fnmatch.fnmatchcase(
+        archive_entry_name(archive) or "", name_glob
+    ):
+        return False
+    if since is None and until is None:
+        return True
+    archive_time = parse_archive_time(archive) if isinstance(archive, dict) else None
+    if archive_time is None:
+        return False
+    if since is not None and archive_time < coerce_naive_utc(since):
+        return False
+    if until is not None and archive_time >= coerce_naive_utc(until):
+        return False
+    return True
+
+
+def page_archives(
+    archives: List[Any],
+    *,
+    sort: str = DEFAULT_ARCHIVE_SORT,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    name_glob: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> ArchivePage:
+    """Return one page of ``archives``.
+
+    ``name_glob`` is a shell-style pattern matched against the archive name;
+    ``since``/``until`` bound the archive start time (inclusive/exclusive).
+    Without ``limit`` every remaining archive is returned. ``total`` counts
+    all archives matching the filters, not just this page.
+    """
+    if sort not in ARCHIVE_SORTS:
+        raise ValueError(f"Unknown archive sort: {sort}")
+    if limit is not None and not 1 <= limit <= MAX_ARCHIVE_PAGE_SIZE:
+        raise ValueError(f"Archive page size out of range: {limit}")
+
+    matching = [
+        archive for archive in archives if _matches(archive, name_glob, since, until)
+    ]
+    descending = sort in ("newest", "name_desc")
+    keyed = sorted(
+        ((_sort_key(archive, sort), archive) for archive in matching),
+        key=lambda item: item[0],
+        reverse=descending,
+    )
+
+    start = 0
+    if cursor:
+        after = _decode_cursor(cursor, sort)
+        # First archive strictly past the cursor key in sort direction.
+        start = next(
+            (
+                index
+                for index, (key, _) in enumerate(keyed)
+                if (key < after if descending else key > after)
+            ),
+            len(keyed),
+        )
+
+    end = len(keyed) if limit is None else min(len(keyed), start + limit)
+    page = keyed[start:end]
+    next_cursor = (
+        _encode_cursor(sort, page[-1][0]) if page and end < len(keyed) else None
+    )
+    return ArchivePage(
+        archives=[archive for _, archive in page],
+        total=len(keyed),
+        next_cursor=next_cursor,
+    )
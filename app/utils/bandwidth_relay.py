@@ -0,0 +1,120 @@
+"""Rate-limited ``BORG_RSH`` relay used by the shared upload bandwidth budget.
+
+Borg starts this script in place of ``ssh``::
+
+    python bandwidth_relay.py RATE_FILE ssh -i key ... host borg serve
+
+The relay runs the real ssh command, passes its output straight through and
+copies Borg's stdin (the upload direction) to ssh through a token bucket.
+``RATE_FILE`` holds a single integer in KiB/s (0 = unlimited); the server
+rewrites it while the backup runs and the relay re-reads it every second.
+
+The script is executed by path rather than as a module because Borg starts it
+from the backup's working directory, so it must only use the standard library.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Optional
+
+CHUNK_BYTES = 64 * 1024
+RATE_REFRESH_SECONDS = 1.0
+# Burst allowance: at most this many seconds of traffic may be sent at once
+BURST_SECONDS = 0.25
+
+
+def read_rate_kib(rate_file: str) -> Optional[int]:
+    """Return the rate in ``rate_file``; ``None`` when unlimited or unreadable."""
+    try:
+        with open(rate_file, encoding="ascii") as handle:
+            rate = int(handle.read().strip() or 0)
+    except (OSError, ValueError):
+        return None
+    return rate if rate > 0 else None
+
+
+class TokenBucket:
+    """Byte token bucket whose rate can change while data is flowing."""
+
+    def __init__(self, rate_kib: Optional[int], clock=time.monotonic):
+        self._clock = clock
+        self.rate_bytes: Optional[float] = None
+        self.tokens = 0.0
+        self.updated = clock()
+        self.set_rate(rate_kib)
+
+    def set_rate(self, rate_kib: Optional[int]) -> None:
+        self._refill()
+        self.rate_bytes = rate_kib * 1024.0 if rate_kib else None
+        if self.rate_bytes is not None:
+            self.tokens = min(self.tokens, self._capacity())
+
+    def _capacity(self) -> float:
+        return max(self.rate_bytes * BURST_SECONDS, 1024.0)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self.rate_bytes is not None:
+            self.tokens = min(
+                self._capacity(), self.tokens + (now - self.updated) * self.rate_bytes
+            )
+        self.updated = now
+
+    def read_size(self) -> int:
+        """Largest read that keeps a single wait within the burst window."""
+        if self.rate_bytes is None:
+            return CHUNK_BYTES
+        return max(1024, min(CHUNK_BYTES, int(self._capacity())))
+
+    def delay_for(self, size: int) -> float:
+        """Take ``size`` bytes from the bucket and return how long to wait first."""
+        if self.rate_bytes is None:
+            return 0.0
+        self._refill()
+        self.tokens -= size
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate_bytes
+
+
+def relay(rate_file: str, command: list[str]) -> int:
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, bufsize=0)
+    bucket = TokenBucket(read_rate_kib(rate_file))
+    next_refresh = time.monotonic() + RATE_REFRESH_SECONDS
+    stdin_fd = sys.stdin.fileno()
+
+    try:
+        while True:
+            data = os.read(stdin_fd, bucket.read_size())
+            if not data:
+                break
+            now = time.monotonic()
+            if now >= next_refresh:
+                bucket.set_rate(read_rate_kib(rate_file))
+                next_refresh = now + RATE_REFRESH_SECONDS
+            delay = bucket.delay_for(len(data))
+            if delay > 0:
+                time.sleep(delay)
+            process.stdin.write(data)
+    except (BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+
+    return process.wait()
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) < 3:
+        print("usage: bandwidth_relay.py RATE_FILE COMMAND [ARGS...]", file=sys.stderr)
+        return 2
+    return relay(argv[1], argv[2:])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,84 @@
+"""Keyset pagination for filesystem browse listings.
+
+Browse results are ordered local mounts first, then directories, then by
+case-insensitive name. A page is the ``limit`` entries whose sort key follows
+the cursor, picked with a bounded heap, so only the page itself needs to be
+stat'ed or probed for Borg repositories. The cursor is the sort key of the last
+entry returned, which keeps paging stable while entries are added or removed.
+"""
+
+import base64
+import heapq
+import json
+from typing import Callable, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+BrowseKey = tuple[bool, bool, str, str]
+
+
+def browse_sort_key(name: str, is_dir: bool, is_local_mount: bool = False) -> BrowseKey:
+    return (not is_local_mount, not is_dir, name.lower(), name)
+
+
+def encode_cursor(key: BrowseKey) -> str:
+    payload = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> BrowseKey:
+    """Sort key stored in ``cursor``; raise ``ValueError`` when malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("invalid browse cursor") from e
+    if (
+        not isinstance(value, list)
+        or len(value) != 4
+        or not all(isinstance(part, bool) for part in value[:2])
+        or not all(isinstance(part, str) for part in value[2:])
+    ):
+        raise ValueError("invalid browse cursor")
+    return tuple(value)
+
+
+def select_page(
+    entries: Iterable[T],
+    *,
+    key: Callable[[T], BrowseKey],
+    name: Callable[[T], str],
+    limit: Optional[int],
+    cursor: Optional[str] = None,
+    name_filter: Optional[str] = None,
+) -> tuple[list[T], Optional[str], int]:
+    """Return ``(page, next_cursor, total)`` for ``entries``.
+
+    ``total`` counts every entry matching ``name_filter`` (a case-insensitive
+    substring), not only those after the cursor. Without ``limit`` the whole
+    filtered listing is returned in order.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    needle = (name_filter or "").lower()
+    total = 0
+    candidates: list[tuple[BrowseKey, int, T]] = []
+    for index, entry in enumerate(entries):
+        if needle and needle not in name(entry).lower():
+            continue
+        total += 1
+        entry_key = key(entry)
+        if after is not None and entry_key <= after:
+            continue
+        candidates.append((entry_key, index, entry))
+        if limit and len(candidates) > 4 * (limit + 1):
+            candidates = heapq.nsmallest(limit + 1, candidates)
+
+    if limit:
+        ordered = heapq.nsmallest(limit + 1, candidates)
+    else:
+        ordered = sorted(candidates)
+    page = ordered[:limit] if limit else ordered
+    next_cursor = None
+    if limit and len(ordered) > limit:
+        next_cursor = encode_cursor(page[-1][0])
+    return [entry for _, _, entry in page], next_cursor, total
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import os
 import re
+import shlex
 import structlog
 from typing import Optional
 
@@ -187,3 +190,108 @@ def _login_relative_remote_path_candidate(remote_path: str) -> Optional[str]:
 
     relative_path = normalized.lstrip("/")
     return relative_path or None
+
+
+async def probe_directory_fingerprint(
+    path: str,
+    timeout: int = 30,
+    key_file: str | None = None,
+) -> Optional[str]:
+    """Return a cheap change fingerprint for a local or SSH directory.
+
+    Only the directory's own entries are stat'ed (names, sizes, mtimes), never
+    the tree below, so it costs one readdir locally or one SSH round trip.
+    A Borg repository rewrites its top-level index/hints (Borg 1) or touches
+    its archives directory (Borg 2) on every transaction, so the fingerprint
+    changes whenever the repository does. Lock files are ignored since every
+    Borg command, reads included, creates them. Returns None when the directory
+    could not be probed; callers must then assume it changed.
+    """
+    try:
+        if path.startswith("ssh://"):
+            listing = await _list_directory_ssh(path, timeout, key_file=key_file)
+        else:
+            listing = await asyncio.wait_for(
+                asyncio.to_thread(_list_directory_local, path), timeout=timeout
+            )
+    except asyncio.TimeoutError:
+        logger.warning("Timeout probing directory", path=path, timeout_seconds=timeout)
+        return None
+    except Exception as e:
+        logger.debug("Failed to probe directory", path=path, error=str(e))
+        return None
+
+    if listing is None:
+        return None
+    return hashlib.sha256(listing.encode("utf-8", errors="replace")).hexdigest()
+
+
+# Lock entries come and go with every Borg command, including reads.
+_PROBE_IGNORED_NAMES = frozenset({"lock.exclusive", "lock.roster", "locks"})
+
+
+def _list_directory_local(path: str) -> Optional[str]:
+    entries = []
+    with os.scandir(path) as iterator:
+        for entry in iterator:
+            if entry.name in _PROBE_IGNORED_NAMES:
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            entries.append(f"{entry.name}\t{stat.st_size}\t{stat.st_mtime_ns}")
+    return "\n".join(sorted(entries))
+
+
+async def _list_directory_ssh(
+    path: str, timeout: int, key_file: str | None = None
+) -> Optional[str]:
+    parsed = _parse_ssh_url(path)
+    if not parsed:
+        return None
+
+    username, host, port, remote_path = parsed
+    if remote_path.startswith("/./"):
+        remote_path = remote_path[1:]
+
+    cmd = ["ssh"]
+    if key_file:
+        cmd.extend(ssh_key_auth_args(key_file))
+    else:
+        cmd.extend(public_key_only_ssh_args())
+    cmd.extend(
+        [
+            "-o",
+            "StrictHostKeyChecking=no",
+            "-o",
+            "UserKnownHostsFile=/dev/null",
+            "-o",
+            "LogLevel=ERROR",
+            "-o",
+            "ConnectTimeout=10",
+            "-p",
+            port,
+            f"{username}@{host}",
+            f"ls -lA --time-style=+%s.%N -- {shlex.quote(remote_path)}",
+        ]
+    )
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, _stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    if process.returncode != 0:
+        # Restricted shells (borg serve only) refuse arbitrary commands.
+        return None
+    lines = []
+    for line in stdout.decode("utf-8", errors="replace").splitlines():
+        name = line.rsplit(" ", 1)[-1]
+        if line.startswith("total ") or name in _PROBE_IGNORED_NAMES:
+            continue
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,225 @@
+"""CPU/IO priority classes for the processes Borg UI spawns.
+
+Each operation (backup, restore, check, compact, prune, script) runs in a
+priority class: ``normal`` leaves the process alone, ``low`` runs it at nice 10
+with best-effort I/O level 7 and ``idle`` at nice 19 with idle I/O. The server
+default comes from settings; a repository can override it per operation.
+
+With ``PROCESS_CGROUP_ROOT`` pointing at a delegated cgroup v2 directory,
+``low`` and ``idle`` processes also join a child cgroup with the configured
+``cpu.max`` / ``io.max``. The class is applied from the server to the new
+process's pid right after it is spawned -- never in a ``preexec_fn``, which is
+unsafe in a threaded server -- so processes Borg starts itself (ssh) inherit
+it.
+"""
+
+import ctypes
+import os
+import platform
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+OPERATIONS = ("backup", "restore", "check", "compact", "prune", "script")
+PRIORITY_CLASSES = ("normal", "low", "idle")
+
+IOPRIO_CLASS_BEST_EFFORT = 2
+IOPRIO_CLASS_IDLE = 3
+_IOPRIO_CLASS_SHIFT = 13
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_SET_SYSCALLS = {
+    "x86_64": 251,
+    "aarch64": 30,
+    "riscv64": 30,
+    "i686": 289,
+    "armv7l": 314,
+    "ppc64le": 273,
+    "s390x": 282,
+}
+
+_CLASS_SETTINGS = {
+    "normal": (0, None, None),
+    "low": (10, IOPRIO_CLASS_BEST_EFFORT, 7),
+    "idle": (19, IOPRIO_CLASS_IDLE, 0),
+}
+
+_prepared_cgroups: dict[str, Optional[str]] = {}
+
+
+@dataclass(frozen=True)
+class ProcessPriority:
+    operation: str
+    priority_class: str
+    nice: int = 0
+    ionice_class: Optional[int] = None
+    ionice_level: Optional[int] = None
+    cgroup: Optional[str] = None
+
+    @property
+    def is_default(self) -> bool:
+        return not self.nice and self.ionice_class is None and not self.cgroup
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "class": self.priority_class,
+            "nice": self.nice,
+            "ionice_class": self.ionice_class,
+            "ionice_level": self.ionice_level,
+            "cgroup": self.cgroup,
+        }
+
+    def apply(self, pid: int) -> None:
+        """Move the just-spawned process ``pid`` into this class.
+
+        Each step is best effort: a failure is logged and the job carries on.
+        """
+        if self.is_default:
+            return
+        if self.cgroup:
+            _best_effort(pid, "cgroup", _join_cgroup, self.cgroup, pid)
+        if self.nice:
+            _best_effort(pid, "nice", _renice, pid, self.nice)
+        if self.ionice_class is not None:
+            set_io_priority = _io_priority_syscall()
+            if set_io_priority is not None:
+                _best_effort(
+                    pid,
+                    "ionice",
+                    set_io_priority,
+                    pid,
+                    self.ionice_class,
+                    self.ionice_level or 0,
+                )
+
+
+def _best_effort(pid: int, step: str, apply: Callable[..., Any], *args) -> None:
+    try:
+        apply(*args)
+    except Exception as e:
+        logger.warning(
+            "Could not apply process priority", pid=pid, step=step, error=str(e)
+        )
+
+
+def _join_cgroup(cgroup: str, pid: int) -> None:
+    with open(os.path.join(cgroup, "cgroup.procs"), "w") as handle:
+        handle.write(str(pid))
+
+
+def _renice(pid: int, increment: int) -> None:
+    current = os.getpriority(os.PRIO_PROCESS, pid)
+    os.setpriority(os.PRIO_PROCESS, pid, min(19, current + increment))
+
+
+def validate_process_priorities(value: Optional[dict]) -> Optional[dict[str, str]]:
+    """Normalize a repository's per-operation classes; raise ``ValueError``."""
+    if not value:
+        return None
+    if not isinstance(value, dict):
+        raise ValueError("process priorities must be an object")
+    normalized = {}
+    for operation, priority_class in value.items():
+        if operation not in OPERATIONS:
+            raise ValueError(f"unknown operation: {operation}")
+        if priority_class not in PRIORITY_CLASSES:
+            raise ValueError(f"unknown priority class: {priority_class}")
+        normalized[operation] = priority_class
+    return normalized or None
+
+
+def _default_class(operation: str) -> str:
+    priority_class = getattr(settings, f"process_priority_{operation}", "normal")
+    return priority_class if priority_class in PRIORITY_CLASSES else "normal"
+
+
+def resolve_process_priority(operation: str, repository=None) -> ProcessPriority:
+    """Priority for ``operation``, honouring the repository's override."""
+    overrides = getattr(repository, "process_priorities", None) or {}
+    priority_class = overrides.get(operation)
+    if priority_class not in PRIORITY_CLASSES:
+        priority_class = _default_class(operation)
+
+    nice, ionice_class, ionice_level = _CLASS_SETTINGS[priority_class]
+    return ProcessPriority(
+        operation=operation,
+        priority_class=priority_class,
+        nice=nice,
+        ionice_class=ionice_class,
+        ionice_level=ionice_level,
+        cgroup=_prepare_cgroup(priority_class),
+    )
+
+
+def _cgroup_limits(priority_class: str) -> dict[str, str]:
+    limits = {}
+    cpu_max = getattr(settings, f"process_cgroup_{priority_class}_cpu_max", "")
+    io_max = getattr(settings, f"process_cgroup_{priority_class}_io_max", "")
+    if cpu_max:
+        limits["cpu.max"] = cpu_max
+    if io_max:
+        limits["io.max"] = io_max
+    return limits
+
+
+def _prepare_cgroup(priority_class: str) -> Optional[str]:
+    """Create the class cgroup with its limits once; ``None`` when unavailable."""
+    root = settings.process_cgroup_root
+    if not root or priority_class == "normal":
+        return None
+    limits = _cgroup_limits(priority_class)
+    if not limits:
+        return None
+
+    cache_key = f"{root}:{priority_class}"
+    if cache_key in _prepared_cgroups:
+        return _prepared_cgroups[cache_key]
+
+    path = os.path.join(root, priority_class)
+    try:
+        if not os.path.exists(os.path.join(root, "cgroup.controllers")):
+            raise OSError("not a cgroup v2 directory")
+        controllers = " ".join(
+            f"+{name.split('.')[0]}" for name in sorted(limits.keys())
+        )
+        with open(os.path.join(root, "cgroup.subtree_control"), "w") as handle:
+            handle.write(controllers)
+        os.makedirs(path, exist_ok=True)
+        for name, value in limits.items():
+            with open(os.path.join(path, name), "w") as handle:
+                handle.write(value)
+    except OSError as e:
+        logger.warning(
+            "Could not prepare process cgroup, continuing without cgroup limits",
+            cgroup=path,
+            error=str(e),
+        )
+        path = None
+
+    _prepared_cgroups[cache_key] = path
+    return path
+
+
+def _io_priority_syscall() -> Optional[Callable[..., int]]:
+    syscall_number = _IOPRIO_SET_SYSCALLS.get(platform.machine())
+    if syscall_number is None:
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+    def set_io_priority(pid: int, ionice_class: int, ionice_level: int) -> int:
+        return libc.syscall(
+            syscall_number,
+            _IOPRIO_WHO_PROCESS,
+            pid,
+            (ionice_class << _IOPRIO_CLASS_SHIFT) | ionice_level,
+        )
+
+    return set_io_priority
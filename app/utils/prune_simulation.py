@@ -0,0 +1,194 @@
+"""Evaluate Borg prune retention rules without running Borg.
+
+Mirrors ``borg prune`` (Borg 1.4 and 2): archives are walked newest first and
+every rule keeps the newest archive of each period (hour, day, ISO week,
+month, quarter, year) until it has kept its count, skipping periods whose
+archive another rule already kept. A rule that runs out of archives before
+reaching its count also keeps the oldest archive. ``keep_within`` keeps every
+archive younger than the interval, and the newest checkpoint survives when no
+complete archive is newer.
+
+Periods are computed in local time, as Borg does: naive archive timestamps
+(Borg 1 prints local time without an offset) are taken as they are and aware
+ones are converted to ``tz``.
+"""
+
+import fnmatch
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Callable, Optional
+
+_CHECKPOINT_RE = re.compile(r"\.checkpoint(\.\d+)?$")
+_INTERVAL_RE = re.compile(r"^(\d+)([SMHdwmy])$")
+_INTERVAL_SECONDS = {
+    "S": 1,
+    "M": 60,
+    "H": 3600,
+    "d": 24 * 3600,
+    "w": 7 * 24 * 3600,
+    "m": 31 * 24 * 3600,
+    "y": 365 * 24 * 3600,
+}
+
+
+def _quarter(moment: datetime) -> tuple:
+    return (moment.year, (moment.month - 1) // 3)
+
+
+# (rule, period of an archive's local time), in the order borg applies them
+PRUNE_RULES: tuple[tuple[str, Callable[[datetime], Any]], ...] = (
+    ("hourly", lambda moment: moment.strftime("%Y-%m-%d %H")),
+    ("daily", lambda moment: moment.strftime("%Y-%m-%d")),
+    ("weekly", lambda moment: moment.isocalendar()[:2]),
+    ("monthly", lambda moment: (moment.year, moment.month)),
+    ("quarterly", _quarter),
+    ("yearly", lambda moment: moment.year),
+)
+
+
+@dataclass
+class PruneDecision:
+    archive: dict
+    name: str
+    time: datetime
+    reason: Optional[str] = None  # e.g. "daily #2"; None when pruned
+
+    @property
+    def keep(self) -> bool:
+        return self.reason is not None
+
+
+@dataclass
+class PruneSimulation:
+    decisions: list[PruneDecision] = field(default_factory=list)  # Newest first
+    unmatched: int = 0  # Outside ``name_glob``; never pruned
+    undated: int = 0  # No parseable timestamp; left out of the simulation
+
+    @property
+    def kept(self) -> list[PruneDecision]:
+        return [decision for decision in self.decisions if decision.keep]
+
+    @property
+    def pruned(self) -> list[PruneDecision]:
+        return [decision for decision in self.decisions if not decision.keep]
+
+
+def parse_keep_within(value: str) -> timedelta:
+    """Parse a ``--keep-within`` interval such as ``7d``; raise ``ValueError``."""
+    match = _INTERVAL_RE.match(value.strip())
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"Invalid keep-within interval: {value}")
+    return timedelta(seconds=int(match.group(1)) * _INTERVAL_SECONDS[match.group(2)])
+
+
+def _archive_local_time(archive: dict, tz: Optional[tzinfo]) -> Optional[datetime]:
+    value = archive.get("start") or archive.get("time")
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        # Borg 1 prints the local time of the machine that ran it
+        parsed = parsed.astimezone()
+    return parsed.astimezone(tz)
+
+
+def simulate_prune(
+    archives: list[Any],
+    *,
+    keep_hourly: int = 0,
+    keep_daily: int = 0,
+    keep_weekly: int = 0,
+    keep_monthly: int = 0,
+    keep_quarterly: int = 0,
+    keep_yearly: int = 0,
+    keep_within: Optional[str] = None,
+    name_glob: Optional[str] = None,
+    tz: Optional[tzinfo] = None,
+    now: Optional[datetime] = None,
+) -> PruneSimulation:
+    """Decide which of ``archives`` (``borg list --json`` entries) a prune keeps.
+
+    ``name_glob`` scopes the rules to matching archive names like
+    ``--glob-archives``. ``tz`` defaults to the server's local time zone,
+    which is the one borg prune uses when run from this server.
+    """
+    within = parse_keep_within(keep_within) if keep_within else None
+    counts = {
+        "hourly": keep_hourly,
+        "daily": keep_daily,
+        "weekly": keep_weekly,
+        "monthly": keep_monthly,
+        "quarterly": keep_quarterly,
+        "yearly": keep_yearly,
+    }
+
+    simulation = PruneSimulation()
+    candidates: list[PruneDecision] = []
+    for archive in archives:
+        if not isinstance(archive, dict):
+            continue
+        name = archive.get("name") or archive.get("archive")
+        if not isinstance(name, str) or not name:
+            continue
+        if name_glob and not fnmatch.fnmatchcase(name, name_glob):
+            simulation.unmatched += 1
+            continue
+        moment = _archive_local_time(archive, tz)
+        if moment is None:
+            simulation.undated += 1
+            continue
+        candidates.append(PruneDecision(archive=archive, name=name, time=moment))
+    # Stable sort keeps borg's list order for archives with equal timestamps
+    candidates.sort(key=lambda decision: decision.time, reverse=True)
+
+    checkpoints = [d for d in candidates if _CHECKPOINT_RE.search(d.name)]
+    complete = [d for d in candidates if not _CHECKPOINT_RE.search(d.name)]
+    if checkpoints and candidates[0] is checkpoints[0]:
+        checkpoints[0].reason = "checkpoint"
+
+    if within is not None:
+        cutoff = (now or datetime.now().astimezone()) - within
+        kept = 0
+        for decision in complete:
+            if decision.time > cutoff:
+                kept += 1
+                decision.reason = f"within #{kept}"
+
+    for rule, period_of in PRUNE_RULES:
+        count = counts[rule]
+        if count <= 0:
+            continue
+        kept = 0
+        last_period = None
+        for decision in complete:
+            period = period_of(decision.time)
+            if period == last_period:
+                continue
+            last_period = period
+            if decision.reason is None:
+                kept += 1
+                decision.reason = f"{rule} #{kept}"
+                if kept == count:
+                    break
+        oldest = complete[-1] if complete else None
+        if oldest is not None and kept < count and oldest.reason is None:
+            oldest.reason = f"{rule}[oldest] #{kept + 1}"
+
+    simulation.decisions = candidates
+    return simulation
+
+
+def format_prune_line(decision: PruneDecision) -> str:
+    """Render a decision the way ``borg prune --list --dry-run`` prints it."""
+    archive_id = decision.archive.get("id")
+    suffix = f" [{archive_id}]" if archive_id else ""
+    timestamp = decision.time.strftime("%a, %Y-%m-%d %H:%M:%S")
+    if decision.keep:
+        verb = f"Keeping archive (rule: {decision.reason}):"
+    else:
+        verb = "Would prune:"
+    return f"{verb} {decision.name:<36} {timestamp}{suffix}"
@@ -28,6 +28,7 @@ import {
   getGroupsArray,
   sortArchives,
   filterArchivesByType,
+  getSavedSortOption,
   type SortOption,
   type TimeGroup,
   type FilterType,
@@ -45,6 +46,11 @@ interface ArchivesListProps {
   canDelete?: boolean
   defaultRowsPerPage?: number
   rowsPerPageOptions?: number[]
+  /** Archives matching the server-side query, when the list is paged. */
+  totalCount?: number
+  onSortChange?: (sort: SortOption) => void
+  /** Rendered below the list, e.g. a button loading the next page. */
+  footer?: React.ReactNode
 }
 
 export default function ArchivesList({
@@ -58,6 +64,9 @@ export default function ArchivesList({
   canDelete = true,
   defaultRowsPerPage = 10,
   rowsPerPageOptions = [5, 10, 25, 50, 100],
+  totalCount,
+  onSortChange,
+  footer,
 }: ArchivesListProps) {
   // Load saved preferences from localStorage
   const getInitialRowsPerPage = () => {
@@ -71,14 +80,6 @@ export default function ArchivesList({
     return defaultRowsPerPage
   }
 
-  const getInitialSortBy = (): SortOption => {
-    const saved = localStorage.getItem('archives-list-sort-by')
-    if (saved && ['date-desc', 'date-asc'].includes(saved)) {
-      return saved as SortOption
-    }
-    return 'date-desc'
-  }
-
   const getInitialGroupingEnabled = (): boolean => {
     const saved = localStorage.getItem('archives-list-grouping-enabled')
     if (saved === 'true') return true
@@ -116,7 +117,7 @@ export default function ArchivesList({
   // State
   const [page, setPage] = useState(0)
   const [rowsPerPage, setRowsPerPage] = useState(getInitialRowsPerPage)
-  const [sortBy, setSortBy] = useState<SortOption>(getInitialSortBy)
+  const [sortBy, setSortBy] = useState<SortOption>(getSavedSortOption)
   const [groupingEnabled, setGroupingEnabled] = useState(getInitialGroupingEnabled)
   const [expandedGroups, setExpandedGroups] = useState<Set<TimeGroup>>(getInitialExpandedGroups)
   const [filter, setFilter] = useState<FilterType>(getInitialFilter)
@@ -154,6 +155,7 @@ export default function ArchivesList({
     setSortBy(newSort)
     setPage(0)
     localStorage.setItem('archives-list-sort-by', newSort)
+    onSortChange?.(newSort)
   }
 
   const handleToggleGroup = (groupKey: TimeGroup) => {
@@ -336,7 +338,7 @@ export default function ArchivesList({
             }}
           >
             {filter === 'all' || sortedArchives.length === archives.length
-              ? archives.length
+              ? (totalCount ?? archives.length)
               : `${sortedArchives.length}/${archives.length}`}
           </Typography>
         </Box>
@@ -730,6 +732,7 @@ export default function ArchivesList({
           )}
         </>
       )}
+      {footer}
     </Box>
   )
 }
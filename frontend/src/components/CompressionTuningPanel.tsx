@@ -0,0 +1,241 @@
+import { useState } from 'react'
+import {
+  Alert,
+  Box,
+  Button,
+  Chip,
+  CircularProgress,
+  FormControlLabel,
+  Paper,
+  Switch,
+  Table,
+  TableBody,
+  TableCell,
+  TableHead,
+  TableRow,
+  TextField,
+  Typography,
+} from '@mui/material'
+import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
+import { useTranslation } from 'react-i18next'
+import { toast } from 'react-hot-toast'
+import { repositoriesAPI } from '../services/api'
+import { formatBytes, formatDateShort } from '../utils/dateUtils'
+import { getApiErrorDetail } from '../utils/apiErrors'
+import { translateBackendKey } from '../utils/translateBackendKey'
+
+interface CompressionTuningPanelProps {
+  repositoryId: number
+  canTune: boolean
+}
+
+const formatRatio = (ratio: number | null | undefined) =>
+  ratio == null ? '—' : `${(ratio * 100).toFixed(1)}%`
+
+const formatSpeed = (speed: number | null | undefined) =>
+  speed == null ? '—' : `${speed.toFixed(1)} MB/s`
+
+export default function CompressionTuningPanel({
+  repositoryId,
+  canTune,
+}: CompressionTuningPanelProps) {
+  const { t } = useTranslation()
+  const queryClient = useQueryClient()
+  const [apply, setApply] = useState(false)
+  const [targetPercent, setTargetPercent] = useState('')
+  const queryKey = ['compression-tuning', repositoryId]
+
+  const { data, isLoading } = useQuery({
+    queryKey,
+    queryFn: () => repositoriesAPI.getCompressionTuning(repositoryId).then((r) => r.data),
+    refetchInterval: (query) => (query.state.data?.tuning?.status === 'running' ? 3000 : false),
+  })
+
+  const startMutation = useMutation({
+    mutationFn: () =>
+      repositoriesAPI.startCompressionTuning(repositoryId, {
+        apply,
+        target_ratio: targetPercent ? Number(targetPercent) / 100 : null,
+      }),
+    onSuccess: () => {
+      queryClient.invalidateQueries({ queryKey })
+      toast.success(t('backend.success.repo.compressionTuningStarted'))
+    },
+    onError: (error: unknown) => {
+      toast.error(
+        translateBackendKey(
+          getApiErrorDetail(error),
+          'backend.errors.repo.failedToStartCompressionTuning'
+        )
+      )
+    },
+  })
+
+  if (isLoading || !data) {
+    return (
+      <Box sx={{ p: 2 }}>
+        <CircularProgress size={20} />
+      </Box>
+    )
+  }
+
+  const tuning = data.tuning
+  const running = tuning?.status === 'running'
+  const targetInvalid =
+    targetPercent !== '' && !(Number(targetPercent) > 0 && Number(targetPercent) <= 100)
+
+  return (
+    <Paper variant="outlined" sx={{ p: 2, borderRadius: 1 }}>
+      <Typography variant="subtitle2" sx={{ fontWeight: 700 }}>
+        {t('compressionTuning.title')}
+      </Typography>
+      <Typography variant="body2" sx={{ color: 'text.secondary', mb: 1.5 }}>
+        {t('compressionTuning.description', { compression: data.compression })}
+      </Typography>
+
+      {canTune && (
+        <Box
+          sx={{
+            display: 'flex',
+            flexWrap: 'wrap',
+            alignItems: 'center',
+            gap: 2,
+            mb: 2,
+          }}
+        >
+          <TextField
+            size="small"
+            type="number"
+            label={t('compressionTuning.targetLabel')}
+            placeholder={t('compressionTuning.targetPlaceholder')}
+            value={targetPercent}
+            onChange={(e) => setTargetPercent(e.target.value)}
+            error={targetInvalid}
+            disabled={running}
+            sx={{ width: 200 }}
+          />
+          <FormControlLabel
+            control={
+              <Switch
+                checked={apply}
+                onChange={(e) => setApply(e.target.checked)}
+                disabled={running}
+              />
+            }
+            label={t('compressionTuning.applyLabel')}
+          />
+          <Button
+            variant="contained"
+            size="small"
+            disabled={running || targetInvalid || startMutation.isPending}
+            onClick={() => startMutation.mutate()}
+            startIcon={running ? <CircularProgress size={14} color="inherit" /> : undefined}
+          >
+            {running ? t('compressionTuning.running') : t('compressionTuning.run')}
+          </Button>
+        </Box>
+      )}
+
+      {tuning?.status === 'failed' && tuning.error && (
+        <Alert severity="error" sx={{ mb: 2 }}>
+          {translateBackendKey(tuning.error)}
+        </Alert>
+      )}
+      {tuning?.status === 'interrupted' && (
+        <Alert severity="warning" sx={{ mb: 2 }}>
+          {t('compressionTuning.interrupted')}
+        </Alert>
+      )}
+
+      {tuning?.candidates && tuning.candidates.length > 0 && (
+        <Box sx={{ mb: 2 }}>
+          <Typography variant="body2" sx={{ mb: 1 }}>
+            {t('compressionTuning.sampleSummary', {
+              files: tuning.sample_files ?? 0,
+              size: formatBytes(tuning.sample_bytes ?? 0),
+              date: tuning.completed_at ? formatDateShort(tuning.completed_at) : '—',
+            })}
+          </Typography>
+          {tuning.recommended && (
+            <Alert severity={tuning.applied ? 'success' : 'info'} sx={{ mb: 1 }}>
+              {tuning.applied
+                ? t('compressionTuning.applied', {
+                    compression: tuning.recommended,
+                    previous: tuning.previous_compression,
+                  })
+                : t('compressionTuning.recommended', { compression: tuning.recommended })}
+            </Alert>
+          )}
+          <Table size="small">
+            <TableHead>
+              <TableRow>
+                <TableCell>{t('compressionTuning.columns.compression')}</TableCell>
+                <TableCell align="right">{t('compressionTuning.columns.speed')}</TableCell>
+                <TableCell align="right">{t('compressionTuning.columns.ratio')}</TableCell>
+              </TableRow>
+            </TableHead>
+            <TableBody>
+              {tuning.candidates.map((candidate) => (
+                <TableRow key={candidate.compression}>
+                  <TableCell sx={{ fontFamily: 'monospace' }}>
+                    {candidate.compression}
+                    {candidate.compression === tuning.recommended && (
+                      <Chip
+                        size="small"
+                        color="primary"
+                        label={t('compressionTuning.recommendedChip')}
+                        sx={{ ml: 1 }}
+                      />
+                    )}
+                  </TableCell>
+                  {candidate.error ? (
+                    <TableCell colSpan={2} align="right" sx={{ color: 'error.main' }}>
+                      {candidate.error}
+                    </TableCell>
+                  ) : (
+                    <>
+                      <TableCell align="right">{formatSpeed(candidate.mb_per_second)}</TableCell>
+                      <TableCell align="right">{formatRatio(candidate.ratio)}</TableCell>
+                    </>
+                  )}
+                </TableRow>
+              ))}
+            </TableBody>
+          </Table>
+        </Box>
+      )}
+
+      <Typography variant="body2" sx={{ fontWeight: 600, mb: 1 }}>
+        {t('compressionTuning.observedTitle')}
+      </Typography>
+      {data.observed_backups.length === 0 ? (
+        <Typography variant="body2" sx={{ color: 'text.secondary' }}>
+          {t('compressionTuning.noObservedBackups')}
+        </Typography>
+      ) : (
+        <Table size="small">
+          <TableHead>
+            <TableRow>
+              <TableCell>{t('compressionTuning.columns.completed')}</TableCell>
+              <TableCell align="right">{t('compressionTuning.columns.size')}</TableCell>
+              <TableCell align="right">{t('compressionTuning.columns.speed')}</TableCell>
+              <TableCell align="right">{t('compressionTuning.columns.ratio')}</TableCell>
+            </TableRow>
+          </TableHead>
+          <TableBody>
+            {data.observed_backups.map((backup) => (
+              <TableRow key={backup.job_id}>
+                <TableCell>
+                  {backup.completed_at ? formatDateShort(backup.completed_at) : '—'}
+                </TableCell>
+                <TableCell align="right">{formatBytes(backup.original_size)}</TableCell>
+                <TableCell align="right">{formatSpeed(backup.mb_per_second)}</TableCell>
+                <TableCell align="right">{formatRatio(backup.ratio)}</TableCell>
+              </TableRow>
+            ))}
+          </TableBody>
+        </Table>
+      )}
+    </Paper>
+  )
+}
@@ -75,8 +75,13 @@ interface BrowseCacheEntry {
   currentPath: string
   items: FileSystemItem[]
   isInsideLocalMount: boolean
+  nextCursor: string | null
+  totalItems: number | null
 }
 
+// Entries requested per page; huge directories are browsed with "load more"
+const BROWSE_PAGE_SIZE = 500
+
 function getAgentBrowseCacheKey(agentId: number, path: string, includeHidden: boolean) {
   return `agent:${agentId}:${includeHidden ? 'hidden' : 'visible'}:${path || '/'}`
 }
@@ -154,6 +159,9 @@ export default function FileExplorerDialog({
   const [activeConnectionType, setActiveConnectionType] = useState(connectionType)
   const [activeSshConfig, setActiveSshConfig] = useState(sshConfig)
   const [isInsideLocalMount, setIsInsideLocalMount] = useState(false)
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [totalItems, setTotalItems] = useState<number | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   // Create folder dialog
   const [showCreateFolder, setShowCreateFolder] = useState(false)
@@ -182,8 +190,17 @@ export default function FileExplorerDialog({
   }
 
   const loadDirectory = React.useCallback(
-    async (path: string, conn?: FileExplorerConnectionType, config?: SSHNetworkConfig) => {
+    async (
+      path: string,
+      conn?: FileExplorerConnectionType,
+      config?: SSHNetworkConfig,
+      cursor?: string
+    ) => {
       setError(null)
+      const appendPage = Boolean(cursor)
+      const showItems = (pageItems: FileSystemItem[]) =>
+        setItems((previous) => (appendPage ? [...previous, ...pageItems] : pageItems))
+      const setLoadingState = appendPage ? setLoadingMore : setLoading
 
       // Update state if new connection params provided
       if (conn !== undefined) {
@@ -206,21 +223,24 @@ export default function FileExplorerDialog({
             return
           }
 
-          const cachedEntry = browseCache.current.get(
-            getAgentBrowseCacheKey(agentId, requestedPath, includeHidden)
-          )
+          const cachedEntry = appendPage
+            ? undefined
+            : browseCache.current.get(getAgentBrowseCacheKey(agentId, requestedPath, includeHidden))
           if (cachedEntry) {
             setItems(cachedEntry.items)
             setCurrentPath(cachedEntry.currentPath)
             setIsInsideLocalMount(cachedEntry.isInsideLocalMount)
+            setNextCursor(cachedEntry.nextCursor)
+            setTotalItems(cachedEntry.totalItems)
             return
           }
 
-          setLoading(true)
+          setLoadingState(true)
           const response = await managedAgentsAPI.browseFilesystem(
             agentId,
             requestedPath,
-            includeHidden
+            includeHidden,
+            { limit: BROWSE_PAGE_SIZE, cursor }
           )
           const agentItems = (response.data.items || []).map((item) => ({
             name: item.name,
@@ -234,22 +254,30 @@ export default function FileExplorerDialog({
             permissions: item.hidden ? 'hidden' : undefined,
           }))
           const currentAgentPath = response.data.current_path || requestedPath
-          const entry = {
-            currentPath: currentAgentPath,
-            items: agentItems,
-            isInsideLocalMount: false,
+          const agentNextCursor = response.data.next_cursor ?? null
+          const agentTotalItems = response.data.total_items ?? null
+          if (!appendPage) {
+            const entry = {
+              currentPath: currentAgentPath,
+              items: agentItems,
+              isInsideLocalMount: false,
+              nextCursor: agentNextCursor,
+              totalItems: agentTotalItems,
+            }
+            browseCache.current.set(
+              getAgentBrowseCacheKey(agentId, requestedPath, includeHidden),
+              entry
+            )
+            browseCache.current.set(
+              getAgentBrowseCacheKey(agentId, currentAgentPath, includeHidden),
+              entry
+            )
           }
-          browseCache.current.set(
-            getAgentBrowseCacheKey(agentId, requestedPath, includeHidden),
-            entry
-          )
-          browseCache.current.set(
-            getAgentBrowseCacheKey(agentId, currentAgentPath, includeHidden),
-            entry
-          )
-          setItems(agentItems)
+          showItems(agentItems)
           setCurrentPath(currentAgentPath)
           setIsInsideLocalMount(false)
+          setNextCursor(agentNextCursor)
+          setTotalItems(agentTotalItems)
           return
         }
 
@@ -276,14 +304,18 @@ export default function FileExplorerDialog({
           )
           setCurrentPath(currentRclonePath)
           setIsInsideLocalMount(false)
+          setNextCursor(null)
+          setTotalItems(null)
           return
         }
 
-        setLoading(true)
+        setLoadingState(true)
         // eslint-disable-next-line @typescript-eslint/no-explicit-any
         const params: any = {
           path,
           connection_type: useConnectionType,
+          limit: BROWSE_PAGE_SIZE,
+          cursor,
         }
 
         if (useConnectionType === 'ssh' && useSshConfig) {
@@ -294,9 +326,11 @@ export default function FileExplorerDialog({
         }
 
         const response = await api.get('/filesystem/browse', { params })
-        setItems(response.data.items || [])
+        showItems(response.data.items || [])
         setCurrentPath(response.data.current_path)
         setIsInsideLocalMount(response.data.is_inside_local_mount || false)
+        setNextCursor(response.data.next_cursor ?? null)
+        setTotalItems(response.data.total_items ?? null)
         // eslint-disable-next-line @typescript-eslint/no-explicit-any
       } catch (err: any) {
         if (useConnectionType === 'rclone') {
@@ -311,14 +345,24 @@ export default function FileExplorerDialog({
         } else {
           setError(typeof detail === 'string' ? detail : t('fileExplorer.failedToLoad'))
         }
-        setItems([])
+        if (!appendPage) {
+          setItems([])
+          setNextCursor(null)
+          setTotalItems(null)
+        }
       } finally {
-        setLoading(false)
+        setLoadingState(false)
       }
     },
     [activeConnectionType, activeSshConfig, agentId, rcloneRemoteId, t]
   )
 
+  const handleLoadMore = () => {
+    if (nextCursor) {
+      loadDirectory(currentPath, undefined, undefined, nextCursor)
+    }
+  }
+
   // Initial load - only runs once when dialog opens
   useEffect(() => {
     if (open && !initialLoadDone.current) {
@@ -921,6 +965,21 @@ export default function FileExplorerDialog({
                 )}
               </List>
 
+              {nextCursor && (
+                <Box sx={{ flexShrink: 0, display: 'flex', justifyContent: 'center', py: 1 }}>
+                  <Button size="small" onClick={handleLoadMore} disabled={loadingMore}>
+                    {loadingMore ? (
+                      <CircularProgress size={16} />
+                    ) : (
+                      t('fileExplorer.loadMore', {
+                        shown: items.length,
+                        total: totalItems ?? items.length,
+                      })
+                    )}
+                  </Button>
+                </Box>
+              )}
+
               {/* Info Box */}
               {multiSelect && selectedPaths.length > 0 && (
                 <Box
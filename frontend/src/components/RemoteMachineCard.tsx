@@ -30,6 +30,8 @@ interface StorageInfo {
   available_formatted: string
   percent_used: number
   last_check?: string | null
+  growth_per_day?: number | null
+  growth_per_day_formatted?: string | null
 }
 
 interface RemoteMachine {
@@ -48,6 +50,8 @@ interface RemoteMachine {
   last_success?: string
   error_message?: string
   storage?: StorageInfo | null
+  latency_ms?: number | null
+  throughput_mbps?: number | null
   created_at: string
 }
 
@@ -316,6 +320,20 @@ export default function RemoteMachineCard({
                     {machine.storage.percent_used.toFixed(1)}
                     {t('remoteMachine.percentUsed')}
                   </Typography>
+                  {machine.storage.growth_per_day_formatted && (
+                    <Typography
+                      sx={{
+                        fontSize: '0.58rem',
+                        color: 'text.disabled',
+                        lineHeight: 1,
+                        fontVariantNumeric: 'tabular-nums',
+                      }}
+                    >
+                      {t('remoteMachine.growthPerDay', {
+                        value: machine.storage.growth_per_day_formatted,
+                      })}
+                    </Typography>
+                  )}
                 </Box>
                 <Typography
                   sx={{
@@ -326,6 +344,8 @@ export default function RemoteMachineCard({
                   }}
                 >
                   {t('remoteMachine.total', { value: machine.storage.total_formatted })}
+                  {machine.latency_ms != null &&
+                    ` · ${t('remoteMachine.latency', { value: Math.round(machine.latency_ms) })}`}
                 </Typography>
               </Box>
               <LinearProgress
@@ -28,6 +28,7 @@ import { repositoriesAPI } from '../services/api'
 import { toast } from 'react-hot-toast'
 import RepositoryStatsV1 from './RepositoryStatsV1'
 import RepositoryStatsV2, { type ArchiveEntry } from './RepositoryStatsV2'
+import CompressionTuningPanel from './CompressionTuningPanel'
 import type { CacheStats } from './RepositoryStatsV1'
 import PlanGate from './shared/PlanGate'
 import UpgradePrompt from './UpgradePrompt'
@@ -59,6 +60,7 @@ interface RepositoryInfoDialogProps {
   onRunRecoveryCheck?: (repository: Repository) => void
   canRunRecoveryCheck?: boolean
   isRecoveryCheckStarting?: boolean
+  canTuneCompression?: boolean
 }
 
 interface RecoveryCommand {
@@ -307,6 +309,7 @@ export default function RepositoryInfoDialog({
   onRunRecoveryCheck,
   canRunRecoveryCheck = true,
   isRecoveryCheckStarting = false,
+  canTuneCompression = false,
 }: RepositoryInfoDialogProps) {
   const { t } = useTranslation()
   const [displayRepository, setDisplayRepository] = useState<Repository | null>(repository)
@@ -560,6 +563,13 @@ export default function RepositoryInfoDialog({
                       </Typography>
                     </Alert>
                   )}
+
+                  {displayRepository.executor_type !== 'agent' && (
+                    <CompressionTuningPanel
+                      repositoryId={displayRepository.id}
+                      canTune={canTuneCompression}
+                    />
+                  )}
                 </Box>
               </PlanGate>
             ) : (
@@ -45,6 +45,7 @@ interface ScheduledCheck {
   next_scheduled_check: string | null
   check_max_duration: number
   check_extra_flags?: string | null
+  check_verify_archives_per_run?: number | null
   notify_on_check_success: boolean
   notify_on_check_failure: boolean
   enabled: boolean
@@ -73,6 +74,7 @@ const ScheduledChecksSection = forwardRef<ScheduledChecksSectionRef, {}>((_, ref
     timezone: getBrowserTimeZone(),
     max_duration: 3600,
     check_extra_flags: '',
+    verify_archives_per_run: 0,
   })
   const timezoneOptions = useMemo(
     () => getSupportedTimeZones(formData.timezone),
@@ -99,7 +101,9 @@ const ScheduledChecksSection = forwardRef<ScheduledChecksSectionRef, {}>((_, ref
     formData.check_extra_flags,
     formData.max_duration
   )
-  const hasCheckFlagConflict = conflictingCheckFlags.length > 0
+  // Rotating verification does not run borg check, so its flags do not apply
+  const hasCheckFlagConflict =
+    conflictingCheckFlags.length > 0 && !formData.verify_archives_per_run
 
   // Fetch scheduled checks for all repositories
   const { data: scheduledChecks, isLoading } = useQuery({
@@ -203,6 +207,7 @@ const ScheduledChecksSection = forwardRef<ScheduledChecksSectionRef, {}>((_, ref
       return new BorgApiClient(repo).checkRepository({
         maxDuration: check.check_max_duration,
         checkExtraFlags: check.check_extra_flags || '',
+        verifyArchivesPerRun: check.check_verify_archives_per_run,
       })
     },
     onSuccess: () => {
@@ -223,6 +228,7 @@ const ScheduledChecksSection = forwardRef<ScheduledChecksSectionRef, {}>((_, ref
       timezone: getBrowserTimeZone(),
       max_duration: 3600,
       check_extra_flags: '',
+      verify_archives_per_run: 0,
     })
     setShowDialog(true)
   }
@@ -234,6 +240,7 @@ const ScheduledChecksSection = forwardRef<ScheduledChecksSectionRef, {}>((_, ref
       timezone: check.check_timezone || check.timezone || 'UTC',
       max_duration: check.check_max_duration,
       check_extra_flags: check.check_extra_flags || '',
+      verify_archives_per_run: check.check_verify_archives_per_run ?? 0,
     })
     setShowDialog(true)
   }
@@ -254,6 +261,7 @@ const ScheduledChecksSection = forwardRef<ScheduledChecksSectionRef, {}>((_, ref
           timezone: data.check_timezone || data.timezone || getBrowserTimeZone(),
           max_duration: data.check_max_duration ?? 3600,
           check_extra_flags: data.check_extra_flags || '',
+          verify_archives_per_run: data.check_verify_archives_per_run ?? 0,
         })
       } else {
         setFormData({
@@ -261,6 +269,7 @@ const ScheduledChecksSection = forwardRef<ScheduledChecksSectionRef, {}>((_, ref
           timezone: getBrowserTimeZone(),
           max_duration: 3600,
           check_extra_flags: '',
+          verify_archives_per_run: 0,
         })
       }
       setShowDialog(true)
@@ -272,6 +281,7 @@ const ScheduledChecksSection = forwardRef<ScheduledChecksSectionRef, {}>((_, ref
         timezone: getBrowserTimeZone(),
         max_duration: 3600,
         check_extra_flags: '',
+        verify_archives_per_run: 0,
       })
       setShowDialog(true)
     }
@@ -641,6 +651,20 @@ const ScheduledChecksSection = forwardRef<ScheduledChecksSectionRef, {}>((_, ref
               }}
             />
 
+            <TextField
+              label={t('scheduledChecks.verifyArchivesPerRun')}
+              type="number"
+              value={formData.verify_archives_per_run}
+              onChange={(e) =>
+                setFormData({ ...formData, verify_archives_per_run: Number(e.target.value) })
+              }
+              helperText={t('scheduledChecks.verifyArchivesPerRunHint')}
+              fullWidth
+              slotProps={{
+                htmlInput: { min: 0 },
+              }}
+            />
+
             <TextField
               label={t('scheduledChecks.extraFlags')}
               value={formData.check_extra_flags}
@@ -0,0 +1,90 @@
+import { screen, waitFor } from '@testing-library/react'
+import userEvent from '@testing-library/user-event'
+import { beforeEach, describe, expect, it, vi } from 'vitest'
+import { renderWithProviders } from '../../test/test-utils'
+import CompressionTuningPanel from '../CompressionTuningPanel'
+
+vi.mock('../../services/api', () => ({
+  repositoriesAPI: {
+    getCompressionTuning: vi.fn(),
+    startCompressionTuning: vi.fn(),
+  },
+}))
+
+import { repositoriesAPI } from '../../services/api'
+
+const tuningResponse = {
+  compression: 'lz4',
+  tuning: {
+    status: 'completed',
+    completed_at: '2026-10-01T12:00:00Z',
+    sample_files: 64,
+    sample_bytes: 67108864,
+    recommended: 'zstd,3',
+    applied: false,
+    candidates: [
+      {
+        compression: 'lz4',
+        seconds: 1,
+        stored_bytes: 40000000,
+        ratio: 0.596,
+        mb_per_second: 64,
+        error: null,
+      },
+      {
+        compression: 'zstd,3',
+        seconds: 1.2,
+        stored_bytes: 30000000,
+        ratio: 0.447,
+        mb_per_second: 53.3,
+        error: null,
+      },
+    ],
+  },
+  observed_backups: [
+    {
+      job_id: 7,
+      completed_at: '2026-10-01T11:00:00Z',
+      seconds: 10,
+      original_size: 209715200,
+      mb_per_second: 20,
+      ratio: 0.5,
+    },
+  ],
+}
+
+describe('CompressionTuningPanel', () => {
+  beforeEach(() => {
+    vi.clearAllMocks()
+    vi.mocked(repositoriesAPI.getCompressionTuning).mockResolvedValue({
+      data: tuningResponse,
+    } as Awaited<ReturnType<typeof repositoriesAPI.getCompressionTuning>>)
+  })
+
+  it('shows candidates, the recommendation and observed backup speeds', async () => {
+    renderWithProviders(<CompressionTuningPanel repositoryId={3} canTune={false} />)
+
+    expect(await screen.findByText('44.7%')).toBeInTheDocument()
+    expect(screen.getByText('59.6%')).toBeInTheDocument()
+    expect(screen.getByText('20.0 MB/s')).toBeInTheDocument()
+    expect(screen.queryByRole('button')).not.toBeInTheDocument()
+  })
+
+  it('starts a tuning run with the requested target', async () => {
+    vi.mocked(repositoriesAPI.startCompressionTuning).mockResolvedValue({
+      data: {},
+    } as Awaited<ReturnType<typeof repositoriesAPI.startCompressionTuning>>)
+    const user = userEvent.setup()
+    renderWithProviders(<CompressionTuningPanel repositoryId={3} canTune={true} />)
+
+    await user.type(await screen.findByRole('spinbutton'), '50')
+    await user.click(screen.getByRole('button'))
+
+    await waitFor(() =>
+      expect(repositoriesAPI.startCompressionTuning).toHaveBeenCalledWith(3, {
+        apply: false,
+        target_ratio: 0.5,
+      })
+    )
+  })
+})
@@ -13,6 +13,10 @@ vi.mock('../../services/api', () => ({
   },
 }))
 
+vi.mock('../CompressionTuningPanel', () => ({
+  default: () => null,
+}))
+
 vi.mock('../../hooks/usePlan', () => ({
   usePlan: () => ({
     plan: 'community',
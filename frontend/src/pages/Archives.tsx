@@ -1,8 +1,16 @@
 import React, { useState, useEffect } from 'react'
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { useLocation, useSearchParams } from 'react-router-dom'
 import { useTranslation } from 'react-i18next'
-import { Box, Typography, useTheme, alpha } from '@mui/material'
+import {
+  Box,
+  Button,
+  CircularProgress,
+  TextField,
+  Typography,
+  useTheme,
+  alpha,
+} from '@mui/material'
 import { Folder } from 'lucide-react'
 import { repositoriesAPI, mountsAPI, restoreAPI } from '../services/api'
 import { useRepositoryStats } from '../hooks/useRepositoryStats'
@@ -29,6 +37,7 @@ import { usePermissions } from '../hooks/usePermissions'
 import { useLockBreakPermissions } from '../hooks/useLockBreakPermissions'
 import { useTrackedJobOutcomes } from '../hooks/useTrackedJobOutcomes'
 import { getArchiveAgeBucket, getJobDurationSeconds } from '../utils/analyticsProperties'
+import { getSavedSortOption, type SortOption } from '../utils/archiveGrouping'
 
 interface RestoreJob {
   id: number
@@ -44,6 +53,16 @@ function getDefaultMountPoint(archiveName: string): string {
   return archiveName.replace(/[/:]/g, '_').replace(/\s+/g, '_')
 }
 
+// Archives fetched per request; further pages load on demand
+const ARCHIVE_PAGE_SIZE = 200
+
+// Plain text matches anywhere in the name; text with glob characters is used as is
+function toArchiveNameGlob(value: string): string | undefined {
+  const trimmed = value.trim()
+  if (!trimmed) return undefined
+  return /[*?[]/.test(trimmed) ? trimmed : `*${trimmed}*`
+}
+
 function normalizeRepositoryId(value: number | string | null | undefined): number | null {
   if (typeof value === 'number' && Number.isFinite(value)) return value
   if (typeof value === 'string' && value.trim() !== '') {
@@ -69,6 +88,9 @@ const Archives: React.FC = () => {
     borgVersion?: 1 | 2
   } | null>(null)
   const [mountDialogArchive, setMountDialogArchive] = useState<Archive | null>(null)
+  const [archiveSort, setArchiveSort] = useState<SortOption>(getSavedSortOption)
+  const [nameFilterInput, setNameFilterInput] = useState('')
+  const [nameGlob, setNameGlob] = useState<string | undefined>(undefined)
   const [customMountPoint, setCustomMountPoint] = useState<string>('')
 
   // Restore functionality
@@ -115,14 +137,31 @@ const Archives: React.FC = () => {
     retry: false,
   })
 
-  // Get archives for selected repository after repo info settles
+  useEffect(() => {
+    const timer = setTimeout(() => setNameGlob(toArchiveNameGlob(nameFilterInput)), 300)
+    return () => clearTimeout(timer)
+  }, [nameFilterInput])
+
+  // Get archives for selected repository after repo info settles, one page at
+  // a time in the order the list shows them
   const {
     data: archives,
     isLoading: loadingArchives,
     error: archivesError,
-  } = useQuery({
-    queryKey: ['repository-archives', selectedRepositoryId],
-    queryFn: () => new BorgApiClient(selectedRepository!).listArchives(),
+    hasNextPage: hasMoreArchives,
+    fetchNextPage: fetchMoreArchives,
+    isFetchingNextPage: loadingMoreArchives,
+  } = useInfiniteQuery({
+    queryKey: ['repository-archives', selectedRepositoryId, archiveSort, nameGlob],
+    queryFn: ({ pageParam }) =>
+      new BorgApiClient(selectedRepository!).listArchives({
+        sort: archiveSort === 'date-asc' ? 'oldest' : 'newest',
+        limit: ARCHIVE_PAGE_SIZE,
+        cursor: pageParam,
+        name: nameGlob,
+      }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.data?.next_cursor ?? undefined,
     enabled: !!selectedRepository && !repoInfoPending,
     retry: false,
   })
@@ -430,10 +469,11 @@ const Archives: React.FC = () => {
     }
   }, [location.state, setSearchParams])
 
-  const archivesList = (archives?.data?.archives || []).sort((a: Archive, b: Archive) => {
-    // Sort by start date (borg1) or time (borg2), latest first
-    return new Date(b.start || b.time).getTime() - new Date(a.start || a.time).getTime()
-  })
+  const archivesList: Archive[] = React.useMemo(
+    () => (archives?.pages || []).flatMap((page) => page.data?.archives || []),
+    [archives]
+  )
+  const archivesTotal: number = archives?.pages[0]?.data?.total ?? archivesList.length
 
   const repositoryStats = useRepositoryStats(repoInfo?.data?.info, selectedRepository?.borg_version)
 
@@ -574,7 +614,9 @@ const Archives: React.FC = () => {
               ) : repositoryStats ? (
                 <RepositoryStatsGrid
                   stats={repositoryStats}
-                  archivesCount={archivesList.length}
+                  archivesCount={
+                    nameGlob ? (selectedRepository?.archive_count ?? archivesTotal) : archivesTotal
+                  }
                   borgVersion={selectedRepository?.borg_version}
                   archivesLoading={loadingArchives || repoInfoPending}
                 />
@@ -598,9 +640,41 @@ const Archives: React.FC = () => {
         )}
 
       {/* ── Archives list ── */}
+      {selectedRepositoryId && (
+        <TextField
+          size="small"
+          value={nameFilterInput}
+          onChange={(event) => setNameFilterInput(event.target.value)}
+          placeholder={t('archivesList.nameFilterPlaceholder')}
+          inputProps={{ 'aria-label': t('archivesList.nameFilterPlaceholder') }}
+          sx={{ mb: 2, width: { xs: '100%', sm: 320 } }}
+        />
+      )}
       {selectedRepositoryId && (
         <ArchivesList
           archives={archivesList}
+          totalCount={archivesTotal}
+          onSortChange={setArchiveSort}
+          footer={
+            hasMoreArchives && (
+              <Box sx={{ display: 'flex', justifyContent: 'center', py: 1.5 }}>
+                <Button
+                  size="small"
+                  onClick={() => fetchMoreArchives()}
+                  disabled={loadingMoreArchives}
+                >
+                  {loadingMoreArchives ? (
+                    <CircularProgress size={16} />
+                  ) : (
+                    t('archivesList.loadMore', {
+                      shown: archivesList.length,
+                      total: archivesTotal,
+                    })
+                  )}
+                </Button>
+              </Box>
+            )
+          }
           repositoryName={selectedRepository?.name || ''}
           loading={loadingArchives || repoInfoPending}
           onViewArchive={handleViewArchive}
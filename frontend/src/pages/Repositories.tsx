@@ -379,7 +379,8 @@ export default function Repositories() {
     mutationFn: ({ id, data }: { id: number; data: any }) => {
       const repo = repositories.find((r: Repository) => r.id === id)
       if (!repo) throw new Error('Repository not found')
-      return new BorgApiClient(repo).pruneArchives(data)
+      const client = new BorgApiClient(repo)
+      return data.dry_run ? client.previewPrune(data) : client.pruneArchives(data)
     },
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
     onSuccess: (response: any) => {
@@ -1031,6 +1032,7 @@ export default function Repositories() {
           viewingInfoRepository ? permissions.canDo(viewingInfoRepository.id, 'maintenance') : false
         }
         isRecoveryCheckStarting={checkRepositoryMutation.isPending}
+        canTuneCompression={canManageRepositoriesGlobally}
       />
 
       {/* Prune Repository Dialog */}
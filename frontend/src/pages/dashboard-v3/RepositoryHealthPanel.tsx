@@ -513,6 +513,34 @@ export function RepositoryHealthPanel({
                 <Typography sx={{ fontFamily: T.mono, fontSize: '0.75rem', color: T.textMuted }}>
                   {repo.total_size}
                 </Typography>
+                {repo.verify_coverage && (
+                  <Tooltip
+                    title={t('dashboard.repositoryHealth.verifyCoverageTooltip', {
+                      verified: repo.verify_coverage.archives_verified,
+                      count: repo.verify_coverage.archive_count,
+                      oldest: repo.verify_coverage.oldest_verified_at
+                        ? formatDistanceToNow(new Date(repo.verify_coverage.oldest_verified_at), {
+                            addSuffix: true,
+                          })
+                        : t('common.never'),
+                    })}
+                    arrow
+                    placement="top"
+                  >
+                    <Typography
+                      sx={{
+                        fontFamily: T.mono,
+                        fontSize: '0.75rem',
+                        color: T.textMuted,
+                        cursor: 'help',
+                      }}
+                    >
+                      {t('dashboard.repositoryHealth.verifyCoverageShort', {
+                        percent: repo.verify_coverage.percent,
+                      })}
+                    </Typography>
+                  </Tooltip>
+                )}
               </Stack>
 
               {Boolean(repo.backup_plan_count) && (
@@ -57,6 +57,13 @@ export interface DashboardOverview {
     restore_check_configured?: boolean
     latest_restore_check_status?: string | null
     latest_restore_check_error?: string | null
+    verify_coverage?: {
+      archive_count: number
+      archives_verified: number
+      percent: number
+      oldest_verified_at: string | null
+      last_verified_at: string | null
+    } | null
     dimension_health: {
       backup: 'healthy' | 'warning' | 'critical' | 'unknown'
       check: 'healthy' | 'warning' | 'critical' | 'unknown'
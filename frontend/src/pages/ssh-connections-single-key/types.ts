@@ -7,6 +7,8 @@ export interface StorageInfo {
   available_formatted: string
   percent_used: number
   last_check?: string | null
+  growth_per_day?: number | null
+  growth_per_day_formatted?: string | null
 }
 
 export interface SSHConnection {
@@ -26,6 +28,8 @@ export interface SSHConnection {
   last_success?: string
   error_message?: string
   storage?: StorageInfo | null
+  latency_ms?: number | null
+  throughput_mbps?: number | null
   created_at: string
 }
 
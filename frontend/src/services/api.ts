@@ -120,6 +120,40 @@ api.interceptors.response.use(
   }
 )
 
+export interface CompressionTuningCandidate {
+  compression: string
+  seconds: number
+  stored_bytes: number
+  ratio: number | null
+  mb_per_second: number | null
+  error: string | null
+}
+
+export interface CompressionTuningResponse {
+  compression: string
+  tuning: {
+    status: 'running' | 'completed' | 'failed' | 'interrupted'
+    started_at?: string | null
+    completed_at?: string | null
+    target_ratio?: number | null
+    sample_files?: number
+    sample_bytes?: number
+    candidates?: CompressionTuningCandidate[]
+    recommended?: string | null
+    applied?: boolean
+    previous_compression?: string | null
+    error?: string | null
+  } | null
+  observed_backups: Array<{
+    job_id: number
+    completed_at: string | null
+    seconds: number
+    original_size: number
+    mb_per_second: number | null
+    ratio: number | null
+  }>
+}
+
 export interface RepositoryData {
   name?: string
   borg_version?: 1 | 2
@@ -164,6 +198,7 @@ export interface RepositoryData {
   rclone_storage?: RcloneStorage | null
   custom_flags?: string | null
   upload_ratelimit_kib?: number | null
+  process_priorities?: Record<string, 'normal' | 'low' | 'idle'> | null
   check_extra_flags?: string | null
   bypass_lock?: boolean
   has_schedule?: boolean
@@ -646,6 +681,12 @@ export const dashboardAPI = {
   getMetrics: () => api.get('/dashboard/metrics'),
   getSchedule: () => api.get('/dashboard/schedule'),
   getOverview: () => api.get('/dashboard/overview'),
+  getTrends: (params: {
+    metric: string
+    resolution?: 'raw' | 'hour' | 'day' | 'week'
+    days?: number
+    repository_id?: number
+  }) => api.get('/dashboard/trends', { params }),
 }
 
 export const licensingAPI = {
@@ -895,6 +936,10 @@ export const repositoriesAPI = {
     api.post<RepositoryWipeJob>(`/repositories/${id}/wipe-jobs/${jobId}/cancel`),
   breakLock: (id: number) => api.post(`/repositories/${id}/break-lock`),
   getRepositoryStats: (id: number) => api.get(`/repositories/${id}/stats`),
+  getCompressionTuning: (id: number) =>
+    api.get<CompressionTuningResponse>(`/repositories/${id}/compression-tuning`),
+  startCompressionTuning: (id: number, data: { apply?: boolean; target_ratio?: number | null }) =>
+    api.post(`/repositories/${id}/compression-tuning`, data),
   listRepositoryArchives: (id: number) => api.get(`/repositories/${id}/archives`),
   getRepositoryInfo: (id: number) => api.get(`/repositories/${id}/info`),
   syncRcloneRepository: (id: number) => api.post(`/repositories/${id}/rclone/sync`),
@@ -1182,6 +1227,8 @@ export interface AgentFilesystemBrowseResponse {
   parent_path: string | null
   items: AgentFilesystemItem[]
   items_truncated?: boolean
+  next_cursor?: string | null
+  total_items?: number | null
 }
 
 export interface AgentDiagnosticsTargetRequest {
@@ -1270,10 +1317,15 @@ export const managedAgentsAPI = {
     api.get<AgentJobLogEntryResponse[]>(`/managed-machines/agent-jobs/${jobId}/logs`),
   listAgentLogs: (agentId: number) =>
     api.get<AgentSessionLogEntryResponse[]>(`/managed-machines/agents/${agentId}/logs`),
-  browseFilesystem: (agentId: number, path = '/', includeHidden = false) =>
+  browseFilesystem: (
+    agentId: number,
+    path = '/',
+    includeHidden = false,
+    page?: { limit?: number; cursor?: string }
+  ) =>
     api.get<AgentFilesystemBrowseResponse>(
       `/managed-machines/agents/${agentId}/filesystem/browse`,
-      { params: { path, include_hidden: includeHidden } }
+      { params: { path, include_hidden: includeHidden, ...page } }
     ),
   runDiagnostics: (agentId: number, data: AgentDiagnosticsRequest) =>
     api.post<AgentDiagnosticsResponse>(`/managed-machines/agents/${agentId}/diagnostics`, data),
@@ -75,18 +75,23 @@ describe('BorgApiClient', () => {
 
     client.getInfo()
     client.listArchives()
+    client.listArchives({ sort: 'newest', limit: 50 })
     client.getArchiveInfo('archive-1')
     client.getArchiveContents('archive-id', 'archive-name', '/etc')
     client.deleteArchive('archive-1')
     client.getDeleteJobStatus(12)
     client.runBackup({ archive_name: 'nightly' })
     client.pruneArchives({ keep_daily: 7, keep_within: '1d' })
+    client.previewPrune({ keep_daily: 7 })
     client.compact()
     client.checkRepository(30)
     client.fetchArchiveFile('archive-1', '/etc/hosts')
 
     expect(getMock).toHaveBeenCalledWith('/repositories/7/info')
     expect(getMock).toHaveBeenCalledWith('/repositories/7/archives')
+    expect(getMock).toHaveBeenCalledWith('/repositories/7/archives', {
+      params: { sort: 'newest', limit: 50 },
+    })
     expect(getMock).toHaveBeenCalledWith('/archives/archive-1/info', {
       params: { repository: 7, include_files: false, file_limit: 1000 },
     })
@@ -105,6 +110,7 @@ describe('BorgApiClient', () => {
       keep_daily: 7,
       keep_within: '1d',
     })
+    expect(postMock).toHaveBeenCalledWith('/repositories/7/prune-preview', { keep_daily: 7 })
     expect(postMock).toHaveBeenCalledWith('/repositories/7/compact')
     expect(postMock).toHaveBeenCalledWith('/repositories/7/check', { max_duration: 30 })
     expect(getMock).toHaveBeenCalledWith('/archives/download', {
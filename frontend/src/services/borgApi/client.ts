@@ -79,9 +79,22 @@ export interface PruneOptions {
   dry_run?: boolean
 }
 
+/** Server-side paging for archive lists; omit for the full list. */
+export interface ArchiveListParams {
+  sort?: 'oldest' | 'newest' | 'name_asc' | 'name_desc'
+  limit?: number
+  cursor?: string
+  /** Shell-style glob matched against the archive name. */
+  name?: string
+  since?: string
+  until?: string
+}
+
 export interface CheckRepositoryOptions {
   maxDuration?: number
   checkExtraFlags?: string | null
+  /** Verify the data of this many archives instead of running borg check. */
+  verifyArchivesPerRun?: number | null
 }
 
 function usesRepositoryDispatcher(data: Omit<Repository, 'id'>): boolean {
@@ -141,7 +154,10 @@ export class BorgApiClient {
 
   // ── Archives ─────────────────────────────────────────────────────────────
 
-  listArchives() {
+  listArchives(params?: ArchiveListParams) {
+    if (params) {
+      return httpClient.get(`${this.repoBase}/archives`, { params })
+    }
     return httpClient.get(`${this.repoBase}/archives`)
   }
 
@@ -222,6 +238,11 @@ export class BorgApiClient {
     return httpClient.post(`/repositories/${this.repoId}/prune`, options)
   }
 
+  /** Evaluate the retention policy over the cached archive list; Borg is not run. */
+  previewPrune(options: PruneOptions = {}) {
+    return httpClient.post(`/repositories/${this.repoId}/prune-preview`, options)
+  }
+
   compact() {
     if (this.v === '/v2') {
       return httpClient.post(`/v2/backup/compact`, { repository_id: this.repoId })
@@ -237,6 +258,9 @@ export class BorgApiClient {
     const payload = {
       ...(options.maxDuration !== undefined && { max_duration: options.maxDuration }),
       ...(options.checkExtraFlags !== undefined && { check_extra_flags: options.checkExtraFlags }),
+      ...(options.verifyArchivesPerRun && {
+        verify_archives_per_run: options.verifyArchivesPerRun,
+      }),
     }
 
     if (this.v === '/v2') {
@@ -9,4 +9,4 @@
 
 export { BorgApiProvider, useBorgApi } from './context'
 export { BorgApiClient } from './client'
-export type { Repository, BackupOptions, PruneOptions } from './client'
+export type { Repository, ArchiveListParams, BackupOptions, PruneOptions } from './client'
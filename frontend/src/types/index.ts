@@ -82,6 +82,7 @@ export interface Repository {
   bypass_lock?: boolean
   custom_flags?: string | null
   upload_ratelimit_kib?: number | null
+  process_priorities?: Record<string, 'normal' | 'low' | 'idle'> | null
   check_extra_flags?: string | null
   archive_count?: number
   total_size?: string | null
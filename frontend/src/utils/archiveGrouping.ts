@@ -151,3 +151,14 @@ export function sortArchives(archives: Archive[], sortBy: SortOption): Archive[]
       return sorted
   }
 }
+
+/**
+ * Sort option saved by the archives list, or the default (newest first)
+ */
+export function getSavedSortOption(): SortOption {
+  const saved = localStorage.getItem('archives-list-sort-by')
+  if (saved && ['date-desc', 'date-asc'].includes(saved)) {
+    return saved as SortOption
+  }
+  return 'date-desc'
+}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Measure local restore throughput for a range of extract shard counts.
+
+Creates a throwaway Borg 1 repository with a synthetic tree (a few large
+files plus many small ones), lists the archive the way the archive browser
+does, and restores it with the same shard plan and commands RestoreService
+uses, once per shard count:
+
+    python scripts/benchmark_sharded_restore.py                   # 1 2 4 8 shards
+    python scripts/benchmark_sharded_restore.py --shards 1 2 4 --size-mb 4096
+    python scripts/benchmark_sharded_restore.py --workdir /mnt/nvme/bench
+
+Data is random (incompressible) and the repository uses repokey encryption,
+so the numbers reflect decryption and decompression cost rather than
+deduplication. Put --workdir on the disk you care about; the tree is
+written twice (source and every restore) and cleaned up afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.borg_router import BorgRouter  # noqa: E402
+from app.services.archive_browse_service import parse_archive_items  # noqa: E402
+from app.services.restore_shards import (  # noqa: E402
+    ShardedExtract,
+    directory_patterns,
+    plan_restore_shards,
+    shard_patterns,
+    write_patterns_file,
+)
+
+PASSPHRASE = "benchmark"
+ARCHIVE = "bench"
+
+
+def make_tree(root: Path, size_mb: int) -> None:
+    """Half the bytes in 64 MiB files, half in 256 KiB files across dirs."""
+    large = root / "large"
+    large.mkdir(parents=True)
+    budget = size_mb * 1024 * 1024
+    for index in range(max(1, budget // 2 // (64 * 1024 * 1024))):
+        (large / f"blob-{index:03d}.bin").write_bytes(os.urandom(64 * 1024 * 1024))
+    small_count = budget // 2 // (256 * 1024)
+    for index in range(small_count):
+        directory = root / "small" / f"d{index // 200:03d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"f{index:05d}.bin").write_bytes(os.urandom(256 * 1024))
+
+
+def borg(env: dict, *args: str) -> str:
+    return subprocess.run(
+        ["borg", *args], env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+
+async def restore(
+    repo: str, env: dict, items: list, shards: int, target: Path
+) -> tuple[float, int]:
+    router = BorgRouter(type("Repo", (), {"borg_version": 1})())
+    args = {"repository_path": repo, "archive_name": ARCHIVE, "paths": []}
+    plan = plan_restore_shards(items, [], shards) if shards > 1 else None
+    pattern_files = []
+    if plan is None:
+        commands = [router.build_restore_extract_command(**args)]
+        final_command = None
+    else:
+        commands = []
+        for shard in plan.shards:
+            pattern_files.append(write_patterns_file(shard_patterns(shard)))
+            commands.append(
+                router.build_restore_extract_command(
+                    **args, patterns_from=pattern_files[-1]
+                )
+            )
+        final_command = None
+        if plan.split_directories:
+            pattern_files.append(
+                write_patterns_file(directory_patterns(plan.split_directories))
+            )
+            final_command = router.build_restore_extract_command(
+                **args, patterns_from=pattern_files[-1]
+            )
+
+    target.mkdir(parents=True)
+    extract = ShardedExtract(commands, env, str(target), final_command)
+    started = time.monotonic()
+    try:
+        returncode = await extract.run()
+    finally:
+        for pattern_file in pattern_files:
+            os.unlink(pattern_file)
+    elapsed = time.monotonic() - started
+    if returncode not in (0, 1):
+        raise SystemExit(
+            f"Restore with {shards} shard(s) failed ({returncode}):\n"
+            + "\n".join(list(extract.stderr_lines)[-20:])
+        )
+    return elapsed, len(commands)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--workdir", default=None)
+    options = parser.parse_args()
+
+    if not shutil.which("borg"):
+        raise SystemExit("borg is not installed")
+
+    workdir = Path(tempfile.mkdtemp(prefix="borg-ui-bench-", dir=options.workdir))
+    env = {
+        **os.environ,
+        "BORG_PASSPHRASE": PASSPHRASE,
+        "BORG_BASE_DIR": str(workdir / "borg-home"),
+    }
+    try:
+        source = workdir / "source"
+        repo = str(workdir / "repo")
+        print(f"Writing {options.size_mb} MB of test data to {source}")
+        make_tree(source, options.size_mb)
+        borg(env, "init", "--encryption", "repokey", repo)
+        subprocess.run(
+            ["borg", "create", "--compression", "lz4", f"{repo}::{ARCHIVE}", "."],
+            env=env,
+            cwd=source,
+            check=True,
+        )
+        items = parse_archive_items(
+            borg(env, "list", "--json-lines", f"{repo}::{ARCHIVE}")
+        )
+        total = sum(item["size"] or 0 for item in items if item["type"] == "-")
+
+        results = []
+        for shards in options.shards:
+            target = workdir / f"restore-{shards}"
+            elapsed, processes = asyncio.run(restore(repo, env, items, shards, target))
+            shutil.rmtree(target)
+            throughput = total / (1024 * 1024) / elapsed
+            results.append(
+                {
+                    "shards": shards,
+                    "processes": processes,
+                    "seconds": round(elapsed, 2),
+                    "mb_per_second": round(throughput, 1),
+                }
+            )
+            print(
+                f"{shards:>3} shard(s), {processes} process(es): "
+                f"{elapsed:7.2f}s  {throughput:8.1f} MB/s"
+            )
+
+        print(json.dumps({"cpu_count": os.cpu_count(), "results": results}))
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
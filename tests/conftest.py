@@ -82,6 +82,26 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_archive_list_cache():
+    """Repository ids repeat across per-test databases; drop cached lists."""
+    from app.services.archive_list_cache import archive_list_cache
+
+    archive_list_cache.clear()
+    yield
+    archive_list_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_repository_permission_cache():
+    """User ids repeat across per-test databases; drop cached permissions."""
+    from app.core.security import invalidate_repository_permissions
+
+    invalidate_repository_permissions()
+    yield
+    invalidate_repository_permissions()
+
+
 def pytest_sessionfinish(session, exitstatus):
     """Clean up asyncio after all tests complete.
 
@@ -101,6 +101,9 @@ def test_db(tmp_path, monkeypatch):
         patch("app.services.mqtt_service.SessionLocal", TestingSessionLocal),
         patch("app.services.remote_backup_service.SessionLocal", TestingSessionLocal),
         patch("app.services.stats_refresh_scheduler.SessionLocal", TestingSessionLocal),
+        patch(
+            "app.services.connection_storage_prober.SessionLocal", TestingSessionLocal
+        ),
         patch("app.services.restore_check_scheduler.SessionLocal", TestingSessionLocal),
         patch("app.api.schedule.SessionLocal", TestingSessionLocal),
         patch("app.api.repositories.SessionLocal", TestingSessionLocal),
@@ -1,3 +1,4 @@
+import base64
 from pathlib import Path
 
 import pytest
@@ -49,6 +50,45 @@ def test_browse_filesystem_structured_failures(tmp_path: Path, path_factory, cod
     assert exc.value.to_result()["error"]["code"] == code
 
 
+def test_browse_filesystem_pages_with_cursor(tmp_path: Path):
+    for index in range(5):
+        (tmp_path / f"file-{index}.txt").write_text("x")
+    (tmp_path / "sub").mkdir()
+
+    first = browse_filesystem(str(tmp_path), limit=3)
+    second = browse_filesystem(str(tmp_path), limit=3, cursor=first["next_cursor"])
+
+    assert [item["name"] for item in first["items"]] == [
+        "sub",
+        "file-0.txt",
+        "file-1.txt",
+    ]
+    assert [item["name"] for item in second["items"]] == [
+        "file-2.txt",
+        "file-3.txt",
+        "file-4.txt",
+    ]
+    assert second["next_cursor"] is None
+    assert first["total_items"] == 6
+    filtered = browse_filesystem(str(tmp_path), limit=3, name_filter="-4")
+    assert [item["name"] for item in filtered["items"]] == ["file-4.txt"]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-base64!", '[true,false,"a"]', '[true,false,1,"x"]', '["a","b","c","d"]'],
+)
+def test_browse_filesystem_rejects_malformed_cursor(tmp_path: Path, cursor):
+    (tmp_path / "file.txt").write_text("x")
+    if cursor.startswith("["):
+        cursor = base64.urlsafe_b64encode(cursor.encode()).decode().rstrip("=")
+
+    with pytest.raises(FilesystemBrowseError) as exc_info:
+        browse_filesystem(str(tmp_path), limit=3, cursor=cursor)
+
+    assert exc_info.value.code == "invalid_cursor"
+
+
 class BrowseClient:
     def __init__(self):
         self.calls = []
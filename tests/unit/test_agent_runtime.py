@@ -1,7 +1,8 @@
 import base64
 import json
-import queue
+import socket as socket_module
 import threading
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -759,9 +760,9 @@ def test_session_delivers_result_over_rest_not_ws(patch_session_platform, monkey
 def test_session_command_client_delivers_error_over_rest():
     """A failed command reports via REST fail_job (with error_message/return_code
     preserved), not over the WebSocket."""
-    from agent.borg_ui_agent.session import SessionCommandClient
+    from agent.borg_ui_agent.session import SessionCommandClient, SessionOutbox
 
-    outbox = queue.Queue()
+    outbox = SessionOutbox()
     http = RecordingHttpClient()
     client = SessionCommandClient(
         command_id="cmd-1", job_id=7, outbox=outbox, http_client=http
@@ -779,13 +780,13 @@ def test_session_command_client_delivers_error_over_rest():
 def test_session_terminal_rest_failure_is_swallowed():
     """If REST delivery raises, the worker must not crash: the failure is logged
     and swallowed, and the client still marks the job finished."""
-    from agent.borg_ui_agent.session import SessionCommandClient
+    from agent.borg_ui_agent.session import SessionCommandClient, SessionOutbox
 
     class FailingHttpClient:
         def complete_job(self, job_id, *, result):
             raise RuntimeError("rest unreachable")
 
-    outbox = queue.Queue()
+    outbox = SessionOutbox()
     client = SessionCommandClient(
         command_id="cmd-1", job_id=9, outbox=outbox, http_client=FailingHttpClient()
     )
@@ -1201,6 +1202,227 @@ def test_session_runtime_writes_the_socket_from_one_thread_only(monkeypatch):
     assert set(socket.send_timeouts) == {30}
 
 
+class SelectableWebSocket(FakeWebSocket):
+    """FakeWebSocket whose incoming frames arrive over a real socket pair, so the
+    session waits on it with select() like on a websocket-client connection."""
+
+    def __init__(self):
+        super().__init__([])
+        self.sock, self._server = socket_module.socketpair()
+        self.sender_threads = set()
+
+    def push(self, message):
+        self._server.sendall((json.dumps(message) + "\n").encode())
+
+    def send(self, payload):
+        self.sender_threads.add(threading.get_ident())
+        super().send(payload)
+
+    def recv(self):
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = self.sock.recv(1)
+            if not chunk:
+                raise EOFError("closed")
+            data += chunk
+        return data.decode()
+
+    def close(self):
+        super().close()
+        self.sock.close()
+        self._server.close()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+def test_session_outbox_coalesces_progress_and_never_drops_frames():
+    from agent.borg_ui_agent.session import SessionOutbox
+
+    outbox = SessionOutbox(max_frames=2)
+    assert outbox.put("log-1")
+    assert outbox.put("progress-1", coalesce_key=("cmd", 1))
+    assert outbox.put("progress-2", coalesce_key=("cmd", 1))
+    assert outbox.put("log-2")
+
+    # Full: the next frame waits for the session thread instead of being dropped.
+    blocked = threading.Thread(target=outbox.put, args=("log-3",))
+    blocked.start()
+    blocked.join(timeout=0.1)
+    assert blocked.is_alive()
+
+    assert outbox.drain() == ["log-1", "progress-2", "log-2"]
+    blocked.join(timeout=5)
+    assert outbox.drain() == ["log-3"]
+
+    outbox.close()
+    assert outbox.put("late") is False
+
+
+@pytest.mark.unit
+def test_session_outbox_non_blocking_put_ignores_the_bound():
+    from agent.borg_ui_agent.session import SessionOutbox
+
+    outbox = SessionOutbox(max_frames=1)
+    assert outbox.put("log-1")
+    assert outbox.put("ack", block=False)
+
+    assert outbox.drain() == ["log-1", "ack"]
+
+
+@pytest.mark.unit
+def test_session_runtime_shutdown_drains_workers_blocked_on_a_full_outbox(
+    patch_session_platform, monkeypatch
+):
+    from agent.borg_ui_agent.session import AgentSessionRuntime, SessionOutbox
+
+    monkeypatch.setitem(SessionOutbox.__init__.__kwdefaults__, "max_frames", 2)
+
+    def fake_handler(job, client, *, should_cancel=None):
+        for sequence in range(6):
+            client.send_log(7, sequence=sequence, stream="stdout", message="line")
+        return SimpleNamespace(job_id=7, status="completed", message="done")
+
+    monkeypatch.setattr(
+        "agent.borg_ui_agent.session.get_job_handler",
+        lambda command: fake_handler if command == "backup.create" else None,
+    )
+    socket = FakeWebSocket(
+        [
+            {
+                "type": "command",
+                "command_id": "cmd-7",
+                "command": "backup.create",
+                "job_id": 7,
+                "payload": {},
+            }
+        ]
+    )
+    http = RecordingHttpClient()
+    runtime = AgentSessionRuntime(
+        AgentConfig("https://borgui.example.com", "agt_123", "secret"),
+        connect=lambda *args, **kwargs: socket,
+        http_client=http,
+    )
+    session = threading.Thread(target=runtime.run_session, kwargs={"max_messages": 1})
+    session.start()
+    session.join(timeout=10)
+
+    assert not session.is_alive()
+    assert [frame["type"] for frame in socket.sent].count("log") == 6
+    assert [job_id for job_id, _ in http.completed] == [7]
+
+
+@pytest.mark.unit
+def test_session_runtime_writes_worker_frames_without_waiting_for_recv(
+    patch_session_platform, monkeypatch
+):
+    """An event-driven session writes a worker's frame as soon as it is queued,
+    while no server message is arriving, and still from the session thread."""
+    from agent.borg_ui_agent.session import AgentSessionRuntime
+
+    socket = SelectableWebSocket()
+    released = threading.Event()
+
+    def fake_handler(job, client, *, should_cancel=None):
+        client.send_log(91, sequence=1, stream="stdout", message="running")
+        released.wait(timeout=5)
+        return SimpleNamespace(job_id=91, status="completed", message="done")
+
+    monkeypatch.setattr(
+        "agent.borg_ui_agent.session.get_job_handler",
+        lambda command: fake_handler if command == "backup.create" else None,
+    )
+    runtime = AgentSessionRuntime(
+        AgentConfig("https://borgui.example.com", "agt_123", "secret"),
+        connect=lambda *args, **kwargs: socket,
+        http_client=RecordingHttpClient(),
+    )
+    session = threading.Thread(target=runtime.run_session, kwargs={"max_messages": 2})
+    session.start()
+    try:
+        socket.push(
+            {
+                "type": "command",
+                "command_id": "cmd-9",
+                "command": "backup.create",
+                "job_id": 91,
+                "payload": {},
+            }
+        )
+        _wait_for(lambda: any(frame["type"] == "log" for frame in socket.sent))
+    finally:
+        released.set()
+        socket.push({"type": "noop"})
+        session.join(timeout=5)
+
+    assert not session.is_alive()
+    assert [frame["type"] for frame in socket.sent] == [
+        "hello",
+        "command_ack",
+        "job_started",
+        "log",
+    ]
+    assert socket.sender_threads == {session.ident}
+    assert set(socket.send_timeouts) == {30}
+
+
+@pytest.mark.unit
+def test_session_runtime_queues_commands_beyond_the_pool_limit(
+    patch_session_platform, monkeypatch
+):
+    from agent.borg_ui_agent.session import COMMAND_POOL_LIMITS, AgentSessionRuntime
+
+    monkeypatch.setitem(COMMAND_POOL_LIMITS, "backup", 1)
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def fake_handler(job, client, *, should_cancel=None):
+        with lock:
+            running.append(job["id"])
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(job["id"])
+        return SimpleNamespace(job_id=job["id"], status="completed", message="ok")
+
+    monkeypatch.setattr(
+        "agent.borg_ui_agent.session.get_job_handler",
+        lambda command: fake_handler if command == "backup.create" else None,
+    )
+    socket = FakeWebSocket(
+        [
+            {
+                "type": "command",
+                "command_id": f"cmd-{job_id}",
+                "command": "backup.create",
+                "job_id": job_id,
+                "payload": {},
+            }
+            for job_id in (1, 2, 3)
+        ]
+    )
+    http = RecordingHttpClient()
+    runtime = AgentSessionRuntime(
+        AgentConfig("https://borgui.example.com", "agt_123", "secret"),
+        connect=lambda *args, **kwargs: socket,
+        http_client=http,
+    )
+    runtime.run_session(max_messages=3)
+
+    assert max(peak) == 1
+    assert sorted(job_id for job_id, _ in http.completed) == [1, 2, 3]
+    # Every command is acknowledged on arrival, before it gets a worker.
+    assert [frame["type"] for frame in socket.sent[1:4]] == ["command_ack"] * 3
+
+
 @pytest.mark.unit
 def test_session_runtime_sends_ping_on_idle_recv_timeout(monkeypatch):
     from agent.borg_ui_agent.session import AgentSessionRuntime
@@ -657,6 +657,143 @@ class TestRecentActivityEndpoint:
         assert activity[0]["status"] == "completed"
         assert activity[0]["type"] == "backup"
 
+    def test_activity_feed_pages_with_keyset_cursor_and_filters(
+        self, test_client, admin_headers, test_db
+    ):
+        from sqlalchemy import event
+
+        from app.database.models import BackupJob, CheckJob
+
+        repo = _create_activity_repository(test_db, "Feed Repo")
+        other = _create_activity_repository(test_db, "Other Feed Repo")
+        start = datetime(2024, 3, 1, 8, 0, 0)
+        for index in range(5):
+            test_db.add(
+                BackupJob(
+                    repository=repo.path,
+                    status="failed" if index % 2 else "completed",
+                    started_at=start + timedelta(hours=index),
+                )
+            )
+            test_db.add(
+                CheckJob(
+                    repository_id=other.id,
+                    repository_path=other.path,
+                    status="completed",
+                    started_at=start + timedelta(hours=index, minutes=30),
+                )
+            )
+        # Same start time as a backup: ties break by type, then id
+        test_db.add(
+            CheckJob(
+                repository_id=repo.id,
+                repository_path=repo.path,
+                status="completed",
+                started_at=start,
+            )
+        )
+        test_db.commit()
+
+        statements = []
+        engine = test_db.get_bind()
+
+        def count(*args):
+            statements.append(args[2])
+
+        seen = []
+        cursor = None
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            while True:
+                params = {"limit": 4, **({"cursor": cursor} if cursor else {})}
+                response = test_client.get(
+                    "/api/activity/feed", params=params, headers=admin_headers
+                )
+                assert response.status_code == 200
+                page = response.json()
+                seen.extend((item["type"], item["id"]) for item in page["items"])
+                cursor = page["next_cursor"]
+                if not cursor:
+                    break
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert len(seen) == len(set(seen)) == 11
+        times = [
+            datetime.fromisoformat(item["started_at"].replace("Z", "+00:00"))
+            for item in test_client.get(
+                "/api/activity/recent?limit=11", headers=admin_headers
+            ).json()
+        ]
+        assert times == sorted(times, reverse=True)
+        # Three pages; each costs the same handful of queries, not one per row
+        assert len(statements) < 3 * 12
+
+        failed = test_client.get(
+            "/api/activity/feed?status=failed&limit=1", headers=admin_headers
+        ).json()
+        assert [item["status"] for item in failed["items"]] == ["failed"]
+        assert failed["next_cursor"]
+
+        by_repo = test_client.get(
+            f"/api/activity/feed?repository_id={other.id}", headers=admin_headers
+        ).json()
+        assert {item["type"] for item in by_repo["items"]} == {"check"}
+        assert len(by_repo["items"]) == 5
+
+        invalid = test_client.get(
+            "/api/activity/feed?cursor=not-a-cursor", headers=admin_headers
+        )
+        assert invalid.status_code == 400
+        assert invalid.json()["detail"]["key"] == (
+            "backend.errors.activity.invalidCursor"
+        )
+
+    def test_activity_feed_hides_repositories_the_user_cannot_view(
+        self, test_client, test_db
+    ):
+        from app.core.security import create_access_token, get_password_hash
+        from app.database.models import (
+            BackupJob,
+            PackageInstallJob,
+            User,
+            UserRepositoryPermission,
+        )
+
+        visible = _create_activity_repository(test_db, "Visible Feed Repo")
+        hidden = _create_activity_repository(test_db, "Hidden Feed Repo")
+        user = User(
+            username="feed-viewer",
+            password_hash=get_password_hash("pass"),
+            is_active=True,
+            role="viewer",
+        )
+        test_db.add(user)
+        test_db.commit()
+        test_db.add_all(
+            [
+                UserRepositoryPermission(
+                    user_id=user.id, repository_id=visible.id, role="viewer"
+                ),
+                BackupJob(repository=visible.path, status="completed"),
+                BackupJob(repository=hidden.path, status="completed"),
+                PackageInstallJob(package_id=1, status="completed"),
+            ]
+        )
+        test_db.commit()
+        token = create_access_token(data={"sub": user.username})
+
+        response = test_client.get(
+            "/api/activity/feed", headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert sorted((item["type"], item["repository_path"]) for item in items) == [
+            ("backup", visible.path),
+            ("package", None),
+        ]
+
 
 @pytest.mark.unit
 class TestRecentActivityLogPolicy:
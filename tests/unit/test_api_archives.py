@@ -17,6 +17,7 @@ Integration tests (test_api_archives_integration.py) handle:
 import asyncio
 import base64
 import os
+import sys
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -46,6 +47,21 @@ def _create_agent(test_db, *capabilities: str) -> AgentMachine:
     return agent
 
 
+def _extract_stdout(payload: bytes = b"", exit_code: int = 0):
+    """Fake `borg extract --stdout` that writes ``payload`` and exits."""
+
+    async def open_extract_stdout(*args, **kwargs):
+        return await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            f"import sys; sys.stdout.buffer.write({payload!r}); sys.exit({exit_code})",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+    return open_extract_stdout
+
+
 @pytest.mark.unit
 class TestArchivesAuthentication:
     """Test authentication and authorization for archives endpoints"""
@@ -216,6 +232,109 @@ class TestArchivesResourceValidation:
         asyncio.run(created["coro"])
         fake_router.delete_archive.assert_awaited_once_with(job_id, f"aid:{hex_id}")
 
+    def test_bulk_delete_resolves_glob_to_borg2_ids_in_one_job(
+        self,
+        test_client: TestClient,
+        admin_headers,
+        test_db,
+    ):
+        repo = Repository(
+            name="V2 Repo",
+            path="/tmp/v2-bulk-repo",
+            encryption="none",
+            repository_type="local",
+            borg_version=2,
+        )
+        test_db.add(repo)
+        test_db.commit()
+
+        archives = [
+            {"name": "daily", "id": "aa" * 8, "start": "2026-10-01T03:00:00"},
+            {"name": "daily", "id": "bb" * 8, "start": "2026-10-02T03:00:00"},
+            {"name": "weekly", "id": "cc" * 8, "start": "2026-10-03T03:00:00"},
+        ]
+        fake_router = Mock(
+            list_archives=AsyncMock(return_value=archives),
+            delete_archives=AsyncMock(),
+        )
+        created = {}
+
+        with (
+            patch("app.api.archives.BorgRouter", return_value=fake_router),
+            patch(
+                "app.api.archives.asyncio.create_task",
+                side_effect=lambda coro: created.setdefault("coro", coro) or object(),
+            ),
+        ):
+            response = test_client.post(
+                "/api/archives/bulk-delete",
+                json={"repository": repo.path, "name_glob": "daily*"},
+                headers=admin_headers,
+            )
+
+        assert response.status_code == 200
+        assert response.json()["archive_count"] == 2
+        job_id = response.json()["job_id"]
+        selectors = [f"aid:{'aa' * 8}", f"aid:{'bb' * 8}"]
+        delete_job = (
+            test_db.query(DeleteArchiveJob)
+            .filter(DeleteArchiveJob.id == job_id)
+            .first()
+        )
+        assert delete_job.archive_names == selectors
+        assert delete_job.archive_name == "2 archives"
+
+        asyncio.run(created["coro"])
+        fake_router.delete_archives.assert_awaited_once_with(job_id, selectors)
+
+        status_response = test_client.get(
+            f"/api/archives/delete-jobs/{job_id}", headers=admin_headers
+        )
+        assert status_response.json()["archive_count"] == 2
+        assert status_response.json()["archives_deleted"] == 0
+
+    def test_bulk_delete_rejects_invalid_or_conflicting_requests(
+        self,
+        test_client: TestClient,
+        admin_headers,
+        test_db,
+    ):
+        repo = Repository(
+            name="Repo",
+            path="/tmp/bulk-repo",
+            encryption="none",
+            repository_type="local",
+        )
+        test_db.add(repo)
+        test_db.commit()
+
+        def post(body):
+            return test_client.post(
+                "/api/archives/bulk-delete",
+                json={"repository": repo.path, **body},
+                headers=admin_headers,
+            )
+
+        mixed = post({"archives": ["daily-1"], "name_glob": "daily*"})
+        assert mixed.status_code == 400
+        assert (
+            mixed.json()["detail"]["key"]
+            == "backend.errors.archives.invalidArchiveSelection"
+        )
+        empty = post({"archives": []})
+        assert empty.json()["detail"]["key"] == (
+            "backend.errors.archives.noArchivesSelected"
+        )
+
+        test_db.add(
+            DeleteArchiveJob(
+                repository_id=repo.id, archive_name="daily-0", status="running"
+            )
+        )
+        test_db.commit()
+        running = post({"archives": ["daily-1", "daily-2"]})
+        assert running.status_code == 409
+
     def test_delete_job_status_applies_log_save_policy(
         self, test_client: TestClient, admin_headers, test_db, tmp_path
     ):
@@ -479,28 +598,21 @@ class TestDownloadFileEndpoint:
         test_db.commit()
 
         fake_key_path = "/tmp/test-ssh.key"
-        temp_dir = "/tmp/archive-download"
-        extracted_path = os.path.realpath(os.path.join(temp_dir, "extracted.txt"))
         with (
             patch(
                 "app.api.archives.resolve_repo_ssh_key_file", return_value=fake_key_path
             ),
             patch(
                 "app.api.archives.os.path.exists",
-                side_effect=lambda path: path in {fake_key_path, extracted_path},
+                side_effect=lambda path: path == fake_key_path,
             ),
             patch("app.api.archives.os.unlink") as mock_unlink,
             patch(
-                "app.api.archives.tempfile.mkdtemp",
-                return_value=temp_dir,
-            ),
+                "app.api.archives.borg.open_extract_stdout",
+                side_effect=_extract_stdout(b"hello"),
+            ) as mock_open,
             patch(
-                "app.api.archives.FileResponse",
-                side_effect=lambda **kwargs: {"path": kwargs["path"]},
-            ) as mock_file_response,
-            patch(
-                "app.api.archives.borg.extract_archive",
-                new=AsyncMock(return_value={"success": True, "stdout": ""}),
+                "app.api.archives.borg.extract_archive", new=AsyncMock()
             ) as mock_extract,
         ):
             response = test_client.get(
@@ -508,10 +620,15 @@ class TestDownloadFileEndpoint:
                 headers=admin_headers,
             )
 
+        # Not in a cached listing: streamed chunked, without Range support
         assert response.status_code == 200
-        _, kwargs = mock_extract.await_args
-        assert kwargs["env"]["BORG_RSH"].startswith("ssh -i /tmp/test-ssh.key")
-        mock_file_response.assert_called_once()
+        assert response.content == b"hello"
+        assert response.headers["accept-ranges"] == "none"
+        assert "content-length" not in response.headers
+        assert mock_open.call_args.kwargs["env"]["BORG_RSH"].startswith(
+            "ssh -i /tmp/test-ssh.key"
+        )
+        mock_extract.assert_not_awaited()
         mock_unlink.assert_called_once_with(fake_key_path)
 
     def test_download_file_accepts_repository_id(
@@ -545,6 +662,11 @@ class TestDownloadFileEndpoint:
                 "app.api.archives.FileResponse",
                 side_effect=lambda **kwargs: {"path": kwargs["path"]},
             ) as mock_file_response,
+            # borg writes nothing for a directory: fall back to a temp dir
+            patch(
+                "app.api.archives.borg.open_extract_stdout",
+                side_effect=_extract_stdout(),
+            ),
             patch(
                 "app.api.archives.borg.extract_archive",
                 new=AsyncMock(return_value={"success": True, "stdout": ""}),
@@ -569,6 +691,64 @@ class TestDownloadFileEndpoint:
         assert kwargs["bypass_lock"] == repo.bypass_lock
         mock_file_response.assert_called_once()
 
+    def test_download_file_streams_cached_file_with_range(
+        self,
+        test_client: TestClient,
+        admin_headers,
+        test_db,
+    ):
+        repo = Repository(
+            name="Streaming Repo",
+            path="/tmp/streaming-repo",
+            repository_type="local",
+            passphrase=None,
+        )
+        test_db.add(repo)
+        test_db.commit()
+
+        listing = [{"path": "images/vm.img", "type": "-", "size": 10}]
+
+        async def fake_cache_get(repo_id, key):
+            return listing if key == "test-archive" else None
+
+        async def open_extract_stdout(*args, **kwargs):
+            return await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                "import sys; sys.stdout.buffer.write(b'0123456789')",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+
+        with (
+            patch("app.api.archives.resolve_repo_ssh_key_file", return_value=None),
+            patch(
+                "app.api.archive_download.archive_cache.get",
+                side_effect=fake_cache_get,
+            ),
+            patch(
+                "app.api.archives.borg.open_extract_stdout",
+                side_effect=open_extract_stdout,
+            ) as mock_open,
+            patch(
+                "app.api.archives.borg.extract_archive", new=AsyncMock()
+            ) as mock_extract,
+        ):
+            response = test_client.get(
+                f"/api/archives/download?repository={repo.id}&archive=test-archive&file_path=/images/vm.img",
+                headers={**admin_headers, "Range": "bytes=4-"},
+            )
+
+        assert response.status_code == 206
+        assert response.content == b"456789"
+        assert response.headers["content-range"] == "bytes 4-9/10"
+        assert mock_open.call_args.args == (
+            repo.path,
+            "test-archive",
+            "/images/vm.img",
+        )
+        mock_extract.assert_not_awaited()
+
     def test_download_file_for_agent_repository_queues_extract_job(
         self,
         test_client: TestClient,
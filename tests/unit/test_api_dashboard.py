@@ -23,6 +23,7 @@ from app.database.models import (
     BackupPlanRepository,
     CheckJob,
     CompactJob,
+    MetricPoint,
     Repository,
     RestoreCheckJob,
     ScheduledJob,
@@ -241,6 +242,71 @@ class TestDashboardMetrics:
         assert len(data["load_average"]) == 3
 
 
+@pytest.mark.unit
+class TestDashboardTrends:
+    """Test the metric history endpoint"""
+
+    def test_trends_return_daily_series_for_visible_repositories(
+        self,
+        test_client: TestClient,
+        admin_headers,
+        operator_headers,
+        test_db,
+    ):
+        repo = Repository(name="Trend Repo", path="/tmp/trend-repo")
+        test_db.add(repo)
+        test_db.commit()
+        now = datetime.utcnow()
+        test_db.add_all(
+            [
+                MetricPoint(
+                    repository_id=repo.id,
+                    metric="repository_size_bytes",
+                    resolution="raw",
+                    bucket_start=now - timedelta(days=days_ago),
+                    count=1,
+                    total=size,
+                    minimum=size,
+                    maximum=size,
+                    last=size,
+                )
+                for days_ago, size in ((3, 1000), (0, 4000))
+            ]
+        )
+        test_db.commit()
+
+        response = test_client.get(
+            "/api/dashboard/trends?metric=repository_size_bytes&days=30",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["resolution"] == "day"
+        assert len(data["series"]) == 1
+        series = data["series"][0]
+        assert series["repository_name"] == "Trend Repo"
+        assert [point["last"] for point in series["points"]] == [1000, 4000]
+
+        hidden = test_client.get(
+            f"/api/dashboard/trends?metric=repository_size_bytes&repository_id={repo.id}",
+            headers=operator_headers,
+        )
+        assert hidden.status_code == 200
+        assert hidden.json()["series"] == []
+
+    def test_trends_reject_unknown_metric(self, test_client: TestClient, admin_headers):
+        response = test_client.get(
+            "/api/dashboard/trends?metric=unknown", headers=admin_headers
+        )
+
+        assert response.status_code == 400
+        assert (
+            response.json()["detail"]["key"]
+            == "backend.errors.dashboard.invalidTrendQuery"
+        )
+
+
 @pytest.mark.unit
 class TestDashboardAuthentication:
     """Test authentication for dashboard endpoints"""
@@ -615,11 +681,13 @@ class TestDashboardStatistics:
 class TestDashboardCharts:
     """Test dashboard chart data endpoints"""
 
-    def test_backup_trends(self, test_client: TestClient, admin_headers):
-        """Test getting backup trends over time"""
+    def test_backup_trends_require_a_metric(
+        self, test_client: TestClient, admin_headers
+    ):
+        """Trends are served per metric (see TestDashboardTrends)"""
         response = test_client.get("/api/dashboard/trends", headers=admin_headers)
 
-        assert response.status_code == 404
+        assert response.status_code == 422
 
     def test_storage_growth(self, test_client: TestClient, admin_headers):
         """Test getting storage growth data"""
@@ -156,13 +156,66 @@ class TestFilesystemBrowseLocal:
 
     @pytest.mark.asyncio
     async def test_browse_local_filesystem_permission_denied_raises_403(self, tmp_path):
-        with patch.object(filesystem.os, "listdir", side_effect=PermissionError):
+        with patch.object(filesystem.os, "scandir", side_effect=PermissionError):
             with pytest.raises(filesystem.HTTPException) as exc:
                 await filesystem.browse_local_filesystem(str(tmp_path))
 
         assert exc.value.status_code == 403
         assert exc.value.detail["key"] == "backend.errors.filesystem.permissionDenied"
 
+    def test_browse_local_filesystem_pages_with_cursor_and_filter(
+        self,
+        test_client: TestClient,
+        admin_headers,
+        monkeypatch,
+        tmp_path,
+    ):
+        root = tmp_path / "huge"
+        root.mkdir()
+        for name in ("beta", "Alpha", "gamma"):
+            (root / name).mkdir()
+        for index in range(3):
+            (root / f"file-{index}.txt").write_text("x")
+        probed = []
+        monkeypatch.setattr(
+            filesystem, "is_borg_repository", lambda path: probed.append(path) or False
+        )
+
+        def browse(**params):
+            response = test_client.get(
+                "/api/filesystem/browse",
+                params={"path": str(root), "connection_type": "local", **params},
+                headers=admin_headers,
+            )
+            assert response.status_code == 200
+            return response.json()
+
+        first = browse(limit=2)
+        second = browse(limit=2, cursor=first["next_cursor"])
+        third = browse(limit=2, cursor=second["next_cursor"])
+
+        assert [item["name"] for item in first["items"]] == ["Alpha", "beta"]
+        assert [item["name"] for item in second["items"]] == ["gamma", "file-0.txt"]
+        assert [item["name"] for item in third["items"]] == ["file-1.txt", "file-2.txt"]
+        assert third["next_cursor"] is None
+        assert first["total_items"] == 6
+        # Only directories on the returned pages are probed.
+        assert len(probed) == 3
+
+        filtered = browse(limit=10, name_filter="FILE-1")
+        assert [item["name"] for item in filtered["items"]] == ["file-1.txt"]
+        assert filtered["total_items"] == 1
+
+        invalid = test_client.get(
+            "/api/filesystem/browse",
+            params={"path": str(root), "limit": 2, "cursor": "not-a-cursor"},
+            headers=admin_headers,
+        )
+        assert invalid.status_code == 400
+        assert (
+            invalid.json()["detail"]["key"] == "backend.errors.filesystem.invalidCursor"
+        )
+
 
 @pytest.mark.unit
 class TestFilesystemBrowseSSH:
@@ -269,6 +322,55 @@ class TestFilesystemBrowseSSH:
         assert response.items[0].is_borg_repo is True
         assert response.items[1].is_directory is False
 
+    @pytest.mark.asyncio
+    async def test_browse_ssh_filesystem_probes_only_the_requested_page(
+        self,
+        test_db,
+        monkeypatch,
+    ):
+        secret_key = "a" * 32
+        monkeypatch.setattr(
+            filesystem.settings, "secret_key", secret_key, raising=False
+        )
+        monkeypatch.setattr(
+            filesystem.settings.__class__, "get_local_mount_points", lambda self: []
+        )
+        ssh_key = _create_ssh_key_record(test_db, secret_key)
+        listing = "".join(
+            f"drwxr-xr-x 2 user group 4096 Nov 26 10:30 dir-{index:03d}\n"
+            for index in range(50)
+        )
+        monkeypatch.setattr(
+            filesystem.subprocess,
+            "run",
+            lambda cmd, *args, **kwargs: SimpleNamespace(
+                returncode=0, stdout=listing, stderr=""
+            ),
+        )
+        probed = []
+        monkeypatch.setattr(
+            filesystem,
+            "is_borg_repository_ssh",
+            lambda host, username, key, path, port: probed.append(path) or False,
+        )
+
+        response = await filesystem.browse_ssh_filesystem(
+            path="/remote",
+            ssh_key_id=ssh_key.id,
+            host="example.com",
+            username="borg",
+            port=22,
+            db=test_db,
+            limit=5,
+        )
+
+        assert [item.name for item in response.items] == [
+            f"dir-{index:03d}" for index in range(5)
+        ]
+        assert probed == [f"/remote/dir-{index:03d}" for index in range(5)]
+        assert response.total_items == 50
+        assert response.next_cursor is not None
+
     @pytest.mark.asyncio
     async def test_browse_ssh_filesystem_lists_sftp_root_without_cd(
         self,
@@ -1070,3 +1172,38 @@ class TestFilesystemValidationAndCreateFolder:
             response.json()["detail"]["key"]
             == "backend.errors.filesystem.folderAlreadyExists"
         )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_agent_browse_pages_listing_from_agents_without_paging(monkeypatch):
+    from app.services import agent_filesystem_service
+
+    monkeypatch.setattr(
+        agent_filesystem_service,
+        "_require_browse_agent",
+        lambda db, agent_machine_id: SimpleNamespace(id=agent_machine_id),
+    )
+    send_command = AsyncMock(
+        return_value={
+            "success": True,
+            "current_path": "/home",
+            "items": [
+                {"name": "b.txt", "type": "file"},
+                {"name": "docs", "type": "directory"},
+                {"name": "a.txt", "type": "file"},
+            ],
+        }
+    )
+    monkeypatch.setattr(
+        agent_filesystem_service.agent_connection_manager, "send_command", send_command
+    )
+
+    result = await agent_filesystem_service.browse_agent_filesystem(
+        None, 7, path="/home", limit=2
+    )
+
+    assert send_command.await_args.kwargs["payload"]["limit"] == 2
+    assert [item["name"] for item in result["items"]] == ["docs", "a.txt"]
+    assert result["next_cursor"] is not None
+    assert result["total_items"] == 3
@@ -274,9 +274,9 @@ def test_agent_filesystem_browse_endpoint_returns_browse_result(
     calls = []
 
     async def fake_browse(
-        db, agent_machine_id, *, path, include_hidden, timeout_seconds=15
+        db, agent_machine_id, *, path, include_hidden, timeout_seconds=15, **page
     ):
-        calls.append((agent_machine_id, path, include_hidden, timeout_seconds))
+        calls.append((agent_machine_id, path, include_hidden, timeout_seconds, page))
         return {"current_path": path, "parent_path": None, "items": []}
 
     monkeypatch.setattr(
@@ -286,7 +286,7 @@ def test_agent_filesystem_browse_endpoint_returns_browse_result(
 
     response = test_client.get(
         f"/api/managed-machines/agents/{agent.id}/filesystem/browse"
-        "?path=/home/pi&include_hidden=true",
+        "?path=/home/pi&include_hidden=true&limit=50&name_filter=docs",
         headers=admin_headers,
     )
 
@@ -297,7 +297,13 @@ def test_agent_filesystem_browse_endpoint_returns_browse_result(
         "items": [],
     }
     assert calls == [
-        (agent.id, "/home/pi", True, AGENT_FILESYSTEM_BROWSE_TIMEOUT_SECONDS)
+        (
+            agent.id,
+            "/home/pi",
+            True,
+            AGENT_FILESYSTEM_BROWSE_TIMEOUT_SECONDS,
+            {"limit": 50, "cursor": None, "name_filter": "docs"},
+        )
     ]
 
 
@@ -308,9 +314,9 @@ def test_agent_filesystem_browse_endpoint_waits_longer_than_default_agent_poll_i
     calls = []
 
     async def fake_browse(
-        db, agent_machine_id, *, path, include_hidden, timeout_seconds=15
+        db, agent_machine_id, *, path, include_hidden, timeout_seconds=15, **page
     ):
-        calls.append((agent_machine_id, path, include_hidden, timeout_seconds))
+        calls.append((agent_machine_id, path, include_hidden, timeout_seconds, page))
         return {"current_path": path, "parent_path": None, "items": []}
 
     monkeypatch.setattr(
@@ -11,9 +11,10 @@ Tests cover:
 """
 
 import pytest
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.database.models import (
+    ArchiveVerification,
     Repository,
     BackupJob,
     RestoreJob,
@@ -262,6 +263,42 @@ class TestRepositoryMetrics:
             'borg_repository_last_backup_timestamp{repository="New Repo"} 0' in content
         )
 
+    def test_verify_coverage_for_rotating_checks(self, test_client, test_db):
+        """Coverage is exported only for repositories with rotating verification"""
+        verified_at = datetime(2026, 10, 1, 12, 0)
+        rotating = Repository(
+            name="Rotating",
+            path="/rotating",
+            archive_count=4,
+            check_verify_archives_per_run=2,
+        )
+        plain = Repository(name="Plain", path="/plain", archive_count=4)
+        test_db.add_all([rotating, plain])
+        test_db.commit()
+        test_db.add(
+            ArchiveVerification(
+                repository_id=rotating.id,
+                archive_id="a1",
+                archive_name="a1",
+                status="verified",
+                verified_at=verified_at,
+            )
+        )
+        test_db.commit()
+
+        content = test_client.get("/metrics").text
+
+        assert (
+            'borg_repository_verify_coverage_percent{repository="Rotating"} 25.0'
+            in content
+        )
+        timestamp = int(verified_at.replace(tzinfo=timezone.utc).timestamp())
+        assert (
+            f'borg_repository_verify_oldest_timestamp{{repository="Rotating"}} {timestamp}'
+            in content
+        )
+        assert 'verify_coverage_percent{repository="Plain"}' not in content
+
 
 class TestBackupJobMetrics:
     """Test backup job metrics"""
@@ -336,6 +373,33 @@ class TestBackupJobMetrics:
         # Should show 125 seconds
         assert 'borg_backup_last_duration_seconds{repository="Test"} 125.00' in content
 
+    def test_backup_trend_metrics_come_from_history(self, test_client, test_db):
+        """Finished backups feed the throughput and success ratio gauges"""
+        repo = Repository(name="Trend", path="/trend")
+        test_db.add(repo)
+        test_db.commit()
+
+        end = datetime.utcnow()
+        for status, seconds in (("completed", 100), ("failed", 50)):
+            test_db.add(
+                BackupJob(
+                    repository=repo.path,
+                    repository_id=repo.id,
+                    status=status,
+                    started_at=end - timedelta(seconds=seconds),
+                    completed_at=end,
+                    original_size=10_000,
+                )
+            )
+        test_db.commit()
+
+        content = test_client.get("/metrics").text
+
+        assert (
+            'borg_backup_throughput_bytes_per_second{repository="Trend"} 100' in content
+        )
+        assert 'borg_backup_success_ratio{repository="Trend"} 0.500' in content
+
     def test_backup_size_metrics(self, test_client, test_db):
         """Backup size metrics should show in bytes"""
         repo = Repository(name="Test", path="/test")
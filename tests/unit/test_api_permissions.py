@@ -218,3 +218,71 @@ class TestPermissions:
             headers=admin_headers,
         )
         assert response.status_code == 422
+
+    def test_permission_changes_apply_to_cached_snapshot(
+        self, test_client: TestClient, test_db, admin_headers
+    ):
+        """Repository list follows permission writes despite the role cache"""
+        user = _make_user(test_db, "viewer11")
+        visible = _make_repo(test_db, "visible-repo")
+        _make_repo(test_db, "hidden-repo")
+        token = create_access_token(data={"sub": user.username})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        def listed_names():
+            response = test_client.get("/api/repositories/", headers=headers)
+            assert response.status_code == 200
+            return [repo["name"] for repo in response.json()["repositories"]]
+
+        assert listed_names() == []
+        test_client.post(
+            f"/api/settings/users/{user.id}/permissions",
+            json={"repository_id": visible.id, "role": "viewer"},
+            headers=admin_headers,
+        )
+        assert listed_names() == ["visible-repo"]
+        test_client.delete(
+            f"/api/settings/users/{user.id}/permissions/{visible.id}",
+            headers=admin_headers,
+        )
+        assert listed_names() == []
+
+    def test_permission_snapshot_serves_checks_from_one_query(self, test_db):
+        from sqlalchemy import event
+
+        from app.core.security import check_repo_access, get_repository_permissions
+        from app.database.models import UserRepositoryPermission
+
+        user = _make_user(test_db, "viewer12")
+        repos = [_make_repo(test_db, f"snapshot-{index}") for index in range(3)]
+        for repo in repos[:2]:
+            test_db.add(
+                UserRepositoryPermission(
+                    user_id=user.id, repository_id=repo.id, role="viewer"
+                )
+            )
+        test_db.commit()
+        for instance in [user, *repos]:
+            test_db.refresh(instance)
+
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        engine = test_db.get_bind()
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            for repo in repos[:2]:
+                check_repo_access(test_db, user, repo, "viewer")
+            with pytest.raises(Exception):
+                check_repo_access(test_db, user, repos[2], "viewer")
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert len(statements) == 1
+        permissions = get_repository_permissions(test_db, user)
+        assert permissions.repository_ids("viewer") == {repos[0].id, repos[1].id}
+        assert permissions.repository_ids("operator") == set()
+        user.all_repositories_role = "viewer"
+        assert get_repository_permissions(test_db, user).repository_ids() is None
@@ -3554,6 +3554,44 @@ class TestRepositoryCheckSchedule:
         assert data["repository"]["check_max_duration"] == 0
         assert data["repository"]["check_extra_flags"] == "--verify-data"
 
+    def test_update_check_schedule_sets_rotating_verification(
+        self, test_client: TestClient, admin_headers, test_db
+    ):
+        """Rotating verification is stored per repository; 0 turns it off."""
+        repo = Repository(
+            name="Test Repo",
+            path="/tmp/test",
+            encryption="none",
+            repository_type="local",
+        )
+        test_db.add(repo)
+        test_db.commit()
+        test_db.refresh(repo)
+        url = f"/api/repositories/{repo.id}/check-schedule"
+
+        response = test_client.put(
+            url,
+            headers=admin_headers,
+            json={"cron_expression": "0 3 * * *", "verify_archives_per_run": 5},
+        )
+        assert response.status_code == 200
+        assert response.json()["repository"]["check_verify_archives_per_run"] == 5
+        schedule = test_client.get(url, headers=admin_headers).json()
+        assert schedule["check_verify_archives_per_run"] == 5
+
+        invalid = test_client.put(
+            url, headers=admin_headers, json={"verify_archives_per_run": -1}
+        )
+        assert invalid.status_code == 422
+        assert invalid.json()["detail"]["key"] == (
+            "backend.errors.repo.invalidVerifyArchivesPerRun"
+        )
+
+        response = test_client.put(
+            url, headers=admin_headers, json={"verify_archives_per_run": 0}
+        )
+        assert response.json()["repository"]["check_verify_archives_per_run"] is None
+
     def test_update_check_schedule_disable(
         self, test_client: TestClient, admin_headers, test_db
     ):
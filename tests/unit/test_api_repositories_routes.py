@@ -1,4 +1,5 @@
 import asyncio
+import json
 import re
 from collections import Counter
 from datetime import datetime, timezone
@@ -6,6 +7,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from app.api import repositories as repositories_api
@@ -375,8 +377,18 @@ class TestRepositoryHelperContracts:
             ) as mock_list,
             patch.object(
                 repositories_api.BorgRouter,
-                "calculate_total_size_bytes",
-                AsyncMock(return_value=2097152),
+                "_load_repository_info",
+                AsyncMock(
+                    return_value={
+                        "cache": {
+                            "stats": {
+                                "total_size": 8388608,
+                                "total_csize": 4194304,
+                                "unique_csize": 2097152,
+                            }
+                        }
+                    }
+                ),
             ) as mock_size,
         ):
             success = await repositories_api.update_repository_stats(repo, test_db)
@@ -384,6 +396,10 @@ class TestRepositoryHelperContracts:
         assert success is True
         assert repo.archive_count == 2
         assert repo.total_size == "2.00 MB"
+        assert repo.original_size_bytes == 8388608
+        assert repo.compressed_size_bytes == 4194304
+        assert repo.unique_size_bytes == 2097152
+        assert repo.size_stats_refreshed_at is not None
         assert repo.last_backup == datetime(2024, 2, 1, 12, 0)
         mock_list.assert_awaited_once()
         assert mock_list.await_args.kwargs["env"]["TZ"] == "UTC"
@@ -497,8 +513,8 @@ class TestRepositoryHelperContracts:
             ),
             patch.object(
                 repositories_api.BorgRouter,
-                "calculate_total_size_bytes",
-                AsyncMock(return_value=0),
+                "_load_repository_info",
+                AsyncMock(return_value=None),
             ),
         ):
             success = await repositories_api.update_repository_stats(repo, test_db)
@@ -549,8 +565,8 @@ class TestRepositoryHelperContracts:
             ) as mock_list,
             patch.object(
                 repositories_api.BorgRouter,
-                "calculate_total_size_bytes",
-                AsyncMock(return_value=1024),
+                "_load_repository_info",
+                AsyncMock(return_value={"cache": {"stats": {"unique_csize": 1024}}}),
             ) as mock_size,
             patch("app.api.repositories.os.path.exists", return_value=False),
         ):
@@ -748,3 +764,208 @@ class TestRepositoryHelperContracts:
         assert archive["triggered_by"] == "manual"
         assert archive["backup_plan_id"] == plan.id
         assert archive["backup_plan_run_id"] == run.id
+
+    @pytest.mark.asyncio
+    async def test_list_repository_archives_reuses_cached_list_until_invalidated(
+        self, test_db, tmp_path
+    ):
+        repo = _create_repo(test_db, "Cached", str(tmp_path))
+        run_list = AsyncMock(return_value=b'{"archives":[{"name":"first"}]}')
+
+        with (
+            patch.object(
+                repositories_api,
+                "_load_repository_with_access",
+                return_value=repo,
+            ),
+            patch.object(
+                repositories_api,
+                "_resolve_bypass_lock",
+                return_value=(False, "none"),
+            ),
+            patch.object(
+                repositories_api,
+                "get_operation_timeouts",
+                return_value={"list_timeout": 30},
+            ),
+            patch.object(
+                repositories_api.BorgRouter,
+                "build_repo_list_command",
+                return_value=["borg", "list"],
+            ),
+            patch.object(
+                repositories_api, "_run_repository_command_with_retries", new=run_list
+            ),
+        ):
+            first = await repositories_api.list_repository_archives(
+                repo.id, current_user=object(), db=test_db
+            )
+            second = await repositories_api.list_repository_archives(
+                repo.id, current_user=object(), db=test_db
+            )
+            repositories_api.archive_list_cache.invalidate(repo.id)
+            await repositories_api.list_repository_archives(
+                repo.id, current_user=object(), db=test_db
+            )
+
+        assert first["archives"] == second["archives"] == [{"name": "first"}]
+        assert run_list.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_repository_archives_pages_and_enriches_only_the_page(
+        self, test_db
+    ):
+        repo = _create_repo(test_db, "Paged", "/repos/paged")
+        listing = {
+            "archives": [
+                {"name": f"a{index}", "start": f"2026-05-1{index}T10:00:00"}
+                for index in range(5)
+            ]
+        }
+        enriched = []
+
+        def fake_enrich(archives, repository, db):
+            enriched.append([archive["name"] for archive in archives])
+            return archives
+
+        with (
+            patch.object(
+                repositories_api,
+                "_load_repository_with_access",
+                return_value=repo,
+            ),
+            patch.object(
+                repositories_api,
+                "_resolve_bypass_lock",
+                return_value=(False, "none"),
+            ),
+            patch.object(
+                repositories_api,
+                "get_operation_timeouts",
+                return_value={"list_timeout": 30},
+            ),
+            patch.object(
+                repositories_api.BorgRouter,
+                "build_repo_list_command",
+                return_value=["borg", "list"],
+            ),
+            patch.object(
+                repositories_api,
+                "_run_repository_command_with_retries",
+                new=AsyncMock(return_value=json.dumps(listing).encode()),
+            ),
+            patch.object(
+                repositories_api,
+                "enrich_archives_with_backup_metadata",
+                side_effect=fake_enrich,
+            ),
+        ):
+            first = await repositories_api.list_repository_archives(
+                repo.id, sort="newest", limit=2, current_user=object(), db=test_db
+            )
+            second = await repositories_api.list_repository_archives(
+                repo.id,
+                sort="newest",
+                limit=2,
+                cursor=first["next_cursor"],
+                current_user=object(),
+                db=test_db,
+            )
+            with pytest.raises(HTTPException) as exc_info:
+                await repositories_api.list_repository_archives(
+                    repo.id, limit=0, current_user=object(), db=test_db
+                )
+
+        assert [a["name"] for a in first["archives"]] == ["a4", "a3"]
+        assert [a["name"] for a in second["archives"]] == ["a2", "a1"]
+        assert first["total"] == 5
+        assert enriched == [["a4", "a3"], ["a2", "a1"]]
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_prune_preview_simulates_from_cached_list_with_reclaim(self, test_db):
+        repo = _create_repo(test_db, "Preview", "/repos/preview")
+        job = BackupJob(
+            repository=repo.path,
+            repository_id=repo.id,
+            archive_name="a0",
+            status="completed",
+            deduplicated_size=4096,
+        )
+        test_db.add(job)
+        test_db.commit()
+        listing = {
+            "archives": [
+                {
+                    "name": f"a{day}",
+                    "id": f"{day:02d}" * 8,
+                    "start": f"2026-05-1{day}T10:00:00+00:00",
+                }
+                for day in range(5)
+            ]
+        }
+        run_list = AsyncMock(return_value=json.dumps(listing).encode())
+
+        with (
+            patch.object(
+                repositories_api,
+                "_load_repository_with_access",
+                return_value=repo,
+            ),
+            patch.object(
+                repositories_api,
+                "_resolve_bypass_lock",
+                return_value=(False, "none"),
+            ),
+            patch.object(
+                repositories_api,
+                "get_operation_timeouts",
+                return_value={"list_timeout": 30},
+            ),
+            patch.object(
+                repositories_api.BorgRouter,
+                "build_repo_list_command",
+                return_value=["borg", "list"],
+            ),
+            patch.object(
+                repositories_api, "_run_repository_command_with_retries", new=run_list
+            ),
+        ):
+            request = repositories_api.PrunePreviewRequest(
+                keep_daily=2,
+                keep_weekly=0,
+                keep_monthly=0,
+                keep_yearly=0,
+                timezone="UTC",
+            )
+            first = await repositories_api.preview_prune(
+                repo.id, request, current_user=object(), db=test_db
+            )
+            request.keep_daily = 3
+            second = await repositories_api.preview_prune(
+                repo.id, request, current_user=object(), db=test_db
+            )
+            request.keep_within = "soon"
+            with pytest.raises(HTTPException) as exc_info:
+                await repositories_api.preview_prune(
+                    repo.id, request, current_user=object(), db=test_db
+                )
+
+        assert run_list.await_count == 1
+        assert [(a["name"], a["reason"]) for a in first["archives"]] == [
+            ("a4", "daily #1"),
+            ("a3", "daily #2"),
+            ("a2", None),
+            ("a1", None),
+            ("a0", None),
+        ]
+        assert first["pruned_count"] == 3
+        assert first["estimated_reclaim_bytes"] == 4096
+        assert first["archives_without_size"] == 2
+        assert (
+            first["prune_result"]["stdout"]
+            .splitlines()[2]
+            .startswith("Would prune: a2")
+        )
+        assert second["kept_count"] == 3
+        assert exc_info.value.status_code == 422
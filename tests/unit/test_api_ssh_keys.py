@@ -2,7 +2,7 @@
 Unit tests for SSH keys API endpoints
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -18,7 +18,7 @@ from app.api.ssh_keys import (
     SSHConnectionUpdate,
     SSHQuickSetup,
 )
-from app.database.models import SSHConnection, SSHKey
+from app.database.models import SSHConnection, SSHConnectionSample, SSHKey
 
 
 @pytest.mark.unit
@@ -1430,3 +1430,55 @@ class TestSSHKeyStorageAndHelpers:
 
         assert response.status_code == 404
         assert response.json()["detail"]["key"] == "backend.errors.ssh.noSystemKeyFound"
+
+    def test_connection_history_returns_recorded_samples(
+        self,
+        test_client: TestClient,
+        admin_headers,
+        test_db,
+    ):
+        connection = SSHConnection(
+            host="storage.example.com",
+            username="borg",
+            port=22,
+            status="connected",
+        )
+        test_db.add(connection)
+        test_db.commit()
+        test_db.refresh(connection)
+        now = datetime.utcnow()
+        test_db.add_all(
+            [
+                SSHConnectionSample(
+                    connection_id=connection.id,
+                    resolution="raw",
+                    sampled_at=now - timedelta(days=days_ago),
+                    storage_total=1000,
+                    storage_used=used,
+                    storage_available=1000 - used,
+                    latency_ms=8.0,
+                )
+                for days_ago, used in ((40, 50), (2, 100), (0, 300))
+            ]
+        )
+        test_db.commit()
+
+        response = test_client.get(
+            f"/api/ssh-keys/connections/{connection.id}/history?days=30",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["growth_per_day"] == 100
+        assert [sample["storage_used"] for sample in data["samples"]] == [100, 300]
+        assert data["samples"][0]["latency_ms"] == 8.0
+
+        missing = test_client.get(
+            "/api/ssh-keys/connections/999999/history", headers=admin_headers
+        )
+        assert missing.status_code == 404
+        assert (
+            missing.json()["detail"]["key"]
+            == "backend.errors.ssh.sshConnectionNotFound"
+        )
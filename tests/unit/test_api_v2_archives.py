@@ -1,4 +1,6 @@
+import asyncio
 import json
+import sys
 from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
@@ -55,6 +57,27 @@ def _create_v2_repo(
     return repo
 
 
+def _extract_stdout(payload: bytes = b"", exit_code: int = 0, stderr: str = ""):
+    """Fake `borg2 extract --stdout` that writes ``payload`` and exits."""
+    script = (
+        "import sys;"
+        f"sys.stdout.buffer.write({payload!r});"
+        f"sys.stderr.write({stderr!r});"
+        f"sys.exit({exit_code})"
+    )
+
+    async def open_extract_stdout(*args, **kwargs):
+        return await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            script,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+    return open_extract_stdout
+
+
 @pytest.mark.unit
 class TestV2ArchiveRoutes:
     def test_archive_routes_are_feature_gated_by_plan(
@@ -838,67 +861,55 @@ class TestV2ArchiveRoutes:
         assert calls[2][2] == response.json()["items"]
 
     def test_download_file_success(
-        self, test_client: TestClient, admin_headers, test_db, tmp_path
+        self, test_client: TestClient, admin_headers, test_db
     ):
         _enable_borg_v2(test_db)
         repo = _create_v2_repo(test_db)
-        archive_path = tmp_path / "extract"
 
-        async def _extract_side_effect(*args, **kwargs):
-            target = archive_path / "documents" / "report.txt"
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text("hello borg2")
-            return {"success": True, "stderr": ""}
-
-        with patch(
-            "app.api.v2.archives.tempfile.mkdtemp", return_value=str(archive_path)
+        with (
+            patch(
+                "app.api.v2.archives.borg2.open_extract_stdout",
+                side_effect=_extract_stdout(b"hello borg2"),
+            ),
+            patch(
+                "app.api.v2.archives.borg2.extract_archive", new=AsyncMock()
+            ) as mock_extract,
+            patch("app.api.v2.archives.tempfile.mkdtemp") as mkdtemp,
         ):
-            with patch(
-                "app.api.v2.archives.borg2.extract_archive",
-                new=AsyncMock(side_effect=_extract_side_effect),
-            ):
-                response = test_client.get(
-                    f"/api/v2/archives/download?repository={repo.id}&archive=archive-1&file_path=/documents/report.txt",
-                    headers=admin_headers,
-                )
+            response = test_client.get(
+                f"/api/v2/archives/download?repository={repo.id}&archive=archive-1&file_path=/documents/report.txt",
+                headers=admin_headers,
+            )
 
+        # Not in a cached listing: streamed chunked, without a scratch dir
         assert response.status_code == 200
         assert response.content == b"hello borg2"
+        assert response.headers["accept-ranges"] == "none"
+        mock_extract.assert_not_awaited()
+        mkdtemp.assert_not_called()
 
     def test_download_file_uses_archive_id_selector(
-        self, test_client: TestClient, admin_headers, test_db, tmp_path
+        self, test_client: TestClient, admin_headers, test_db
     ):
         _enable_borg_v2(test_db)
         repo = _create_v2_repo(test_db)
         archive_id = "10614da295b13209b207fc2499d67e7f10c24f4a1745e482bd3fc2595e4ec7fd"
-        archive_path = tmp_path / "extract"
 
-        with (
-            patch(
-                "app.api.v2.archives.tempfile.mkdtemp",
-                return_value=str(archive_path),
-            ),
-            patch(
-                "app.api.v2.archives.borg2.extract_archive",
-                new=AsyncMock(
-                    return_value={"success": False, "stderr": "extract failed"}
-                ),
-            ) as mock_extract,
-        ):
+        with patch(
+            "app.api.v2.archives.borg2.open_extract_stdout",
+            side_effect=_extract_stdout(exit_code=2, stderr="extract failed"),
+        ) as mock_open:
             response = test_client.get(
                 f"/api/v2/archives/download?repository={repo.id}&archive={archive_id}&file_path=/documents/report.txt",
                 headers=admin_headers,
             )
 
         assert response.status_code == 500
-        mock_extract.assert_awaited_once_with(
+        assert response.json()["detail"]["params"]["error"] == "extract failed"
+        assert mock_open.call_args.args == (
             repo.path,
             f"aid:{archive_id}",
-            ["/documents/report.txt"],
-            str(archive_path),
-            passphrase=None,
-            remote_path=None,
-            bypass_lock=False,
+            "/documents/report.txt",
         )
 
     def test_download_file_returns_500_when_extract_fails(
@@ -908,8 +919,15 @@ class TestV2ArchiveRoutes:
         repo = _create_v2_repo(test_db)
         archive_path = tmp_path / "extract"
 
-        with patch(
-            "app.api.v2.archives.tempfile.mkdtemp", return_value=str(archive_path)
+        # borg writes nothing for a directory: fall back to a temp dir
+        with (
+            patch(
+                "app.api.v2.archives.borg2.open_extract_stdout",
+                side_effect=_extract_stdout(),
+            ),
+            patch(
+                "app.api.v2.archives.tempfile.mkdtemp", return_value=str(archive_path)
+            ),
         ):
             with patch(
                 "app.api.v2.archives.borg2.extract_archive",
@@ -935,8 +953,15 @@ class TestV2ArchiveRoutes:
         repo = _create_v2_repo(test_db)
         archive_path = tmp_path / "extract"
 
-        with patch(
-            "app.api.v2.archives.tempfile.mkdtemp", return_value=str(archive_path)
+        # borg writes nothing for a directory: fall back to a temp dir
+        with (
+            patch(
+                "app.api.v2.archives.borg2.open_extract_stdout",
+                side_effect=_extract_stdout(),
+            ),
+            patch(
+                "app.api.v2.archives.tempfile.mkdtemp", return_value=str(archive_path)
+            ),
         ):
             with patch(
                 "app.api.v2.archives.borg2.extract_archive",
@@ -1043,7 +1043,12 @@ class TestV2RepositoryRoutes:
             )
 
         assert response.status_code == 200
-        assert response.json() == {"archives": [{"name": "one"}], "borg_version": 2}
+        assert response.json() == {
+            "archives": [{"name": "one"}],
+            "total": 1,
+            "next_cursor": None,
+            "borg_version": 2,
+        }
         mock_list.assert_awaited_once()
         assert mock_list.call_args.kwargs["bypass_lock"] is True
 
@@ -1,10 +1,19 @@
+import asyncio
 import os
+import sys
 from pathlib import Path
 
 import pytest
 from fastapi import HTTPException, status
+from fastapi.responses import Response
 
-from app.api.archive_download import extract_file_download
+from app.api.archive_download import (
+    ArchiveStreamError,
+    cached_file_size,
+    extract_file_download,
+    parse_byte_range,
+    stream_extracted_file,
+)
 
 
 @pytest.mark.asyncio
@@ -31,3 +40,223 @@ async def test_extract_file_download_rejects_paths_outside_temp_dir(tmp_path):
         "key": "backend.errors.archives.fileNotFoundAfterExtraction"
     }
     assert not temp_dir.exists()
+
+
+def _printer(payload: bytes, *, exit_code: int = 0, stderr: str = ""):
+    script = (
+        "import sys;"
+        f"sys.stdout.buffer.write({payload!r});"
+        f"sys.stderr.write({stderr!r});"
+        f"sys.exit({exit_code})"
+    )
+
+    async def open_process():
+        return await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            script,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+    return open_process
+
+
+async def _body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-3", (0, 3)),
+        ("bytes=5-", (5, 9)),
+        ("bytes=-4", (6, 9)),
+        ("bytes=8-100", (8, 9)),
+        ("bytes=0-1,4-5", None),
+        ("items=0-3", None),
+    ],
+)
+def test_parse_byte_range(header, expected):
+    assert parse_byte_range(header, 10) == expected
+
+
+@pytest.mark.unit
+def test_parse_byte_range_rejects_range_past_end():
+    with pytest.raises(HTTPException) as exc_info:
+        parse_byte_range("bytes=10-", 10)
+
+    assert exc_info.value.status_code == 416
+    assert exc_info.value.headers == {"Content-Range": "bytes */10"}
+
+
+@pytest.mark.unit
+def test_cached_file_size_only_matches_regular_files():
+    items = [
+        {"path": "etc", "type": "d", "size": 0},
+        {"path": "etc/hosts", "type": "-", "size": 42},
+        {"path": "etc/localtime", "type": "l", "size": 0},
+        {"path": "etc/motd", "type": "file", "size": 7},
+    ]
+
+    assert cached_file_size(items, "/etc/hosts") == 42
+    assert cached_file_size(items, "etc/motd") == 7
+    assert cached_file_size(items, "/etc") is None
+    assert cached_file_size(items, "/etc/localtime") is None
+    assert cached_file_size(items, "/etc/missing") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_extracted_file_serves_whole_file_and_cleans_up():
+    closed = []
+
+    response = await stream_extracted_file(
+        "/data/report.bin",
+        10,
+        _printer(b"0123456789"),
+        on_close=lambda: closed.append(True),
+        chunk_size=4,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-length"] == "10"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert 'filename="report.bin"' in response.headers["content-disposition"]
+    assert await _body(response) == b"0123456789"
+    assert closed == [True]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_extracted_file_serves_requested_range():
+    closed = []
+
+    response = await stream_extracted_file(
+        "/data/report.bin",
+        10,
+        _printer(b"0123456789"),
+        range_header="bytes=3-6",
+        on_close=lambda: closed.append(True),
+        chunk_size=2,
+    )
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 3-6/10"
+    assert response.headers["content-length"] == "4"
+    assert await _body(response) == b"3456"
+    assert closed == [True]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_extracted_file_reports_borg_failure_before_headers():
+    closed = []
+
+    with pytest.raises(HTTPException) as exc_info:
+        await stream_extracted_file(
+            "/data/report.bin",
+            10,
+            _printer(b"", exit_code=2, stderr="Archive does not exist"),
+            on_close=lambda: closed.append(True),
+        )
+
+    assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert exc_info.value.detail == {
+        "key": "backend.errors.archives.failedExtractFile",
+        "params": {"error": "Archive does not exist"},
+    }
+    assert closed == [True]
+
+
+async def _partial_body(response) -> bytes:
+    received = bytearray()
+    with pytest.raises(ArchiveStreamError):
+        async for chunk in response.body_iterator:
+            received.extend(chunk)
+    return bytes(received)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_extracted_file_aborts_when_borg_fails_after_headers():
+    closed = []
+
+    response = await stream_extracted_file(
+        "/data/report.bin",
+        10,
+        _printer(b"0123456789", exit_code=2, stderr="Data integrity error"),
+        on_close=lambda: closed.append(True),
+        chunk_size=4,
+    )
+
+    assert response.status_code == 200
+    # The last chunk is withheld, so the client sees a short transfer.
+    assert await _partial_body(response) == b"01234567"
+    assert closed == [True]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_extracted_file_aborts_when_borg_output_is_short():
+    response = await stream_extracted_file(
+        "/data/report.bin",
+        10,
+        _printer(b"012345"),
+        chunk_size=4,
+    )
+
+    assert await _partial_body(response) == b"0123"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_extracted_file_completes_on_borg_warning():
+    response = await stream_extracted_file(
+        "/data/report.bin",
+        10,
+        _printer(b"0123456789", exit_code=1, stderr="file changed"),
+        chunk_size=4,
+    )
+
+    assert await _body(response) == b"0123456789"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_extracted_file_streams_unknown_size_without_ranges():
+    response = await stream_extracted_file(
+        "/data/report.bin",
+        None,
+        _printer(b"0123456789"),
+        range_header="bytes=3-6",
+        chunk_size=4,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["accept-ranges"] == "none"
+    assert "content-length" not in response.headers
+    assert await _body(response) == b"0123456789"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stream_extracted_file_hands_empty_output_to_fallback():
+    closed = []
+    fallback = Response(content=b"from temp dir")
+
+    async def on_empty():
+        return fallback
+
+    response = await stream_extracted_file(
+        "/data/photos",
+        None,
+        _printer(b""),
+        on_close=lambda: closed.append(True),
+        on_empty=on_empty,
+    )
+
+    assert response is fallback
+    assert closed == [True]
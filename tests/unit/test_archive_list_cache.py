@@ -0,0 +1,103 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.database.models import Repository
+from app.services.archive_list_cache import ArchiveListCache
+
+
+def _repo(repo_id=1, **kwargs):
+    defaults = {"id": repo_id, "name": f"Repo {repo_id}", "path": "/repos/main"}
+    defaults.update(kwargs)
+    return Repository(**defaults)
+
+
+def _probe(*fingerprints):
+    return patch(
+        "app.services.archive_list_cache.probe_repository_fingerprint",
+        AsyncMock(side_effect=list(fingerprints)),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cached_list_reused_while_fingerprint_matches():
+    cache = ArchiveListCache()
+    repo = _repo()
+    loader = AsyncMock(return_value=[{"name": "a"}])
+
+    with _probe("fp1", "fp1", "fp2"):
+        assert await cache.get_or_load(repo, None, loader) == [{"name": "a"}]
+        assert await cache.get_or_load(repo, None, loader) == [{"name": "a"}]
+        # Another Borg client wrote to the repository.
+        await cache.get_or_load(repo, None, loader)
+
+    assert loader.await_count == 2
+    assert cache.get_stats() == {"repositories": 1, "hits": 1, "misses": 2}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_invalidate_drops_list_and_discards_racing_load():
+    cache = ArchiveListCache()
+    repo = _repo()
+
+    with _probe("fp", "fp", "fp"):
+        archives, ticket = await cache.lookup(repo, None)
+        assert archives is None
+        # A backup finished while the list was running.
+        cache.invalidate(repo.id)
+        cache.store(ticket, [{"name": "stale"}])
+
+        archives, ticket = await cache.lookup(repo, None)
+        assert archives is None
+        cache.store(ticket, [{"name": "fresh"}])
+
+        archives, _ = await cache.lookup(repo, None)
+
+    assert archives == [{"name": "fresh"}]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unprobeable_repository_falls_back_to_ttl():
+    cache = ArchiveListCache()
+    repo = _repo(path="sftp://host/repo")
+    loader = AsyncMock(return_value=[])
+
+    with (
+        _probe(None, None, None),
+        patch(
+            "app.services.archive_list_cache.settings.archive_list_cache_ttl_seconds",
+            60,
+        ),
+        patch("app.services.archive_list_cache.time.monotonic") as monotonic,
+    ):
+        monotonic.return_value = 100.0
+        await cache.get_or_load(repo, None, loader)
+        monotonic.return_value = 150.0
+        await cache.get_or_load(repo, None, loader)
+        monotonic.return_value = 161.0
+        await cache.get_or_load(repo, None, loader)
+
+    assert loader.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_loads_and_agent_repositories_are_not_cached():
+    cache = ArchiveListCache()
+    failing = AsyncMock(return_value=None)
+
+    with _probe("fp", "fp"):
+        assert await cache.get_or_load(_repo(), None, failing) is None
+        assert await cache.get_or_load(_repo(), None, failing) is None
+    assert failing.await_count == 2
+
+    agent_repo = _repo(2, executor_type="agent", agent_machine_id=7)
+    loader = AsyncMock(return_value=[{"name": "a"}])
+    with _probe() as probe:
+        await cache.get_or_load(agent_repo, None, loader)
+        await cache.get_or_load(agent_repo, None, loader)
+    probe.assert_not_awaited()
+    assert loader.await_count == 2
@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.archive_listing import InvalidArchiveCursor, page_archives
+
+
+def _archives():
+    return [
+        {"name": f"host-{hour:02d}", "start": f"2026-05-15T{hour:02d}:00:00.000000"}
+        for hour in range(5)
+    ] + [{"name": "manual-x", "time": "2026-05-14T12:00:00"}]
+
+
+@pytest.mark.unit
+def test_page_archives_without_limit_returns_everything_oldest_first():
+    page = page_archives(_archives())
+
+    assert [a["name"] for a in page.archives] == [
+        "manual-x",
+        "host-00",
+        "host-01",
+        "host-02",
+        "host-03",
+        "host-04",
+    ]
+    assert page.total == 6
+    assert page.next_cursor is None
+
+
+@pytest.mark.unit
+def test_page_archives_walks_pages_with_cursor():
+    seen = []
+    cursor = None
+    while True:
+        page = page_archives(_archives(), sort="newest", limit=4, cursor=cursor)
+        seen.extend(a["name"] for a in page.archives)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [
+        "host-04",
+        "host-03",
+        "host-02",
+        "host-01",
+        "host-00",
+        "manual-x",
+    ]
+
+
+@pytest.mark.unit
+def test_page_archives_cursor_survives_new_archives():
+    first = page_archives(_archives(), sort="newest", limit=2)
+    grown = [{"name": "host-05", "start": "2026-05-15T05:00:00"}] + _archives()
+
+    second = page_archives(grown, sort="newest", limit=2, cursor=first.next_cursor)
+
+    assert [a["name"] for a in second.archives] == ["host-02", "host-01"]
+    assert second.total == 7
+
+
+@pytest.mark.unit
+def test_page_archives_filters_by_glob_and_time_range():
+    page = page_archives(
+        _archives(),
+        sort="name_desc",
+        name_glob="host-*",
+        since=datetime(2026, 5, 15, 1, 0, tzinfo=timezone.utc),
+        until=datetime(2026, 5, 15, 4, 0),
+    )
+
+    assert [a["name"] for a in page.archives] == ["host-03", "host-02", "host-01"]
+    assert page.total == 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"sort": "size"},
+        {"limit": 0},
+        {"limit": 5000},
+        {"cursor": "not-a-cursor"},
+    ],
+)
+def test_page_archives_rejects_bad_input(kwargs):
+    with pytest.raises(ValueError):
+        page_archives(_archives(), **kwargs)
+
+
+@pytest.mark.unit
+def test_page_archives_rejects_cursor_from_other_sort():
+    cursor = page_archives(_archives(), sort="newest", limit=1).next_cursor
+
+    with pytest.raises(InvalidArchiveCursor):
+        page_archives(_archives(), sort="name_asc", cursor=cursor)
@@ -75,6 +75,8 @@ def backup_service():
         mock_settings.borg_list_timeout = 60
         mock_settings.backup_timeout = 3600
         mock_settings.source_size_timeout = 120
+        mock_settings.sshfs_source_profile = True
+        mock_settings.sshfs_source_files_cache = "mtime,size"
         service = BackupService()
         yield service
 
@@ -507,7 +509,6 @@ class TestBackupService:
         )
         info_process.returncode = 0
         mqtt = Mock()
-        mqtt.sync_state_with_db = Mock()
 
         with (
             patch(
@@ -522,7 +523,56 @@ class TestBackupService:
         assert repo.archive_count == 2
         assert repo.total_size == "1.00 MB"
         assert repo.last_backup is not None
-        mqtt.sync_state_with_db.assert_called_once()
+        mqtt.request_sync.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_repository_stats_applies_archive_stats_without_borg_info(
+        self, backup_service, test_db
+    ):
+        repo = Repository(
+            name="Test Repo",
+            path="/test/repo",
+            encryption="none",
+            repository_type="local",
+            archive_count=1,
+            original_size_bytes=1000,
+            compressed_size_bytes=500,
+            unique_size_bytes=300,
+            size_stats_refreshed_at=datetime.utcnow(),
+        )
+        test_db.add(repo)
+        test_db.commit()
+        test_db.refresh(repo)
+
+        list_process = AsyncMock()
+        list_process.communicate = AsyncMock(
+            return_value=(b'{"archives": [{"name": "a"}, {"name": "b"}]}', b"")
+        )
+        list_process.returncode = 0
+
+        with (
+            patch(
+                "asyncio.create_subprocess_exec", side_effect=[list_process]
+            ) as mock_exec,
+            patch("app.services.backup_service.mqtt_service", Mock()),
+        ):
+            await backup_service._update_repository_stats(
+                test_db,
+                "/test/repo",
+                {},
+                archive_stats={
+                    "original_size": 100,
+                    "compressed_size": 50,
+                    "deduplicated_size": 20,
+                },
+            )
+
+        test_db.refresh(repo)
+        assert mock_exec.call_count == 1
+        assert repo.archive_count == 2
+        assert repo.original_size_bytes == 1100
+        assert repo.compressed_size_bytes == 550
+        assert repo.unique_size_bytes == 320
 
     @pytest.mark.asyncio
     async def test_update_repository_stats_waits_for_repository_command_lock(
@@ -1153,7 +1203,13 @@ class TestBackupService:
             source_connection_id=None,
             stable_sshfs_temp_root=ANY,
         )
-        calculate_size.assert_called_once_with(job.id, ["/snap/job-1/0-app"], [])
+        calculate_size.assert_called_once_with(
+            job.id,
+            ["/snap/job-1/0-app"],
+            [],
+            repository_id=repo.id,
+            source_labels=["/srv/app"],
+        )
         cleanup_snapshots.assert_awaited_once_with(job.id)
 
     @pytest.mark.asyncio
@@ -2497,11 +2553,16 @@ class TestBackupServicePeriodicSync:
         captured = {}
 
         async def mock_mount_ssh_paths_shared(
-            connection_id, remote_paths, job_id, preserve_symlinks=False
+            connection_id,
+            remote_paths,
+            job_id,
+            preserve_symlinks=False,
+            source_profile=False,
         ):
             captured["connection_id"] = connection_id
             captured["remote_paths"] = remote_paths
             captured["preserve_symlinks"] = preserve_symlinks
+            captured["source_profile"] = source_profile
             return "/tmp/sshfs_mount_test", [("mount-1", "etc/komodo")]
 
         monkeypatch.setattr(
@@ -2524,6 +2585,7 @@ class TestBackupServicePeriodicSync:
         assert captured["remote_paths"] == ["/etc/komodo"]
         # Backup sources must mount with faithful symlink handling (issue #751).
         assert captured["preserve_symlinks"] is True
+        assert captured["source_profile"] is True
         assert processed_paths == ["etc/komodo"]
         assert ssh_mount_info == [("/tmp/sshfs_mount_test", "etc/komodo")]
 
@@ -2548,7 +2610,11 @@ class TestBackupServicePeriodicSync:
         temp_root = tmp_path / "sshfs_mount_test"
 
         async def mock_mount_ssh_paths_shared(
-            connection_id, remote_paths, job_id, preserve_symlinks=False
+            connection_id,
+            remote_paths,
+            job_id,
+            preserve_symlinks=False,
+            source_profile=False,
         ):
             return str(temp_root), [("mount-1", "etc/komodo")]
 
@@ -2576,6 +2642,21 @@ class TestBackupServicePeriodicSync:
             encoding="utf-8"
         ) == "{}"
 
+    def test_sshfs_sources_use_mount_stable_files_cache(self, backup_service):
+        mounts = [("/data/sshfs-cache/repository-1", "etc/komodo")]
+
+        assert backup_service._sshfs_files_cache_flags(mounts, []) == [
+            "--files-cache",
+            "mtime,size",
+        ]
+        assert backup_service._sshfs_files_cache_flags([], []) == []
+        assert (
+            backup_service._sshfs_files_cache_flags(
+                mounts, ["--files-cache=ctime,size"]
+            )
+            == []
+        )
+
     def test_resolve_backup_command_paths_mixes_remote_source_and_local_canary(
         self, backup_service
     ):
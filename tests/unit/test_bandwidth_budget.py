@@ -0,0 +1,143 @@
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services.bandwidth_budget import (
+    RELAY_SCRIPT,
+    BandwidthBudgetService,
+    allocate_rates,
+    destination_key,
+)
+from app.services.upload_ratelimit_policies import UploadRatelimitSchedule
+from app.utils.bandwidth_relay import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+def test_allocate_rates_splits_budgets_fairly():
+    jobs = {
+        1: ("nas", None),
+        2: ("nas", None),
+        3: ("cloud", 100),
+        4: ("cloud", None),
+    }
+
+    rates = allocate_rates(jobs, global_budget_kib=1000, destination_budget_kib=None)
+    # Job 3 keeps its own lower limit and the rest is shared.
+    assert rates == {1: 300, 2: 300, 3: 100, 4: 300}
+
+    rates = allocate_rates(jobs, global_budget_kib=1000, destination_budget_kib=400)
+    assert rates == {1: 200, 2: 200, 3: 100, 4: 300}
+
+    rates = allocate_rates(jobs, global_budget_kib=None, destination_budget_kib=None)
+    assert rates == {1: None, 2: None, 3: 100, 4: None}
+
+
+@pytest.mark.unit
+def test_destination_key_uses_ssh_host():
+    assert destination_key("ssh://borg@NAS.example:2222/./repo") == "nas.example"
+    assert destination_key("/local/repo") == "/local/repo"
+
+
+@pytest.mark.unit
+def test_token_bucket_paces_to_rate_and_follows_rate_changes():
+    clock = FakeClock()
+    bucket = TokenBucket(100, clock=clock)
+
+    # 100 KiB/s: 50 KiB beyond the empty bucket waits half a second.
+    assert bucket.delay_for(50 * 1024) == pytest.approx(0.5)
+    clock.now = 0.5
+    bucket.set_rate(None)
+    assert bucket.delay_for(10 * 1024 * 1024) == 0.0
+    assert bucket.read_size() == 64 * 1024
+
+    bucket.set_rate(4)
+    assert bucket.read_size() == 1024
+
+
+@pytest.mark.unit
+def test_rebalance_follows_policy_windows_and_running_jobs(tmp_path, monkeypatch):
+    from app.services import bandwidth_budget
+
+    monkeypatch.setattr(bandwidth_budget.settings, "upload_bandwidth_budget_kib", 1000)
+    monkeypatch.setattr(
+        bandwidth_budget.settings, "upload_bandwidth_destination_budget_kib", 0
+    )
+    service = BandwidthBudgetService()
+    service._rate_dir = str(tmp_path)
+    night_only = UploadRatelimitSchedule(
+        base_upload_ratelimit_kib=200,
+        policies=[
+            {"start_time": "22:00", "end_time": "07:00", "upload_ratelimit_kib": None}
+        ],
+        timezone_name="UTC",
+    )
+    service._jobs = {}
+    for job_id, schedule in (
+        (1, night_only),
+        (2, UploadRatelimitSchedule(base_upload_ratelimit_kib=None)),
+    ):
+        service._jobs[job_id] = bandwidth_budget.BandwidthJob(
+            job_id=job_id,
+            destination="nas",
+            schedule=schedule,
+            rate_file=str(tmp_path / f"job-{job_id}.rate"),
+        )
+
+    night = datetime(2026, 10, 18, 6, 59, tzinfo=timezone.utc)
+    assert service.rebalance(night) == {1: 500, 2: 500}
+    day = datetime(2026, 10, 18, 7, 0, tzinfo=timezone.utc)
+    assert service.rebalance(day) == {1: 200, 2: 800}
+    assert (tmp_path / "job-2.rate").read_text() == "800"
+
+    service.unregister(1)
+    assert not (tmp_path / "job-1.rate").exists()
+    assert (tmp_path / "job-2.rate").read_text() == "1000"
+
+
+@pytest.mark.unit
+def test_relay_passes_data_through_and_exit_code(tmp_path):
+    rate_file = tmp_path / "job.rate"
+    rate_file.write_text("0")
+    payload = b"borg" * 50_000
+
+    result = subprocess.run(
+        [sys.executable, str(RELAY_SCRIPT), str(rate_file), "cat"],
+        input=payload,
+        capture_output=True,
+        timeout=30,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == payload
+
+    failed = subprocess.run(
+        [sys.executable, str(RELAY_SCRIPT), str(rate_file), "false"],
+        input=b"",
+        timeout=30,
+    )
+    assert failed.returncode == 1
+
+
+@pytest.mark.unit
+def test_should_relay_only_when_the_relay_can_wrap_borg_rsh(monkeypatch):
+    monkeypatch.setattr(
+        "app.services.bandwidth_budget.settings.upload_bandwidth_budget_kib", 1000
+    )
+    service = BandwidthBudgetService()
+    schedule = UploadRatelimitSchedule(base_upload_ratelimit_kib=500)
+    repository = "ssh://borg@nas/./repo"
+
+    assert service.should_relay(repository, schedule, {"BORG_RSH": "ssh -i key"})
+    # No BORG_RSH to wrap: the backup keeps its static --upload-ratelimit.
+    assert not service.should_relay(repository, schedule, {})
+    assert not service.should_relay("/local/repo", schedule, {"BORG_RSH": "ssh"})
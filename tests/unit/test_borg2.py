@@ -4,6 +4,7 @@ import pytest
 
 from app.config import settings
 from app.core.borg2 import borg2
+from app.utils.process_priority import resolve_process_priority
 
 
 @pytest.mark.unit
@@ -88,6 +89,7 @@ async def test_extract_archive_uses_restore_umask():
         timeout=3600,
         cwd="/restore",
         env=None,
+        priority=resolve_process_priority("restore"),
     )
 
 
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from app.services.borg_progress import (
+    CurrentFileTracker,
+    ExtractProgress,
+    FilesCacheStats,
+    MessageThrottle,
+    SpeedWindow,
+    estimate_seconds_remaining,
+    parse_log_json,
+)
+
+
+@pytest.mark.unit
+def test_speed_window_keeps_fixed_number_of_samples():
+    window = SpeedWindow(window=30, slots=30)
+
+    for tick in range(100_000):
+        window.add(tick * 0.01, tick * 1000)
+
+    assert len(window._samples) <= 31
+    assert window.rate() == pytest.approx(100_000, rel=0.01)
+
+
+@pytest.mark.unit
+def test_speed_window_forgets_samples_older_than_window():
+    window = SpeedWindow(window=10, slots=10)
+    window.add(0.0, 0)
+    window.add(5.0, 5_000)
+    # A stall: nothing new for a long time, then a burst.
+    window.add(60.0, 5_000)
+    assert window.rate() is None
+
+    window.add(62.0, 25_000)
+    assert window.rate() == pytest.approx(10_000)
+
+
+@pytest.mark.unit
+def test_estimate_seconds_remaining_needs_a_rate():
+    assert estimate_seconds_remaining(1000, 100.0) == 10
+    assert estimate_seconds_remaining(1000, None) == 0
+    assert estimate_seconds_remaining(0, 100.0) == 0
+
+
+@pytest.mark.unit
+def test_extract_progress_counts_files_without_remembering_them():
+    progress = ExtractProgress()
+    for index, path in enumerate(["a", "a", "b", "c", "c", "c"]):
+        line = json.dumps(
+            {
+                "type": "progress_percent",
+                "current": index * 10,
+                "total": 100,
+                "info": [path],
+            }
+        )
+        assert progress.feed(parse_log_json(line))
+
+    assert progress.nfiles == 3
+    assert progress.current_file == "c"
+    assert progress.restored == 50
+    assert not progress.feed({"type": "progress_percent", "finished": True})
+    assert not progress.feed(parse_log_json("not json"))
+
+
+@pytest.mark.unit
+def test_current_file_tracker_only_shows_slow_files():
+    tracker = CurrentFileTracker(threshold=3.0, linger=10.0)
+
+    assert tracker.observe("fast", 0.0) is None
+    assert tracker.observe("big.iso", 1.0) is None
+    assert tracker.observe("big.iso", 5.0) == "big.iso"
+    assert tracker.elapsed("big.iso", 5.0) == pytest.approx(4.0)
+    # Finished big.iso: it stays until another slow file or the linger expires.
+    assert tracker.observe("small", 6.0) == "big.iso"
+    assert tracker.observe("smaller", 17.0) is None
+
+
+@pytest.mark.unit
+def test_message_throttle_lets_new_phases_through():
+    throttle = MessageThrottle(interval=2.0)
+
+    assert throttle.allow("Checking segments (1/10)", 0.0)
+    assert not throttle.allow("Checking segments (2/10)", 1.0)
+    assert throttle.allow("Checking archives (1/3)", 1.5)
+    assert throttle.allow("Checking archives (2/3)", 3.6)
+
+
+@pytest.mark.unit
+def test_files_cache_stats_from_borg2_progress():
+    stats = FilesCacheStats()
+    stats.feed(
+        {
+            "type": "archive_progress",
+            "nfiles": 10,
+            "files_stats": {"A": 1, "M": 1, "U": 8},
+        }
+    )
+
+    assert stats.hit_rate == pytest.approx(0.8)
+
+
+@pytest.mark.unit
+def test_files_cache_stats_from_stats_output():
+    stats = FilesCacheStats()
+    assert stats.hit_rate is None
+
+    for line in ("Number of files: 4", "Added files: 0", "Unchanged files: 3"):
+        stats.feed({"type": "log_message", "message": line})
+    stats.feed({"type": "log_message", "message": "Modified files: 1"})
+
+    assert stats.hit_rate == pytest.approx(0.75)
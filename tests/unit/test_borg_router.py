@@ -19,7 +19,7 @@ async def test_update_stats_delegates_to_v2_repository_helper(db_session):
         result = await BorgRouter(repo).update_stats(db_session)
 
     assert result is True
-    mock_update.assert_awaited_once_with(repo, db_session)
+    mock_update.assert_awaited_once_with(repo, db_session, refresh_size=True)
 
 
 @pytest.mark.unit
@@ -34,7 +34,7 @@ async def test_update_stats_delegates_to_v1_repository_helper(db_session):
         result = await BorgRouter(repo).update_stats(db_session)
 
     assert result is False
-    mock_update.assert_awaited_once_with(repo, db_session)
+    mock_update.assert_awaited_once_with(repo, db_session, refresh_size=True)
 
 
 @pytest.mark.unit
@@ -943,6 +943,45 @@ def test_build_restore_extract_command_adds_strip_components_for_v1():
     ]
 
 
+@pytest.mark.unit
+def test_build_restore_export_tar_command_streams_to_stdout():
+    v1 = BorgRouter(SimpleNamespace(borg_version=1)).build_restore_export_tar_command(
+        repository_path="/repos/v1",
+        archive_name="manual-1",
+        paths=["home/user/folder"],
+        strip_components=2,
+    )
+    v2 = BorgRouter(SimpleNamespace(borg_version=2)).build_restore_export_tar_command(
+        repository_path="/repos/v2",
+        archive_name="manual-1",
+        paths=["home/user/folder"],
+        bypass_lock=True,
+    )
+
+    assert v1 == [
+        "borg",
+        "export-tar",
+        "--list",
+        "--log-json",
+        "--strip-components",
+        "2",
+        "/repos/v1::manual-1",
+        "-",
+        "home/user/folder",
+    ]
+    assert v2[1:] == [
+        "-r",
+        "/repos/v2",
+        "export-tar",
+        "--list",
+        "--log-json",
+        "--bypass-lock",
+        "manual-1",
+        "-",
+        "home/user/folder",
+    ]
+
+
 @pytest.mark.unit
 def test_build_restore_extract_command_delegates_strip_components_for_v2():
     repo = SimpleNamespace(borg_version=2)
@@ -966,6 +1005,7 @@ def test_build_restore_extract_command_delegates_strip_components_for_v2():
         remote_path=None,
         bypass_lock=False,
         strip_components=3,
+        patterns_from=None,
     )
 
 
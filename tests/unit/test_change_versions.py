@@ -0,0 +1,68 @@
+import pytest
+
+from app.database.models import BackupJob, Repository
+from app.services.change_versions import change_versions, families_for_tables
+
+
+@pytest.mark.unit
+def test_families_follow_committed_writes_only(test_db):
+    jobs_before = change_versions.get("jobs")
+    repositories_before = change_versions.get("repositories")
+
+    test_db.add(BackupJob(repository="/backups/a", status="running"))
+    test_db.flush()
+    assert change_versions.get("jobs") == jobs_before
+    test_db.rollback()
+    test_db.commit()
+    assert change_versions.get("jobs") == jobs_before
+
+    test_db.add(BackupJob(repository="/backups/a", status="running"))
+    test_db.commit()
+    assert change_versions.get("jobs") == jobs_before + 1
+    assert change_versions.get("repositories") == repositories_before
+
+    test_db.query(BackupJob).update({"status": "completed"})
+    test_db.commit()
+    assert change_versions.get("jobs") == jobs_before + 2
+
+
+@pytest.mark.unit
+def test_families_for_tables_ignores_untracked_tables():
+    assert families_for_tables(["backup_jobs", "repositories", "auth_events"]) == {
+        "jobs",
+        "repositories",
+    }
+
+
+@pytest.mark.unit
+def test_polled_job_list_answers_304_until_a_job_changes(
+    test_client, test_db, admin_headers
+):
+    repo = Repository(name="etag-repo", path="/backups/etag", encryption="none")
+    test_db.add(repo)
+    test_db.commit()
+
+    first = test_client.get("/api/backup/jobs", headers=admin_headers)
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    unchanged = test_client.get(
+        "/api/backup/jobs", headers={**admin_headers, "If-None-Match": etag}
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    other_query = test_client.get(
+        "/api/backup/jobs?limit=5", headers={**admin_headers, "If-None-Match": etag}
+    )
+    assert other_query.status_code == 200
+
+    test_db.add(BackupJob(repository=repo.path, status="running"))
+    test_db.commit()
+
+    changed = test_client.get(
+        "/api/backup/jobs", headers={**admin_headers, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert [job["repository"] for job in changed.json()["jobs"]] == [repo.path]
@@ -0,0 +1,165 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.borg_router import BorgRouter
+from app.database.models import ArchiveVerification, CheckJob, Repository
+from app.services.check_verify_rotation import (
+    run_verify_rotation,
+    select_verification_batch,
+    verify_coverage,
+)
+
+
+class AsyncLineStream:
+    def __init__(self, lines):
+        self._lines = list(lines)
+
+    def __aiter__(self):
+        async def generator():
+            for line in self._lines:
+                yield line
+
+        return generator()
+
+
+class FakeProcess:
+    def __init__(self, pid=1234, returncode=0, stderr_lines=None):
+        self.pid = pid
+        self.returncode = returncode
+        self.stderr = AsyncLineStream(stderr_lines or [])
+
+    async def wait(self):
+        await asyncio.sleep(0)
+        return self.returncode
+
+    def terminate(self):
+        self.returncode = -15
+
+    def kill(self):
+        self.returncode = -9
+
+
+def _archive(name, start):
+    return {"id": f"id-{name}", "name": name, "start": start}
+
+
+@pytest.mark.unit
+def test_batch_takes_unverified_oldest_first_then_failed_then_stalest():
+    now = datetime(2026, 10, 19)
+    archives = [
+        _archive("new", "2026-10-18T00:00:00"),
+        _archive("stale", "2026-01-01T00:00:00"),
+        _archive("fresh", "2026-02-01T00:00:00"),
+        _archive("broken", "2026-03-01T00:00:00"),
+        _archive("old", "2026-01-02T00:00:00"),
+    ]
+    verifications = {
+        "id-stale": SimpleNamespace(status="verified", verified_at=now - timedelta(30)),
+        "id-fresh": SimpleNamespace(status="verified", verified_at=now),
+        "id-broken": SimpleNamespace(status="failed", verified_at=now),
+    }
+
+    batch = select_verification_batch(archives, verifications, 4)
+
+    assert [archive["name"] for archive in batch] == ["old", "new", "broken", "stale"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rotation_records_each_archive_and_fails_on_bad_data(
+    db_session_commit, tmp_path
+):
+    db = db_session_commit
+    repo = Repository(
+        name="Repo",
+        path="/tmp/repo",
+        encryption="none",
+        repository_type="local",
+        archive_count=3,
+        check_verify_archives_per_run=2,
+    )
+    db.add(repo)
+    db.commit()
+    db.add_all(
+        [
+            ArchiveVerification(
+                repository_id=repo.id,
+                archive_id="id-b",
+                archive_name="b",
+                status="verified",
+                verified_at=datetime.utcnow() - timedelta(days=1),
+            ),
+            ArchiveVerification(
+                repository_id=repo.id,
+                archive_id="id-pruned",
+                archive_name="pruned",
+                status="verified",
+                verified_at=datetime.utcnow() - timedelta(days=9),
+            ),
+        ]
+    )
+    job = CheckJob(
+        repository_id=repo.id,
+        status="running",
+        started_at=datetime.utcnow(),
+        max_duration=0,
+        verify_archives_per_run=2,
+    )
+    db.add(job)
+    db.commit()
+    archives = [
+        _archive("a", "2026-01-01T00:00:00"),
+        _archive("b", "2026-01-02T00:00:00"),
+        _archive("c", "2026-01-03T00:00:00"),
+    ]
+    processes = [
+        FakeProcess(returncode=0),
+        FakeProcess(
+            returncode=2,
+            stderr_lines=[
+                b'{"type": "log_message", "levelname": "ERROR", '
+                b'"message": "Data integrity error: chunk 1f2e"}\n'
+            ],
+        ),
+    ]
+    exec_mock = AsyncMock(side_effect=processes)
+
+    with (
+        patch.object(BorgRouter, "list_archives", AsyncMock(return_value=archives)),
+        patch(
+            "app.services.check_verify_rotation.asyncio.create_subprocess_exec",
+            new=exec_mock,
+        ),
+        patch("app.services.check_service.get_process_start_time", return_value=1),
+        patch(
+            "app.services.check_verify_rotation.NotificationService.send_check_completion",
+            new=AsyncMock(),
+        ),
+    ):
+        await run_verify_rotation(db, job, repo, {}, {}, tmp_path)
+
+    commands = [call.args for call in exec_mock.await_args_list]
+    assert commands[0][-1] == "/tmp/repo::a"
+    assert "--dry-run" in commands[0]
+    assert commands[1][-1] == "/tmp/repo::c"
+
+    assert job.status == "failed"
+    assert job.archives_verified == 1
+    assert "c" in job.error_message
+    rows = {
+        row.archive_id: row
+        for row in db.query(ArchiveVerification).filter_by(repository_id=repo.id)
+    }
+    assert set(rows) == {"id-a", "id-b", "id-c"}
+    assert rows["id-a"].status == "verified"
+    assert rows["id-c"].status == "failed"
+    assert rows["id-c"].error_message == "Data integrity error: chunk 1f2e"
+
+    coverage = verify_coverage(db, [repo])[repo.id]
+    assert coverage.archives_verified == 2
+    assert coverage.percent == 66.7
+    assert coverage.oldest_verified_at == rows["id-b"].verified_at
@@ -0,0 +1,159 @@
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database.models import BackupJob, Repository
+from app.services.compression_tuning import (
+    CandidateResult,
+    collect_sample,
+    compression_tuning_service,
+    recommend_compression,
+)
+
+MB = 1024 * 1024
+
+
+def _result(compression, seconds, stored, sample=100 * MB, error=None):
+    return CandidateResult(
+        compression=compression,
+        seconds=seconds,
+        sample_bytes=sample,
+        stored_bytes=stored,
+        error=error,
+    )
+
+
+def _create_repository(test_db, source_directories) -> Repository:
+    repo = Repository(
+        name="Tuned",
+        path="/tmp/tuned",
+        encryption="none",
+        repository_type="local",
+        borg_version=1,
+        compression="lz4",
+        source_directories=json.dumps(source_directories),
+    )
+    test_db.add(repo)
+    test_db.commit()
+    test_db.refresh(repo)
+    return repo
+
+
+@pytest.mark.unit
+def test_collect_sample_stays_within_budget(tmp_path):
+    source = tmp_path / "source"
+    for directory in range(5):
+        (source / f"d{directory}").mkdir(parents=True)
+        for index in range(20):
+            path = source / f"d{directory}" / f"f{index}.txt"
+            path.write_bytes(b"line of text\n" * 2000)
+    (source / "empty").write_bytes(b"")
+    sample_dir = tmp_path / "sample"
+    sample_dir.mkdir()
+
+    sample = collect_sample(
+        [str(source)], str(sample_dir), budget=100_000, seed=1, chunk_size=8192
+    )
+
+    assert sample.bytes == 100_000
+    assert sample.files == len(list(sample_dir.iterdir()))
+    assert sum(path.stat().st_size for path in sample_dir.iterdir()) == 100_000
+
+
+@pytest.mark.unit
+def test_recommend_prefers_fastest_within_tolerance_of_best_ratio():
+    results = [
+        _result("lz4", 1.0, 60 * MB),
+        _result("zstd,3", 2.0, 41 * MB),
+        _result("zstd,10", 9.0, 40 * MB),
+        _result("auto,zstd,6", 0.5, 0, error="exited with 2"),
+    ]
+
+    assert recommend_compression(results).compression == "zstd,3"
+    assert recommend_compression(results, target_ratio=0.7).compression == "lz4"
+    # Nothing reaches the target: fall back to the best ratio.
+    assert recommend_compression(results, target_ratio=0.1).compression == "zstd,10"
+    assert recommend_compression([results[-1]]) is None
+
+
+@pytest.mark.unit
+class TestCompressionTuningApi:
+    @pytest.fixture(autouse=True)
+    def _reset_running(self):
+        compression_tuning_service._running.clear()
+        yield
+        compression_tuning_service._running.clear()
+
+    def test_start_requires_local_sources(
+        self, test_client: TestClient, admin_headers, test_db
+    ):
+        repo = _create_repository(test_db, [])
+
+        response = test_client.post(
+            f"/api/repositories/{repo.id}/compression-tuning",
+            json={},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 400
+        assert (
+            response.json()["detail"]["key"]
+            == "backend.errors.repo.compressionTuningNoLocalSources"
+        )
+
+    def test_start_records_run_and_rejects_duplicates(
+        self, test_client: TestClient, admin_headers, test_db
+    ):
+        repo = _create_repository(test_db, ["/data"])
+
+        with patch.object(compression_tuning_service, "run", new=AsyncMock()) as run:
+            response = test_client.post(
+                f"/api/repositories/{repo.id}/compression-tuning",
+                json={"apply": True, "target_ratio": 0.5},
+                headers=admin_headers,
+            )
+            duplicate = test_client.post(
+                f"/api/repositories/{repo.id}/compression-tuning",
+                json={},
+                headers=admin_headers,
+            )
+
+        assert response.status_code == 200
+        assert response.json()["tuning"]["status"] == "running"
+        run.assert_called_once_with(repo.id, apply=True, target_ratio=0.5)
+        assert duplicate.status_code == 409
+
+    def test_get_reports_observed_backup_speeds(
+        self, test_client: TestClient, admin_headers, test_db
+    ):
+        repo = _create_repository(test_db, ["/data"])
+        repo.compression_tuning = {"status": "running"}
+        started = datetime(2026, 10, 1, 12, 0, 0)
+        test_db.add(
+            BackupJob(
+                repository=repo.path,
+                repository_id=repo.id,
+                status="completed",
+                started_at=started,
+                completed_at=started + timedelta(seconds=10),
+                original_size=200 * MB,
+                compressed_size=100 * MB,
+            )
+        )
+        test_db.commit()
+
+        response = test_client.get(
+            f"/api/repositories/{repo.id}/compression-tuning",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["compression"] == "lz4"
+        # No tuning task is running in this process any more.
+        assert body["tuning"]["status"] == "interrupted"
+        assert body["observed_backups"][0]["mb_per_second"] == 20.0
+        assert body["observed_backups"][0]["ratio"] == 0.5
@@ -0,0 +1,174 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import SSHConnection, SSHConnectionSample, SSHKey
+from app.services import connection_storage_prober as prober_module
+from app.services.connection_storage_prober import (
+    RESOLUTION_DAY,
+    RESOLUTION_RAW,
+    ConnectionProbeResult,
+    ConnectionStorageProber,
+    downsample_connection_samples,
+    record_connection_sample,
+    storage_growth_per_day,
+)
+
+
+def _connection(db_session, host="storage.example.com", username="borg"):
+    connection = SSHConnection(
+        host=host, username=username, port=22, status="connected"
+    )
+    db_session.add(connection)
+    db_session.commit()
+    db_session.refresh(connection)
+    return connection
+
+
+def _storage(used):
+    return {
+        "total": 1000,
+        "used": used,
+        "available": 1000 - used,
+        "percent_used": used / 10,
+    }
+
+
+@pytest.mark.unit
+def test_record_connection_sample_updates_latest_values_only_on_success(db_session):
+    connection = _connection(db_session)
+    probed_at = datetime(2026, 1, 1, 12, 0)
+
+    record_connection_sample(
+        db_session,
+        connection,
+        ConnectionProbeResult(storage=_storage(400), latency_ms=12.5),
+        sampled_at=probed_at,
+    )
+    record_connection_sample(db_session, connection, ConnectionProbeResult())
+    db_session.commit()
+
+    assert connection.storage_used == 400
+    assert connection.last_storage_check == probed_at
+    samples = db_session.query(SSHConnectionSample).order_by("sampled_at").all()
+    assert [(s.storage_used, s.latency_ms, s.failures) for s in samples] == [
+        (400, 12.5, 0),
+        (None, None, 1),
+    ]
+
+
+@pytest.mark.unit
+def test_downsample_folds_old_raw_samples_into_daily_rows(db_session):
+    connection = _connection(db_session)
+    day = datetime(2026, 1, 1)
+    readings = [(6, 300, 10.0, 80.0), (12, 350, 30.0, None), (18, None, None, None)]
+    for hour, used, latency, throughput in readings:
+        record_connection_sample(
+            db_session,
+            connection,
+            ConnectionProbeResult(
+                storage=_storage(used) if used is not None else None,
+                latency_ms=latency,
+                throughput_mbps=throughput,
+            ),
+            sampled_at=day + timedelta(hours=hour),
+        )
+    recent_at = day + timedelta(days=3)
+    record_connection_sample(
+        db_session,
+        connection,
+        ConnectionProbeResult(storage=_storage(500), latency_ms=5.0),
+        sampled_at=recent_at,
+    )
+    db_session.commit()
+
+    folded = downsample_connection_samples(db_session, now=recent_at)
+    db_session.commit()
+
+    assert folded == 3
+    rows = db_session.query(SSHConnectionSample).order_by("sampled_at").all()
+    assert [row.resolution for row in rows] == [RESOLUTION_DAY, RESOLUTION_RAW]
+    daily = rows[0]
+    assert daily.sampled_at == day
+    assert daily.sample_count == 3
+    assert daily.failures == 1
+    assert daily.storage_used == 350
+    assert daily.latency_ms == 20.0
+    assert daily.throughput_mbps == 80.0
+
+
+@pytest.mark.unit
+def test_storage_growth_per_day_needs_a_day_of_history(db_session):
+    growing = _connection(db_session)
+    fresh = _connection(db_session, host="fresh.example.com")
+    now = datetime(2026, 1, 11)
+    for connection, offsets in ((growing, (10, 0)), (fresh, (0.5, 0))):
+        for days_ago, used in zip(offsets, (100, 600)):
+            record_connection_sample(
+                db_session,
+                connection,
+                ConnectionProbeResult(storage=_storage(used)),
+                sampled_at=now - timedelta(days=days_ago),
+            )
+    db_session.commit()
+
+    growth = storage_growth_per_day(db_session, [growing.id, fresh.id], now=now)
+
+    assert growth == {growing.id: 50}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_probe_pass_limits_probes_per_host_and_records_failures(db_session):
+    db_session.add(
+        SSHKey(
+            name="system-key",
+            public_key="ssh-rsa AAA",
+            private_key="encrypted",
+            key_type="rsa",
+            is_system_key=True,
+            is_active=True,
+        )
+    )
+    db_session.commit()
+    shared = [_connection(db_session, username=f"user{i}") for i in range(3)]
+    other = _connection(db_session, host="other.example.com")
+    testing_session_local = sessionmaker(
+        bind=db_session.get_bind(), autocommit=False, autoflush=False
+    )
+
+    in_flight = {}
+    peak = {}
+
+    async def fake_probe(connection, ssh_key):
+        host = connection.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        if connection.id == other.id:
+            return ConnectionProbeResult()
+        return ConnectionProbeResult(storage=_storage(200), latency_ms=3.0)
+
+    with (
+        patch.object(prober_module, "SessionLocal", testing_session_local),
+        patch.object(prober_module, "probe_connection", side_effect=fake_probe),
+        patch.object(prober_module.app_settings, "connection_probe_concurrency", 4),
+        patch.object(
+            prober_module.app_settings, "connection_probe_per_host_concurrency", 1
+        ),
+    ):
+        result = await ConnectionStorageProber().probe_connections()
+
+    assert result.total == 4
+    assert result.succeeded == 3
+    assert result.failed == 1
+    assert peak == {"storage.example.com": 1, "other.example.com": 1}
+    db_session.expire_all()
+    assert {c.storage_used for c in shared} == {200}
+    samples = db_session.query(SSHConnectionSample).all()
+    assert len(samples) == 4
+    assert sum(sample.failures for sample in samples) == 1
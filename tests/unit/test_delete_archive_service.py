@@ -12,22 +12,24 @@ from app.services.delete_archive_service import (
 
 
 class AsyncLineStream:
-    def __init__(self, lines):
+    def __init__(self, lines, delay=0):
         self._lines = list(lines)
+        self._delay = delay
 
     def __aiter__(self):
         async def generator():
             for line in self._lines:
+                await asyncio.sleep(self._delay)
                 yield line
 
         return generator()
 
 
 class FakeProcess:
-    def __init__(self, pid=1234, returncode=0, stderr_lines=None):
+    def __init__(self, pid=1234, returncode=0, stderr_lines=None, stderr_delay=0):
         self.pid = pid
         self.returncode = returncode
-        self.stderr = AsyncLineStream(stderr_lines or [])
+        self.stderr = AsyncLineStream(stderr_lines or [], delay=stderr_delay)
 
     async def wait(self):
         await asyncio.sleep(0)
@@ -202,3 +204,190 @@ async def test_cancel_delete_marks_running_job_cancelled(delete_service, db_sess
 
     db_session.refresh(job)
     assert job.status == "cancelled"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_execute_bulk_delete_runs_one_borg_delete(
+    delete_service, db_session_commit
+):
+    repo = Repository(
+        name="Repo", path="/tmp/repo", encryption="none", repository_type="local"
+    )
+    db_session_commit.add(repo)
+    db_session_commit.commit()
+    db_session_commit.refresh(repo)
+    repo_id = repo.id
+
+    names = ["daily-1", "daily-2", "daily-3"]
+    job = DeleteArchiveJob(
+        repository_id=repo_id,
+        archive_name="3 archives",
+        archive_names=names,
+        status="pending",
+    )
+    db_session_commit.add(job)
+    db_session_commit.commit()
+    job_id = job.id
+
+    process = FakeProcess(
+        returncode=0,
+        stderr_lines=[
+            f"Deleting archive: {name}  Mon, 2026-10-19 ({index}/3)\n".encode()
+            for index, name in enumerate(names, start=1)
+        ],
+    )
+    create_process = AsyncMock(return_value=process)
+
+    with (
+        patch(
+            "app.services.delete_archive_service.SessionLocal",
+            return_value=db_session_commit,
+        ),
+        patch(
+            "app.services.delete_archive_service.asyncio.create_subprocess_exec",
+            new=create_process,
+        ),
+        patch(
+            "app.services.delete_archive_service.get_process_start_time",
+            return_value=555,
+        ),
+        patch(
+            "app.services.job_history_retention.purge_jobs_for_pruned_archives"
+        ) as purge,
+    ):
+        await delete_service.execute_bulk_delete(job_id, repo_id, names)
+
+    create_process.assert_awaited_once()
+    args = create_process.await_args.args
+    assert args[1:5] == ("delete", "--stats", "--progress", "--list")
+    assert args[-4:] == ("/tmp/repo", *names)
+    purge.assert_called_once_with(db_session_commit, repo_id, set(names))
+
+    refreshed = (
+        db_session_commit.query(DeleteArchiveJob)
+        .filter(DeleteArchiveJob.id == job_id)
+        .first()
+    )
+    assert refreshed.status == "completed"
+    assert refreshed.archives_deleted == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_execute_bulk_delete_warning_cascades_reported_archives_only(
+    delete_service, db_session_commit
+):
+    repo = Repository(
+        name="Repo", path="/tmp/repo", encryption="none", repository_type="local"
+    )
+    db_session_commit.add(repo)
+    db_session_commit.commit()
+    db_session_commit.refresh(repo)
+    repo_id = repo.id
+
+    names = ["daily-1", "missing", "daily-3"]
+    job = DeleteArchiveJob(
+        repository_id=repo_id, archive_name="3 archives", status="pending"
+    )
+    db_session_commit.add(job)
+    db_session_commit.commit()
+    job_id = job.id
+
+    process = FakeProcess(
+        returncode=1,
+        stderr_lines=[
+            b"Deleting archive: daily-1  Mon, 2026-10-19 (1/3)\n",
+            b"Archive missing not found (2/3).\n",
+            b"Deleting archive: daily-3  Mon, 2026-10-19 (3/3)\n",
+        ],
+    )
+
+    with (
+        patch(
+            "app.services.delete_archive_service.SessionLocal",
+            return_value=db_session_commit,
+        ),
+        patch(
+            "app.services.delete_archive_service.asyncio.create_subprocess_exec",
+            new=AsyncMock(return_value=process),
+        ),
+        patch(
+            "app.services.delete_archive_service.get_process_start_time",
+            return_value=555,
+        ),
+        patch(
+            "app.services.job_history_retention.purge_jobs_for_pruned_archives"
+        ) as purge,
+    ):
+        await delete_service.execute_bulk_delete(job_id, repo_id, names)
+
+    purge.assert_called_once_with(db_session_commit, repo_id, {"daily-1", "daily-3"})
+    refreshed = (
+        db_session_commit.query(DeleteArchiveJob)
+        .filter(DeleteArchiveJob.id == job_id)
+        .first()
+    )
+    assert refreshed.status == "completed_with_warnings"
+    assert refreshed.archives_deleted == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_execute_bulk_delete_reads_stderr_to_the_end_after_borg_exits(
+    delete_service, db_session_commit
+):
+    repo = Repository(
+        name="Repo", path="/tmp/repo", encryption="none", repository_type="local"
+    )
+    db_session_commit.add(repo)
+    db_session_commit.commit()
+    db_session_commit.refresh(repo)
+    repo_id = repo.id
+
+    names = ["daily-1", "missing", "daily-3"]
+    job = DeleteArchiveJob(
+        repository_id=repo_id, archive_name="3 archives", status="pending"
+    )
+    db_session_commit.add(job)
+    db_session_commit.commit()
+    job_id = job.id
+
+    process = FakeProcess(
+        returncode=1,
+        # borg has already exited while its last lines are still buffered
+        stderr_delay=0.01,
+        stderr_lines=[
+            b"Deleting archive: daily-1  Mon, 2026-10-19 (1/3)\n",
+            b"Archive missing not found (2/3).\n",
+            b"Deleting archive: daily-3  Mon, 2026-10-19 (3/3)\n",
+        ],
+    )
+
+    with (
+        patch(
+            "app.services.delete_archive_service.SessionLocal",
+            return_value=db_session_commit,
+        ),
+        patch(
+            "app.services.delete_archive_service.asyncio.create_subprocess_exec",
+            new=AsyncMock(return_value=process),
+        ),
+        patch(
+            "app.services.delete_archive_service.get_process_start_time",
+            return_value=555,
+        ),
+        patch(
+            "app.services.job_history_retention.purge_jobs_for_pruned_archives"
+        ) as purge,
+    ):
+        await delete_service.execute_bulk_delete(job_id, repo_id, names)
+
+    purge.assert_called_once_with(db_session_commit, repo_id, {"daily-1", "daily-3"})
+    refreshed = (
+        db_session_commit.query(DeleteArchiveJob)
+        .filter(DeleteArchiveJob.id == job_id)
+        .first()
+    )
+    assert refreshed.status == "completed_with_warnings"
+    assert refreshed.archives_deleted == 2
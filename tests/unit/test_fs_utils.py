@@ -0,0 +1,24 @@
+import pytest
+
+from app.utils.fs import probe_directory_fingerprint
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_probe_directory_fingerprint_tracks_top_level_changes(tmp_path):
+    (tmp_path / "index.1").write_bytes(b"a")
+    (tmp_path / "data").mkdir()
+
+    first = await probe_directory_fingerprint(str(tmp_path))
+    assert first is not None
+    assert await probe_directory_fingerprint(str(tmp_path)) == first
+
+    (tmp_path / "index.1").unlink()
+    (tmp_path / "index.2").write_bytes(b"ab")
+    assert await probe_directory_fingerprint(str(tmp_path)) != first
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_probe_directory_fingerprint_returns_none_for_missing_path(tmp_path):
+    assert await probe_directory_fingerprint(str(tmp_path / "missing")) is None
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.database.models import BackupJob, MetricPoint, Repository
+from app.services.metric_history import (
+    METRIC_BACKUP_DURATION,
+    METRIC_BACKUP_SUCCESS,
+    METRIC_BACKUP_THROUGHPUT,
+    METRIC_REPOSITORY_ARCHIVES,
+    METRIC_REPOSITORY_SIZE,
+    RESOLUTION_DAY,
+    RESOLUTION_HOUR,
+    RESOLUTION_RAW,
+    RESOLUTION_WEEK,
+    combined_last_series,
+    metric_series,
+    roll_up_metric_points,
+    series_growth_per_day,
+)
+
+
+def _repository(db_session, name="Repo"):
+    repo = Repository(
+        name=name,
+        path=f"/tmp/{name}",
+        encryption="none",
+        compression="lz4",
+        repository_type="local",
+    )
+    db_session.add(repo)
+    db_session.commit()
+    return repo
+
+
+def _points(db_session, metric):
+    return (
+        db_session.query(MetricPoint)
+        .filter(MetricPoint.metric == metric)
+        .order_by(MetricPoint.bucket_start, MetricPoint.id)
+        .all()
+    )
+
+
+def _add_point(db_session, repo, metric, at, value, resolution=RESOLUTION_RAW):
+    db_session.add(
+        MetricPoint(
+            repository_id=repo.id,
+            metric=metric,
+            resolution=resolution,
+            bucket_start=at,
+            count=1,
+            total=value,
+            minimum=value,
+            maximum=value,
+            last=value,
+        )
+    )
+
+
+@pytest.mark.unit
+def test_repository_stats_changes_are_recorded_on_flush(db_session):
+    repo = _repository(db_session)
+    assert _points(db_session, METRIC_REPOSITORY_SIZE) == []
+
+    repo.unique_size_bytes = 2048
+    repo.original_size_bytes = 8192
+    repo.archive_count = 3
+    db_session.commit()
+    repo.name = "Renamed"  # Not a stats column
+    db_session.commit()
+
+    assert [p.last for p in _points(db_session, METRIC_REPOSITORY_SIZE)] == [2048]
+    assert [p.last for p in _points(db_session, METRIC_REPOSITORY_ARCHIVES)] == [3]
+
+
+@pytest.mark.unit
+def test_finished_backup_records_duration_throughput_and_outcome_once(db_session):
+    repo = _repository(db_session)
+    started = datetime(2026, 1, 1, 12, 0)
+    job = BackupJob(
+        repository=repo.path,
+        repository_id=repo.id,
+        status="running",
+        started_at=started,
+    )
+    db_session.add(job)
+    db_session.commit()
+
+    job.status = "completed"
+    job.completed_at = started + timedelta(seconds=100)
+    job.original_size = 10_000
+    db_session.commit()
+    job.status = "completed_with_warnings"
+    db_session.commit()
+
+    assert [p.last for p in _points(db_session, METRIC_BACKUP_SUCCESS)] == [1]
+    assert [p.last for p in _points(db_session, METRIC_BACKUP_DURATION)] == [100]
+    assert [p.last for p in _points(db_session, METRIC_BACKUP_THROUGHPUT)] == [100]
+
+
+@pytest.mark.unit
+def test_rollup_folds_points_into_hour_day_and_week_rows(db_session):
+    repo = _repository(db_session)
+    now = datetime(2026, 3, 4, 10, 30)  # A Wednesday
+    old = now - timedelta(days=500)
+    _add_point(db_session, repo, METRIC_REPOSITORY_SIZE, old, 10)
+    _add_point(db_session, repo, METRIC_REPOSITORY_SIZE, old + timedelta(hours=1), 30)
+    yesterday = now - timedelta(days=1)
+    _add_point(db_session, repo, METRIC_REPOSITORY_SIZE, yesterday, 40)
+    _add_point(
+        db_session, repo, METRIC_REPOSITORY_SIZE, yesterday.replace(minute=50), 60
+    )
+    _add_point(db_session, repo, METRIC_REPOSITORY_SIZE, now, 70)  # Current hour
+    db_session.commit()
+
+    # Two passes, as the hourly rows of an old point only age into days later
+    roll_up_metric_points(db_session, now=now)
+    roll_up_metric_points(db_session, now=now)
+
+    rows = _points(db_session, METRIC_REPOSITORY_SIZE)
+    assert [(row.resolution, row.count) for row in rows] == [
+        (RESOLUTION_WEEK, 2),
+        (RESOLUTION_HOUR, 2),
+        (RESOLUTION_RAW, 1),
+    ]
+    week, hour, _ = rows
+    assert week.bucket_start.weekday() == 0
+    assert (week.total, week.minimum, week.maximum, week.last) == (40, 10, 30, 30)
+    assert hour.bucket_start == yesterday.replace(minute=0)
+    assert (hour.total, hour.last) == (100, 60)
+
+
+@pytest.mark.unit
+def test_metric_series_merges_resolutions_into_requested_buckets(db_session):
+    repo = _repository(db_session, "First")
+    other = _repository(db_session, "Second")
+    day = datetime(2026, 2, 10)
+    _add_point(db_session, repo, METRIC_REPOSITORY_SIZE, day, 100, RESOLUTION_DAY)
+    _add_point(db_session, repo, METRIC_REPOSITORY_SIZE, day + timedelta(days=2), 300)
+    _add_point(
+        db_session,
+        repo,
+        METRIC_REPOSITORY_SIZE,
+        day + timedelta(days=2, hours=5),
+        500,
+        RESOLUTION_HOUR,
+    )
+    _add_point(db_session, other, METRIC_REPOSITORY_SIZE, day + timedelta(days=1), 7)
+    db_session.commit()
+
+    series = metric_series(
+        db_session, METRIC_REPOSITORY_SIZE, RESOLUTION_DAY, day - timedelta(days=1)
+    )
+
+    points = series[repo.id]
+    assert [p.bucket_start for p in points] == [day, day + timedelta(days=2)]
+    assert (points[1].count, points[1].average, points[1].last) == (2, 400, 500)
+    assert series_growth_per_day(points) == 200
+    assert [size for _, size in combined_last_series(series)] == [100, 107, 507]
@@ -93,6 +93,73 @@ class TestMountService:
         assert "follow_symlinks" in argv
         assert "no_contain_symlinks" not in argv
 
+    def test_sshfs_source_profile_uses_max_conns_only_when_supported(self):
+        from app.services.mount_service import _sshfs_source_profile_options
+
+        with patch("app.services.mount_service.settings") as mock_settings:
+            mock_settings.sshfs_source_max_read_kib = 1024
+            mock_settings.sshfs_source_compression = False
+            mock_settings.sshfs_source_ciphers = "aes128-gcm@openssh.com"
+            mock_settings.sshfs_source_max_conns = 4
+
+            current = _sshfs_source_profile_options((3, 7))
+            older = _sshfs_source_profile_options((2, 10))
+
+        assert "kernel_cache" in current
+        assert "max_read=1048576" in current
+        assert "Compression=no" in current
+        assert "Ciphers=aes128-gcm@openssh.com" in current
+        assert "max_conns=4" in current
+        assert "max_conns=4" not in older
+
+    @pytest.mark.asyncio
+    async def test_execute_sshfs_mount_drops_rejected_source_profile(
+        self, mount_service
+    ):
+        connection = Mock(spec=SSHConnection)
+        connection.host = "files.example"
+        connection.username = "backup"
+        connection.port = 22
+        connection.use_sudo = False
+        connection.default_path = None
+
+        rejected = AsyncMock()
+        rejected.returncode = 1
+        rejected.communicate = AsyncMock(
+            return_value=(b"", b"fuse: unknown option(s): `-o max_conns=4'\n")
+        )
+        mounted = AsyncMock()
+        mounted.returncode = 0
+        mounted.communicate = AsyncMock(return_value=(b"", b""))
+        mount_service._sshfs_version = (3, 7)
+
+        with (
+            patch("app.services.mount_service.settings") as mock_settings,
+            patch(
+                "app.services.mount_service.asyncio.create_subprocess_exec",
+                new=AsyncMock(side_effect=[rejected, mounted]),
+            ) as mock_exec,
+            patch("app.services.mount_service.asyncio.sleep", new=AsyncMock()),
+        ):
+            mock_settings.sshfs_source_max_read_kib = 1024
+            mock_settings.sshfs_source_compression = False
+            mock_settings.sshfs_source_ciphers = ""
+            mock_settings.sshfs_source_max_conns = 4
+            await mount_service._execute_sshfs_mount(
+                connection=connection,
+                remote_path="/srv/data",
+                mount_point="/tmp/sshfs_mount_1/srv/data",
+                temp_key_file="/tmp/test.key",
+                preserve_symlinks=True,
+                source_profile=True,
+            )
+
+        first_cmd = mock_exec.await_args_list[0].args
+        second_cmd = mock_exec.await_args_list[1].args
+        assert "kernel_cache" in first_cmd
+        assert "kernel_cache" not in second_cmd
+        assert second_cmd[1] == "backup@files.example:/srv/data"
+
     def test_validate_mount_point_sensitive_paths(self, mount_service):
         """Test mount point validation rejects sensitive system paths"""
         sensitive_paths = [
@@ -535,6 +602,7 @@ class TestMountService:
                 mount_point,
                 temp_key_file,
                 preserve_symlinks=False,
+                source_profile=False,
             ):
                 assert os.path.exists(mount_point)
                 assert os.path.exists(temp_key_file)
@@ -14,6 +14,7 @@ Tests cover:
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch
 import json
+import threading
 
 import pytest
 import paho.mqtt.client as mqtt
@@ -1336,6 +1337,115 @@ class TestMQTTServicePublishing:
         assert service.client.publish.call_args[0][1] == ""
 
 
+def _create_mqtt_service_with_client() -> MQTTService:
+    """Create a configured MQTT service whose broker client is a mock."""
+    service = MQTTService()
+    service.config.update(
+        {"enabled": True, "broker_url": "mqtt://test", "base_topic": "test"}
+    )
+    service.connected = True
+    service.client = Mock()
+    service.client.publish = Mock(return_value=Mock(rc=mqtt.MQTT_ERR_SUCCESS))
+    return service
+
+
+def _published_topics(service: MQTTService):
+    return [call_item.args[0] for call_item in service.client.publish.call_args_list]
+
+
+@pytest.mark.unit
+class TestMQTTServiceIncrementalPublishing:
+    """Tests for payload diffing, progress throttling and coalesced syncs."""
+
+    def test_unchanged_payload_is_not_published_again(self):
+        service = _create_mqtt_service_with_client()
+
+        assert service.publish("repositories/1/size", {"total": 10}) is True
+        assert service.publish("repositories/1/size", {"total": 10}) is True
+        assert service.publish("repositories/1/size", {"total": 20}) is True
+
+        assert service.client.publish.call_count == 2
+        assert json.loads(service.client.publish.call_args[0][1]) == {"total": 20}
+
+    def test_failed_publish_is_retried_on_next_sync(self):
+        service = _create_mqtt_service_with_client()
+        service.client.publish.return_value = Mock(rc=mqtt.MQTT_ERR_NO_CONN)
+        assert service.publish("topic", {"data": "value"}) is False
+
+        service.client.publish.return_value = Mock(rc=mqtt.MQTT_ERR_SUCCESS)
+        assert service.publish("topic", {"data": "value"}) is True
+
+        assert service.client.publish.call_count == 2
+
+    def test_repository_status_ignores_its_publish_timestamp(self):
+        service = _create_mqtt_service_with_client()
+
+        service.publish_repository_status(1, "healthy", "/repo")
+        service.publish_repository_status(1, "healthy", "/repo")
+        service.publish_repository_status(1, "stale", "/repo")
+
+        assert _published_topics(service) == [
+            "test/repositories/1/status",
+            "test/repositories/1/status",
+        ]
+
+    def test_progress_is_rate_limited_until_status_changes(self):
+        service = _create_mqtt_service_with_client()
+
+        with patch(
+            "app.services.mqtt_service.settings.mqtt_progress_min_interval_seconds",
+            60,
+        ):
+            service.publish_repository_backup_progress(1, 10, "running", job_id=5)
+            service.publish_repository_backup_progress(1, 20, "running", job_id=5)
+            service.publish_repository_backup_progress(1, 0, "idle")
+
+        payloads = [
+            json.loads(call_item.args[1])
+            for call_item in service.client.publish.call_args_list
+        ]
+        assert [(p["status"], p["percent"]) for p in payloads] == [
+            ("running", 10),
+            ("idle", 0),
+        ]
+
+    def test_reconnect_and_tombstones_reset_remembered_payloads(self):
+        service = _create_mqtt_service_with_client()
+        service.sync_state = Mock()
+
+        service.publish("topic", {"data": "value"})
+        service._on_connect(None, None, None, 0)
+        service.publish("topic", {"data": "value"})
+        service._publish_raw("topic", "")
+        service.publish("topic", {"data": "value"})
+
+        assert service.client.publish.call_count == 4
+
+    def test_request_sync_coalesces_bursts_into_one_pass(self):
+        service = _create_mqtt_service_with_client()
+        synced = threading.Event()
+        service.sync_state = Mock(side_effect=lambda reason: synced.set())
+
+        with patch(
+            "app.services.mqtt_service.settings.mqtt_sync_debounce_seconds", 0.05
+        ):
+            assert service.request_sync(reason="backup started") is True
+            assert service.request_sync(reason="backup progress update") is True
+            assert service.request_sync(reason="backup started") is True
+
+        assert synced.wait(5)
+        service.sync_state.assert_called_once_with(
+            reason="backup progress update, backup started"
+        )
+
+    def test_request_sync_skips_when_not_enabled(self):
+        service = MQTTService()
+        service.sync_state = Mock()
+
+        assert service.request_sync(reason="backup completed") is False
+        service.sync_state.assert_not_called()
+
+
 # =============================================================================
 # MQTTService State Sync Tests
 # =============================================================================
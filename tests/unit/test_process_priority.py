@@ -0,0 +1,162 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database.models import Repository
+from app.utils import process_priority
+from app.utils.process_priority import (
+    resolve_process_priority,
+    validate_process_priorities,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_cgroup_cache():
+    process_priority._prepared_cgroups.clear()
+    yield
+    process_priority._prepared_cgroups.clear()
+
+
+@pytest.mark.unit
+def test_repository_override_wins_over_server_default(monkeypatch):
+    monkeypatch.setattr(process_priority.settings, "process_priority_check", "low")
+    repository = SimpleNamespace(process_priorities={"compact": "idle"})
+
+    check = resolve_process_priority("check", repository)
+    compact = resolve_process_priority("compact", repository)
+    backup = resolve_process_priority("backup", repository)
+
+    assert (check.priority_class, check.nice, check.ionice_class) == ("low", 10, 2)
+    assert (compact.priority_class, compact.nice, compact.ionice_class) == (
+        "idle",
+        19,
+        3,
+    )
+    assert backup.priority_class == "normal"
+    assert backup.is_default
+    assert check.is_default is False
+    assert compact.to_dict()["class"] == "idle"
+
+
+@pytest.mark.unit
+def test_validate_process_priorities_rejects_unknown_values():
+    assert validate_process_priorities({}) is None
+    assert validate_process_priorities({"check": "idle"}) == {"check": "idle"}
+    with pytest.raises(ValueError):
+        validate_process_priorities({"check": "realtime"})
+    with pytest.raises(ValueError):
+        validate_process_priorities({"mount": "low"})
+
+
+@pytest.mark.unit
+def test_cgroup_is_prepared_with_class_limits(tmp_path, monkeypatch):
+    (tmp_path / "cgroup.controllers").write_text("cpu io memory")
+    monkeypatch.setattr(process_priority.settings, "process_cgroup_root", str(tmp_path))
+    monkeypatch.setattr(
+        process_priority.settings, "process_cgroup_idle_cpu_max", "50000 100000"
+    )
+    monkeypatch.setattr(process_priority.settings, "process_cgroup_idle_io_max", "")
+
+    priority = resolve_process_priority(
+        "check", SimpleNamespace(process_priorities={"check": "idle"})
+    )
+
+    assert priority.cgroup == str(tmp_path / "idle")
+    assert (tmp_path / "cgroup.subtree_control").read_text() == "+cpu"
+    assert (tmp_path / "idle" / "cpu.max").read_text() == "50000 100000"
+
+
+@pytest.mark.unit
+def test_missing_cgroup_hierarchy_falls_back_to_nice(tmp_path, monkeypatch):
+    monkeypatch.setattr(process_priority.settings, "process_cgroup_root", str(tmp_path))
+    monkeypatch.setattr(
+        process_priority.settings, "process_cgroup_low_cpu_max", "50000 100000"
+    )
+
+    priority = resolve_process_priority(
+        "check", SimpleNamespace(process_priorities={"check": "low"})
+    )
+
+    assert priority.cgroup is None
+    assert priority.nice == 10
+
+
+@pytest.mark.unit
+def test_spawned_process_runs_at_class_niceness():
+    priority = resolve_process_priority(
+        "compact", SimpleNamespace(process_priorities={"compact": "low"})
+    )
+
+    async def spawn():
+        process = await asyncio.create_subprocess_exec(
+            "sh",
+            "-c",
+            "sleep 0.2; cat /proc/self/stat",
+            stdout=asyncio.subprocess.PIPE,
+        )
+        priority.apply(process.pid)
+        stdout, _ = await process.communicate()
+        return stdout.decode()
+
+    stat = asyncio.run(spawn())
+    # Field 19 of /proc/<pid>/stat is the nice value.
+    child_nice = int(stat.rsplit(")", 1)[1].split()[16])
+    assert child_nice == min(19, os.nice(0) + 10)
+
+
+@pytest.mark.unit
+def test_borg_wrappers_honour_repository_override(monkeypatch):
+    from app.core.borg import borg
+
+    captured = {}
+
+    async def fake_execute(cmd, env=None, priority=None, **kwargs):
+        captured["priority"] = priority
+        return {"success": True}
+
+    monkeypatch.setattr(borg, "_execute_command", fake_execute)
+    asyncio.run(
+        borg.check_repository(
+            "/tmp/repo",
+            repository_record=SimpleNamespace(process_priorities={"check": "idle"}),
+        )
+    )
+
+    assert captured["priority"].priority_class == "idle"
+
+
+@pytest.mark.unit
+def test_repository_update_stores_process_priorities(
+    test_client: TestClient, admin_headers, test_db
+):
+    repo = Repository(
+        name="Prioritized",
+        path="/tmp/prioritized",
+        encryption="none",
+        repository_type="local",
+    )
+    test_db.add(repo)
+    test_db.commit()
+
+    invalid = test_client.put(
+        f"/api/repositories/{repo.id}",
+        json={"process_priorities": {"check": "realtime"}},
+        headers=admin_headers,
+    )
+    response = test_client.put(
+        f"/api/repositories/{repo.id}",
+        json={"process_priorities": {"check": "idle"}},
+        headers=admin_headers,
+    )
+
+    assert invalid.status_code == 422
+    assert (
+        invalid.json()["detail"]["key"]
+        == "backend.errors.repo.invalidProcessPriorities"
+    )
+    assert response.status_code == 200
+    test_db.refresh(repo)
+    assert repo.process_priorities == {"check": "idle"}
@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.utils.prune_simulation import (
+    format_prune_line,
+    parse_keep_within,
+    simulate_prune,
+)
+
+UTC = timezone.utc
+
+
+def _archive(name, start):
+    return {"name": name, "id": "ab" * 16, "start": start}
+
+
+def _reasons(simulation):
+    return {decision.name: decision.reason for decision in simulation.decisions}
+
+
+@pytest.mark.unit
+def test_daily_rule_keeps_newest_archive_per_day():
+    archives = [
+        _archive("mon-early", "2026-10-12T01:00:00+00:00"),
+        _archive("mon-late", "2026-10-12T23:00:00+00:00"),
+        _archive("tue", "2026-10-13T12:00:00+00:00"),
+        _archive("wed", "2026-10-14T12:00:00+00:00"),
+    ]
+
+    simulation = simulate_prune(archives, keep_daily=2, tz=UTC)
+
+    assert _reasons(simulation) == {
+        "wed": "daily #1",
+        "tue": "daily #2",
+        "mon-late": None,
+        "mon-early": None,
+    }
+    assert [decision.name for decision in simulation.pruned] == [
+        "mon-late",
+        "mon-early",
+    ]
+
+
+@pytest.mark.unit
+def test_rules_skip_kept_archives_and_keep_oldest_when_short():
+    archives = [
+        _archive("w42-b", "2026-10-14T12:00:00+00:00"),
+        _archive("w42-a", "2026-10-13T12:00:00+00:00"),
+        _archive("w41", "2026-10-06T12:00:00+00:00"),
+        _archive("w40", "2026-09-29T12:00:00+00:00"),
+    ]
+
+    simulation = simulate_prune(archives, keep_daily=1, keep_weekly=5, tz=UTC)
+
+    # Week 42's newest archive is already kept by the daily rule, so the weekly
+    # rule takes the next period; it runs short and also keeps the oldest.
+    assert _reasons(simulation) == {
+        "w42-b": "daily #1",
+        "w42-a": None,
+        "w41": "weekly #1",
+        "w40": "weekly #2",
+    }
+    assert _reasons(simulate_prune(archives[:2], keep_monthly=3, tz=UTC)) == {
+        "w42-b": "monthly #1",
+        "w42-a": "monthly[oldest] #2",
+    }
+
+
+@pytest.mark.unit
+def test_keep_within_checkpoints_and_name_glob():
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    archives = [
+        _archive("host-a.checkpoint", "2026-10-19T11:00:00+00:00"),
+        _archive("host-a-3", "2026-10-19T10:00:00+00:00"),
+        _archive("host-a-2", "2026-10-18T10:00:00+00:00"),
+        _archive("host-a.checkpoint.1", "2026-10-17T10:00:00+00:00"),
+        _archive("host-a-1", "2026-10-10T10:00:00+00:00"),
+        _archive("host-b-1", "2026-10-01T10:00:00+00:00"),
+        {"name": "undated"},
+    ]
+
+    simulation = simulate_prune(
+        archives, keep_within="2d", name_glob="host-a*", tz=UTC, now=now
+    )
+
+    assert _reasons(simulation) == {
+        "host-a.checkpoint": "checkpoint",
+        "host-a-3": "within #1",
+        "host-a-2": "within #2",
+        "host-a.checkpoint.1": None,
+        "host-a-1": None,
+    }
+    assert (simulation.unmatched, simulation.undated) == (2, 0)
+    assert simulate_prune(archives, keep_daily=1).undated == 1
+
+
+@pytest.mark.unit
+def test_periods_follow_the_requested_timezone():
+    archives = [
+        _archive("late", "2026-10-20T01:00:00+00:00"),
+        _archive("evening", "2026-10-19T23:00:00+00:00"),
+        _archive("older", "2026-10-18T12:00:00+00:00"),
+    ]
+
+    in_utc = simulate_prune(archives, keep_daily=2, tz=UTC)
+    in_new_york = simulate_prune(
+        archives, keep_daily=2, tz=ZoneInfo("America/New_York")
+    )
+
+    assert [decision.name for decision in in_utc.pruned] == ["older"]
+    # 21:00 and 19:00 on the 19th in New York share a day
+    assert [decision.name for decision in in_new_york.pruned] == ["evening"]
+
+
+@pytest.mark.unit
+def test_naive_timestamps_are_local_wall_clock():
+    simulation = simulate_prune(
+        [_archive("local", "2026-10-19T03:00:00.000000")], keep_daily=1
+    )
+
+    decision = simulation.decisions[0]
+    assert (decision.time.day, decision.time.hour) == (19, 3)
+    assert format_prune_line(decision).startswith(
+        "Keeping archive (rule: daily #1): local"
+    )
+    assert format_prune_line(decision).endswith(
+        f"Mon, 2026-10-19 03:00:00 [{'ab' * 16}]"
+    )
+
+
+@pytest.mark.unit
+def test_parse_keep_within():
+    assert parse_keep_within("36H") == timedelta(hours=36)
+    assert parse_keep_within("2w") == timedelta(days=14)
+    assert parse_keep_within("1m") == timedelta(days=31)
+    for value in ("", "7", "0d", "1x", "d7"):
+        with pytest.raises(ValueError):
+            parse_keep_within(value)
@@ -0,0 +1,194 @@
+from datetime import datetime, timedelta
+import json
+
+import pytest
+
+from app.database.models import Repository
+from app.services.repository_stats import (
+    apply_archive_created,
+    apply_archives_removed,
+    apply_compact_result,
+    apply_repository_info,
+    dedup_ratio_percent,
+    needs_full_size_refresh,
+    parse_borg_size,
+    parse_size_string,
+    parse_stats_rows,
+    repository_size_bytes,
+)
+
+
+def _repo(**kwargs):
+    defaults = {"name": "Repo", "path": "/repos/main", "borg_version": 1}
+    defaults.update(kwargs)
+    return Repository(**defaults)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1.00 GB", 1024**3),
+        ("1.5 TB", int(1.5 * 1024**4)),
+        ("512", 512),
+        ("", 0),
+        (None, 0),
+        ("bad", 0),
+    ],
+)
+def test_parse_size_string_reads_legacy_binary_units(value, expected):
+    assert parse_size_string(value) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1.29 kB", 1290),
+        ("-2.50 MB", -2_500_000),
+        ("3 GB", 3_000_000_000),
+        ("17 B", 17),
+    ],
+)
+def test_parse_borg_size_uses_decimal_units(value, expected):
+    assert parse_borg_size(value) == expected
+
+
+@pytest.mark.unit
+def test_apply_repository_info_seeds_all_size_columns():
+    repo = _repo()
+    now = datetime(2026, 10, 1, 12, 0)
+
+    applied = apply_repository_info(
+        repo,
+        {
+            "cache": {
+                "stats": {
+                    "total_size": 10_000,
+                    "total_csize": 6_000,
+                    "unique_size": 4_000,
+                    "unique_csize": 2_048,
+                }
+            }
+        },
+        now=now,
+    )
+
+    assert applied is True
+    assert repo.original_size_bytes == 10_000
+    assert repo.compressed_size_bytes == 6_000
+    assert repo.unique_size_bytes == 2_048
+    assert repo.total_size == "2.00 KB"
+    assert repo.size_stats_refreshed_at == now
+    assert repository_size_bytes(repo) == 2_048
+    assert dedup_ratio_percent(repo) == 79
+
+
+@pytest.mark.unit
+def test_apply_repository_info_ignores_output_without_stats():
+    repo = _repo(total_size="1.00 MB")
+
+    assert apply_repository_info(repo, {"encryption": {"mode": "none"}}) is False
+    assert repo.unique_size_bytes is None
+    assert repository_size_bytes(repo) == 1024**2
+
+
+@pytest.mark.unit
+def test_apply_archive_created_requires_baseline():
+    repo = _repo(archive_count=3)
+
+    assert apply_archive_created(repo, {"deduplicated_size": 10}) is False
+    assert repo.archive_count == 3
+
+
+@pytest.mark.unit
+def test_apply_archive_created_advances_totals():
+    repo = _repo(
+        archive_count=3,
+        original_size_bytes=1000,
+        compressed_size_bytes=600,
+        unique_size_bytes=400,
+    )
+
+    assert apply_archive_created(
+        repo,
+        {"original_size": 100, "compressed_size": 60, "deduplicated_size": 8},
+    )
+
+    assert repo.archive_count == 4
+    assert repo.original_size_bytes == 1100
+    assert repo.compressed_size_bytes == 660
+    assert repo.unique_size_bytes == 408
+
+
+@pytest.mark.unit
+def test_apply_archives_removed_uses_prune_stats_from_log_json():
+    repo = _repo(
+        archive_count=5,
+        original_size_bytes=10_000_000,
+        compressed_size_bytes=5_000_000,
+        unique_size_bytes=2_000_000,
+    )
+    stats_message = "\n".join(
+        [
+            "                       Original size      Compressed size    Deduplicated size",
+            "Deleted data:               -1.00 MB            -500.00 kB            -250.00 kB",
+            "All archives:                9.00 MB              4.50 MB              1.75 MB",
+        ]
+    )
+    lines = [
+        "[stderr] " + json.dumps({"type": "log_message", "message": stats_message}),
+        "[stdout] not json",
+    ]
+
+    assert apply_archives_removed(repo, 2, lines) is True
+
+    assert repo.archive_count == 3
+    assert repo.original_size_bytes == 9_000_000
+    assert repo.compressed_size_bytes == 4_500_000
+    assert repo.unique_size_bytes == 1_750_000
+
+
+@pytest.mark.unit
+def test_apply_archives_removed_without_stats_only_adjusts_count():
+    repo = _repo(archive_count=1, unique_size_bytes=100)
+
+    assert apply_archives_removed(repo, 3, ["Deleting archive x"]) is False
+    assert repo.archive_count == 0
+    assert repo.unique_size_bytes == 100
+
+
+@pytest.mark.unit
+def test_parse_stats_rows_reads_plain_delete_output():
+    rows = parse_stats_rows(["Deleted data:    -2.00 GB    -1.00 GB    -10.00 MB"])
+
+    assert rows["Deleted data"] == (-2_000_000_000, -1_000_000_000, -10_000_000)
+
+
+@pytest.mark.unit
+def test_apply_compact_result_only_shrinks_borg2_on_disk_size():
+    lines = [json.dumps({"type": "log_message", "message": "freed 1.00 MB"})]
+    v1 = _repo(unique_size_bytes=5_000_000)
+    v2 = _repo(name="Repo 2", borg_version=2, unique_size_bytes=5_000_000)
+
+    assert apply_compact_result(v1, lines) is False
+    assert apply_compact_result(v2, lines) is True
+    assert v1.unique_size_bytes == 5_000_000
+    assert v2.unique_size_bytes == 4_000_000
+
+
+@pytest.mark.unit
+def test_needs_full_size_refresh():
+    now = datetime(2026, 10, 10)
+    fresh = _repo(unique_size_bytes=1, size_stats_refreshed_at=now - timedelta(days=1))
+    stale = _repo(unique_size_bytes=1, size_stats_refreshed_at=now - timedelta(days=8))
+    observe = _repo(
+        mode="observe",
+        unique_size_bytes=1,
+        size_stats_refreshed_at=now - timedelta(hours=1),
+    )
+
+    assert needs_full_size_refresh(_repo(), now=now) is True
+    assert needs_full_size_refresh(fresh, now=now) is False
+    assert needs_full_size_refresh(stale, now=now) is True
+    assert needs_full_size_refresh(observe, now=now) is True
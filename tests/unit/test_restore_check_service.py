@@ -1,3 +1,8 @@
+import asyncio
+import hashlib
+import io
+import json
+import tarfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -5,31 +10,55 @@ import pytest
 from sqlalchemy.orm import sessionmaker
 
 from app.database.models import Repository, RestoreCheckJob
+from app.services.restore_check_canary import (
+    _build_canary_entries,
+    get_restore_canary_archive_paths,
+)
 from app.services.restore_check_service import RestoreCheckService
 
 
+def build_tar(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=tarfile.GNU_FORMAT) as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def _reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
 class FakeRestoreCheckProcess:
     def __init__(
         self,
         returncode: int,
-        stdout: bytes = b"",
+        stdout: bytes | None = None,
         stderr: bytes = b"",
         pid: int = 4321,
     ):
         self.returncode = returncode
-        self.stdout = stdout
-        self.stderr = stderr
+        self.stdout = _reader(build_tar({}) if stdout is None else stdout)
+        self.stderr = _reader(stderr)
         self.pid = pid
 
     async def communicate(self):
-        return self.stdout, self.stderr
+        return await self.stdout.read(), await self.stderr.read()
+
+    async def wait(self):
+        return self.returncode
 
 
 class FakeBorgRouter:
     def __init__(self, repository):
         self.repository = repository
 
-    async def list_archives(self, env=None):
+    async def list_archives(self, env=None, db=None):
         return [{"name": "archive-1", "start": "2026-01-02T00:00:00Z"}]
 
     def build_restore_extract_command(
@@ -42,9 +71,25 @@ class FakeBorgRouter:
     ):
         return ["borg", "extract", f"{repository_path}::{archive_name}", *paths]
 
+    def build_restore_export_tar_command(
+        self,
+        repository_path,
+        archive_name,
+        paths,
+        remote_path=None,
+        bypass_lock=False,
+    ):
+        return [
+            "borg",
+            "export-tar",
+            f"{repository_path}::{archive_name}",
+            "-",
+            *paths,
+        ]
+
 
 class FakeEmptyArchiveBorgRouter(FakeBorgRouter):
-    async def list_archives(self, env=None):
+    async def list_archives(self, env=None, db=None):
         return []
 
 
@@ -281,7 +326,6 @@ async def test_restore_check_canary_missing_payload_needs_backup_and_saves_logs(
     db_session.refresh(job)
 
     service = RestoreCheckService()
-    process = FakeRestoreCheckProcess(returncode=0, stderr=b"extract completed\n")
 
     with (
         patch("app.services.restore_check_service.SessionLocal", testing_session_local),
@@ -297,7 +341,9 @@ async def test_restore_check_canary_missing_payload_needs_backup_and_saves_logs(
         ),
         patch(
             "app.services.restore_check_service.asyncio.create_subprocess_exec",
-            return_value=process,
+            side_effect=lambda *args, **kwargs: FakeRestoreCheckProcess(
+                returncode=0, stderr=b"extract completed\n"
+            ),
         ),
     ):
         await service.execute_restore_check(job.id, restore_check_repository.id)
@@ -363,3 +409,150 @@ async def test_restore_check_canary_without_archives_saves_actionable_logs(
     assert "Mode: Canary" in log_text
     assert "Run a backup" in log_text
     verification.close()
+
+
+def _canary_stream(repository, tamper: bool = False) -> bytes:
+    archive_root = get_restore_canary_archive_paths(repository)[0].rsplit("/", 1)[0]
+    entries = _build_canary_entries(repository)
+    manifest = {
+        "files": [
+            {
+                "path": path,
+                "size": len(content),
+                "sha256": hashlib.sha256(content).hexdigest(),
+            }
+            for path, content in entries.items()
+        ]
+    }
+    if tamper:
+        entries[".borgui-canary/binary/check.bin"] = b"x" * 256
+    files = {f"{archive_root}/{path}": content for path, content in entries.items()}
+    files[f"{archive_root}/.borgui-canary/manifest.json"] = json.dumps(
+        manifest
+    ).encode()
+    return build_tar(files)
+
+
+async def _run_canary_check(
+    testing_session_local, db_session, repository, stdout, returncode=0
+):
+    job = RestoreCheckJob(
+        repository_id=repository.id,
+        repository_path=repository.path,
+        status="pending",
+        full_archive=False,
+    )
+    db_session.add(job)
+    db_session.commit()
+    db_session.refresh(job)
+
+    service = RestoreCheckService()
+    with (
+        patch("app.services.restore_check_service.SessionLocal", testing_session_local),
+        patch("app.services.restore_check_service.BorgRouter", FakeBorgRouter),
+        patch(
+            "app.services.restore_check_service.build_repository_borg_env",
+            return_value=({}, None),
+        ),
+        patch("app.services.restore_check_service.cleanup_temp_key_file"),
+        patch(
+            "app.services.restore_check_service.get_process_start_time",
+            return_value=123456,
+        ),
+        patch(
+            "app.services.restore_check_service.asyncio.create_subprocess_exec",
+            return_value=FakeRestoreCheckProcess(returncode=returncode, stdout=stdout),
+        ) as exec_mock,
+        patch("app.services.restore_check_service.tempfile.mkdtemp") as mkdtemp,
+    ):
+        await service.execute_restore_check(job.id, repository.id)
+
+    mkdtemp.assert_not_called()
+    assert exec_mock.await_args.args[1] == "export-tar"
+    verification = testing_session_local()
+    refreshed_job = verification.get(RestoreCheckJob, job.id)
+    verification.expunge(refreshed_job)
+    verification.close()
+    return refreshed_job
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_restore_check_streams_canary_without_scratch_directory(
+    testing_session_local,
+    db_session,
+    restore_check_repository,
+):
+    job = await _run_canary_check(
+        testing_session_local,
+        db_session,
+        restore_check_repository,
+        _canary_stream(restore_check_repository),
+    )
+
+    assert job.status == "completed"
+    log_text = Path(job.log_file_path).read_text(encoding="utf-8")
+    assert "Verification: streamed and hashed in memory" in log_text
+    assert "Verified canary files: .borgui-canary/README.txt" in log_text
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_restore_check_stream_fails_on_canary_hash_mismatch(
+    testing_session_local,
+    db_session,
+    restore_check_repository,
+):
+    job = await _run_canary_check(
+        testing_session_local,
+        db_session,
+        restore_check_repository,
+        _canary_stream(restore_check_repository, tamper=True),
+    )
+
+    assert job.status == "failed"
+    assert "Canary hash mismatch" in job.error_message
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_restore_check_stream_fails_on_truncated_stream(
+    testing_session_local,
+    db_session,
+    restore_check_repository,
+):
+    stream = _canary_stream(restore_check_repository)
+    job = await _run_canary_check(
+        testing_session_local, db_session, restore_check_repository, stream[:1500]
+    )
+
+    assert job.status == "failed"
+    assert "exit code 2" in job.error_message
+    log_text = Path(job.log_file_path).read_text(encoding="utf-8")
+    assert "Tar stream ended in the middle of an entry" in log_text
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("borg_returncode", [1, 105])
+async def test_restore_check_truncated_stream_fails_despite_borg_warning(
+    testing_session_local,
+    db_session,
+    restore_check_repository,
+    borg_returncode,
+):
+    stream = _canary_stream(restore_check_repository)
+    job = await _run_canary_check(
+        testing_session_local,
+        db_session,
+        restore_check_repository,
+        stream[:1500],
+        returncode=borg_returncode,
+    )
+
+    assert job.status == "failed"
+    assert "exit code 2" in job.error_message
+    verification = testing_session_local()
+    repository = verification.get(Repository, restore_check_repository.id)
+    assert repository.last_restore_check is None
+    verification.close()
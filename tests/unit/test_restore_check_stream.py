@@ -0,0 +1,82 @@
+import asyncio
+import hashlib
+import io
+import tarfile
+
+import pytest
+
+from app.services.restore_check_stream import TarStreamError, hash_tar_stream
+
+
+def _tar_bytes(tar_format, add_members) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=tar_format) as tar:
+        add_members(tar)
+    return buffer.getvalue()
+
+
+def _add_file(tar, path: str, content: bytes) -> None:
+    info = tarfile.TarInfo(path)
+    info.size = len(content)
+    tar.addfile(info, io.BytesIO(content))
+
+
+def _reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+LONG_PATH = "home/user/" + "deeply-nested-directory/" * 6 + "file.bin"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tar_format", [tarfile.GNU_FORMAT, tarfile.PAX_FORMAT])
+async def test_hash_tar_stream_hashes_files_with_long_names_and_links(tar_format):
+    payload = bytes(range(256)) * 700  # Spans several read chunks
+
+    def add_members(tar):
+        directory = tarfile.TarInfo("home/user")
+        directory.type = tarfile.DIRTYPE
+        tar.addfile(directory)
+        _add_file(tar, LONG_PATH, payload)
+        link = tarfile.TarInfo("home/user/hardlink.bin")
+        link.type = tarfile.LNKTYPE
+        link.linkname = LONG_PATH
+        tar.addfile(link)
+        symlink = tarfile.TarInfo("home/user/symlink")
+        symlink.type = tarfile.SYMTYPE
+        symlink.linkname = "hardlink.bin"
+        tar.addfile(symlink)
+        _add_file(tar, "home/user/manifest.json", b'{"files": []}')
+
+    digest = await hash_tar_stream(
+        _reader(_tar_bytes(tar_format, add_members)),
+        keep=lambda path: path.endswith("manifest.json"),
+        chunk_size=4096,
+    )
+
+    assert digest.entries == 5
+    assert digest.bytes_hashed == len(payload) + 13
+    assert digest.members[LONG_PATH].sha256 == _sha256(payload)
+    assert digest.members[LONG_PATH].size == len(payload)
+    assert digest.members["home/user/hardlink.bin"].sha256 == _sha256(payload)
+    assert "home/user/symlink" not in digest.members
+    assert digest.kept == {"home/user/manifest.json": b'{"files": []}'}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_hash_tar_stream_rejects_truncated_stream():
+    data = _tar_bytes(
+        tarfile.GNU_FORMAT, lambda tar: _add_file(tar, "file", b"x" * 2000)
+    )
+
+    with pytest.raises(TarStreamError):
+        await hash_tar_stream(_reader(data[:1024]))
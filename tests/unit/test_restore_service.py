@@ -251,6 +251,10 @@ class TestRestoreServiceExecution:
                 "app.services.mount_service.mount_service.mount_ssh_paths_shared",
                 new=fake_mount,
             ),
+            patch(
+                "app.services.restore_service.probe_remote_tar",
+                new=AsyncMock(return_value=False),
+            ),
         ):
             try:
                 await service._execute_local_to_ssh(
@@ -265,6 +269,96 @@ class TestRestoreServiceExecution:
 
         assert captured.get("preserve_symlinks") is True
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_ssh_restore_streams_tar_when_remote_has_tar(
+        self, testing_session_local, db_session, restore_job
+    ):
+        connection = SSHConnection(host="example.com", username="borg", port=2222)
+        db_session.add(connection)
+        db_session.commit()
+        db_session.refresh(connection)
+
+        started = {}
+
+        class FakePipeline:
+            pid = 4321
+            returncode = 0
+            stderr_lines = []
+
+            def __init__(self):
+                self.bytes_sent = 0
+                self.nfiles = 0
+                self.current_file = ""
+
+            async def run(self, on_progress):
+                self.bytes_sent, self.nfiles, self.current_file = 5120, 2, "docs/a"
+                on_progress(self)
+                return 0
+
+        async def fake_start(cmd, env, remote_cmd, priority=None):
+            started.update(cmd=cmd, remote_cmd=remote_cmd)
+            return FakePipeline()
+
+        mount = AsyncMock()
+        notification_mock = SimpleNamespace(
+            send_restore_success=AsyncMock(return_value=None),
+            send_restore_failure=AsyncMock(return_value=None),
+        )
+        service = RestoreService()
+        with (
+            patch("app.services.restore_service.SessionLocal", testing_session_local),
+            patch(
+                "app.services.mount_service.mount_service.mount_ssh_paths_shared",
+                new=mount,
+            ),
+            patch(
+                "app.services.restore_service.probe_remote_tar",
+                new=AsyncMock(return_value=True),
+            ),
+            patch(
+                "app.services.restore_service.estimate_cached_tar_size",
+                new=AsyncMock(return_value=10240),
+            ),
+            patch(
+                "app.services.restore_service.TarStreamPipeline.start",
+                new=fake_start,
+            ),
+            patch(
+                "app.services.restore_service.notification_service",
+                notification_mock,
+            ),
+        ):
+            await service._execute_local_to_ssh(
+                restore_job.id,
+                restore_job.repository,
+                "archive-1",
+                "/srv/restore here",
+                paths=["docs"],
+                destination_connection_id=connection.id,
+            )
+
+        mount.assert_not_awaited()
+        assert started["cmd"][:2] == ["borg", "export-tar"]
+        assert started["cmd"][-2:] == ["-", "docs"]
+        assert "2222" in started["remote_cmd"]
+        assert started["remote_cmd"][-1] == (
+            "mkdir -p '/srv/restore here' && tar -xpf - -C '/srv/restore here'"
+        )
+        assert service.running_processes == {}
+
+        verification = testing_session_local()
+        refreshed = (
+            verification.query(RestoreJob)
+            .filter(RestoreJob.id == restore_job.id)
+            .first()
+        )
+        assert refreshed.status == "completed"
+        assert refreshed.restored_size == 5120
+        assert refreshed.original_size == 10240
+        assert refreshed.nfiles == 2
+        verification.close()
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_local_restore_marks_failed_when_destination_creation_fails(
@@ -297,6 +391,82 @@ class TestRestoreServiceExecution:
         assert "failedCreateDestinationDir" in refreshed.error_message
         verification.close()
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_local_restore_runs_shards_for_large_cached_archive(
+        self, testing_session_local, restore_job, restore_repository
+    ):
+        items = [{"path": "data", "type": "d", "size": 0}] + [
+            {"path": f"data/{index}.bin", "type": "-", "size": 512 * 1024 * 1024}
+            for index in range(4)
+        ]
+        runs = []
+
+        class FakeShardedExtract:
+            def __init__(self, commands, env, cwd, final_command=None, priority=None):
+                self.commands = commands
+                self.final_command = final_command
+                self.patterns = [
+                    open(command[command.index("--patterns-from") + 1]).read()
+                    for command in commands
+                ]
+                self.returncode = None
+                self.stdout_lines, self.stderr_lines = [], []
+                self.nfiles, self.current_file = 4, "data/3.bin"
+                runs.append(self)
+
+            async def run(self, on_progress):
+                self.restored_size = 1024
+                on_progress(self)
+                self.returncode = 0
+                return 0
+
+        service = RestoreService()
+        with (
+            patch("app.services.restore_service.SessionLocal", testing_session_local),
+            patch("app.services.restore_service.settings.restore_parallel_shards", 2),
+            patch(
+                "app.services.restore_service.archive_cache.get_archive_listing",
+                new=AsyncMock(return_value=items),
+            ),
+            patch("app.services.restore_service.ShardedExtract", FakeShardedExtract),
+            patch(
+                "app.services.restore_service.notification_service",
+                SimpleNamespace(
+                    send_restore_success=AsyncMock(return_value=None),
+                    send_restore_failure=AsyncMock(return_value=None),
+                ),
+            ),
+        ):
+            await service._execute_local_to_local(
+                restore_job.id,
+                restore_job.repository,
+                restore_job.archive,
+                restore_job.destination,
+                ["data"],
+            )
+
+        (extract,) = runs
+        assert len(extract.commands) == 2
+        assert all("--patterns-from" in command for command in extract.commands)
+        assert sorted(extract.patterns) == [
+            "+ pp:data/0.bin\n+ pp:data/2.bin\n- sh:**\n",
+            "+ pp:data/1.bin\n+ pp:data/3.bin\n- sh:**\n",
+        ]
+        assert "--patterns-from" in extract.final_command
+        assert service.running_processes == {}
+
+        verification = testing_session_local()
+        refreshed = (
+            verification.query(RestoreJob)
+            .filter(RestoreJob.id == restore_job.id)
+            .first()
+        )
+        assert refreshed.status == "completed"
+        assert refreshed.original_size == 2 * 1024 * 1024 * 1024
+        assert refreshed.nfiles == 4
+        verification.close()
+
     @pytest.mark.unit
     @pytest.mark.asyncio
     async def test_local_restore_success_updates_job_and_sends_notification(
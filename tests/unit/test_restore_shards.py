@@ -0,0 +1,124 @@
+import json
+import sys
+
+import pytest
+
+from app.services.restore_shards import (
+    ShardedExtract,
+    aggregate_returncode,
+    directory_patterns,
+    plan_restore_shards,
+    shard_patterns,
+)
+
+MB = 1024 * 1024
+
+
+def _tree():
+    items = [{"path": "data", "type": "d", "size": 0}]
+    items.append({"path": "data/big", "type": "d", "size": 0})
+    for index in range(4):
+        items.append({"path": f"data/big/{index}.bin", "type": "-", "size": 100 * MB})
+    for index in range(8):
+        items.append({"path": f"data/small-{index}", "type": "-", "size": 25 * MB})
+    items.append({"path": "other/file", "type": "-", "size": 5 * MB})
+    return items
+
+
+def _emitter(code, *messages, sleep=0):
+    lines = "".join(json.dumps(message) + "\n" for message in messages)
+    script = (
+        "import sys, time\n"
+        f"sys.stderr.write({lines!r}); sys.stderr.flush()\n"
+        f"time.sleep({sleep})\n"
+        f"sys.exit({code})\n"
+    )
+    return [sys.executable, "-c", script]
+
+
+def _progress(current, path):
+    return {"type": "progress_percent", "current": current, "total": 0, "info": [path]}
+
+
+@pytest.mark.unit
+def test_plan_splits_large_directories_into_balanced_shards():
+    plan = plan_restore_shards(_tree(), ["/data"], 4)
+
+    assert plan is not None
+    assert len(plan.shards) == 4
+    assert plan.total_size == 600 * MB
+    assert plan.split_directories == ["data/big", "data"]
+    assert sorted(path for shard in plan.shards for path in shard) == sorted(
+        [f"data/big/{index}.bin" for index in range(4)]
+        + [f"data/small-{index}" for index in range(8)]
+    )
+    assert max(plan.shard_sizes) - min(plan.shard_sizes) < 30 * MB
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "items, shards, min_size",
+    [
+        (_tree(), 1, 0),
+        (_tree(), 4, 1024 * MB),
+        (_tree() + [{"path": "data/link", "type": "h", "size": 0}], 4, 0),
+        (_tree() + [{"path": "data/bad\nname", "type": "-", "size": 1}], 4, 0),
+        ([{"path": "data/one", "type": "-", "size": 10 * MB}], 4, 0),
+    ],
+)
+def test_plan_keeps_single_extract(items, shards, min_size):
+    assert plan_restore_shards(items, ["data"], shards, min_size=min_size) is None
+
+
+@pytest.mark.unit
+def test_patterns_select_only_the_planned_paths():
+    assert shard_patterns(["a/b", "c"]) == "+ pp:a/b\n+ pp:c\n- sh:**\n"
+    assert directory_patterns(["a/b", "a"]) == "+ pf:a/b\n+ pf:a\n- sh:**\n"
+
+
+@pytest.mark.unit
+def test_aggregate_returncode_prefers_failures_then_warnings():
+    assert aggregate_returncode([0, 0]) == 0
+    assert aggregate_returncode([0, 1, 0]) == 1
+    assert aggregate_returncode([1, 2, 0]) == 2
+    assert aggregate_returncode([0, None]) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sharded_extract_combines_progress_and_runs_final_pass(tmp_path):
+    updates = []
+    extract = ShardedExtract(
+        [
+            _emitter(0, _progress(10, "a/1"), _progress(30, "a/2")),
+            _emitter(1, _progress(5, "b/1")),
+        ],
+        None,
+        str(tmp_path),
+        final_command=[sys.executable, "-c", "open('final', 'w').close()"],
+    )
+
+    returncode = await extract.run(lambda shards: updates.append(shards.restored_size))
+
+    assert returncode == 1
+    assert extract.restored_size == 35
+    assert extract.nfiles == 3
+    assert max(updates) == 35
+    assert (tmp_path / "final").exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sharded_extract_failure_stops_other_shards(tmp_path):
+    extract = ShardedExtract(
+        [_emitter(0, sleep=30), _emitter(2)],
+        None,
+        str(tmp_path),
+        final_command=[sys.executable, "-c", "open('final', 'w').close()"],
+    )
+
+    returncode = await extract.run()
+
+    assert returncode == 2
+    assert extract.processes[0].returncode != 0
+    assert not (tmp_path / "final").exists()
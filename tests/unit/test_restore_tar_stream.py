@@ -0,0 +1,114 @@
+import io
+import json
+import sys
+import tarfile
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.restore_tar_stream import (
+    TarStreamPipeline,
+    build_remote_untar_command,
+    estimate_tar_size,
+)
+
+
+def _tar_bytes(entries):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=tarfile.GNU_FORMAT) as tar:
+        for path, size in entries:
+            info = tarfile.TarInfo(path)
+            if size is None:
+                info.type = tarfile.DIRTYPE
+                tar.addfile(info)
+            else:
+                info.size = size
+                tar.addfile(info, io.BytesIO(b"x" * size))
+    return buffer.getvalue()
+
+
+def _producer(payload: bytes, listed):
+    log = "".join(
+        json.dumps({"type": "log_message", "name": "borg.output.list", "message": p})
+        + "\n"
+        for p in listed
+    )
+    script = (
+        f"import sys\nsys.stderr.write({log!r})\nsys.stdout.buffer.write({payload!r})\n"
+    )
+    return [sys.executable, "-c", script]
+
+
+@pytest.mark.unit
+def test_estimate_tar_size_matches_gnu_tar_stream():
+    long_name = "docs/" + "n" * 120
+    entries = [("docs", None), ("docs/a.txt", 1000), (long_name, 10), ("other", 5)]
+    items = [
+        {"path": "docs", "type": "d", "size": 0},
+        {"path": "docs/a.txt", "type": "-", "size": 1000},
+        {"path": long_name, "type": "-", "size": 10},
+        {"path": "other", "type": "-", "size": 5},
+    ]
+
+    assert estimate_tar_size(items, None) == len(_tar_bytes(entries))
+    assert estimate_tar_size(items, ["/docs/"]) == len(_tar_bytes(entries[:3]))
+
+
+@pytest.mark.unit
+def test_remote_untar_command_quotes_and_applies_ssh_prefix():
+    connection = SimpleNamespace(ssh_path_prefix="/volume1")
+
+    assert build_remote_untar_command("/data/it's here", connection) == (
+        "mkdir -p '/volume1/data/it'\"'\"'s here' && "
+        "tar -xpf - -C '/volume1/data/it'\"'\"'s here'"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pipeline_streams_archive_into_tar(tmp_path):
+    payload = _tar_bytes([("docs", None), ("docs/a.txt", 3000)])
+    destination = tmp_path / "dest"
+    destination.mkdir()
+    progress = []
+
+    pipeline = await TarStreamPipeline.start(
+        _producer(payload, ["docs", "docs/a.txt"]),
+        None,
+        ["tar", "-xf", "-", "-C", str(destination)],
+    )
+    returncode = await pipeline.run(
+        lambda stream: progress.append(stream.bytes_sent), chunk_size=1024
+    )
+
+    assert returncode == 0
+    assert pipeline.bytes_sent == len(payload)
+    assert pipeline.nfiles == 2
+    assert pipeline.current_file == "docs/a.txt"
+    assert progress[-1] == len(payload)
+    assert (destination / "docs" / "a.txt").read_bytes() == b"x" * 3000
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pipeline_fails_when_remote_side_exits():
+    # A producer that would block forever on a full pipe if nobody stopped it.
+    producer = [
+        sys.executable,
+        "-c",
+        "import sys\nwhile True: sys.stdout.buffer.write(bytes(65536))",
+    ]
+
+    pipeline = await TarStreamPipeline.start(
+        producer,
+        None,
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.stderr.write('no space\\n'); sys.exit(3)",
+        ],
+    )
+    returncode = await pipeline.run()
+
+    assert returncode >= 2
+    assert "remote: no space" in pipeline.stderr_lines
@@ -797,7 +797,7 @@ async def test_stats_refresh_scheduler_updates_repositories_and_settings(db_sess
 
     scheduler = StatsRefreshScheduler()
     update_results = [True, False]
-    sync_state_with_db = MagicMock()
+    request_sync = MagicMock()
     testing_session_local = sessionmaker(
         bind=db_session.get_bind(), autocommit=False, autoflush=False
     )
@@ -806,7 +806,8 @@ async def test_stats_refresh_scheduler_updates_repositories_and_settings(db_sess
         def __init__(self, repo):
             self.repo = repo
 
-        async def update_stats(self, db):
+        async def update_stats(self, db, refresh_size=True):
+            assert refresh_size is True  # no size baseline yet
             return update_results.pop(0)
 
     with patch(
@@ -816,15 +817,15 @@ async def test_stats_refresh_scheduler_updates_repositories_and_settings(db_sess
             "app.services.stats_refresh_scheduler.BorgRouter", side_effect=FakeRouter
         ):
             with patch(
-                "app.services.mqtt_service.mqtt_service.sync_state_with_db",
-                sync_state_with_db,
+                "app.services.mqtt_service.mqtt_service.request_sync",
+                request_sync,
             ):
                 await scheduler.refresh_all_repository_stats()
 
     verification_session = testing_session_local()
     settings = verification_session.query(SystemSettings).first()
     assert settings.last_stats_refresh is not None
-    sync_state_with_db.assert_called_once()
+    request_sync.assert_called_once()
     verification_session.close()
 
 
@@ -844,6 +845,169 @@ def test_stats_refresh_scheduler_reads_interval_from_settings(db_session):
         assert scheduler._get_refresh_interval_minutes() == 15
 
 
+def _stats_refresh_repos(db_session, count, *, hosts=(None,)):
+    repos = []
+    for host in hosts:
+        for index in range(count):
+            path = (
+                f"ssh://borg@{host}/./repo{index}"
+                if host
+                else f"/tmp/stats-repo-{index}"
+            )
+            repos.append(
+                Repository(
+                    name=f"Stats Repo {host or 'local'} {index}",
+                    path=path,
+                    encryption="none",
+                    compression="lz4",
+                    repository_type="ssh" if host else "local",
+                )
+            )
+    db_session.add_all(repos)
+    db_session.add(SystemSettings())
+    db_session.commit()
+    return repos
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stats_refresh_scheduler_bounds_concurrency_per_host(db_session):
+    _stats_refresh_repos(db_session, 3, hosts=("a.example", "b.example"))
+    testing_session_local = sessionmaker(
+        bind=db_session.get_bind(), autocommit=False, autoflush=False
+    )
+    active = {"total": 0, "max_total": 0}
+    per_host = {}
+
+    class FakeRouter:
+        def __init__(self, repo):
+            self.host = repo.path.split("@")[1].split("/")[0]
+
+        async def update_stats(self, db, refresh_size=True):
+            active["total"] += 1
+            per_host.setdefault(self.host, [0, 0])
+            per_host[self.host][0] += 1
+            active["max_total"] = max(active["max_total"], active["total"])
+            per_host[self.host][1] = max(per_host[self.host][1], per_host[self.host][0])
+            await asyncio.sleep(0.01)
+            per_host[self.host][0] -= 1
+            active["total"] -= 1
+            return True
+
+    scheduler = StatsRefreshScheduler()
+    with (
+        patch(
+            "app.services.stats_refresh_scheduler.SessionLocal", testing_session_local
+        ),
+        patch(
+            "app.services.stats_refresh_scheduler.BorgRouter", side_effect=FakeRouter
+        ),
+        patch(
+            "app.services.stats_refresh_scheduler.probe_repository_fingerprint",
+            AsyncMock(return_value=None),
+        ),
+        patch(
+            "app.services.stats_refresh_scheduler.app_settings.stats_refresh_concurrency",
+            3,
+        ),
+        patch(
+            "app.services.stats_refresh_scheduler.app_settings.stats_refresh_per_host_concurrency",
+            1,
+        ),
+        patch("app.services.mqtt_service.mqtt_service.sync_state_with_db"),
+    ):
+        progress = await scheduler.refresh_repositories()
+
+    assert progress.succeeded == 6
+    assert progress.completed == 6
+    assert active["max_total"] == 2
+    assert {host: peak for host, (_, peak) in per_host.items()} == {
+        "a.example": 1,
+        "b.example": 1,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stats_refresh_scheduler_skips_unchanged_unless_forced(db_session):
+    _stats_refresh_repos(db_session, 2)
+    testing_session_local = sessionmaker(
+        bind=db_session.get_bind(), autocommit=False, autoflush=False
+    )
+    update_stats = AsyncMock(return_value=True)
+
+    class FakeRouter:
+        def __init__(self, repo):
+            self.update_stats = update_stats
+
+    scheduler = StatsRefreshScheduler()
+    with (
+        patch(
+            "app.services.stats_refresh_scheduler.SessionLocal", testing_session_local
+        ),
+        patch(
+            "app.services.stats_refresh_scheduler.BorgRouter", side_effect=FakeRouter
+        ),
+        patch(
+            "app.services.stats_refresh_scheduler.probe_repository_fingerprint",
+            AsyncMock(return_value="same"),
+        ),
+        patch("app.services.mqtt_service.mqtt_service.sync_state_with_db"),
+    ):
+        first = await scheduler.refresh_repositories()
+        second = await scheduler.refresh_repositories()
+        forced = await scheduler.refresh_repositories(force=True)
+
+    assert first.succeeded == 2
+    assert second.skipped == 2 and second.succeeded == 0
+    assert forced.succeeded == 2
+    assert update_stats.await_count == 4
+    assert update_stats.await_args.kwargs == {"refresh_size": True}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stats_refresh_scheduler_times_out_slow_repository(db_session):
+    _stats_refresh_repos(db_session, 2)
+    testing_session_local = sessionmaker(
+        bind=db_session.get_bind(), autocommit=False, autoflush=False
+    )
+
+    class FakeRouter:
+        def __init__(self, repo):
+            self.repo = repo
+
+        async def update_stats(self, db, refresh_size=True):
+            if self.repo.name.endswith("0"):
+                await asyncio.sleep(5)
+            return True
+
+    scheduler = StatsRefreshScheduler()
+    with (
+        patch(
+            "app.services.stats_refresh_scheduler.SessionLocal", testing_session_local
+        ),
+        patch(
+            "app.services.stats_refresh_scheduler.BorgRouter", side_effect=FakeRouter
+        ),
+        patch(
+            "app.services.stats_refresh_scheduler.probe_repository_fingerprint",
+            AsyncMock(return_value=None),
+        ),
+        patch(
+            "app.services.stats_refresh_scheduler.app_settings.stats_refresh_repository_timeout",
+            0.05,
+        ),
+        patch("app.services.mqtt_service.mqtt_service.sync_state_with_db"),
+    ):
+        progress = await scheduler.refresh_repositories()
+
+    assert progress.succeeded == 1
+    assert progress.failed == 1
+    assert progress.timed_out == 1
+    assert progress.finished_at is not None
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_periodic_mqtt_sync_runs_once_before_cancellation():
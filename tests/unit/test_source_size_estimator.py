@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import source_size_estimator as estimator_module
+from app.services.backup_service import BackupService
+from app.services.source_size_estimator import (
+    SourceSizeEstimator,
+    estimate_from_baseline,
+    sample_directories,
+    source_fingerprint,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def _make_tree(root):
+    for name in ("a", "b", "c"):
+        (root / name).mkdir()
+        (root / name / "data.bin").write_bytes(b"x" * 100)
+    return str(root)
+
+
+def _baseline(sample, original_size=10_000, age=timedelta(hours=1)):
+    return {
+        "original_size": original_size,
+        "job_id": 1,
+        "recorded_at": (NOW - age).isoformat(),
+        "dirs": sample,
+    }
+
+
+@pytest.mark.unit
+def test_sample_directories_is_breadth_first_and_bounded(tmp_path):
+    source = _make_tree(tmp_path)
+
+    sample = sample_directories([source, "ssh://user@host/data"], max_dirs=3)
+
+    assert list(sample) == [source, f"{source}/a", f"{source}/b"]
+    assert sample[f"{source}/a"][1] == 100
+    assert sample_directories([str(tmp_path / "missing")], 10) == {
+        str(tmp_path / "missing"): None
+    }
+
+
+@pytest.mark.unit
+def test_sample_directories_keys_snapshot_paths_by_source(tmp_path):
+    snapshot = _make_tree(tmp_path)
+
+    sample = sample_directories([snapshot], max_dirs=2, source_labels=["/srv/app"])
+
+    assert list(sample) == ["/srv/app", "/srv/app/a"]
+
+
+@pytest.mark.unit
+def test_estimate_adjusts_baseline_by_sampled_bytes(tmp_path):
+    source = _make_tree(tmp_path)
+    before = sample_directories([source], max_dirs=10)
+    (tmp_path / "a" / "more.bin").write_bytes(b"y" * 50)
+    after = sample_directories([source], max_dirs=10)
+
+    estimate, reason = estimate_from_baseline(
+        _baseline(before), after, now=NOW, max_age_days=7, changed_threshold=0.5
+    )
+
+    assert (estimate, reason) == (10_050, "baseline")
+
+
+@pytest.mark.unit
+def test_estimate_falls_back_when_stale_or_changed(tmp_path):
+    source = _make_tree(tmp_path)
+    sample = sample_directories([source], max_dirs=10)
+    changed = {path: [0, 0] for path in sample}
+
+    assert estimate_from_baseline(
+        None, sample, now=NOW, max_age_days=7, changed_threshold=0.1
+    ) == (None, "no_baseline")
+    assert estimate_from_baseline(
+        _baseline(sample, age=timedelta(days=8)),
+        sample,
+        now=NOW,
+        max_age_days=7,
+        changed_threshold=0.1,
+    ) == (None, "baseline_expired")
+    assert estimate_from_baseline(
+        _baseline(sample), changed, now=NOW, max_age_days=7, changed_threshold=0.1
+    ) == (None, "too_many_changes")
+    # Remote-only sources have no sample to detect changes with.
+    assert estimate_from_baseline(
+        _baseline({}), {}, now=NOW, max_age_days=0, changed_threshold=0.1
+    ) == (None, "no_change_signal")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_recorded_baseline_is_used_by_next_backup(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        estimator_module.settings, "source_size_estimation", "incremental"
+    )
+    source = _make_tree(tmp_path)
+    estimator = SourceSizeEstimator()
+    repository = SimpleNamespace(source_size_baselines=None)
+    for job_id in (1, 2, 3, 4):
+        estimator.begin(job_id)
+
+    assert await estimator.estimate(repository, 1, [source], ["*.tmp"]) is None
+    job = SimpleNamespace(id=1, original_size=5_000)
+    assert estimator.record_baseline(repository, job, now=NOW)
+    assert list(repository.source_size_baselines) == [
+        source_fingerprint([source], ["*.tmp"])
+    ]
+
+    estimate = await estimator.estimate(repository, 2, [source], ["*.tmp"], now=NOW)
+    assert estimate == 5_000
+    # Different excludes are a different source set.
+    assert await estimator.estimate(repository, 3, [source], [], now=NOW) is None
+
+    for job_id in (1, 2, 3):
+        estimator.discard(job_id)
+    assert estimator._pending == {} and estimator._active == {4}
+
+    monkeypatch.setattr(estimator_module.settings, "source_size_estimation", "du")
+    assert await estimator.estimate(repository, 4, [source], ["*.tmp"]) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sample_finishing_after_job_end_is_dropped(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        estimator_module.settings, "source_size_estimation", "incremental"
+    )
+    estimator = SourceSizeEstimator()
+    estimator.begin(1)
+    estimator.discard(1)
+
+    await estimator.estimate(None, 1, [_make_tree(tmp_path)])
+
+    assert estimator._pending == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_background_size_skips_du_when_estimate_available(monkeypatch):
+    monkeypatch.setattr(
+        estimator_module.settings, "source_size_estimation", "incremental"
+    )
+    service = BackupService()
+    job = SimpleNamespace(status="running", total_expected_size=None)
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = job
+
+    with (
+        patch("app.services.backup_service.SessionLocal", return_value=db),
+        patch(
+            "app.services.backup_service.source_size_estimator.estimate",
+            new=AsyncMock(return_value=7_000),
+        ),
+        patch.object(service, "_calculate_source_size", new=AsyncMock()) as du,
+    ):
+        await service._calculate_and_update_size_background(
+            42, ["/data"], [], repository_id=3
+        )
+
+    du.assert_not_awaited()
+    assert job.total_expected_size == 7_000
@@ -104,4 +104,5 @@ async def test_run_backup_delegates_to_borg2_create():
         archive_name="manual-1",
         passphrase="secret",
         remote_path="/usr/local/bin/borg2",
+        repository_record=repo,
     )
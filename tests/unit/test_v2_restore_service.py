@@ -67,6 +67,7 @@ async def test_preview_restore_delegates_to_borg2_extract():
         passphrase="secret",
         remote_path=None,
         bypass_lock=True,
+        repository_record=repo,
     )
 
 
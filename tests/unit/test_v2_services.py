@@ -587,3 +587,60 @@ class TestDeleteArchiveV2Service:
         assert refreshed.status == "completed"
         assert refreshed.progress == 100
         verification.close()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_execute_bulk_delete_compacts_once_after_all_archives(
+        self, db_session, testing_session_local, borg_v2_repo_for_services, tmp_path
+    ):
+        selectors = ["aid:" + "aa" * 8, "aid:" + "bb" * 8, "aid:" + "cc" * 8]
+        job = DeleteArchiveJob(
+            repository_id=borg_v2_repo_for_services.id,
+            repository_path=borg_v2_repo_for_services.path,
+            archive_name="3 archives",
+            archive_names=selectors,
+            status="pending",
+        )
+        db_session.add(job)
+        db_session.commit()
+        db_session.refresh(job)
+
+        service = DeleteArchiveV2Service()
+        service.log_dir = tmp_path
+
+        with (
+            patch(
+                "app.services.v2.delete_archive_service.SessionLocal",
+                testing_session_local,
+            ),
+            patch(
+                "app.services.v2.delete_archive_service.borg2.delete_archive",
+                side_effect=[
+                    {"success": True, "stderr": ""},
+                    {"success": False, "stderr": "archive not found"},
+                    {"success": True, "stderr": ""},
+                ],
+            ) as delete_archive,
+            patch(
+                "app.services.v2.delete_archive_service.borg2.compact",
+                return_value={"success": True, "stderr": ""},
+            ) as compact,
+        ):
+            await service.execute_bulk_delete(
+                job.id, borg_v2_repo_for_services.id, selectors
+            )
+
+        assert [call.kwargs["archive"] for call in delete_archive.call_args_list] == (
+            selectors
+        )
+        compact.assert_called_once()
+        verification = testing_session_local()
+        refreshed = (
+            verification.query(DeleteArchiveJob)
+            .filter(DeleteArchiveJob.id == job.id)
+            .first()
+        )
+        assert refreshed.status == "completed_with_warnings"
+        assert refreshed.archives_deleted == 2
+        assert "archive not found" in refreshed.error_message
+        verification.close()